@@ -5,11 +5,23 @@ Dependencia para obtener la sesión de base de datos con FastAPI y SQLAlchemy.
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.infrastructure.db.session import get_db
 
 
+@traced("dependency", name="get_db_session")
 def get_db_session(db: Session = Depends(get_db)) -> Session:
     """
     Dependencia reutilizable para obtener una sesión de base de datos.
     """
     return db
+
+
+@traced("dependency", name="get_read_db_session")
+def get_read_db_session(db: Session = Depends(get_db)) -> Session:
+    """
+    Sesión para rutas de solo lectura: con réplicas configuradas, sus `SELECT` se
+    envían a una réplica (ver `app.infrastructure.db.replicas`).
+    """
+    db.info["read_only"] = True
+    return db
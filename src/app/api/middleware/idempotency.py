@@ -0,0 +1,282 @@
+"""
+Middleware de idempotencia para las peticiones `POST`.
+
+Un cliente que reintenta una petición con la misma cabecera `Idempotency-Key` recibe
+la respuesta de la primera ejecución (con `Idempotent-Replayed: true`) en lugar de
+ejecutarla de nuevo, incluidas las cabeceras que el cliente necesita (`ETag`,
+`Location`). Las respuestas se guardan en la tabla `idempotency_keys` y en
+una caché LRU en memoria, de modo que la mayoría de los reintentos se responden sin
+consultar la base de datos.
+
+Si llega un duplicado mientras la petición original sigue en curso, espera a que
+termine: dentro del proceso con un `asyncio.Event`, y entre procesos consultando la
+reserva de la clave en la base de datos.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.auth.jwt import user_id_from_authorization
+from app.core.config import Settings
+from app.infrastructure.db.crud.idempotency import (
+    claim_idempotency_key,
+    complete_idempotency_key,
+    release_idempotency_key,
+)
+from app.infrastructure.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+POLL_INTERVAL = 0.05
+# Cabeceras de la respuesta original que se guardan y se repiten en los reintentos.
+REPLAYED_RESPONSE_HEADERS = ("content-type", "etag", "location")
+
+
+class StoredResponse(NamedTuple):
+    """Respuesta guardada para una clave de idempotencia."""
+
+    request_hash: bytes
+    status_code: int
+    body: bytes
+    headers: dict[str, str]
+    stored_at: float
+
+
+class ResponseCache:
+    """
+    Caché LRU de respuestas idempotentes con expiración.
+
+    Args:
+        max_size (int): Número máximo de respuestas en memoria.
+        ttl (float): Segundos que una respuesta sigue siendo válida.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[StoredResponse]:
+        """Devuelve la respuesta guardada para `key`, o None si no hay o expiró."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: StoredResponse) -> None:
+        """Guarda una respuesta, descartando la menos usada si se supera el tamaño."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def _error(status_code: int, detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"detail": detail})
+
+
+# pylint: disable-next=too-few-public-methods
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """
+    Aplica la cabecera `Idempotency-Key` a las peticiones `POST` autenticadas.
+
+    Las claves son por usuario. Reutilizar una clave con otra petición (otra ruta,
+    otros parámetros de consulta u otro cuerpo) responde 422; las respuestas 5xx no se guardan, para que el cliente
+    pueda reintentar.
+
+    Args:
+        app: Aplicación ASGI envuelta.
+        settings (Settings): Configuración (`idempotency_*`).
+    """
+
+    def __init__(self, app, settings: Settings):
+        super().__init__(app)
+        self.wait_timeout = settings.idempotency_wait_timeout
+        self.cache = ResponseCache(
+            settings.idempotency_cache_size, settings.idempotency_ttl_hours * 3600
+        )
+        self._in_flight: dict[tuple, asyncio.Event] = {}
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if request.method != "POST" or key is None:
+            return await call_next(request)
+        if not key or len(key) > MAX_KEY_LENGTH:
+            return _error(
+                status.HTTP_400_BAD_REQUEST, "Cabecera Idempotency-Key inválida"
+            )
+        user_id = user_id_from_authorization(request.headers.get("Authorization"))
+        if user_id is None:
+            # Sin usuario válido el endpoint responderá 401; no hay nada que guardar.
+            return await call_next(request)
+
+        body = await request.body()
+        target = request.url.path
+        if request.url.query:
+            target = f"{target}?{request.url.query}"
+        request_hash = hashlib.sha256(
+            b"%s %s\n%s" % (request.method.encode(), target.encode(), body)
+        ).digest()
+        cache_key = (user_id, key)
+
+        while (event := self._in_flight.get(cache_key)) is not None:
+            try:
+                await asyncio.wait_for(event.wait(), self.wait_timeout)
+            except asyncio.TimeoutError:
+                return self._in_progress()
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._replay(cached, request_hash)
+
+        event = asyncio.Event()
+        self._in_flight[cache_key] = event
+        try:
+            return await self._execute(request, call_next, cache_key, request_hash)
+        finally:
+            del self._in_flight[cache_key]
+            event.set()
+
+    async def _execute(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+        cache_key: tuple,
+        request_hash: bytes,
+    ) -> Response:
+        user_id, key = cache_key
+        deadline = time.monotonic() + self.wait_timeout
+        while (
+            row := await run_in_threadpool(_claim, user_id, key, request_hash)
+        ) is not None:
+            if row.request_hash != request_hash:
+                return self._replay(row, request_hash)
+            if row.status_code is not None:
+                self.cache.put(cache_key, row)
+                return self._replay(row, request_hash)
+            if time.monotonic() >= deadline:
+                # La petición original lleva más de `wait_timeout` sin terminar: si su
+                # reserva es así de antigua se considera abandonada y se libera.
+                stale_before = datetime.now(timezone.utc) - timedelta(
+                    seconds=self.wait_timeout
+                )
+                if not await run_in_threadpool(_release, user_id, key, stale_before):
+                    return self._in_progress()
+                continue
+            await asyncio.sleep(POLL_INTERVAL)
+
+        try:
+            response = await call_next(request)
+            content = b"".join([chunk async for chunk in response.body_iterator])
+        except Exception:
+            await run_in_threadpool(_release, user_id, key)
+            raise
+
+        if response.status_code >= 500:
+            await run_in_threadpool(_release, user_id, key)
+        else:
+            headers = {
+                name: response.headers[name]
+                for name in REPLAYED_RESPONSE_HEADERS
+                if name in response.headers
+            }
+            await run_in_threadpool(
+                _complete, user_id, key, response.status_code, content, headers
+            )
+            self.cache.put(
+                cache_key,
+                StoredResponse(
+                    request_hash,
+                    response.status_code,
+                    content,
+                    headers,
+                    time.monotonic(),
+                ),
+            )
+        return Response(
+            content=content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            background=response.background,
+        )
+
+    @staticmethod
+    def _replay(stored: StoredResponse, request_hash: bytes) -> Response:
+        if stored.request_hash != request_hash:
+            return _error(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                "La Idempotency-Key ya se usó con una petición distinta",
+            )
+        return Response(
+            content=stored.body,
+            status_code=stored.status_code,
+            headers={
+                "content-type": "application/json",
+                **stored.headers,
+                REPLAYED_HEADER: "true",
+            },
+        )
+
+    @staticmethod
+    def _in_progress() -> JSONResponse:
+        return _error(
+            status.HTTP_409_CONFLICT,
+            "Una petición con la misma Idempotency-Key sigue en curso",
+        )
+
+
+def _claim(user_id: int, key: str, request_hash: bytes) -> Optional[StoredResponse]:
+    db = SessionLocal()
+    try:
+        row = claim_idempotency_key(db, user_id, key, request_hash)
+        if row is None:
+            return None
+        return StoredResponse(
+            row.request_hash,
+            row.status_code,
+            row.body,
+            row.headers or {},
+            time.monotonic(),
+        )
+    finally:
+        db.close()
+
+
+def _complete(  # pylint: disable=too-many-arguments
+    user_id: int, key: str, status_code: int, body: bytes, headers: dict[str, str]
+) -> None:
+    db = SessionLocal()
+    try:
+        complete_idempotency_key(db, user_id, key, status_code, body, headers=headers)
+    finally:
+        db.close()
+
+
+def _release(user_id: int, key: str, pending_before: Optional[datetime] = None) -> bool:
+    db = SessionLocal()
+    try:
+        return release_idempotency_key(db, user_id, key, pending_before)
+    finally:
+        db.close()
@@ -0,0 +1,106 @@
+"""
+Perfilado bajo demanda de peticiones.
+
+Se perfila una fracción `profiling_sample_rate` de las peticiones y toda petición que
+envíe la cabecera `X-Profile` con el valor de `profiling_token`. El perfil (pilas
+muestreadas y sentencias SQL, ver `app.core.profiling`) se guarda en `profiling_dir`
+y su nombre se devuelve en la cabecera `X-Profile-Id`.
+
+Con la tasa a 0 y sin token, `create_app` no añade este middleware ni registra los
+eventos de SQL: desactivado no tiene ningún coste.
+"""
+
+import hmac
+import logging
+import random
+
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import Settings
+from app.core.profiling import ProfileStore, RequestProfile, install_sql_listeners
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+def profiling_enabled(settings: Settings) -> bool:
+    """Indica si la configuración activa el perfilado de peticiones."""
+    return settings.profiling_sample_rate > 0 or bool(settings.profiling_token)
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Perfila las peticiones elegidas y guarda el resultado en disco.
+
+    Cada perfil activo mantiene un hilo muestreador; como mucho se perfilan
+    `profiling_max_concurrent` peticiones a la vez y las demás se atienden sin perfilar.
+
+    Args:
+        app: Aplicación ASGI envuelta.
+        settings (Settings): Configuración (`profiling_*`).
+    """
+
+    def __init__(self, app, settings: Settings):
+        super().__init__(app)
+        self.sample_rate = settings.profiling_sample_rate
+        self.token = settings.profiling_token
+        self.interval = settings.profiling_interval_ms / 1000
+        self.max_concurrent = settings.profiling_max_concurrent
+        self.store = ProfileStore(
+            settings.profiling_dir,
+            settings.profiling_max_files,
+            settings.profiling_format,
+        )
+        self.active = 0
+        install_sql_listeners()
+
+    def should_profile(self, request: Request) -> bool:
+        """Decide si la petición se perfila (cabecera privilegiada o muestreo)."""
+        if self.active >= self.max_concurrent:
+            return False
+        header = request.headers.get(PROFILE_HEADER)
+        # `compare_digest` no admite cadenas no ASCII: se comparan los bytes.
+        if (
+            header
+            and self.token
+            and hmac.compare_digest(header.encode(), self.token.encode())
+        ):
+            return True
+        return random.random() < self.sample_rate
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        if not self.should_profile(request):
+            return await call_next(request)
+
+        profile = RequestProfile(
+            f"{request.method} {request.url.path}", request.scope, self.interval
+        )
+        self.active += 1
+        profile.start()
+        try:
+            response = await call_next(request)
+        finally:
+            profile.stop()
+            self.active -= 1
+        try:
+            name = await run_in_threadpool(self.store.save, profile)
+        except OSError:
+            logger.exception("Could not write profile for %s", profile.name)
+            return response
+        logger.info(
+            "Profiled %s: %.1f ms, %d samples, %d SQL statements -> %s",
+            profile.name,
+            profile.duration * 1000,
+            len(profile.samples),
+            len(profile.statements),
+            name,
+        )
+        response.headers[PROFILE_ID_HEADER] = name
+        return response
@@ -0,0 +1,140 @@
+"""
+Limitación de peticiones por usuario y por IP con cubetas de tokens (token bucket).
+
+Cada cliente activo ocupa una sola entrada (tokens disponibles y momento de la última
+recarga), que se actualiza en O(1) por petición. Las cubetas que llevan tiempo sin
+uso ya estarían llenas, así que se eliminan periódicamente sin cambiar el resultado:
+la memoria es proporcional a los clientes activos, no a los vistos alguna vez.
+"""
+
+import math
+import time
+from typing import Hashable, Optional
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.auth.jwt import user_id_from_authorization
+from app.core.config import Settings
+
+
+class TokenBucketLimiter:
+    """
+    Conjunto de cubetas de tokens con la misma tasa y capacidad.
+
+    Args:
+        rate (float): Tokens que se recargan por segundo.
+        burst (int): Capacidad de la cubeta (ráfaga máxima).
+        eviction_interval (float): Segundos entre barridos de cubetas inactivas.
+    """
+
+    def __init__(self, rate: float, burst: int, eviction_interval: float = 60.0):
+        self.rate = rate
+        self.burst = burst
+        self.eviction_interval = eviction_interval
+        self._buckets: dict[Hashable, list[float]] = {}
+        self._next_eviction = time.monotonic() + eviction_interval
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, key: Hashable, now: Optional[float] = None) -> float:
+        """
+        Consume un token de la cubeta de `key`.
+
+        Args:
+            key (Hashable): Cliente (usuario o IP).
+            now (Optional[float]): Instante actual (`time.monotonic()`).
+
+        Returns:
+            float: 0 si se concedió el token; si no, segundos hasta que haya uno.
+        """
+        now = time.monotonic() if now is None else now
+        if now >= self._next_eviction:
+            self.evict(now)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [self.burst - 1.0, now]
+            return 0.0
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return 0.0
+        bucket[0] = tokens
+        return (1 - tokens) / self.rate
+
+    def refund(self, key: Hashable) -> None:
+        """Devuelve a la cubeta de `key` un token concedido que no llegó a usarse."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket[0] = min(self.burst, bucket[0] + 1)
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Elimina las cubetas que ya se habrían recargado por completo."""
+        now = time.monotonic() if now is None else now
+        refill_time = self.burst / self.rate
+        idle = [
+            key for key, (_, last) in self._buckets.items() if now - last >= refill_time
+        ]
+        for key in idle:
+            del self._buckets[key]
+        self._next_eviction = now + self.eviction_interval
+        return len(idle)
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few-public-methods
+    """
+    Responde 429 con `Retry-After` cuando un usuario o una IP superan su tasa.
+
+    Las peticiones autenticadas consumen un token de la cubeta del usuario y otro de
+    la de su IP; las anónimas, solo de la IP. Si la IP rechaza la petición, el token
+    del usuario se devuelve. Una tasa 0 desactiva ese límite.
+
+    La IP es la de `request.client`: detrás de un proxy o balanceador es la del proxy
+    salvo que uvicorn se ejecute con `--proxy-headers --forwarded-allow-ips=<proxy>`,
+    que la sustituye por la de `X-Forwarded-For` solo si llega de un proxy de
+    confianza. Por eso el límite por IP está desactivado por defecto.
+
+    Args:
+        app: Aplicación ASGI envuelta.
+        settings (Settings): Configuración (`rate_limit_*`).
+    """
+
+    def __init__(self, app, settings: Settings):
+        super().__init__(app)
+        self.user_limiter = None
+        self.ip_limiter = None
+        if settings.rate_limit_user_rate > 0:
+            self.user_limiter = TokenBucketLimiter(
+                settings.rate_limit_user_rate, settings.rate_limit_user_burst
+            )
+        if settings.rate_limit_ip_rate > 0:
+            self.ip_limiter = TokenBucketLimiter(
+                settings.rate_limit_ip_rate, settings.rate_limit_ip_burst
+            )
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        now = time.monotonic()
+        wait = 0.0
+        user_id = None
+        if self.user_limiter is not None:
+            user_id = user_id_from_authorization(request.headers.get("Authorization"))
+            if user_id is not None:
+                wait = self.user_limiter.acquire(user_id, now)
+        if not wait and self.ip_limiter is not None and request.client is not None:
+            wait = self.ip_limiter.acquire(request.client.host, now)
+            if wait and user_id is not None:
+                self.user_limiter.refund(user_id)
+        if wait:
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Demasiadas peticiones, intente más tarde"},
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+        return await call_next(request)
@@ -0,0 +1,105 @@
+"""
+Endpoints de administración: informe de consultas lentas y reclamo de las listas
+sin propietario.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Path, Query, status
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.schemas.admin import SlowQueryReport, UnownedListPage
+from app.api.schemas.list_member import ListMemberResponse
+from app.core.auth.dependencies import get_current_admin
+from app.core.constants import SlowQuerySortField
+from app.infrastructure.db.crud.membership import claim_list, get_unowned_lists
+from app.infrastructure.db.models.user import UserModel
+from app.infrastructure.db.slow_queries import slow_query_log
+
+router = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(get_current_admin)]
+)
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryReport,
+    summary="Consultas SQL más lentas",
+)
+def get_slow_queries(
+    limit: int = Query(20, ge=1, le=500, description="Huellas a devolver"),
+    sort: SlowQuerySortField = Query(
+        SlowQuerySortField.TOTAL, description="Criterio de orden (de mayor a menor)"
+    ),
+) -> SlowQueryReport:
+    """
+    Devuelve las huellas de las sentencias SQL que superaron `SLOW_QUERY_THRESHOLD_MS`
+    en este proceso, con su número de ejecuciones, tiempos total, medio y máximo y,
+    en PostgreSQL con `SLOW_QUERY_EXPLAIN`, su plan de ejecución.
+
+    Solo para administradores (`ADMIN_USERNAMES`).
+    """
+    return SlowQueryReport(
+        threshold_ms=slow_query_log.threshold_ms,
+        queries=slow_query_log.top(limit, sort.value),
+    )
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Reiniciar el informe de consultas lentas",
+)
+def reset_slow_queries():
+    """
+    Descarta las estadísticas acumuladas de consultas lentas.
+
+    Solo para administradores (`ADMIN_USERNAMES`).
+    """
+    slow_query_log.reset()
+
+
+@router.get(
+    "/lists/unowned",
+    response_model=UnownedListPage,
+    summary="Listas sin propietario",
+)
+def list_unowned_lists(
+    limit: int = Query(50, ge=1, le=200, description="Tamaño de página"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página anterior"),
+    db: Session = Depends(deps.get_read_db_session),
+) -> UnownedListPage:
+    """
+    Devuelve las listas que no tienen ningún propietario, y por tanto ningún usuario
+    puede abrir: las que ya estaban vacías antes de existir los miembros de las
+    listas. Se asignan con `POST /admin/lists/{list_id}/claim`.
+
+    Solo para administradores (`ADMIN_USERNAMES`).
+    """
+    lists, next_cursor = get_unowned_lists(db, limit=limit, cursor=cursor)
+    return {"lists": lists, "next_cursor": next_cursor}
+
+
+@router.post(
+    "/lists/{list_id}/claim",
+    response_model=ListMemberResponse,
+    summary="Reclamar una lista sin propietario",
+)
+def claim_unowned_list(
+    list_id: int = Path(..., gt=0, description="ID de la lista de tareas"),
+    db: Session = Depends(deps.get_db_session),
+    admin: UserModel = Depends(get_current_admin),
+) -> ListMemberResponse:
+    """
+    Hace al administrador propietario de una lista sin propietario; después puede
+    añadir miembros con `PUT /lists/{list_id}/members/{user_id}`.
+
+    ### Respuestas:
+    - ✅ **200**: El administrador es ahora propietario de la lista.
+    - ❌ **404**: La lista no existe.
+    - ❌ **409**: La lista ya tiene propietario.
+
+    Solo para administradores (`ADMIN_USERNAMES`).
+    """
+    return claim_list(db, list_id, admin.id)
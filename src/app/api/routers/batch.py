@@ -0,0 +1,69 @@
+"""
+Endpoint para ejecutar varias operaciones sobre tareas en una sola petición.
+"""
+
+import logging
+
+from fastapi import APIRouter, Body, Depends
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.schemas.batch import BatchRequest, BatchResponse
+from app.core.auth.dependencies import get_current_user
+from app.infrastructure.db.crud.batch import run_task_batch
+from app.infrastructure.db.models.user import UserModel
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+
+@router.post(
+    "/",
+    response_model=BatchResponse,
+    summary="Ejecutar un lote de operaciones sobre tareas",
+)
+def run_batch(
+    batch: BatchRequest = Body(...),
+    db: Session = Depends(deps.get_db_session),
+    current_user: UserModel = Depends(get_current_user),
+) -> BatchResponse:
+    """
+    Ejecuta en orden una lista de operaciones sobre tareas de cualquier lista.
+
+    El usuario se autentica una sola vez y todas las operaciones comparten una
+    transacción. Cada operación obtiene el mismo código y cuerpo que su endpoint
+    individual (`201`, `200`, `204`, `404`, `409`...).
+
+    ## Operaciones
+    - `create`: `list_id`, `task` (como en `POST /lists/{list_id}/tasks/`).
+    - `update`: `list_id`, `task_id`, `task` y `version` opcional (`If-Match`).
+    - `status`: `list_id`, `task_id`, `is_done` y `version` opcional.
+    - `delete`: `list_id`, `task_id`.
+
+    ## Atomicidad
+    - `atomic: false` (por defecto): las operaciones que fallan se deshacen por
+      separado y el resto se confirma.
+    - `atomic: true`: el primer error deshace todo el lote; el resto de operaciones
+      se informan con `424` y `committed` es `false`.
+
+    ## Ejemplo de solicitud
+    ```json
+    {
+        "atomic": true,
+        "operations": [
+            {"op": "create", "list_id": 1, "task": {"title": "Comprar pan"}},
+            {"op": "status", "list_id": 1, "task_id": 7, "is_done": true}
+        ]
+    }
+    ```
+    """
+    logger.info(
+        "Running batch of %d operations (atomic=%s)",
+        len(batch.operations),
+        batch.atomic,
+    )
+    committed, results = run_task_batch(
+        db, batch.operations, current_user.id, atomic=batch.atomic
+    )
+    return BatchResponse(committed=committed, results=results)
@@ -0,0 +1,69 @@
+"""
+Endpoints de la bandeja de tareas del usuario autenticado.
+
+Permite consultar, en una sola petición, las tareas asignadas al usuario o
+creadas por él en todas las listas, con filtros y paginación por cursor.
+"""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.schemas.task import TaskPageResponse
+from app.core.auth.dependencies import get_current_user
+from app.core.constants import PriorityLevel, TaskRelation
+from app.infrastructure.db.crud.task import get_user_tasks
+from app.infrastructure.db.models.user import UserModel
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/tasks", tags=["Inbox"])
+
+
+@router.get(
+    "/mine",
+    response_model=TaskPageResponse,
+    summary="Listar mis tareas en todas las listas",
+)
+def list_my_tasks(  # pylint: disable=too-many-arguments
+    *,
+    relation: TaskRelation = Query(
+        TaskRelation.ASSIGNED,
+        description="`assigned`: tareas asignadas a mí; `created`: creadas por mí",
+    ),
+    is_done: Optional[bool] = Query(None, description="Filtrar por tareas completadas"),
+    priority: Optional[PriorityLevel] = Query(
+        None, description="Filtrar por prioridad (ej: alta, media, baja)"
+    ),
+    limit: int = Query(50, ge=1, le=200, description="Tareas por página"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página anterior"),
+    db: Session = Depends(deps.get_read_db_session),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskPageResponse:
+    """
+    Devuelve las tareas del usuario autenticado en todas sus listas.
+
+    Las tareas se ordenan de la más a la menor recientemente actualizada. Para
+    pedir la siguiente página se envía el `next_cursor` recibido.
+
+    ### Parámetros:
+    - `relation`: `assigned` (por defecto) o `created`.
+    - `is_done`: Filtra tareas completadas o no.
+    - `priority`: Filtra por nivel de prioridad.
+    - `limit`: Tamaño de página (1-200).
+    - `cursor`: Cursor opaco devuelto por la página anterior.
+    """
+    logger.info("Listing %s tasks for user %d", relation.value, current_user.id)
+    tasks, next_cursor = get_user_tasks(
+        db,
+        current_user.id,
+        relation,
+        is_done=is_done,
+        priority=priority,
+        limit=limit,
+        cursor=cursor,
+    )
+    return {"tasks": tasks, "next_cursor": next_cursor}
@@ -0,0 +1,89 @@
+"""
+Rutas (endpoints) para gestionar los miembros de una lista de tareas y sus roles.
+
+- `viewer`: consulta la lista y sus tareas.
+- `editor`: además crea, modifica, mueve y elimina tareas, y edita la lista.
+- `owner`: además gestiona los miembros y puede eliminar la lista.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Body, Depends, Path, status
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.schemas.list_member import ListMemberRequest, ListMemberResponse
+from app.core.auth.permissions import can_view, is_owner
+from app.core.constants import ListRole
+from app.infrastructure.db.crud.membership import (
+    get_list_members,
+    remove_list_member,
+    set_list_member,
+)
+
+router = APIRouter(prefix="/lists/{list_id}/members", tags=["List Members"])
+
+
+@router.get(
+    "/",
+    response_model=List[ListMemberResponse],
+    summary="Listar los miembros de una lista",
+)
+def list_members(
+    list_id: int = Path(..., gt=0, description="ID de la lista de tareas"),
+    db: Session = Depends(deps.get_read_db_session),
+    _role: ListRole = Depends(can_view),
+) -> List[ListMemberResponse]:
+    """
+    Lista los miembros de una lista con su rol. Requiere ser miembro de la lista.
+    """
+    return get_list_members(db, list_id)
+
+
+@router.put(
+    "/{user_id}",
+    response_model=ListMemberResponse,
+    summary="Añadir un miembro o cambiar su rol",
+)
+def put_member(
+    list_id: int = Path(..., gt=0, description="ID de la lista de tareas"),
+    user_id: int = Path(..., gt=0, description="ID del usuario"),
+    member: ListMemberRequest = Body(...),
+    db: Session = Depends(deps.get_db_session),
+    _role: ListRole = Depends(is_owner),
+) -> ListMemberResponse:
+    """
+    Añade a un usuario como miembro de la lista o cambia su rol. Solo el propietario.
+
+    ## Ejemplo de cuerpo (JSON):
+    ```json
+    {
+        "role": "editor"
+    }
+    ```
+
+    ### Respuestas:
+    - ✅ **200**: Miembro añadido o actualizado; el cambio se aplica de inmediato.
+    - ❌ **404**: El usuario no existe.
+    - ❌ **409**: Se intenta degradar al único propietario.
+    """
+    return set_list_member(db, list_id, user_id, member.role)
+
+
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Quitar un miembro de una lista",
+)
+def delete_member(
+    list_id: int = Path(..., gt=0, description="ID de la lista de tareas"),
+    user_id: int = Path(..., gt=0, description="ID del usuario"),
+    db: Session = Depends(deps.get_db_session),
+    _role: ListRole = Depends(is_owner),
+):
+    """
+    Quita a un usuario de la lista. Solo el propietario.
+
+    - Responde 404 si el usuario no es miembro y 409 si es el único propietario.
+    """
+    remove_list_member(db, list_id, user_id)
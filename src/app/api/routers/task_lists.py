@@ -7,22 +7,28 @@ de tareas con filtros de completitud y prioridad.
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Body, Depends, Path, Query, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.api.schemas.task_list import (
+    TaskListCloneRequest,
+    TaskListCloneResponse,
+    TaskListPageResponse,
     TaskListRequest,
     TaskListResponse,
     TaskListWithCompletionResponse,
 )
 from app.core.auth.dependencies import get_current_user
-from app.core.constants import PriorityLevel
+from app.core.auth.permissions import can_edit, can_view, is_owner
+from app.core.constants import ListRole, PriorityLevel, TaskSortField
 from app.infrastructure.db.models.user import UserModel
 
 from app.infrastructure.db.crud.task_list import (
+    clone_task_list,
     create_task_list,
     delete_task_list,
+    get_user_lists,
     get_task_list,
     get_tasks_with_filters,
     update_task_list,
@@ -41,10 +47,11 @@ router = APIRouter(prefix="/lists", tags=["Task Lists"])
 def create_list(
     list_data: TaskListRequest,
     db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    current_user: UserModel = Depends(get_current_user),
 ) -> TaskListResponse:
     """
-    Crea una nueva lista de tareas para organizar tus actividades.
+    Crea una nueva lista de tareas para organizar tus actividades. El usuario
+    autenticado queda como propietario.
 
     ## Ejemplo de cuerpo (JSON):
     ```json
@@ -65,7 +72,45 @@ def create_list(
     - ❌ **400**: Datos inválidos en la solicitud.
     - ❌ **500**: Error interno al crear la lista.
     """
-    return create_task_list(db, list_data)
+    return create_task_list(db, list_data, owner_id=current_user.id)
+
+
+@router.get(
+    "/mine",
+    response_model=TaskListPageResponse,
+    summary="Listar mis listas de tareas",
+)
+def list_my_lists(
+    limit: int = Query(50, ge=1, le=200, description="Listas por página"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página anterior"),
+    db: Session = Depends(deps.get_read_db_session),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskListPageResponse:
+    """
+    Lista las listas de tareas de las que el usuario autenticado es miembro,
+    ordenadas por ID, con su rol, el número de tareas y el porcentaje de completitud
+    de cada una.
+
+    Las estadísticas de toda la página se calculan en una sola consulta. Para pedir
+    la siguiente página se envía el `next_cursor` recibido.
+
+    ### Parámetros:
+    - `limit`: Tamaño de página (1-200).
+    - `cursor`: Cursor opaco devuelto por la página anterior.
+
+    ### Ejemplo de respuesta:
+    ```json
+    {
+      "lists": [
+        {"id": 3, "name": "Casa", "role": "owner", "task_count": 5,
+         "done_count": 3, "completion_percentage": 60.0}
+      ],
+      "next_cursor": null
+    }
+    ```
+    """
+    lists, next_cursor = get_user_lists(db, current_user.id, limit=limit, cursor=cursor)
+    return {"lists": lists, "next_cursor": next_cursor}
 
 
 @router.get(
@@ -73,8 +118,8 @@ def create_list(
 )
 def get_list(
     list_id: int = Path(..., gt=0, description="ID de la lista de tareas"),
-    db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(deps.get_read_db_session),
+    _role: ListRole = Depends(can_view),
 ) -> TaskListResponse:
     """
     Obtiene una lista de tareas por su ID.
@@ -93,7 +138,7 @@ def update_list(
     list_id: int = Path(..., gt=0, description="ID de la lista de tareas a actualizar"),
     list_data: TaskListRequest = ...,
     db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(can_edit),
 ) -> TaskListResponse:
     """
     Actualiza el nombre de una lista de tareas existente.
@@ -116,16 +161,63 @@ def update_list(
 def delete_list(
     list_id: int = Path(..., gt=0, description="ID de la lista de tareas a eliminar"),
     db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(is_owner),
 ):
     """
     Elimina una lista de tareas por su ID.
 
+    - Solo puede hacerlo su propietario.
     - No retorna contenido si es exitosa.
+    - Responde 409 si la lista todavía tiene tareas.
     """
     delete_task_list(db, list_id)
 
 
+@router.post(
+    "/{list_id}/clone",
+    response_model=TaskListCloneResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Duplicar una lista de tareas",
+)
+def clone_list(
+    list_id: int = Path(..., gt=0, description="ID de la lista a duplicar"),
+    clone_data: TaskListCloneRequest = Body(default_factory=TaskListCloneRequest),
+    db: Session = Depends(deps.get_db_session),
+    current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(can_view),
+) -> TaskListCloneResponse:
+    """
+    Duplica una lista de tareas (por ejemplo, una plantilla) junto con todas sus tareas.
+
+    La copia se realiza en la base de datos con sentencias `INSERT ... SELECT`,
+    sin importar cuántas tareas tenga la lista. El usuario queda como propietario de
+    la nueva lista.
+
+    ## Ejemplo de cuerpo (JSON, opcional):
+    ```json
+    {
+        "name": "Sprint 12",
+        "reset_status": true
+    }
+    ```
+
+    - `name`: nombre de la nueva lista (por defecto, el de la original).
+    - `reset_status`: si es `true` (por defecto), las tareas copiadas quedan pendientes.
+
+    ### Respuestas:
+    - ✅ **201**: Lista copiada; incluye `copied_tasks`.
+    - ❌ **404**: La lista origen no existe.
+    """
+    new_list, copied = clone_task_list(
+        db,
+        list_id,
+        created_by_id=current_user.id,
+        name=clone_data.name,
+        reset_status=clone_data.reset_status,
+    )
+    return {**new_list._asdict(), "copied_tasks": copied}
+
+
 @router.get(
     "/",
     response_model=TaskListWithCompletionResponse,
@@ -137,8 +229,15 @@ def list_tasks(
     priority: Optional[PriorityLevel] = Query(
         None, description="Filtrar por prioridad (ej: alta, media, baja)"
     ),
-    db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    sort: Optional[TaskSortField] = Query(
+        None,
+        description=(
+            "Ordenar tareas (`rank`: orden manual definido por el usuario; "
+            "`priority`: de mayor a menor prioridad)"
+        ),
+    ),
+    db: Session = Depends(deps.get_read_db_session),
+    _role: ListRole = Depends(can_view),
 ) -> TaskListWithCompletionResponse:
     """
     Lista las tareas asociadas a una lista específica, con opción de filtros por estado y prioridad.
@@ -148,6 +247,8 @@ def list_tasks(
     ### Parámetros:
     - `is_done`: Filtra tareas completadas o no.
     - `priority`: Filtra por nivel de prioridad.
+    - `sort`: `rank` devuelve las tareas en el orden manual de la lista; `priority`,
+      de mayor a menor prioridad.
 
     ### Ejemplo de respuesta:
     ```json
@@ -157,5 +258,5 @@ def list_tasks(
     }
     ```
     """
-    tasks, percentage = get_tasks_with_filters(db, list_id, is_done, priority)
+    tasks, percentage = get_tasks_with_filters(db, list_id, is_done, priority, sort)
     return {"tasks": tasks, "completion_percentage": percentage}
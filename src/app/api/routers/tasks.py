@@ -6,26 +6,54 @@ y cambio de estado de tareas en listas específicas.
 """
 
 import logging
+from typing import Optional
 
-from fastapi import APIRouter, Body, Depends, Path, status, HTTPException
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+    status,
+)
 from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.api.schemas.task import (
+    ArchivedTaskPageResponse,
     StatusChangeRequest,
     TaskCreate,
+    TaskHistoryPageResponse,
+    TaskMoveRequest,
+    TaskMoveResponse,
+    TaskPositionRequest,
     TaskResponse,
+    TaskSearchResponse,
     TaskUpdate,
 )
 from app.domain.models.exceptions import TaskNotFoundException
 from app.core.auth.dependencies import get_current_user
+from app.core.auth.permissions import can_edit, can_view
+from app.core.constants import ListRole
+from app.core.etag import format_etag, parse_if_match
+from app.infrastructure.db.crud.archive import (
+    get_archived_tasks,
+    restore_archived_task,
+)
+from app.infrastructure.db.crud.ordering import move_task
 from app.infrastructure.db.crud.task import (
     create_task,
     delete_task,
     get_task,
+    move_tasks,
+    search_tasks,
     update_task,
     update_task_status,
 )
+from app.infrastructure.db.crud.task_history import get_task_history
 from app.infrastructure.db.models.user import UserModel
 
 logger = logging.getLogger(__name__)
@@ -39,13 +67,16 @@ router = APIRouter(prefix="/lists/{list_id}/tasks", tags=["Tasks"])
     status_code=status.HTTP_201_CREATED,
     summary="Crear una nueva tarea",
 )
-def create_task_endpoint(
+def create_task_endpoint(  # pylint: disable=too-many-arguments
+    *,
+    response: Response,
     list_id: int = Path(
         ..., gt=0, description="ID de la lista a la que pertenece la tarea"
     ),
     task: TaskCreate = Body(..., description="Datos de la nueva tarea"),
     db: Session = Depends(deps.get_db_session),
     current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(can_edit),
 ) -> TaskResponse:
     """
     Crear una nueva tarea en una lista específica.
@@ -82,47 +113,208 @@ def create_task_endpoint(
     ```
 
     ## Respuesta
-    Retorna un objeto con los detalles de la tarea recién creada.
+    Retorna un objeto con los detalles de la tarea recién creada. La cabecera `ETag`
+    contiene su versión, para enviarla en `If-Match` al modificarla.
     """
 
     logger.info("Creating task in list %d: %s", list_id, task.dict())
     try:
-        return create_task(db, list_id, task, created_by_id=current_user.id)
+        created = create_task(db, list_id, task, created_by_id=current_user.id)
     except HTTPException:
         raise
     except Exception as e:
         logger.error("Unexpected error creating task: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
+    response.headers["ETag"] = format_etag(created.version)
+    return created
+
+
+@router.post(
+    "/move",
+    response_model=TaskMoveResponse,
+    summary="Mover tareas a otra lista",
+)
+def move_tasks_endpoint(
+    list_id: int = Path(..., gt=0, description="ID de la lista origen"),
+    move_request: TaskMoveRequest = Body(...),
+    db: Session = Depends(deps.get_db_session),
+    current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(can_edit),
+) -> TaskMoveResponse:
+    """
+    Mueve un conjunto de tareas de la lista `list_id` a otra lista.
+
+    Todas las tareas se re-asignan con una única sentencia `UPDATE`, que las coloca
+    al final de la lista destino en el orden que tenían en la origen. Las tareas
+    que no pertenecen a la lista origen se ignoran.
+
+    ## Ejemplo de solicitud
+    ```json
+    {
+        "task_ids": [10, 11, 12],
+        "target_list_id": 7
+    }
+    ```
+
+    ## Respuesta
+    Número de tareas movidas (`moved`). Retorna 404 si la lista destino no existe o
+    el usuario no puede editarla.
+    """
+    logger.info(
+        "Moving tasks %s from list %d to list %d",
+        move_request.task_ids,
+        list_id,
+        move_request.target_list_id,
+    )
+    moved = move_tasks(
+        db,
+        list_id,
+        move_request.task_ids,
+        move_request.target_list_id,
+        user_id=current_user.id,
+    )
+    return {"moved": moved}
+
+
+@router.get(
+    "/search",
+    response_model=TaskSearchResponse,
+    summary="Buscar tareas por texto",
+)
+def search_tasks_endpoint(
+    list_id: int = Path(..., gt=0),
+    q: str = Query(..., min_length=1, max_length=200, description="Texto a buscar"),
+    limit: int = Query(20, ge=1, le=100, description="Resultados por página"),
+    offset: int = Query(0, ge=0, description="Resultados a omitir"),
+    db: Session = Depends(deps.get_read_db_session),
+    _role: ListRole = Depends(can_view),
+) -> TaskSearchResponse:
+    """
+    Busca tareas de una lista por texto en su título y descripción.
+
+    La búsqueda usa un índice de texto completo (`tsvector` + GIN en PostgreSQL,
+    FTS5 en SQLite) y devuelve los resultados ordenados por relevancia.
+
+    ### Parámetros:
+    - `q`: texto a buscar.
+    - `limit`: número máximo de resultados (1-100).
+    - `offset`: resultados a omitir para paginar.
+    """
+    logger.info("Searching tasks in list %d: %r", list_id, q)
+    tasks = search_tasks(db, list_id, q, limit=limit, offset=offset)
+    return {"tasks": tasks, "limit": limit, "offset": offset}
+
+
+@router.get(
+    "/archived",
+    response_model=ArchivedTaskPageResponse,
+    summary="Listar tareas archivadas",
+)
+def list_archived_tasks(
+    list_id: int = Path(..., gt=0),
+    limit: int = Query(50, ge=1, le=200, description="Tareas por página"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página anterior"),
+    db: Session = Depends(deps.get_read_db_session),
+    _role: ListRole = Depends(can_view),
+) -> ArchivedTaskPageResponse:
+    """
+    Lista las tareas completadas que fueron archivadas en una lista.
+
+    Las tareas completadas hace más de `ARCHIVE_AFTER_DAYS` días se mueven
+    periódicamente al archivo y dejan de aparecer en el listado habitual, aunque
+    siguen contando en el porcentaje de completitud.
+    """
+    logger.info("Listing archived tasks from list %d", list_id)
+    tasks, next_cursor = get_archived_tasks(db, list_id, limit=limit, cursor=cursor)
+    return {"tasks": tasks, "next_cursor": next_cursor}
+
+
+@router.post(
+    "/archived/{task_id}/restore",
+    response_model=TaskResponse,
+    summary="Restaurar una tarea archivada",
+)
+def restore_archived_task_endpoint(
+    response: Response,
+    list_id: int = Path(..., gt=0),
+    task_id: int = Path(..., gt=0),
+    db: Session = Depends(deps.get_db_session),
+    _role: ListRole = Depends(can_edit),
+) -> TaskResponse:
+    """
+    Devuelve una tarea archivada a la lista, conservando su ID. La cabecera `ETag`
+    contiene su nueva versión.
+    """
+    logger.info("Restoring archived task %d in list %d", task_id, list_id)
+    task = restore_archived_task(db, list_id, task_id)
+    response.headers["ETag"] = format_etag(task.version)
+    return task
 
 
 @router.get("/{task_id}", response_model=TaskResponse, summary="Obtener una tarea")
 def get_task_endpoint(
+    response: Response,
     list_id: int = Path(..., gt=0),
     task_id: int = Path(..., gt=0),
-    db: Session = Depends(deps.get_db_session),
-    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(deps.get_read_db_session),
+    _role: ListRole = Depends(can_view),
 ) -> TaskResponse:
     """
     Obtiene una tarea por su ID y el ID de su lista.
+
+    La cabecera `ETag` de la respuesta contiene la versión de la tarea, que puede
+    enviarse en `If-Match` al modificarla.
     """
     logger.info("Fetching task %d from list %d", task_id, list_id)
     task = get_task(db, list_id, task_id)
     if not task:
         raise TaskNotFoundException(task_id)
 
-    if task.created_by != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
+    response.headers["ETag"] = format_etag(task.version)
     return task
 
 
+@router.get(
+    "/{task_id}/history",
+    response_model=TaskHistoryPageResponse,
+    summary="Historial de cambios de una tarea",
+)
+def get_task_history_endpoint(
+    list_id: int = Path(..., gt=0),
+    task_id: int = Path(..., gt=0),
+    limit: int = Query(50, ge=1, le=200, description="Cambios por página"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página anterior"),
+    db: Session = Depends(deps.get_read_db_session),
+    _role: ListRole = Depends(can_view),
+) -> TaskHistoryPageResponse:
+    """
+    Lista los cambios de una tarea de la lista, del más reciente al más antiguo,
+    incluso si la tarea ya fue eliminada.
+
+    Cada cambio indica quién lo hizo, cuándo, la versión resultante y, en `changes`,
+    los campos que cambiaron como `[anterior, nuevo]` (al crear, su valor). Los
+    cambios se registran en segundo plano y pueden tardar hasta
+    `TASK_HISTORY_FLUSH_INTERVAL` segundos en aparecer.
+    """
+    logger.info("Fetching history of task %d in list %d", task_id, list_id)
+    entries, next_cursor = get_task_history(
+        db, list_id, task_id, limit=limit, cursor=cursor
+    )
+    return {"entries": entries, "next_cursor": next_cursor}
+
+
 @router.put("/{task_id}", response_model=TaskResponse, summary="Actualizar una tarea")
-def update_task_endpoint(
+def update_task_endpoint(  # pylint: disable=too-many-arguments
+    *,
+    response: Response,
     list_id: int = Path(..., gt=0),
     task_id: int = Path(..., gt=0),
     task: TaskUpdate = Body(...),
+    if_match: Optional[str] = Header(
+        None, description="ETag (versión) de la tarea que se modifica"
+    ),
     db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(can_edit),
 ) -> TaskResponse:
     """
     Actualiza una tarea existente dentro de una lista.
@@ -138,11 +330,15 @@ def update_task_endpoint(
 
     ### Campos **no actualizables** desde este endpoint:
     - `id`: ID de la tarea.
-    - `list_id`: ID de la lista (no se permite mover la tarea a otra lista).
+    - `list_id`: ID de la lista (para mover tareas use `POST /lists/{list_id}/tasks/move`).
     - `created_by`: usuario creador (lo determina el sistema).
     - `created_at`: fecha de creación (autogenerada).
     - `updated_at`: fecha de modificación (autogenerada).
 
+    ### Concurrencia:
+    Si se envía `If-Match` con el `ETag` obtenido al leer la tarea, la actualización
+    solo se aplica si nadie la modificó entretanto; si no, responde 409.
+
     Retorna la tarea actualizada o un error si no se encuentra.
     """
     logger.info(
@@ -151,10 +347,8 @@ def update_task_endpoint(
         list_id,
         task.dict(exclude_unset=True),
     )
-    updated_task = update_task(db, list_id, task_id, task)
-    if not updated_task:
-        raise TaskNotFoundException(task_id)
-
+    updated_task = update_task(db, list_id, task_id, task, parse_if_match(if_match))
+    response.headers["ETag"] = format_etag(updated_task.version)
     return updated_task
 
 
@@ -165,7 +359,7 @@ def delete_task_endpoint(
     list_id: int = Path(..., gt=0),
     task_id: int = Path(..., gt=0),
     db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(can_edit),
 ):
     """
     Elimina una tarea específica por ID dentro de una lista.
@@ -181,15 +375,22 @@ def delete_task_endpoint(
     response_model=TaskResponse,
     summary="Cambiar estado de una tarea",
 )
-def change_task_status(
+def change_task_status(  # pylint: disable=too-many-arguments
+    *,
+    response: Response,
     list_id: int = Path(..., gt=0),
     task_id: int = Path(..., gt=0),
     status_request: StatusChangeRequest = Body(...),
+    if_match: Optional[str] = Header(
+        None, description="ETag (versión) de la tarea que se modifica"
+    ),
     db: Session = Depends(deps.get_db_session),
-    _current_user: UserModel = Depends(get_current_user),
+    _role: ListRole = Depends(can_edit),
 ) -> TaskResponse:
     """
     Cambia el estado de completitud (`is_done`) de una tarea específica.
+
+    Con `If-Match` el cambio solo se aplica si la versión coincide (si no, 409).
     """
     logger.info(
         "Changing status of task %d in list %d to: %s",
@@ -197,7 +398,43 @@ def change_task_status(
         list_id,
         status_request.is_done,
     )
-    task = update_task_status(db, list_id, task_id, status_request.is_done)
-    if not task:
-        raise TaskNotFoundException(task_id)
+    task = update_task_status(
+        db, list_id, task_id, status_request.is_done, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = format_etag(task.version)
     return task
+
+
+@router.patch(
+    "/{task_id}/position",
+    response_model=TaskResponse,
+    summary="Cambiar la posición de una tarea",
+)
+def change_task_position(
+    list_id: int = Path(..., gt=0),
+    task_id: int = Path(..., gt=0),
+    position_request: TaskPositionRequest = Body(...),
+    db: Session = Depends(deps.get_db_session),
+    _role: ListRole = Depends(can_edit),
+) -> TaskResponse:
+    """
+    Mueve una tarea dentro del orden manual de su lista (arrastrar y soltar).
+
+    Solo se actualiza la fila de la tarea movida: recibe una clave de orden
+    fraccional entre la de `after_id` y la siguiente.
+
+    ## Ejemplo de solicitud
+    ```json
+    {
+        "after_id": 42
+    }
+    ```
+    Con `"after_id": null` la tarea pasa al inicio de la lista.
+    """
+    logger.info(
+        "Moving task %d in list %d after task %s",
+        task_id,
+        list_id,
+        position_request.after_id,
+    )
+    return move_task(db, list_id, task_id, position_request.after_id)
@@ -0,0 +1,51 @@
+"""
+Esquemas Pydantic de los endpoints de administración.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SlowQueryResponse(BaseModel):
+    """Estadísticas de una huella de consulta lenta"""
+
+    id: str = Field(..., description="Identificador de la huella")
+    fingerprint: str = Field(..., description="Sentencia normalizada")
+    sample: str = Field(..., description="Primera sentencia lenta observada")
+    count: int = Field(..., description="Ejecuciones por encima del umbral")
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    last_seen: Optional[datetime] = None
+    explain: Optional[str] = Field(None, description="Plan de ejecución (PostgreSQL)")
+
+    model_config = {"from_attributes": True}
+
+
+class SlowQueryReport(BaseModel):
+    """Informe de las consultas más lentas del proceso"""
+
+    threshold_ms: float = Field(..., description="Umbral de registro (0 = desactivado)")
+    queries: List[SlowQueryResponse]
+
+
+class UnownedListResponse(BaseModel):
+    """Lista de tareas sin propietario"""
+
+    id: int
+    name: str
+    color_tag: Optional[str] = None
+    category: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class UnownedListPage(BaseModel):
+    """Página de listas sin propietario"""
+
+    lists: List[UnownedListResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor para pedir la siguiente página"
+    )
@@ -0,0 +1,92 @@
+"""
+Esquemas Pydantic del endpoint de operaciones por lotes sobre tareas.
+"""
+
+from typing import Annotated, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from app.api.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+
+MAX_BATCH_OPERATIONS = 200
+
+
+class CreateTaskOperation(BaseModel):
+    """Operación que crea una tarea en una lista"""
+
+    op: Literal["create"]
+    list_id: int = Field(..., gt=0)
+    task: TaskCreate
+
+
+class UpdateTaskOperation(BaseModel):
+    """Operación que actualiza parcialmente una tarea"""
+
+    op: Literal["update"]
+    list_id: int = Field(..., gt=0)
+    task_id: int = Field(..., gt=0)
+    task: TaskUpdate
+    version: Optional[int] = Field(
+        None, description="Versión esperada de la tarea (equivalente a `If-Match`)"
+    )
+
+
+class StatusTaskOperation(BaseModel):
+    """Operación que cambia el estado de una tarea"""
+
+    op: Literal["status"]
+    list_id: int = Field(..., gt=0)
+    task_id: int = Field(..., gt=0)
+    is_done: bool
+    version: Optional[int] = Field(
+        None, description="Versión esperada de la tarea (equivalente a `If-Match`)"
+    )
+
+
+class DeleteTaskOperation(BaseModel):
+    """Operación que elimina una tarea"""
+
+    op: Literal["delete"]
+    list_id: int = Field(..., gt=0)
+    task_id: int = Field(..., gt=0)
+
+
+BatchOperation = Annotated[
+    Union[
+        CreateTaskOperation,
+        UpdateTaskOperation,
+        StatusTaskOperation,
+        DeleteTaskOperation,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class BatchRequest(BaseModel):
+    """Request con la lista ordenada de operaciones a ejecutar"""
+
+    operations: List[BatchOperation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS
+    )
+    atomic: bool = Field(
+        False,
+        description="Si es true, un error en cualquier operación deshace todo el lote",
+    )
+
+
+class BatchOperationResult(BaseModel):
+    """Resultado de una operación del lote"""
+
+    index: int = Field(..., description="Posición de la operación en el lote")
+    status: int = Field(..., description="Código HTTP equivalente al de la operación")
+    task: Optional[TaskResponse] = None
+    detail: Optional[str] = Field(None, description="Mensaje de error, si falló")
+
+
+class BatchResponse(BaseModel):
+    """Response con el resultado de cada operación, en el orden recibido"""
+
+    committed: bool = Field(
+        ..., description="False si el lote atómico se deshizo por un error"
+    )
+    results: List[BatchOperationResult]
@@ -0,0 +1,30 @@
+"""
+Esquemas de Pydantic para los miembros de las listas de tareas y sus roles.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.core.constants import ListRole
+
+
+class ListMemberRequest(BaseModel):
+    """
+    Esquema para añadir un miembro a una lista o cambiar su rol.
+    """
+
+    role: ListRole = Field(..., description="Rol del usuario en la lista")
+
+
+class ListMemberResponse(BaseModel):
+    """
+    Esquema de respuesta que representa a un miembro de una lista.
+    """
+
+    user_id: int
+    list_id: int
+    role: ListRole
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -2,12 +2,21 @@
 Esquemas Pydantic para crear, actualizar y representar tareas en TidyTasks.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
-from app.core.constants import PriorityLevel
+from app.core.constants import PriorityLevel, TaskHistoryAction
+
+
+def _to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convierte una fecha a UTC; las que no indican zona horaria se toman como UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
 
 class TaskBase(BaseModel):
@@ -25,6 +34,11 @@ class TaskBase(BaseModel):
     assigned_to: Optional[int] = Field(
         default=None, description="ID del usuario asignado", example=None
     )
+    due_at: Optional[datetime] = Field(
+        default=None, description="Fecha límite (UTC si no se indica zona horaria)"
+    )
+
+    _due_at_utc = field_validator("due_at")(_to_utc)
 
 
 class TaskCreate(TaskBase):
@@ -41,6 +55,12 @@ class TaskUpdate(BaseModel):
         default=None, description="ID del usuario asignado", example=None
     )
     is_done: Optional[bool]
+    due_at: Optional[datetime] = Field(
+        None,
+        description="Fecha límite (null para quitarla); reprograma el recordatorio",
+    )
+
+    _due_at_utc = field_validator("due_at")(_to_utc)
 
 
 class TaskResponse(TaskBase):
@@ -52,13 +72,110 @@ class TaskResponse(TaskBase):
         default=None, description="ID del usuario asignado", example=None
     )
     list_id: int
+    rank: Optional[str] = Field(
+        default=None, description="Clave de orden manual dentro de la lista"
+    )
     created_by: int
+    version: int = Field(
+        ..., description="Versión de la tarea; se envía en `If-Match` al modificarla"
+    )
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class TaskSearchResponse(BaseModel):
+    """Response paginada de la búsqueda de tareas"""
+
+    tasks: List[TaskResponse]
+    limit: int
+    offset: int
+
+
+class TaskPageResponse(BaseModel):
+    """Response paginada por cursor de tareas"""
+
+    tasks: List[TaskResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor para pedir la siguiente página"
+    )
+
+
+class ArchivedTaskResponse(TaskResponse):
+    """Response al obtener una tarea archivada"""
+
+    archived_at: datetime
+
+
+class ArchivedTaskPageResponse(BaseModel):
+    """Response paginada por cursor de tareas archivadas"""
+
+    tasks: List[ArchivedTaskResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor para pedir la siguiente página"
+    )
+
+
+class TaskHistoryEntryResponse(BaseModel):
+    """Response con un cambio del historial de una tarea"""
+
+    id: int
+    task_id: int
+    list_id: int
+    version: Optional[int] = Field(
+        None,
+        description="Versión resultante del cambio (al borrar, la siguiente a la última)",
+    )
+    action: TaskHistoryAction
+    changed_by: Optional[int] = Field(
+        None, description="ID del usuario que hizo el cambio"
+    )
+    changed_at: datetime
+    changes: Optional[dict[str, Any]] = Field(
+        None,
+        description=(
+            "Campos que cambiaron como `[anterior, nuevo]` (al crear, su valor)"
+        ),
+    )
+
+    model_config = {"from_attributes": True}
+
+
+class TaskHistoryPageResponse(BaseModel):
+    """Response paginada por cursor del historial de una tarea"""
+
+    entries: List[TaskHistoryEntryResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor para pedir la siguiente página"
+    )
+
+
+class TaskMoveRequest(BaseModel):
+    """Request para mover tareas a otra lista"""
+
+    task_ids: List[int] = Field(
+        ..., min_length=1, max_length=1000, description="IDs de las tareas a mover"
+    )
+    target_list_id: int = Field(..., gt=0, description="ID de la lista destino")
+
+
+class TaskMoveResponse(BaseModel):
+    """Response con el número de tareas movidas"""
+
+    moved: int
+
+
+class TaskPositionRequest(BaseModel):
+    """Request para cambiar la posición de una tarea en el orden manual"""
+
+    after_id: Optional[int] = Field(
+        None,
+        gt=0,
+        description="ID de la tarea que quedará antes (null para moverla al inicio)",
+    )
+
+
 class StatusChangeRequest(BaseModel):
     """Request para cambiar estado de tarea"""
 
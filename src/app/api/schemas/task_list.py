@@ -7,7 +7,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 from app.api.schemas.task import TaskResponse
-from app.core.constants import ColorTagEnum
+from app.core.constants import ColorTagEnum, ListRole
 
 
 class TaskListResponse(BaseModel):
@@ -19,6 +19,7 @@ class TaskListResponse(BaseModel):
     name: str
     color_tag: Optional[str] = None
     category: Optional[str] = None
+    owner_id: Optional[int] = None
     tasks: List[TaskResponse] = []
 
     model_config = {"from_attributes": True}
@@ -35,6 +36,63 @@ class TaskListWithCompletionResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TaskListSummaryResponse(BaseModel):
+    """
+    Esquema de respuesta con los datos de una lista, el rol del usuario en ella y sus
+    estadísticas de tareas (las archivadas cuentan como completadas).
+    """
+
+    id: int
+    name: str
+    color_tag: Optional[str] = None
+    category: Optional[str] = None
+    owner_id: Optional[int] = None
+    role: ListRole
+    task_count: int
+    done_count: int
+    completion_percentage: float
+
+
+class TaskListPageResponse(BaseModel):
+    """
+    Esquema de respuesta paginada por cursor de las listas del usuario.
+    """
+
+    lists: List[TaskListSummaryResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor para pedir la siguiente página"
+    )
+
+
+class TaskListCloneRequest(BaseModel):
+    """
+    Esquema para la solicitud de copia de una lista de tareas.
+    """
+
+    name: Optional[str] = Field(
+        None,
+        min_length=3,
+        max_length=50,
+        description="Nombre de la nueva lista (por defecto, el de la original)",
+    )
+    reset_status: bool = Field(
+        True, description="Marcar como pendientes las tareas copiadas"
+    )
+
+
+class TaskListCloneResponse(BaseModel):
+    """
+    Esquema de respuesta con la lista creada por una copia y el número de tareas copiadas.
+    """
+
+    id: int
+    name: str
+    color_tag: Optional[str] = None
+    category: Optional[str] = None
+    owner_id: Optional[int] = None
+    copied_tasks: int
+
+
 class TaskListRequest(BaseModel):
     """
     Esquema para la solicitud de creación de una nueva lista de tareas.
@@ -6,17 +6,19 @@ y verifica su validez utilizando `verify_token`. Si el token es válido y el usu
 existe en la base de datos, se retorna el usuario; de lo contrario, lanza un error 401.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from app.core.auth.jwt import verify_token
+from app.core.tracing import traced
 from app.infrastructure.db.session import get_db
 from app.infrastructure.db.models.user import UserModel
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
+@traced("dependency", name="get_current_user")
 def get_current_user(
     token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
 ) -> UserModel:
@@ -59,4 +61,30 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Usuario no encontrado"
         )
 
+    # Las escrituras de la sesión fijan a este usuario al primario (read-your-writes).
+    db.info["user_id"] = user.id
     return user
+
+
+def get_current_admin(
+    request: Request, current_user: UserModel = Depends(get_current_user)
+) -> UserModel:
+    """
+    Exige que el usuario autenticado sea administrador (`admin_usernames`).
+
+    Args:
+        request (Request): Petición (para leer la configuración de la aplicación).
+        current_user (UserModel): Usuario autenticado.
+
+    Raises:
+        HTTPException: 403 si el usuario no es administrador.
+
+    Returns:
+        UserModel: Usuario administrador.
+    """
+    if current_user.username not in request.app.state.settings.admin_usernames:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Acceso restringido a administradores",
+        )
+    return current_user
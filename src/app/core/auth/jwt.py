@@ -4,6 +4,7 @@ Módulo de autenticación basado en JWT.
 Este archivo proporciona funciones para:
 - Crear tokens de acceso (`create_access_token`)
 - Verificar y decodificar tokens (`verify_token`)
+- Obtener el usuario de la cabecera `Authorization` (`user_id_from_authorization`)
 
 Usa el estándar JWT (JSON Web Token) con algoritmo HS256 para firmar y validar tokens.
 La clave secreta y el tiempo de expiración se configuran mediante variables de entorno.
@@ -11,6 +12,8 @@ La clave secreta y el tiempo de expiración se configuran mediante variables de
 
 import os
 from datetime import datetime, timedelta
+from typing import Optional
+
 from jose import JWTError, jwt
 from dotenv import load_dotenv
 
@@ -53,3 +56,26 @@ def verify_token(token: str) -> dict | None:
         return payload
     except JWTError:
         return None
+
+
+def user_id_from_authorization(authorization: Optional[str]) -> Optional[int]:
+    """
+    Obtiene el ID de usuario de una cabecera `Authorization: Bearer <token>`.
+
+    Solo valida el token (firma y expiración), no que el usuario exista; lo usan los
+    middlewares que necesitan identificar al cliente antes de llegar al endpoint.
+
+    Args:
+        authorization (Optional[str]): Valor de la cabecera `Authorization`.
+
+    Returns:
+        Optional[int]: ID del usuario, o None si no hay un token válido.
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = verify_token(token)
+    try:
+        return int(payload["sub"]) if payload else None
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,51 @@
+"""
+Dependencias de autorización por lista de tareas.
+
+Cada ruta de una lista declara el rol mínimo que exige (`can_view`, `can_edit`,
+`is_owner`). El rol del usuario autenticado en la lista se resuelve con la caché de
+pertenencias (`app.infrastructure.db.crud.membership`), así que con la caché caliente
+la comprobación no añade consultas a la petición. Quien no es miembro recibe 404,
+como si la lista no existiera; quien no alcanza el rol, 403.
+"""
+
+from typing import Callable
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.core.auth.dependencies import get_current_user
+from app.core.constants import ListRole
+from app.core.tracing import traced
+from app.infrastructure.db.crud.membership import check_list_role, get_list_roles
+from app.infrastructure.db.models.user import UserModel
+from app.infrastructure.db.session import get_db
+
+
+def require_list_role(required: ListRole) -> Callable[..., ListRole]:
+    """
+    Construye la dependencia que exige el rol `required` en la lista `list_id` de la
+    ruta (parámetro de ruta o de consulta).
+
+    Args:
+        required (ListRole): Rol mínimo.
+
+    Returns:
+        Callable[..., ListRole]: Dependencia que devuelve el rol del usuario.
+    """
+
+    @traced("dependency", name="authorize_list")
+    def authorize_list(
+        list_id: int,
+        current_user: UserModel = Depends(get_current_user),
+        db: Session = Depends(get_db),
+    ) -> ListRole:
+        role = get_list_roles(db, current_user.id, [list_id])[list_id]
+        check_list_role(list_id, role, required)
+        return role
+
+    return authorize_list
+
+
+can_view = require_list_role(ListRole.VIEWER)
+can_edit = require_list_role(ListRole.EDITOR)
+is_owner = require_list_role(ListRole.OWNER)
@@ -0,0 +1,191 @@
+"""
+Configuración de la aplicación TidyTasks.
+
+Los valores se leen de variables de entorno (y del archivo `.env`) mediante
+`pydantic-settings`. `get_settings` devuelve una instancia compartida; las pruebas
+y herramientas pueden construir su propio `Settings` y pasarlo a `create_app`.
+"""
+
+from functools import lru_cache
+from typing import Literal, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    Parámetros de configuración de TidyTasks.
+
+    Atributos:
+        db, userdb, passworddb, name_servicedb, port, namedb: Partes de la URL de
+            conexión (`<DB>://<USERDB>:<PASSWORDDB>@<NAME_SERVICEDB>:<PORT>/<NAMEDB>`).
+        database_url (Optional[str]): URL completa; si se define, reemplaza a las partes.
+        db_pool_size, db_max_overflow, db_pool_timeout: Parámetros del pool de conexiones.
+        replica_urls (list[str]): URLs de las réplicas de lectura (vacío = sin réplicas).
+        replica_max_lag_seconds (float): Retraso máximo de una réplica en rotación.
+        replica_lag_check_interval (float): Segundos entre comprobaciones del retraso.
+        read_your_writes_seconds (float): Tiempo que un usuario lee del primario después
+            de escribir.
+        create_schema (bool): Crear las tablas faltantes al iniciar (`create_all`).
+        log_path (str): Archivo de logs; vacío para registrar solo en consola.
+        log_level (str): Nivel de logging.
+        archive_after_days, archive_batch_size: Parámetros del archivador de tareas.
+        rank_rebalance_length (int): Longitud máxima de las claves de orden.
+        idempotency_ttl_hours (int): Tiempo que se conservan las claves de idempotencia.
+        idempotency_cache_size (int): Respuestas idempotentes cacheadas en memoria (LRU).
+        idempotency_wait_timeout (float): Segundos que un reintento espera a la petición
+            original antes de responder 409.
+        rate_limit_user_rate, rate_limit_user_burst: Peticiones por segundo y ráfaga
+            máxima por usuario (tasa 0 = sin límite).
+        rate_limit_ip_rate, rate_limit_ip_burst: Ídem por dirección IP (desactivado
+            por defecto: detrás de un proxy todas las peticiones llegan de su IP salvo
+            que uvicorn se ejecute con `--proxy-headers --forwarded-allow-ips`).
+        admission_max_in_flight (int): Peticiones simultáneas antes de responder 503;
+            por debajo de los 40 hilos que usa FastAPI para los endpoints síncronos.
+        admission_max_pool_wait (float): Espera media por una conexión del pool
+            (segundos) a partir de la cual se responde 503.
+        admission_retry_after (int): Valor de `Retry-After` de las respuestas 503.
+        profiling_sample_rate (float): Fracción de peticiones que se perfilan (0 = ninguna).
+        profiling_token (Optional[str]): Valor de la cabecera `X-Profile` que fuerza el
+            perfilado de una petición; sin definir, la cabecera se ignora.
+        profiling_dir (str): Directorio donde se guardan los perfiles.
+        profiling_max_files (int): Perfiles que se conservan (se borran los más antiguos).
+        profiling_format (str): `speedscope` o `collapsed` (pilas colapsadas).
+        profiling_interval_ms (float): Milisegundos entre muestras de pila.
+        profiling_max_concurrent (int): Peticiones perfiladas a la vez, como máximo.
+        slow_query_threshold_ms (float): Duración a partir de la cual una sentencia SQL se
+            registra como lenta (0 = registro desactivado).
+        slow_query_max_fingerprints (int): Huellas de consultas lentas que se conservan.
+        slow_query_explain (bool): Capturar el plan (`EXPLAIN`) de cada huella lenta
+            nueva (solo PostgreSQL).
+        admin_usernames (list[str]): Usuarios con acceso a los endpoints `/admin`.
+        membership_cache_size (int): Roles `(usuario, lista)` cacheados en memoria (LRU;
+            0 = sin caché).
+        membership_cache_ttl_seconds (float): Segundos que un rol cacheado es válido;
+            acota cuánto tarda un cambio de rol en verse en los demás procesos.
+        outbox_dispatch_interval (float): Segundos entre pasadas del despachador de la
+            bandeja de salida dentro de la aplicación (0 = no se arranca; se ejecuta
+            aparte con `python -m app.infrastructure.jobs.outbox`).
+        outbox_batch_size (int): Eventos reclamados por lote.
+        outbox_max_attempts (int): Intentos de entrega antes de dar un evento por fallido.
+        outbox_retry_backoff_seconds (float): Espera tras el primer fallo de un evento;
+            se duplica en cada reintento.
+        outbox_claim_lease_seconds (float): Segundos que un despachador retiene los
+            eventos que reclama; deben cubrir la entrega de un lote.
+        task_history_flush_interval (float): Segundos entre escrituras por lotes del
+            historial de tareas (0 = cada cambio se escribe al registrarlo).
+        task_history_batch_size (int): Entradas pendientes que adelantan la escritura.
+        task_history_max_pending (int): Entradas retenidas en memoria si la base de datos
+            no responde (se descartan las más antiguas).
+        reminder_window_seconds (float): Segundos hacia delante de los recordatorios que
+            el planificador carga en memoria en cada lectura.
+        reminder_refresh_seconds (float): Segundos entre lecturas de la ventana de
+            recordatorios (0 = no se arranca en la aplicación; se ejecuta aparte con
+            `python -m app.infrastructure.jobs.reminders`). Debe ser menor que la ventana.
+        reminder_batch_size (int): Recordatorios reclamados y notificados por lote.
+        reminder_max_loaded (int): Recordatorios cargados en memoria como máximo.
+        tracing_exporter (str): Destino de las trazas: `none` (desactivadas), `memory`
+            (tests), `otlp-file` (OTLP/JSON en `tracing_file`) o `sentry`.
+        tracing_sample_rate (float): Fracción de peticiones trazadas cuando no llega una
+            cabecera `traceparent` (si llega, se respeta su decisión de muestreo).
+        tracing_file (str): Fichero del exportador `otlp-file`.
+        tracing_service_name (str): Nombre del servicio en las trazas.
+        tracing_environment (Optional[str]): Entorno con el que se etiquetan en Sentry.
+        sentry_dsn (Optional[str]): DSN de Sentry (exportador `sentry`).
+    """
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    db: str = "postgresql"
+    userdb: Optional[str] = None
+    passworddb: Optional[str] = None
+    name_servicedb: Optional[str] = None
+    port: Optional[int] = None
+    namedb: Optional[str] = None
+    database_url: Optional[str] = None
+
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+
+    replica_urls: list[str] = []
+    replica_max_lag_seconds: float = 5.0
+    replica_lag_check_interval: float = 5.0
+    read_your_writes_seconds: float = 5.0
+
+    create_schema: bool = False
+
+    log_path: str = "logs/app.log"
+    log_level: str = "INFO"
+
+    archive_after_days: int = 30
+    archive_batch_size: int = 500
+    rank_rebalance_length: int = 32
+
+    idempotency_ttl_hours: int = 24
+    idempotency_cache_size: int = 1024
+    idempotency_wait_timeout: float = 10.0
+
+    rate_limit_user_rate: float = 20.0
+    rate_limit_user_burst: int = 100
+    rate_limit_ip_rate: float = 0.0
+    rate_limit_ip_burst: int = 200
+
+    admission_max_in_flight: int = 32
+    admission_max_pool_wait: float = 0.5
+    admission_retry_after: int = 1
+
+    profiling_sample_rate: float = 0.0
+    profiling_token: Optional[str] = None
+    profiling_dir: str = "logs/profiles"
+    profiling_max_files: int = 100
+    profiling_format: Literal["speedscope", "collapsed"] = "speedscope"
+    profiling_interval_ms: float = 1.0
+    profiling_max_concurrent: int = 2
+
+    slow_query_threshold_ms: float = 100.0
+    slow_query_max_fingerprints: int = 500
+    slow_query_explain: bool = False
+
+    admin_usernames: list[str] = []
+
+    membership_cache_size: int = 10_000
+    membership_cache_ttl_seconds: float = 30.0
+
+    outbox_dispatch_interval: float = 1.0
+    outbox_batch_size: int = 100
+    outbox_max_attempts: int = 5
+    outbox_retry_backoff_seconds: float = 5.0
+    outbox_claim_lease_seconds: float = 60.0
+
+    task_history_flush_interval: float = 1.0
+    task_history_batch_size: int = 500
+    task_history_max_pending: int = 100_000
+
+    reminder_window_seconds: float = 300.0
+    reminder_refresh_seconds: float = 60.0
+    reminder_batch_size: int = 100
+    reminder_max_loaded: int = 10_000
+
+    tracing_exporter: Literal["none", "memory", "otlp-file", "sentry"] = "none"
+    tracing_sample_rate: float = 0.01
+    tracing_file: str = "logs/traces.jsonl"
+    tracing_service_name: str = "tidytasks"
+    tracing_environment: Optional[str] = None
+    sentry_dsn: Optional[str] = None
+
+    @property
+    def sqlalchemy_url(self) -> str:
+        """URL de conexión para SQLAlchemy."""
+        if self.database_url:
+            return self.database_url
+        return (
+            f"{self.db}://{self.userdb}:{self.passworddb}"
+            f"@{self.name_servicedb}:{self.port}/{self.namedb}"
+        )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Devuelve la configuración compartida de la aplicación."""
+    return Settings()
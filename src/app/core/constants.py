@@ -1,5 +1,6 @@
 """
-Definición de enumerados usados en TidyTasks para errores y niveles de prioridad.
+Definición de enumerados usados en TidyTasks para errores y niveles de prioridad,
+y de los códigos con los que algunos de ellos se almacenan en la base de datos.
 """
 
 from enum import Enum
@@ -34,3 +35,99 @@ class ColorTagEnum(str, Enum):
     YELLOW = "yellow"
     PURPLE = "purple"
     ORANGE = "orange"
+
+
+class TaskRelation(str, Enum):
+    """
+    Relación del usuario con una tarea en la bandeja "mis tareas".
+    """
+
+    ASSIGNED = "assigned"
+    CREATED = "created"
+
+
+class TaskSortField(str, Enum):
+    """
+    Criterios de ordenamiento disponibles al listar las tareas de una lista.
+    """
+
+    RANK = "rank"
+    PRIORITY = "priority"
+
+
+class ListRole(str, Enum):
+    """
+    Rol de un usuario en una lista de tareas, de menor a mayor privilegio.
+    """
+
+    VIEWER = "viewer"
+    EDITOR = "editor"
+    OWNER = "owner"
+
+
+class TaskHistoryAction(str, Enum):
+    """
+    Tipo de cambio registrado en el historial de una tarea.
+    """
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    MOVED = "moved"
+    ARCHIVED = "archived"
+    RESTORED = "restored"
+
+
+class OutboxTopic(str, Enum):
+    """
+    Tipos de eventos que se publican en la bandeja de salida (`outbox_events`).
+    """
+
+    TASK_ASSIGNED = "task.assigned"
+    TASK_DUE = "task.due"
+
+
+class SlowQuerySortField(str, Enum):
+    """
+    Criterios de ordenamiento del informe de consultas lentas (de mayor a menor).
+    """
+
+    TOTAL = "total_ms"
+    COUNT = "count"
+    MAX = "max_ms"
+    MEAN = "mean_ms"
+
+
+# Códigos con los que se almacenan los enumerados en la base de datos (SMALLINT).
+# Se persisten: no reutilizar ni renumerar códigos existentes, solo añadir nuevos.
+# Los de prioridad siguen el orden de importancia para poder ordenar por ellos.
+PRIORITY_CODES = {
+    PriorityLevel.LOW: 1,
+    PriorityLevel.MEDIUM: 2,
+    PriorityLevel.HIGH: 3,
+}
+
+COLOR_TAG_CODES = {
+    ColorTagEnum.RED: 1,
+    ColorTagEnum.GREEN: 2,
+    ColorTagEnum.BLUE: 3,
+    ColorTagEnum.YELLOW: 4,
+    ColorTagEnum.PURPLE: 5,
+    ColorTagEnum.ORANGE: 6,
+}
+
+# Ordenados por privilegio: un rol cumple con los de código menor o igual.
+LIST_ROLE_CODES = {
+    ListRole.VIEWER: 1,
+    ListRole.EDITOR: 2,
+    ListRole.OWNER: 3,
+}
+
+TASK_HISTORY_ACTION_CODES = {
+    TaskHistoryAction.CREATED: 1,
+    TaskHistoryAction.UPDATED: 2,
+    TaskHistoryAction.DELETED: 3,
+    TaskHistoryAction.MOVED: 4,
+    TaskHistoryAction.ARCHIVED: 5,
+    TaskHistoryAction.RESTORED: 6,
+}
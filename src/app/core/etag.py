@@ -0,0 +1,51 @@
+"""
+Utilidades de concurrencia optimista basadas en `ETag` / `If-Match`.
+
+El ETag de una tarea es su número de versión entre comillas (`"3"`). Los clientes lo
+devuelven en `If-Match` al modificarla; si la tarea cambió entretanto, la escritura
+se rechaza con 409 en lugar de sobrescribir los cambios ajenos.
+"""
+
+from typing import Optional
+
+from app.domain.models.exceptions import InvalidIfMatchException
+
+
+def format_etag(version: int) -> str:
+    """
+    Genera el ETag correspondiente a una versión.
+
+    Args:
+        version (int): Versión de la entidad.
+
+    Returns:
+        str: ETag fuerte, por ejemplo `"3"`.
+    """
+    return f'"{version}"'
+
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    """
+    Extrae la versión esperada de una cabecera `If-Match`.
+
+    Acepta `"3"`, `W/"3"` o `3`. `*` (o la ausencia de cabecera) significa
+    "cualquier versión" y devuelve None.
+
+    Args:
+        value (Optional[str]): Valor de la cabecera.
+
+    Returns:
+        Optional[int]: Versión esperada, o None si no se exige ninguna.
+
+    Raises:
+        InvalidIfMatchException: Si el valor no es una versión válida.
+    """
+    if value is None or value.strip() == "*":
+        return None
+    tag = value.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    if not tag.isdigit():
+        raise InvalidIfMatchException()
+    return int(tag)
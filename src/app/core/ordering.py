@@ -0,0 +1,195 @@
+"""
+Claves de orden fraccional (lexicográficas) para el orden manual de tareas.
+
+Implementa el esquema de "fractional indexing" en base 62: cada clave es una
+cadena que se compara byte a byte, y siempre es posible generar una clave entre
+dos claves existentes sin modificar las demás. Las claves empiezan con una parte
+entera de longitud variable (la primera letra indica su longitud), de modo que
+agregar elementos al final mantiene las claves cortas.
+"""
+
+from typing import Optional
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_ZERO = DIGITS[0]
+_SMALLEST_INTEGER = "A" + _ZERO * 26
+
+
+class OrderKeyError(ValueError):
+    """Se lanza cuando una clave de orden no es válida o no se puede generar."""
+
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    """Devuelve la parte fraccional estrictamente entre `a` y `b` (None = infinito)."""
+    if b is not None and a >= b:
+        raise OrderKeyError(f"{a!r} >= {b!r}")
+    if a.endswith(_ZERO) or (b and b.endswith(_ZERO)):
+        raise OrderKeyError("trailing zero")
+    if b:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else _ZERO) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else len(DIGITS)
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    if b and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _integer_length(head: str) -> int:
+    """Longitud de la parte entera según su primer carácter."""
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise OrderKeyError(f"invalid order key head: {head!r}")
+
+
+def _integer_part(key: str) -> str:
+    """Parte entera de una clave."""
+    length = _integer_length(key[0])
+    if length > len(key):
+        raise OrderKeyError(f"invalid order key: {key!r}")
+    return key[:length]
+
+
+def _validate(key: str) -> None:
+    """Verifica que la clave esté bien formada."""
+    if not key or key == _SMALLEST_INTEGER:
+        raise OrderKeyError(f"invalid order key: {key!r}")
+    if key[len(_integer_part(key)) :].endswith(_ZERO):
+        raise OrderKeyError(f"invalid order key: {key!r}")
+
+
+def _increment_integer(value: str) -> Optional[str]:
+    """Incrementa la parte entera; None si ya es la máxima."""
+    head, digits = value[0], list(value[1:])
+    for i in reversed(range(len(digits))):
+        index = DIGITS.index(digits[i]) + 1
+        if index < len(DIGITS):
+            digits[i] = DIGITS[index]
+            return head + "".join(digits)
+        digits[i] = _ZERO
+    if head == "Z":
+        return "a" + _ZERO
+    if head == "z":
+        return None
+    new_head = chr(ord(head) + 1)
+    if new_head > "a":
+        digits.append(_ZERO)
+    else:
+        digits.pop()
+    return new_head + "".join(digits)
+
+
+def _decrement_integer(value: str) -> Optional[str]:
+    """Decrementa la parte entera; None si ya es la mínima."""
+    head, digits = value[0], list(value[1:])
+    for i in reversed(range(len(digits))):
+        index = DIGITS.index(digits[i]) - 1
+        if index >= 0:
+            digits[i] = DIGITS[index]
+            return head + "".join(digits)
+        digits[i] = DIGITS[-1]
+    if head == "a":
+        return "Z" + DIGITS[-1]
+    if head == "A":
+        return None
+    new_head = chr(ord(head) - 1)
+    if new_head < "Z":
+        digits.append(DIGITS[-1])
+    else:
+        digits.pop()
+    return new_head + "".join(digits)
+
+
+def key_between(  # pylint: disable=too-many-return-statements
+    a: Optional[str], b: Optional[str]
+) -> str:
+    """
+    Genera una clave estrictamente entre `a` y `b`.
+
+    Args:
+        a (Optional[str]): Clave anterior, o None para insertar al inicio.
+        b (Optional[str]): Clave siguiente, o None para insertar al final.
+
+    Returns:
+        str: Nueva clave tal que `a < clave < b`.
+
+    Raises:
+        OrderKeyError: Si alguna clave no es válida o `a >= b`.
+    """
+    if a is not None:
+        _validate(a)
+    if b is not None:
+        _validate(b)
+    if a is not None and b is not None and a >= b:
+        raise OrderKeyError(f"{a!r} >= {b!r}")
+
+    if a is None:
+        if b is None:
+            return "a" + _ZERO
+        int_b = _integer_part(b)
+        if int_b == _SMALLEST_INTEGER:
+            return int_b + _midpoint("", b[len(int_b) :])
+        if int_b < b:
+            return int_b
+        decremented = _decrement_integer(int_b)
+        if decremented is None:
+            raise OrderKeyError("cannot decrement any more")
+        return decremented
+
+    int_a = _integer_part(a)
+    frac_a = a[len(int_a) :]
+    if b is None:
+        incremented = _increment_integer(int_a)
+        return int_a + _midpoint(frac_a, None) if incremented is None else incremented
+
+    int_b = _integer_part(b)
+    if int_a == int_b:
+        return int_a + _midpoint(frac_a, b[len(int_b) :])
+    incremented = _increment_integer(int_a)
+    if incremented is None:
+        raise OrderKeyError("cannot increment any more")
+    if incremented < b:
+        return incremented
+    return int_a + _midpoint(frac_a, None)
+
+
+def keys_between(a: Optional[str], b: Optional[str], n: int) -> list[str]:
+    """
+    Genera `n` claves ordenadas estrictamente entre `a` y `b`.
+
+    Args:
+        a (Optional[str]): Clave anterior, o None.
+        b (Optional[str]): Clave siguiente, o None.
+        n (int): Número de claves a generar.
+
+    Returns:
+        list[str]: Claves en orden ascendente.
+    """
+    if n <= 0:
+        return []
+    if n == 1:
+        return [key_between(a, b)]
+    if b is None:
+        keys = [key_between(a, None)]
+        for _ in range(n - 1):
+            keys.append(key_between(keys[-1], None))
+        return keys
+    if a is None:
+        keys = [key_between(None, b)]
+        for _ in range(n - 1):
+            keys.append(key_between(None, keys[-1]))
+        return list(reversed(keys))
+    mid = n // 2
+    middle = key_between(a, b)
+    return [
+        *keys_between(a, middle, mid),
+        middle,
+        *keys_between(middle, b, n - mid - 1),
+    ]
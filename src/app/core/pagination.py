@@ -0,0 +1,69 @@
+"""
+Utilidades de paginación por cursor (keyset) para los endpoints de TidyTasks.
+
+Los cursores son opacos para el cliente: codifican en base64 los valores de la
+última fila devuelta, que se usan como límite de la siguiente página.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from app.domain.models.exceptions import InvalidCursorException
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Codifica los valores de ordenamiento de la última fila en un cursor opaco.
+
+    Args:
+        *values: Valores de las columnas de ordenamiento (fechas o escalares).
+
+    Returns:
+        str: Cursor en base64 apto para URLs.
+    """
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> list[Any]:
+    """
+    Decodifica un cursor generado por `encode_cursor`.
+
+    Args:
+        cursor (str): Cursor recibido del cliente.
+        *types (type): Tipo esperado de cada valor (`datetime`, `int`...), en orden.
+
+    Returns:
+        list[Any]: Valores de ordenamiento de la última fila de la página anterior.
+
+    Raises:
+        InvalidCursorException: Si el cursor no es válido o sus valores no tienen
+            el tipo esperado.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("unexpected cursor size")
+        return [
+            _decode_value(value, expected) for value, expected in zip(payload, types)
+        ]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorException() from e
+
+
+def _decode_value(value: Any, expected: type) -> Any:
+    if expected is datetime:
+        return datetime.fromisoformat(value["dt"])
+    # `bool` es subclase de `int`: se exige el tipo exacto.
+    if type(value) is not expected:  # pylint: disable=unidiomatic-typecheck
+        raise TypeError(f"expected {expected.__name__}")
+    if expected is int and not -(2**63) <= value < 2**63:
+        raise ValueError("integer out of range")
+    return value
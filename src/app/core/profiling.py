@@ -0,0 +1,312 @@
+"""
+Perfilado de peticiones individuales por muestreo de pilas.
+
+Un hilo muestreador lee cada `interval` segundos las pilas de todos los hilos
+(`sys._current_frames`) y conserva solo las que trabajan para la petición perfilada:
+la del bucle de eventos mientras ejecuta una corrutina de esa petición (alguna de sus
+funciones tiene como variable local el `scope` ASGI de la petición) y las de los hilos
+del threadpool que ejecutan sus endpoints y dependencias síncronas (anyio las ejecuta
+en una copia del contexto de la petición, donde el perfil está activo). Las sentencias
+SQL y su duración se registran con eventos del motor.
+
+El resultado se escribe en formato speedscope (https://www.speedscope.app) o como
+pilas colapsadas (`flamegraph.pl`, inferno) en un directorio con un número máximo de
+ficheros: al superarlo se borran los más antiguos.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import Context, ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_active_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "active_profile", default=None
+)
+
+Frame = tuple[str, str, int]
+
+
+@dataclass
+class SqlStatement:
+    """
+    Sentencia SQL ejecutada durante una petición perfilada.
+
+    Atributos:
+        statement (str): Texto de la sentencia.
+        start (float): Inicio, en segundos desde el comienzo del perfil.
+        duration (float): Duración, en segundos.
+    """
+
+    statement: str
+    start: float
+    duration: float
+
+
+@dataclass
+class RequestProfile:  # pylint: disable=too-many-instance-attributes
+    """
+    Perfil de una petición: muestras de pila y sentencias SQL.
+
+    Atributos:
+        name (str): Nombre del perfil (método y ruta).
+        scope (dict): `scope` ASGI de la petición.
+        interval (float): Segundos entre muestras.
+        samples (list[tuple[tuple[Frame, ...], float]]): Pilas (de la raíz a la hoja)
+            y su peso en segundos.
+        statements (list[SqlStatement]): Sentencias SQL, en orden de ejecución.
+    """
+
+    name: str
+    scope: dict
+    interval: float = 0.001
+    samples: list = field(default_factory=list)
+    statements: list = field(default_factory=list)
+    started: float = 0.0
+    duration: float = 0.0
+
+    def __post_init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread = 0
+        self._token = None
+
+    def start(self) -> None:
+        """Activa el perfil en el contexto actual y arranca el muestreador."""
+        self._loop_thread = threading.get_ident()
+        self._token = _active_profile.set(self)
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el muestreador y desactiva el perfil."""
+        self.duration = time.perf_counter() - self.started
+        self._stop.set()
+        self._thread.join()
+        _active_profile.reset(self._token)
+
+    def _run(self) -> None:
+        previous = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight, previous = now - previous, now
+            own = threading.get_ident()
+            for (
+                thread_id,
+                frame,
+            ) in sys._current_frames().items():  # pylint: disable=W0212
+                if thread_id != own and self._owns(thread_id, frame):
+                    self.samples.append((_stack(frame), weight))
+
+    def _owns(self, thread_id: int, frame) -> bool:
+        in_loop = thread_id == self._loop_thread
+        while frame is not None:
+            if in_loop:
+                if frame.f_locals.get("scope") is self.scope:
+                    return True
+            elif frame.f_globals.get("__name__", "").startswith("anyio"):
+                # anyio ejecuta la función con `context.run(...)`; `context` es la copia
+                # del contexto de la petición que la encargó.
+                context = frame.f_locals.get("context")
+                if isinstance(context, Context):
+                    return context.get(_active_profile) is self
+            frame = frame.f_back
+        return False
+
+
+def _stack(frame) -> tuple[Frame, ...]:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+def _before_cursor_execute(conn, *_args) -> None:
+    if _active_profile.get() is not None:
+        conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, *_args) -> None:
+    profile = _active_profile.get()
+    if profile is not None and conn.info.get("profile_started"):
+        started = conn.info["profile_started"].pop()
+        profile.statements.append(
+            SqlStatement(
+                statement, started - profile.started, time.perf_counter() - started
+            )
+        )
+
+
+def install_sql_listeners() -> None:
+    """
+    Registra (una sola vez) los eventos que miden las sentencias SQL de los perfiles.
+
+    Fuera de una petición perfilada solo cuestan una lectura de `ContextVar`.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _frame_name(frame: Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def to_speedscope(profile: RequestProfile) -> dict:
+    """
+    Convierte el perfil al formato de fichero de speedscope.
+
+    Incluye un perfil muestreado con las pilas y otro por eventos con las sentencias
+    SQL, ambos en milisegundos desde el comienzo de la petición.
+
+    Args:
+        profile (RequestProfile): Perfil terminado.
+
+    Returns:
+        dict: Documento JSON de speedscope.
+    """
+    frames: list[dict] = []
+    index: dict = {}
+
+    def frame_id(key, frame: dict) -> int:
+        if key not in index:
+            index[key] = len(frames)
+            frames.append(frame)
+        return index[key]
+
+    samples = [
+        [
+            frame_id(frame, {"name": frame[0], "file": frame[1], "line": frame[2]})
+            for frame in stack
+        ]
+        for stack, _ in profile.samples
+    ]
+    events, clock = [], 0.0
+    for sql in profile.statements:
+        # Los eventos deben estar ordenados y no solaparse.
+        start = max(sql.start * 1000, clock)
+        clock = max(start, (sql.start + sql.duration) * 1000)
+        frame = frame_id(
+            ("sql", sql.statement), {"name": f"SQL: {_one_line(sql.statement)}"}
+        )
+        events.append({"type": "O", "frame": frame, "at": start})
+        events.append({"type": "C", "frame": frame, "at": clock})
+    end = max(profile.duration * 1000, clock)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": profile.name,
+        "exporter": "tidytasks",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": f"{profile.name} (muestras)",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": end,
+                "samples": samples,
+                "weights": [weight * 1000 for _, weight in profile.samples],
+            },
+            {
+                "type": "evented",
+                "name": f"{profile.name} (SQL)",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": end,
+                "events": events,
+            },
+        ],
+    }
+
+
+def to_collapsed(profile: RequestProfile) -> str:
+    """
+    Convierte el perfil a pilas colapsadas (`marco;marco;... peso`).
+
+    Los pesos están en microsegundos. Las sentencias SQL se añaden como pilas bajo una
+    raíz `[sql]`, con su duración como peso.
+
+    Args:
+        profile (RequestProfile): Perfil terminado.
+
+    Returns:
+        str: Una línea por pila distinta.
+    """
+    weights: Counter = Counter()
+    for stack, weight in profile.samples:
+        weights[";".join(_frame_name(frame) for frame in stack)] += weight
+    for sql in profile.statements:
+        weights[f"[sql];{_one_line(sql.statement).replace(';', ',')}"] += sql.duration
+    return "".join(
+        f"{stack} {round(weight * 1e6)}\n"
+        for stack, weight in weights.items()
+        if weight
+    )
+
+
+def _one_line(statement: str, limit: int = 300) -> str:
+    text = re.sub(r"\s+", " ", statement).strip()
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+class ProfileStore:  # pylint: disable=too-few-public-methods
+    """
+    Directorio de perfiles con un máximo de ficheros (búfer circular).
+
+    Args:
+        directory (str): Directorio de destino (se crea si no existe).
+        max_files (int): Ficheros que se conservan; al superarlo se borran los más antiguos.
+        profile_format (str): `speedscope` o `collapsed`.
+    """
+
+    def __init__(
+        self, directory: str, max_files: int, profile_format: str = "speedscope"
+    ):
+        if profile_format not in ("speedscope", "collapsed"):
+            raise ValueError(f"Formato de perfil desconocido: {profile_format}")
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.profile_format = profile_format
+        self._lock = threading.Lock()
+
+    def save(self, profile: RequestProfile) -> str:
+        """
+        Escribe el perfil y elimina los más antiguos si se supera el máximo.
+
+        Args:
+            profile (RequestProfile): Perfil terminado.
+
+        Returns:
+            str: Nombre del fichero escrito.
+        """
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", profile.name).strip("_")[:80]
+        if self.profile_format == "speedscope":
+            name = f"{time.time_ns()}-{slug}.speedscope.json"
+            content = json.dumps(to_speedscope(profile))
+        else:
+            name = f"{time.time_ns()}-{slug}.collapsed"
+            content = to_collapsed(profile)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / name).write_text(content, encoding="utf-8")
+            # El nombre empieza por la marca de tiempo: el orden alfabético es el cronológico.
+            files = sorted(
+                path for path in self.directory.iterdir() if path.name[:1].isdigit()
+            )
+            for path in files[: max(0, len(files) - self.max_files)]:
+                path.unlink(missing_ok=True)
+        return name
@@ -0,0 +1,485 @@
+"""
+Trazas distribuidas de las peticiones.
+
+Cada petición muestreada abre un span raíz (`http.server`) del que cuelgan los de las
+dependencias (`get_current_user`, `get_db_session`...), las funciones CRUD decoradas con
+`traced` y las sentencias SQL (eventos del motor). El span activo se guarda en una
+`ContextVar`, de modo que los endpoints y dependencias síncronos que anyio ejecuta en
+el threadpool (con una copia del contexto) cuelgan del span correcto.
+
+El contexto se propaga con la cabecera W3C `traceparent`: una petición que llega con
+ella continúa la traza de su origen y respeta su decisión de muestreo; las demás se
+muestrean con probabilidad `tracing_sample_rate`. Fuera de una traza muestreada,
+`start_span`, `traced` y los eventos de SQL solo cuestan una lectura de `ContextVar`.
+
+Al terminar la petición, la traza completa se entrega a un exportador: en memoria
+(tests), OTLP/JSON en un fichero (una línea por traza, legible por el OpenTelemetry
+Collector con el receptor `otlpjsonfile`) o Sentry (si `sentry-sdk` está instalado).
+"""
+
+# pylint: disable=too-few-public-methods
+
+import functools
+import json
+import logging
+import random
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+STATEMENT_LENGTH = 2000
+
+
+@dataclass
+class Span:  # pylint: disable=too-many-instance-attributes
+    """
+    Operación medida dentro de una traza.
+
+    Atributos:
+        name (str): Nombre de la operación (p. ej. `GET /lists/{list_id}`).
+        op (str): Tipo: `http.server`, `dependency`, `crud` o `db.sql`.
+        trace (Trace): Traza a la que pertenece.
+        span_id (str): Identificador (16 caracteres hexadecimales).
+        parent_id (Optional[str]): Span padre; None en la raíz de una traza nueva.
+        start_ns, end_ns (int): Inicio y fin en nanosegundos desde la época Unix.
+        attributes (dict): Atributos de la operación.
+        error (Optional[str]): Tipo de la excepción que la interrumpió, si la hubo.
+    """
+
+    name: str
+    op: str
+    trace: "Trace"
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    parent_id: Optional[str] = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int = 0
+    attributes: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duración del span en milisegundos."""
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def finish(self, end_ns: Optional[int] = None) -> None:
+        """Cierra el span y lo añade a su traza."""
+        self.end_ns = end_ns or time.time_ns()
+        self.trace.spans.append(self)
+
+
+@dataclass
+class Trace:
+    """
+    Spans terminados de una petición, pendientes de exportar.
+
+    Atributos:
+        trace_id (str): Identificador (32 caracteres hexadecimales).
+        spans (list[Span]): Spans terminados, en orden de finalización.
+    """
+
+    trace_id: str
+    spans: list = field(default_factory=list)
+
+    @property
+    def root(self) -> Optional[Span]:
+        """Span local sin padre en la traza (el de la petición)."""
+        ids = {span.span_id for span in self.spans}
+        return next((s for s in self.spans if s.parent_id not in ids), None)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[tuple[str, str, bool]]:
+    """
+    Interpreta una cabecera W3C `traceparent` (versión 00).
+
+    Args:
+        header (Optional[str]): Valor de la cabecera.
+
+    Returns:
+        Optional[tuple[str, str, bool]]: (trace_id, span padre, muestreada), o None si
+            falta o no es válida.
+    """
+    match = _TRACEPARENT.match((header or "").strip().lower())
+    if match is None:
+        return None
+    trace_id, parent_id, flags = match.groups()
+    if trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+def format_traceparent(span: Span) -> str:
+    """Cabecera `traceparent` que continúa la traza con `span` como padre."""
+    return f"00-{span.trace.trace_id}-{span.span_id}-01"
+
+
+def current_span() -> Optional[Span]:
+    """Span activo en el contexto actual, o None si no hay traza muestreada."""
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(name: str, op: str, **attributes) -> Iterator[Optional[Span]]:
+    """
+    Abre un span hijo del activo mientras dura el bloque `with`.
+
+    Si no hay traza muestreada no crea nada y entrega None.
+
+    Args:
+        name (str): Nombre de la operación.
+        op (str): Tipo de operación.
+        **attributes: Atributos iniciales.
+
+    Yields:
+        Optional[Span]: Span abierto, o None.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    span = Span(name, op, parent.trace, parent_id=parent.span_id, attributes=attributes)
+    with _activate(span):
+        yield span
+
+
+@contextmanager
+def _activate(span: Span) -> Iterator[None]:
+    token = _current_span.set(span)
+    try:
+        yield
+    except BaseException as e:
+        span.error = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        span.finish()
+
+
+def traced(op: str = "crud", name: Optional[str] = None):
+    """
+    Decorador que mide cada llamada a la función como un span.
+
+    Por defecto el span se llama `<módulo>.<función>` (p. ej. `task.create_task`).
+    Conserva la firma de la función, así que también sirve para dependencias de
+    FastAPI síncronas.
+
+    Args:
+        op (str): Tipo de operación.
+        name (Optional[str]): Nombre del span.
+    """
+
+    def decorator(func):
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with start_span(span_name, op):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Exporter:
+    """Destino de las trazas terminadas."""
+
+    def export(self, trace: Trace) -> None:
+        """Entrega una traza completa (se llama una vez por petición muestreada)."""
+        raise NotImplementedError
+
+
+class InMemoryExporter(Exporter):
+    """
+    Conserva las trazas en memoria, para los tests.
+
+    Atributos:
+        traces (list[Trace]): Trazas exportadas, en orden.
+    """
+
+    def __init__(self):
+        self.traces: list[Trace] = []
+
+    def export(self, trace: Trace) -> None:
+        self.traces.append(trace)
+
+
+_SPAN_KIND = {"http.server": 2, "db.sql": 3}  # SERVER, CLIENT; el resto INTERNAL (1)
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(trace: Trace, service_name: str) -> dict:
+    """
+    Convierte la traza a una petición OTLP/JSON `ExportTraceServiceRequest`.
+
+    Args:
+        trace (Trace): Traza terminada.
+        service_name (str): Valor del atributo de recurso `service.name`.
+
+    Returns:
+        dict: Documento OTLP/JSON.
+    """
+    spans = []
+    for span in trace.spans:
+        attributes = {"op": span.op, **span.attributes}
+        if span.error:
+            attributes["error.type"] = span.error
+        spans.append(
+            {
+                "traceId": trace.trace_id,
+                "spanId": span.span_id,
+                "parentSpanId": span.parent_id or "",
+                "name": span.name,
+                "kind": _SPAN_KIND.get(span.op, 1),
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)}
+                    for key, value in attributes.items()
+                ],
+                "status": {"code": 2 if span.error else 1},
+            }
+        )
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": "app.core.tracing"}, "spans": spans}],
+            }
+        ]
+    }
+
+
+class OtlpFileExporter(Exporter):
+    """
+    Añade cada traza como una línea OTLP/JSON a un fichero.
+
+    Args:
+        path (str): Fichero de destino (su directorio se crea si no existe).
+        service_name (str): Nombre del servicio en el recurso OTLP.
+    """
+
+    def __init__(self, path: str, service_name: str):
+        self.path = Path(path)
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(to_otlp(trace, self.service_name), separators=(",", ":"))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+
+def _timestamp(ns: int) -> datetime:
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc)
+
+
+class SentryExporter(Exporter):
+    """
+    Envía cada traza a Sentry como una transacción con sus spans.
+
+    El muestreo ya se ha decidido aquí, así que el SDK se inicializa con
+    `traces_sample_rate=1.0` y sin las integraciones automáticas (que crearían sus
+    propias transacciones para las mismas peticiones).
+
+    Args:
+        dsn (str): DSN del proyecto de Sentry.
+        environment (Optional[str]): Entorno con el que se etiquetan los eventos.
+
+    Raises:
+        RuntimeError: Si `sentry-sdk` no está instalado.
+    """
+
+    def __init__(self, dsn: str, environment: Optional[str] = None):
+        try:
+            import sentry_sdk  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise RuntimeError(
+                "El exportador de trazas 'sentry' requiere el paquete sentry-sdk"
+            ) from e
+        self.sdk = sentry_sdk
+        sentry_sdk.init(
+            dsn=dsn,
+            environment=environment,
+            traces_sample_rate=1.0,
+            auto_enabling_integrations=False,
+        )
+
+    def export(self, trace: Trace) -> None:
+        # pylint: disable=import-outside-toplevel, import-error
+        from sentry_sdk.tracing import Transaction
+
+        root = trace.root
+        if root is None:
+            return
+        transaction = Transaction(
+            name=root.name,
+            op=root.op,
+            trace_id=trace.trace_id,
+            span_id=root.span_id,
+            parent_span_id=root.parent_id,
+            sampled=True,
+            start_timestamp=_timestamp(root.start_ns),
+        )
+        opened = {root.span_id: transaction}
+        for span in sorted(trace.spans, key=lambda s: s.start_ns):
+            parent = opened.get(span.parent_id)
+            if span is root or parent is None:
+                continue
+            child = parent.start_child(
+                op=span.op,
+                description=span.name,
+                start_timestamp=_timestamp(span.start_ns),
+            )
+            child.span_id = span.span_id
+            for key, value in span.attributes.items():
+                child.set_data(key, value)
+            if span.error:
+                child.set_status("internal_error")
+            opened[span.span_id] = child
+        for span in trace.spans:
+            if span is not root and span.span_id in opened:
+                opened[span.span_id].finish(end_timestamp=_timestamp(span.end_ns))
+        transaction.set_http_status(root.attributes.get("http.status_code", 500))
+        transaction.finish(end_timestamp=_timestamp(root.end_ns))
+
+
+def build_exporter(settings: Settings) -> Optional[Exporter]:
+    """
+    Crea el exportador configurado en `tracing_exporter`.
+
+    Args:
+        settings (Settings): Configuración (`tracing_*`, `sentry_dsn`).
+
+    Returns:
+        Optional[Exporter]: Exportador, o None si las trazas están desactivadas.
+
+    Raises:
+        ValueError: Si el exportador es `sentry` y falta `sentry_dsn`.
+    """
+    if settings.tracing_exporter == "memory":
+        return InMemoryExporter()
+    if settings.tracing_exporter == "otlp-file":
+        return OtlpFileExporter(settings.tracing_file, settings.tracing_service_name)
+    if settings.tracing_exporter == "sentry":
+        if not settings.sentry_dsn:
+            raise ValueError("El exportador de trazas 'sentry' requiere SENTRY_DSN")
+        return SentryExporter(settings.sentry_dsn, settings.tracing_environment)
+    return None
+
+
+class Tracer:
+    """
+    Decide qué peticiones se trazan, abre su span raíz y exporta el resultado.
+
+    Args:
+        exporter (Exporter): Destino de las trazas.
+        sample_rate (float): Probabilidad de trazar una petición sin `traceparent`.
+    """
+
+    def __init__(self, exporter: Exporter, sample_rate: float):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @contextmanager
+    def trace(
+        self, name: str, op: str, traceparent: Optional[str] = None, **attributes
+    ) -> Iterator[Optional[Span]]:
+        """
+        Abre el span raíz de una petición si se muestrea y exporta la traza al salir.
+
+        Args:
+            name (str): Nombre del span raíz.
+            op (str): Tipo de operación.
+            traceparent (Optional[str]): Cabecera `traceparent` recibida.
+            **attributes: Atributos iniciales del span raíz.
+
+        Yields:
+            Optional[Span]: Span raíz, o None si la petición no se traza.
+        """
+        remote = parse_traceparent(traceparent)
+        if remote is not None:
+            trace_id, parent_id, sampled = remote
+        else:
+            trace_id, parent_id = None, None
+            sampled = random.random() < self.sample_rate
+        if not sampled:
+            yield None
+            return
+        trace = Trace(trace_id or secrets.token_hex(16))
+        root = Span(name, op, trace, parent_id=parent_id, attributes=attributes)
+        try:
+            with _activate(root):
+                yield root
+        finally:
+            try:
+                self.exporter.export(trace)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Could not export trace %s", trace.trace_id)
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _many):
+    if _current_span.get() is not None:
+        context.trace_started = time.time_ns()
+
+
+def _after_cursor_execute(conn, _cursor, statement, _parameters, context, _many):
+    parent = _current_span.get()
+    started = getattr(context, "trace_started", None)
+    if parent is None or started is None:
+        return
+    Span(
+        (statement.split(None, 1) or ["SQL"])[0].upper(),
+        "db.sql",
+        parent.trace,
+        parent_id=parent.span_id,
+        start_ns=started,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.statement": statement[:STATEMENT_LENGTH],
+        },
+    ).finish()
+
+
+def install_sql_listeners() -> None:
+    """
+    Registra (una sola vez) los eventos que crean un span por sentencia SQL.
+
+    Fuera de una traza muestreada solo cuestan una lectura de `ContextVar`.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -38,3 +38,124 @@ class TaskNotFoundException(HTTPException):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tarea con ID {task_id} no encontrada",
         )
+
+
+class InvalidCursorException(HTTPException):
+    """
+    Excepción lanzada cuando el cursor de paginación recibido no es válido.
+    """
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginación inválido",
+        )
+
+
+class TaskVersionConflictException(HTTPException):
+    """
+    Excepción lanzada cuando una escritura usa una versión desactualizada de la tarea
+    (`If-Match`), es decir, la tarea fue modificada por otra petición.
+    """
+
+    def __init__(self, task_id: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"La tarea con ID {task_id} fue modificada por otra petición",
+        )
+
+
+class InvalidIfMatchException(HTTPException):
+    """
+    Excepción lanzada cuando la cabecera `If-Match` no contiene una versión válida.
+    """
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cabecera If-Match inválida",
+        )
+
+
+class AssigneeNotFoundException(HTTPException):
+    """
+    Excepción lanzada cuando el usuario asignado a una tarea no existe.
+    """
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuario asignado no existe",
+        )
+
+
+class TaskListNotEmptyException(HTTPException):
+    """
+    Excepción lanzada al eliminar una lista que todavía tiene tareas activas.
+    """
+
+    def __init__(self, list_id: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"La lista de tareas con ID {list_id} todavía tiene tareas",
+        )
+
+
+class ListPermissionDeniedException(HTTPException):
+    """
+    Excepción lanzada cuando el rol del usuario en una lista no alcanza el requerido.
+    """
+
+    def __init__(self, list_id: int, required: str):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Se requiere el rol '{required}' en la lista de tareas con ID {list_id}",
+        )
+
+
+class ListMemberNotFoundException(HTTPException):
+    """
+    Excepción lanzada cuando un usuario no es miembro de una lista de tareas.
+    """
+
+    def __init__(self, list_id: int, user_id: int):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"El usuario {user_id} no es miembro de la lista de tareas {list_id}",
+        )
+
+
+class UserNotFoundException(HTTPException):
+    """
+    Excepción lanzada cuando no se encuentra un usuario por su ID.
+    """
+
+    def __init__(self, user_id: int):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Usuario con ID {user_id} no encontrado",
+        )
+
+
+class LastListOwnerException(HTTPException):
+    """
+    Excepción lanzada al quitar o degradar al único propietario de una lista.
+    """
+
+    def __init__(self, list_id: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"La lista de tareas con ID {list_id} debe conservar un propietario",
+        )
+
+
+class ListAlreadyOwnedException(HTTPException):
+    """
+    Excepción lanzada al reclamar una lista que ya tiene propietario.
+    """
+
+    def __init__(self, list_id: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"La lista de tareas con ID {list_id} ya tiene propietario",
+        )
@@ -4,6 +4,65 @@ Definición del objeto base para los modelos de SQLAlchemy en TidyTasks.
 Todos los modelos ORM deben heredar de esta clase `Base`.
 """
 
+from enum import Enum
+from typing import Mapping, Type
+
+from sqlalchemy import DateTime, SmallInteger
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
+
+# SQLite guarda `CURRENT_TIMESTAMP` con resolución de segundos; los valores enlazados
+# desde Python (por ejemplo, cursores de paginación) usan el mismo formato para que
+# las comparaciones con los valores generados por el servidor sean exactas.
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format=(
+            "%(year)04d-%(month)02d-%(day)02d " "%(hour)02d:%(minute)02d:%(second)02d"
+        )
+    ),
+    "sqlite",
+)
+
+
+class CodedEnum(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """
+    Enumerado almacenado como SMALLINT mediante una tabla de códigos fija.
+
+    Acepta miembros del enumerado o sus valores (`"high"`) y devuelve miembros del
+    enumerado, de modo que los esquemas Pydantic existentes no cambian. Al ser un
+    entero, ocupa menos espacio en filas e índices y ordena según los códigos.
+
+    Args:
+        enum_class (Type[Enum]): Enumerado representado.
+        codes (Mapping[Enum, int]): Código persistido de cada miembro.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum], codes: Mapping[Enum, int]):
+        super().__init__()
+        self.enum_class = enum_class
+        self.codes = tuple(codes.items())
+        self._to_code = dict(self.codes)
+        self._from_code = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._from_code[int(value)]
+
+    def process_literal_param(self, value, dialect):
+        return str(self.process_bind_param(value, dialect))
+
+    @property
+    def python_type(self):
+        return self.enum_class
@@ -0,0 +1,235 @@
+"""
+CRUD del archivo de tareas completadas.
+
+Las tareas completadas hace más de cierto tiempo se mueven de `tasks` a
+`archived_tasks` en lotes pequeños, para mantener pequeña la tabla que consultan
+los endpoints habituales. Desde aquí también se consultan y restauran.
+
+Archivar y restaurar incrementan la versión de la tarea y dejan, una vez confirmados,
+una entrada `archived` o `restored` en su historial. La tarea archivada conserva su
+clave de orden (`rank`), de modo que al restaurarla vuelve a su posición.
+"""
+
+# pylint: disable=not-callable
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.constants import TaskHistoryAction
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.tracing import traced
+from app.domain.models.exceptions import TaskNotFoundException
+from app.infrastructure.db.crud.ordering import next_rank
+from app.infrastructure.db.crud.task_history import record_task_change
+from app.infrastructure.db.models.archived_task import ArchivedTaskModel
+from app.infrastructure.db.models.task import TaskModel
+
+logger = logging.getLogger(__name__)
+
+# Columnas comunes a `tasks` y `archived_tasks`, en el orden usado por INSERT ... SELECT.
+ARCHIVED_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "priority",
+    "is_done",
+    "assigned_to",
+    "list_id",
+    "created_by",
+    "version",
+    "created_at",
+    "updated_at",
+    "due_at",
+    "rank",
+)
+
+
+@traced()
+def archive_completed_tasks(
+    db: Session, older_than: timedelta, batch_size: int = 500
+) -> int:
+    """
+    Archiva las tareas completadas cuya última modificación es anterior a `older_than`.
+
+    Cada lote se procesa en su propia transacción: se bloquean hasta `batch_size`
+    filas (`FOR UPDATE SKIP LOCKED` en PostgreSQL), se copian con
+    `INSERT ... SELECT` (con la versión incrementada) y se eliminan de `tasks`.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        older_than (timedelta): Antigüedad mínima desde la última modificación.
+        batch_size (int): Número máximo de tareas por transacción.
+
+    Returns:
+        int: Número total de tareas archivadas.
+    """
+    cutoff = datetime.now(timezone.utc) - older_than
+    archivable = (TaskModel.is_done.is_(True), TaskModel.updated_at < cutoff)
+    columns = [
+        TaskModel.version + 1 if name == "version" else getattr(TaskModel, name)
+        for name in ARCHIVED_COLUMNS
+    ]
+    total = 0
+
+    while True:
+        try:
+            ids = db.scalars(
+                select(TaskModel.id)
+                .where(*archivable)
+                .order_by(TaskModel.updated_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not ids:
+                db.commit()
+                break
+
+            archived = db.execute(
+                insert(ArchivedTaskModel)
+                .from_select(
+                    list(ARCHIVED_COLUMNS),
+                    select(*columns).where(TaskModel.id.in_(ids), *archivable),
+                )
+                .returning(
+                    ArchivedTaskModel.id,
+                    ArchivedTaskModel.list_id,
+                    ArchivedTaskModel.version,
+                )
+            ).all()
+            db.execute(
+                delete(TaskModel)
+                .where(TaskModel.id.in_(ids), *archivable)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.error("Error archiving batch after %d tasks", total, exc_info=True)
+            raise
+
+        for task in archived:
+            record_task_change(
+                db, TaskHistoryAction.ARCHIVED, task.id, task.list_id, task.version
+            )
+        total += len(ids)
+        logger.info("Archived batch of %d tasks (%d total)", len(ids), total)
+
+    return total
+
+
+@traced()
+def get_archived_tasks(
+    db: Session, list_id: int, limit: int = 50, cursor: Optional[str] = None
+) -> tuple[list[ArchivedTaskModel], Optional[str]]:
+    """
+    Obtiene las tareas archivadas de una lista, de la más reciente a la más antigua.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+        limit (int): Tamaño de página.
+        cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+    Returns:
+        tuple[list[ArchivedTaskModel], Optional[str]]: Tareas de la página y cursor
+        de la siguiente (None si no hay más).
+
+    Raises:
+        HTTPException 400: Si el cursor no es válido.
+        HTTPException 500: Si ocurre un error inesperado durante la consulta.
+    """
+    stmt = select(ArchivedTaskModel).where(ArchivedTaskModel.list_id == list_id)
+    if cursor:
+        (task_id,) = decode_cursor(cursor, int)
+        stmt = stmt.where(ArchivedTaskModel.id < task_id)
+    stmt = stmt.order_by(ArchivedTaskModel.id.desc()).limit(limit + 1)
+
+    try:
+        tasks = list(db.scalars(stmt))
+    except Exception as e:
+        logger.error("Error fetching archived tasks for list %s: %s", list_id, e)
+        raise HTTPException(
+            status_code=500, detail="Failed to fetch archived tasks"
+        ) from e
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1].id)
+    return tasks, next_cursor
+
+
+@traced()
+def restore_archived_task(db: Session, list_id: int, task_id: int) -> TaskModel:
+    """
+    Devuelve una tarea archivada a la tabla `tasks` conservando su ID.
+
+    La fecha de modificación se actualiza para que el archivador no la vuelva a
+    mover de inmediato, y la versión se incrementa. La tarea recupera su clave de
+    orden; las archivadas antes de conservarla se colocan al final de la lista.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista que contiene la tarea.
+        task_id (int): ID de la tarea archivada.
+
+    Returns:
+        TaskModel: La tarea restaurada.
+
+    Raises:
+        TaskNotFoundException: Si la tarea archivada no existe.
+        HTTPException 409: Si ya existe una tarea activa con el mismo ID (solo en
+            bases SQLite creadas antes de usar AUTOINCREMENT en `tasks`).
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    archived = (ArchivedTaskModel.id == task_id, ArchivedTaskModel.list_id == list_id)
+    changed = {
+        "updated_at": func.now(),
+        "version": ArchivedTaskModel.version + 1,
+        "rank": func.coalesce(ArchivedTaskModel.rank, next_rank(db, list_id)),
+    }
+    columns = [
+        changed.get(name, getattr(ArchivedTaskModel, name)) for name in ARCHIVED_COLUMNS
+    ]
+    try:
+        restored = db.execute(
+            insert(TaskModel).from_select(
+                list(ARCHIVED_COLUMNS), select(*columns).where(*archived)
+            )
+        ).rowcount
+        if not restored:
+            db.rollback()
+            raise TaskNotFoundException(task_id)
+        db.execute(
+            delete(ArchivedTaskModel)
+            .where(*archived)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        logger.info("Restored archived task %s in list %s", task_id, list_id)
+        task = db.scalars(
+            select(TaskModel).where(
+                TaskModel.id == task_id, TaskModel.list_id == list_id
+            )
+        ).one()
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        logger.warning("Integrity error restoring task %s: %s", task_id, e.orig)
+        raise HTTPException(
+            status_code=409, detail="Ya existe una tarea activa con ese ID"
+        ) from e
+    except Exception as e:
+        db.rollback()
+        logger.error("Error restoring task %s in list %s: %s", task_id, list_id, e)
+        raise HTTPException(status_code=500, detail="Failed to restore task") from e
+
+    record_task_change(db, TaskHistoryAction.RESTORED, task_id, list_id, task.version)
+    return task
@@ -8,6 +8,7 @@ from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.domain.models.user import UserCreate
 from app.infrastructure.db.models.user import UserModel
 
@@ -15,6 +16,7 @@ from app.infrastructure.db.models.user import UserModel
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+@traced()
 def register_user(db: Session, user: UserCreate):
     """Registra un nuevo usuario en la base de datos."""
     hashed_password = pwd_context.hash(user.password)
@@ -27,6 +29,7 @@ def register_user(db: Session, user: UserCreate):
     return db_user
 
 
+@traced()
 def authenticate_user(db: Session, username: str, password: str):
     """Valida las credenciales de un usuario."""
     db_user = db.query(UserModel).filter(UserModel.username == username).first()
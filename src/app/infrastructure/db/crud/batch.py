@@ -0,0 +1,131 @@
+"""
+Ejecución de operaciones de tareas por lotes en una sola transacción.
+
+Cada operación reutiliza las funciones CRUD de `crud/task.py` sobre una sesión unida
+a la transacción de la petición con `join_transaction_mode="create_savepoint"`: los
+`commit` y `rollback` que hacen esas funciones solo liberan o deshacen el SAVEPOINT
+de su operación, y el resultado del lote se confirma (o se deshace) una sola vez.
+
+Los roles del usuario en todas las listas del lote se resuelven de una vez antes de
+empezar (caché de pertenencias y, para las que falten, una sola consulta); cada
+operación sobre una lista que el usuario no puede editar falla con el mismo 404 o 403
+que su endpoint individual.
+
+Las entradas del historial de las operaciones se acumulan en la sesión del lote y
+solo se entregan si el lote se confirma.
+"""
+
+import logging
+from typing import Any, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.constants import ListRole
+from app.core.tracing import traced
+from app.domain.models.exceptions import TaskNotFoundException
+from app.infrastructure.db.crud.membership import check_list_role, get_list_roles
+from app.infrastructure.db.crud.task import (
+    create_task,
+    delete_task,
+    update_task,
+    update_task_status,
+)
+from app.infrastructure.db.crud.task_history import task_history_writer
+from app.infrastructure.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+NOT_EXECUTED_DETAIL = "No aplicada: el lote atómico se deshizo"
+
+
+def _run_operation(db: Session, operation: Any, user_id: int) -> dict:
+    if operation.op == "create":
+        task = create_task(db, operation.list_id, operation.task, created_by_id=user_id)
+        return {"status": status.HTTP_201_CREATED, "task": task}
+    if operation.op == "update":
+        task = update_task(
+            db, operation.list_id, operation.task_id, operation.task, operation.version
+        )
+        return {"status": status.HTTP_200_OK, "task": task}
+    if operation.op == "status":
+        task = update_task_status(
+            db,
+            operation.list_id,
+            operation.task_id,
+            operation.is_done,
+            operation.version,
+        )
+        return {"status": status.HTTP_200_OK, "task": task}
+    if not delete_task(db, operation.list_id, operation.task_id):
+        raise TaskNotFoundException(operation.task_id)
+    return {"status": status.HTTP_204_NO_CONTENT, "task": None}
+
+
+@traced()
+def run_task_batch(
+    db: Session, operations: Sequence[Any], user_id: int, atomic: bool = False
+) -> tuple[bool, list[dict]]:
+    """
+    Ejecuta en orden un lote de operaciones sobre tareas.
+
+    Si `atomic` es False, cada operación que falla se deshace sola (SAVEPOINT) y el
+    lote continúa; si es True, el primer error deshace todo el lote y las demás
+    operaciones se informan con 424.
+
+    Args:
+        db (Session): Sesión de la petición; su transacción envuelve todo el lote.
+        operations (Sequence[Any]): Operaciones (`op` = create, update, status, delete).
+        user_id (int): ID del usuario autenticado (creador de las tareas nuevas).
+        atomic (bool): Todo o nada.
+
+    Returns:
+        tuple[bool, list[dict]]: Si el lote se confirmó y, por operación, `index`,
+        `status` y `task` o `detail`.
+    """
+    batch_db = SessionLocal(
+        bind=db.connection(),
+        join_transaction_mode="create_savepoint",
+        info={"user_id": user_id, "task_history": []},
+    )
+    roles = get_list_roles(db, user_id, (operation.list_id for operation in operations))
+    results = []
+    failed = None
+    try:
+        for index, operation in enumerate(operations):
+            try:
+                check_list_role(
+                    operation.list_id, roles[operation.list_id], ListRole.EDITOR
+                )
+                result = _run_operation(batch_db, operation, user_id)
+            except HTTPException as e:
+                results.append(
+                    {"index": index, "status": e.status_code, "detail": e.detail}
+                )
+                if atomic:
+                    failed = index
+                    break
+                continue
+            if result["task"] is not None:
+                # Los `rollback` de operaciones posteriores no deben expirarla.
+                batch_db.expunge(result["task"])
+            results.append({"index": index, **result})
+    finally:
+        batch_db.close()
+
+    if failed is None:
+        db.commit()
+        task_history_writer.submit(batch_db.info["task_history"])
+        logger.info("Committed batch of %d task operations", len(operations))
+        return True, results
+
+    db.rollback()
+    logger.info("Rolled back atomic batch at operation %d", failed)
+    not_applied = {
+        "status": status.HTTP_424_FAILED_DEPENDENCY,
+        "detail": NOT_EXECUTED_DETAIL,
+    }
+    return False, [
+        results[failed] if index == failed else {"index": index, **not_applied}
+        for index in range(len(operations))
+    ]
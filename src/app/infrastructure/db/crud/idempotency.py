@@ -0,0 +1,163 @@
+"""
+CRUD de las claves de idempotencia.
+
+Una clave se reserva insertando su fila antes de ejecutar la petición (la clave
+primaria `(user_id, key)` impide que dos peticiones la reserven a la vez), se completa
+con la respuesta obtenida y se elimina periódicamente al vencer su TTL.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.infrastructure.db.models.idempotency_key import IdempotencyKeyModel
+
+logger = logging.getLogger(__name__)
+
+
+def _key_filter(user_id: int, key: str) -> tuple:
+    return IdempotencyKeyModel.user_id == user_id, IdempotencyKeyModel.key == key
+
+
+@traced()
+def claim_idempotency_key(
+    db: Session, user_id: int, key: str, request_hash: bytes
+) -> Optional[IdempotencyKeyModel]:
+    """
+    Reserva una clave de idempotencia para la petición en curso.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        user_id (int): ID del usuario autenticado.
+        key (str): Valor de la cabecera `Idempotency-Key`.
+        request_hash (bytes): Huella de la petición.
+
+    Returns:
+        Optional[IdempotencyKeyModel]: None si la clave quedó reservada; si ya existía,
+        su fila (en curso si `status_code` es None, o con la respuesta guardada).
+    """
+    while True:
+        try:
+            db.execute(
+                insert(IdempotencyKeyModel).values(
+                    user_id=user_id, key=key, request_hash=request_hash
+                )
+            )
+            db.commit()
+            return None
+        except IntegrityError:
+            db.rollback()
+        row = db.scalars(
+            select(IdempotencyKeyModel)
+            .where(*_key_filter(user_id, key))
+            .execution_options(populate_existing=True)
+        ).one_or_none()
+        # Si la reserva se liberó entre ambas sentencias, se vuelve a intentar.
+        if row is not None:
+            return row
+
+
+@traced()
+def complete_idempotency_key(  # pylint: disable=too-many-arguments
+    db: Session,
+    user_id: int,
+    key: str,
+    status_code: int,
+    body: bytes,
+    *,
+    headers: Optional[dict[str, str]] = None,
+) -> None:
+    """
+    Guarda la respuesta de la petición que reservó la clave.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        user_id (int): ID del usuario autenticado.
+        key (str): Clave de idempotencia.
+        status_code (int): Código HTTP de la respuesta.
+        body (bytes): Cuerpo de la respuesta.
+        headers (Optional[dict[str, str]]): Cabeceras de la respuesta que se repiten
+            en los reintentos.
+    """
+    db.execute(
+        update(IdempotencyKeyModel)
+        .where(*_key_filter(user_id, key))
+        .values(status_code=status_code, body=body, headers=headers)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+@traced()
+def release_idempotency_key(
+    db: Session, user_id: int, key: str, pending_before: Optional[datetime] = None
+) -> bool:
+    """
+    Libera una clave sin respuesta guardada para que un reintento pueda reservarla.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        user_id (int): ID del usuario autenticado.
+        key (str): Clave de idempotencia.
+        pending_before (Optional[datetime]): Si se indica, solo se libera si la
+            reserva es anterior (petición original abandonada).
+
+    Returns:
+        bool: True si la clave se liberó.
+    """
+    stmt = delete(IdempotencyKeyModel).where(
+        *_key_filter(user_id, key), IdempotencyKeyModel.status_code.is_(None)
+    )
+    if pending_before is not None:
+        stmt = stmt.where(IdempotencyKeyModel.created_at < pending_before)
+    released = db.execute(stmt.execution_options(synchronize_session=False)).rowcount
+    db.commit()
+    return released > 0
+
+
+@traced()
+def purge_expired_idempotency_keys(
+    db: Session, older_than: timedelta, batch_size: int = 1000
+) -> int:
+    """
+    Elimina las claves de idempotencia más antiguas que `older_than`, por lotes.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        older_than (timedelta): TTL de las claves.
+        batch_size (int): Número máximo de claves por transacción.
+
+    Returns:
+        int: Número de claves eliminadas.
+    """
+    cutoff = datetime.now(timezone.utc) - older_than
+    primary_key = tuple_(IdempotencyKeyModel.user_id, IdempotencyKeyModel.key)
+    expired = (
+        select(IdempotencyKeyModel.user_id, IdempotencyKeyModel.key)
+        .where(IdempotencyKeyModel.created_at < cutoff)
+        .limit(batch_size)
+    )
+    total = 0
+    while True:
+        try:
+            deleted = db.execute(
+                delete(IdempotencyKeyModel)
+                .where(primary_key.in_(expired))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.error(
+                "Error purging idempotency keys after %d rows", total, exc_info=True
+            )
+            raise
+        if not deleted:
+            return total
+        total += deleted
+        logger.info("Purged batch of %d idempotency keys (%d total)", deleted, total)
@@ -0,0 +1,478 @@
+"""
+Operaciones CRUD de los miembros de las listas y resolución de roles con caché.
+
+El rol de `(user_id, list_id)` se consulta en cada petición a una lista, así que se
+guarda en `membership_cache`, una caché LRU en memoria con expiración que también
+recuerda la ausencia de pertenencia. Con la caché caliente, autorizar una petición no
+cuesta ninguna consulta; en un fallo, las listas que faltan se resuelven con una única
+consulta por clave primaria. Las funciones de este módulo (y las de listas que crean
+o eliminan listas) actualizan o invalidan las entradas afectadas tras confirmar.
+
+La caché es por proceso: con varios workers, un cambio hecho en otro proceso se ve
+al expirar la entrada (`membership_cache_ttl_seconds`).
+
+Funciones principales:
+- get_list_roles: Roles de un usuario en varias listas (caché y una consulta).
+- check_list_role: Exige un rol mínimo (404 si no es miembro, 403 si no alcanza).
+- add_list_owner: Registra al propietario de una lista recién creada.
+- get_list_members: Miembros de una lista.
+- set_list_member: Añade un miembro o cambia su rol.
+- remove_list_member: Quita a un miembro de una lista.
+- member_of: Condición `EXISTS` de pertenencia para fusionarla en otras consultas.
+- get_unowned_lists: Listas sin propietario (p. ej. listas vacías anteriores a los
+  miembros), para los administradores.
+- claim_list: Hace propietario de una lista sin propietario a un administrador.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings
+from app.core.constants import LIST_ROLE_CODES, ListRole
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.tracing import traced
+from app.domain.models.exceptions import (
+    LastListOwnerException,
+    ListAlreadyOwnedException,
+    ListMemberNotFoundException,
+    ListPermissionDeniedException,
+    TaskListNotFoundException,
+    UserNotFoundException,
+)
+from app.infrastructure.db.models.list_member import ListMemberModel
+from app.infrastructure.db.models.task_list import TaskListModel
+
+logger = logging.getLogger(__name__)
+
+# Resultado de `MembershipCache.get` sin entrada (None significa "no es miembro").
+MISSING = object()
+
+
+class MembershipCache:
+    """
+    Caché LRU de roles por `(user_id, list_id)` con expiración.
+
+    Guarda también `None` (no es miembro) para que las peticiones repetidas a una
+    lista ajena tampoco consulten la base de datos.
+
+    Args:
+        max_size (int): Entradas en memoria (0 desactiva la caché).
+        ttl (float): Segundos que una entrada sigue siendo válida.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 30.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[
+            tuple[int, int], tuple[Optional[ListRole], float]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, settings: Settings) -> None:
+        """Aplica la configuración `membership_cache_*` y vacía la caché."""
+        with self._lock:
+            self.max_size = settings.membership_cache_size
+            self.ttl = settings.membership_cache_ttl_seconds
+            self._entries.clear()
+
+    def get(self, user_id: int, list_id: int):
+        """
+        Devuelve el rol guardado (None si no es miembro) o `MISSING` si no hay
+        entrada o expiró.
+        """
+        key = (user_id, list_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            role, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return role
+
+    def put(self, user_id: int, list_id: int, role: Optional[ListRole]) -> None:
+        """Guarda un rol, descartando la entrada menos usada si se supera el tamaño."""
+        if self.max_size <= 0:
+            return
+        key = (user_id, list_id)
+        with self._lock:
+            self._entries[key] = (role, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int, list_id: int) -> None:
+        """Olvida el rol de un usuario en una lista."""
+        with self._lock:
+            self._entries.pop((user_id, list_id), None)
+
+    def invalidate_list(self, list_id: int) -> None:
+        """Olvida los roles de todos los usuarios en una lista (p. ej. al borrarla)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == list_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        with self._lock:
+            self._entries.clear()
+
+
+membership_cache = MembershipCache()
+
+
+@traced()
+def get_list_roles(
+    db: Session, user_id: int, list_ids: Iterable[int]
+) -> dict[int, Optional[ListRole]]:
+    """
+    Obtiene el rol de un usuario en varias listas.
+
+    Las listas que no están en `membership_cache` se resuelven con una sola consulta
+    sobre la clave primaria `(user_id, list_id)` y se guardan en la caché.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        user_id (int): ID del usuario.
+        list_ids (Iterable[int]): IDs de las listas.
+
+    Returns:
+        dict[int, Optional[ListRole]]: Rol por lista (None si no es miembro).
+    """
+    roles = {}
+    missing = []
+    for list_id in dict.fromkeys(list_ids):
+        role = membership_cache.get(user_id, list_id)
+        if role is MISSING:
+            missing.append(list_id)
+        else:
+            roles[list_id] = role
+    if missing:
+        found = dict(
+            db.execute(
+                select(ListMemberModel.list_id, ListMemberModel.role).where(
+                    ListMemberModel.user_id == user_id,
+                    ListMemberModel.list_id.in_(missing),
+                )
+            ).all()
+        )
+        for list_id in missing:
+            roles[list_id] = found.get(list_id)
+            membership_cache.put(user_id, list_id, roles[list_id])
+    return roles
+
+
+def check_list_role(list_id: int, role: Optional[ListRole], required: ListRole) -> None:
+    """
+    Exige que `role` alcance el rol `required`.
+
+    Para no revelar qué listas existen, a quien no es miembro se le responde como si
+    la lista no existiera.
+
+    Args:
+        list_id (int): ID de la lista.
+        role (Optional[ListRole]): Rol del usuario (None si no es miembro).
+        required (ListRole): Rol mínimo.
+
+    Raises:
+        TaskListNotFoundException: Si el usuario no es miembro de la lista.
+        ListPermissionDeniedException: Si su rol no alcanza el requerido.
+    """
+    if role is None:
+        raise TaskListNotFoundException(list_id)
+    if LIST_ROLE_CODES[role] < LIST_ROLE_CODES[required]:
+        raise ListPermissionDeniedException(list_id, required.value)
+
+
+def add_list_owner(db: Session, list_id: int, user_id: int) -> None:
+    """
+    Registra a `user_id` como propietario de una lista recién creada, dentro de la
+    transacción que la crea (no confirma).
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+        user_id (int): ID del propietario.
+    """
+    db.execute(
+        insert(ListMemberModel).values(
+            user_id=user_id, list_id=list_id, role=ListRole.OWNER
+        )
+    )
+
+
+@traced()
+def get_list_members(db: Session, list_id: int) -> list[ListMemberModel]:
+    """
+    Obtiene los miembros de una lista, ordenados por ID de usuario.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+
+    Returns:
+        list[ListMemberModel]: Miembros de la lista.
+
+    Raises:
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    try:
+        return list(
+            db.scalars(
+                select(ListMemberModel)
+                .where(ListMemberModel.list_id == list_id)
+                .order_by(ListMemberModel.user_id)
+            )
+        )
+    except Exception as e:
+        logger.error("Error fetching members of list %s: %s", list_id, e)
+        raise HTTPException(
+            status_code=500, detail="Failed to fetch list members"
+        ) from e
+
+
+def _ensure_other_owner(db: Session, list_id: int, user_id: int) -> None:
+    # Bloquea las filas de propietarios: dos cambios simultáneos no pueden dejar la
+    # lista sin ninguno.
+    owners = db.scalars(
+        select(ListMemberModel.user_id)
+        .where(
+            ListMemberModel.list_id == list_id, ListMemberModel.role == ListRole.OWNER
+        )
+        .with_for_update()
+    ).all()
+    if user_id in owners and len(owners) == 1:
+        raise LastListOwnerException(list_id)
+
+
+def _upsert_member(
+    db: Session, list_id: int, user_id: int, role: ListRole
+) -> ListMemberModel:
+    # Cambia el rol del miembro o, si aún no lo es, lo añade (no confirma).
+    member = db.scalars(
+        update(ListMemberModel)
+        .where(ListMemberModel.list_id == list_id, ListMemberModel.user_id == user_id)
+        .values(role=role)
+        .returning(ListMemberModel)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).one_or_none()
+    if member is None:
+        member = db.scalars(
+            insert(ListMemberModel)
+            .values(user_id=user_id, list_id=list_id, role=role)
+            .returning(ListMemberModel)
+        ).one()
+    return member
+
+
+@traced()
+def set_list_member(
+    db: Session, list_id: int, user_id: int, role: ListRole
+) -> ListMemberModel:
+    """
+    Añade a un usuario como miembro de una lista o cambia su rol.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+        user_id (int): ID del usuario.
+        role (ListRole): Nuevo rol.
+
+    Returns:
+        ListMemberModel: La pertenencia creada o actualizada.
+
+    Raises:
+        UserNotFoundException: Si el usuario no existe.
+        LastListOwnerException: Si se degrada al único propietario.
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    try:
+        if role != ListRole.OWNER:
+            _ensure_other_owner(db, list_id, user_id)
+        member = _upsert_member(db, list_id, user_id, role)
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        logger.warning("Cannot add user %s to list %s: %s", user_id, list_id, e.orig)
+        raise UserNotFoundException(user_id) from e
+    except Exception as e:
+        db.rollback()
+        logger.error("Error setting member %s of list %s: %s", user_id, list_id, e)
+        raise HTTPException(status_code=500, detail="Failed to set list member") from e
+    membership_cache.put(user_id, list_id, role)
+    logger.info("User %s is now %s of list %s", user_id, role.value, list_id)
+    return member
+
+
+@traced()
+def remove_list_member(db: Session, list_id: int, user_id: int) -> None:
+    """
+    Quita a un usuario de una lista.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+        user_id (int): ID del usuario.
+
+    Raises:
+        ListMemberNotFoundException: Si el usuario no es miembro de la lista.
+        LastListOwnerException: Si es el único propietario.
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    try:
+        _ensure_other_owner(db, list_id, user_id)
+        removed = db.execute(
+            delete(ListMemberModel)
+            .where(
+                ListMemberModel.list_id == list_id, ListMemberModel.user_id == user_id
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not removed:
+            raise ListMemberNotFoundException(list_id, user_id)
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("Error removing member %s of list %s: %s", user_id, list_id, e)
+        raise HTTPException(
+            status_code=500, detail="Failed to remove list member"
+        ) from e
+    membership_cache.invalidate(user_id, list_id)
+    logger.info("User %s removed from list %s", user_id, list_id)
+
+
+def member_of(user_id: int, list_id, *roles: ListRole):
+    """
+    Condición SQL "el usuario es miembro de la lista `list_id`" (con uno de `roles`,
+    si se indican), para fusionar la autorización en la consulta principal.
+
+    Args:
+        user_id (int): ID del usuario.
+        list_id: Columna o valor con el ID de la lista.
+        *roles (ListRole): Roles admitidos; cualquiera si no se indica ninguno.
+
+    Returns:
+        Exists: Subconsulta `EXISTS` sobre la clave primaria de `list_members`.
+    """
+    condition = select(ListMemberModel.user_id).where(
+        ListMemberModel.user_id == user_id, ListMemberModel.list_id == list_id
+    )
+    if roles:
+        condition = condition.where(ListMemberModel.role.in_(roles))
+    return condition.exists()
+
+
+def _has_owner(list_id):
+    return (
+        select(ListMemberModel.user_id)
+        .where(
+            ListMemberModel.list_id == list_id, ListMemberModel.role == ListRole.OWNER
+        )
+        .exists()
+    )
+
+
+@traced()
+def get_unowned_lists(
+    db: Session, limit: int = 50, cursor: Optional[str] = None
+) -> tuple[list[TaskListModel], Optional[str]]:
+    """
+    Obtiene las listas sin ningún propietario, ordenadas por ID.
+
+    Solo quedan así las listas que ya estaban vacías al introducir los miembros
+    (migraciones `v0010` y `v0011`): nadie puede acceder a ellas hasta que un
+    administrador las reclame con `claim_list`.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        limit (int): Tamaño de página.
+        cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+    Returns:
+        tuple[list[TaskListModel], Optional[str]]: Listas de la página y cursor de la
+        siguiente (None si no hay más).
+
+    Raises:
+        HTTPException 400: Si el cursor no es válido.
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    stmt = select(TaskListModel).where(~_has_owner(TaskListModel.id))
+    if cursor:
+        (after_id,) = decode_cursor(cursor, int)
+        stmt = stmt.where(TaskListModel.id > after_id)
+    try:
+        lists = list(db.scalars(stmt.order_by(TaskListModel.id).limit(limit + 1)))
+    except Exception as e:
+        logger.error("Error fetching unowned lists: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch task lists") from e
+
+    next_cursor = None
+    if len(lists) > limit:
+        lists = lists[:limit]
+        next_cursor = encode_cursor(lists[-1].id)
+    return lists, next_cursor
+
+
+@traced()
+def claim_list(db: Session, list_id: int, user_id: int) -> ListMemberModel:
+    """
+    Hace a `user_id` propietario de una lista que no tiene ninguno.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+        user_id (int): ID del usuario (un administrador).
+
+    Returns:
+        ListMemberModel: La pertenencia del nuevo propietario.
+
+    Raises:
+        TaskListNotFoundException: Si la lista no existe.
+        ListAlreadyOwnedException: Si la lista ya tiene propietario.
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    try:
+        # Bloquea la lista: dos reclamos simultáneos no pueden dejarle dos propietarios.
+        locked = db.scalar(
+            select(TaskListModel.id)
+            .where(TaskListModel.id == list_id)
+            .with_for_update()
+        )
+        if locked is None:
+            raise TaskListNotFoundException(list_id)
+        if db.scalar(select(_has_owner(list_id))):
+            raise ListAlreadyOwnedException(list_id)
+        db.execute(
+            update(TaskListModel)
+            .where(TaskListModel.id == list_id)
+            .values(owner_id=user_id)
+            .execution_options(synchronize_session=False)
+        )
+        member = _upsert_member(db, list_id, user_id, ListRole.OWNER)
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("Error claiming list %s for user %s: %s", list_id, user_id, e)
+        raise HTTPException(status_code=500, detail="Failed to claim list") from e
+    membership_cache.put(user_id, list_id, ListRole.OWNER)
+    logger.info("User %s claimed unowned list %s", user_id, list_id)
+    return member
@@ -0,0 +1,241 @@
+"""
+CRUD del orden manual de tareas dentro de una lista.
+
+Cada tarea tiene una clave de orden fraccional (`rank`): mover una tarea solo
+actualiza su propia fila. Cuando las claves crecen demasiado, o hay tareas sin
+clave, la lista se reequilibra reescribiendo claves cortas y equiespaciadas.
+"""
+
+# pylint: disable=not-callable
+
+import logging
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import String, bindparam, func, literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.ordering import DIGITS, OrderKeyError, key_between, keys_between
+from app.core.tracing import traced
+from app.domain.models.exceptions import TaskNotFoundException
+from app.infrastructure.db.models.task import RANK_MAX_LENGTH, TaskModel
+
+logger = logging.getLogger(__name__)
+
+
+# Orden manual (`rank`, luego `id`), servido por `ix_tasks_list_id_rank`.
+RANK_ORDER = (TaskModel.rank.asc().nulls_last(), TaskModel.id.asc())
+
+
+def rank_order(stmt):
+    """Aplica el orden manual (`rank`, luego `id`) servido por `ix_tasks_list_id_rank`."""
+    return stmt.order_by(*RANK_ORDER)
+
+
+def ranks_by_position(base: str, position, count: int):
+    """
+    Expresión SQL que calcula claves crecientes a partir de una posición (1..`count`).
+
+    Cada clave es `base` seguida de la posición en base 62, con ancho fijo, y de un
+    dígito intermedio. Así las claves ordenan como las posiciones, son mayores que
+    `base` y ninguna termina en cero.
+
+    Args:
+        base (str): Clave que precede a todas las generadas.
+        position: Expresión SQL entera con la posición, p. ej. un `ROW_NUMBER()`.
+        count (int): Posición máxima.
+
+    Returns:
+        ColumnElement[str]: Clave de la posición.
+    """
+    width = 1
+    while len(DIGITS) ** width <= count:
+        width += 1
+    key = literal(base, String)
+    for exponent in reversed(range(width)):
+        digit = (position // len(DIGITS) ** exponent) % len(DIGITS)
+        key = key + func.substr(literal(DIGITS, String), digit + 1, 1, type_=String)
+    return key + DIGITS[len(DIGITS) // 2]
+
+
+@traced()
+def next_rank(db: Session, list_id: int) -> str:
+    """
+    Devuelve la clave para agregar una tarea al final de la lista.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+
+    Returns:
+        str: Clave mayor que todas las de la lista.
+    """
+    last = db.scalar(
+        select(func.max(TaskModel.rank)).where(TaskModel.list_id == list_id)
+    )
+    return key_between(last, None)
+
+
+def _neighbour_ranks(
+    db: Session, list_id: int, task_id: int, after_id: Optional[int]
+) -> tuple[bool, Optional[str], Optional[str]]:
+    """
+    Obtiene en una consulta la clave de `after_id` y la clave siguiente a ella.
+
+    El límite superior incluye las claves iguales a la de `after_id` (de otras
+    tareas): si las hay, ambos límites coinciden y `move_task` reequilibra la lista.
+    Pueden aparecer al agregar tareas a la vez, porque `next_rank` no bloquea.
+
+    Returns:
+        tuple[bool, Optional[str], Optional[str]]: Si `after_id` existe en la lista,
+        su clave (límite inferior) y la siguiente clave (límite superior).
+    """
+    others = (TaskModel.list_id == list_id, TaskModel.id != task_id)
+    if after_id is None:
+        upper = db.scalar(select(func.min(TaskModel.rank)).where(*others))
+        return True, None, upper
+
+    after = (
+        select(TaskModel.rank)
+        .where(TaskModel.list_id == list_id, TaskModel.id == after_id)
+        .scalar_subquery()
+    )
+    row = db.execute(
+        select(
+            select(func.count(TaskModel.id))
+            .where(TaskModel.list_id == list_id, TaskModel.id == after_id)
+            .scalar_subquery(),
+            after,
+            select(func.min(TaskModel.rank))
+            .where(*others, TaskModel.id != after_id, TaskModel.rank >= after)
+            .scalar_subquery(),
+        )
+    ).one()
+    return bool(row[0]), row[1], row[2]
+
+
+@traced()
+def move_task(
+    db: Session, list_id: int, task_id: int, after_id: Optional[int]
+) -> TaskModel:
+    """
+    Mueve una tarea justo después de otra (o al inicio) actualizando solo su fila.
+
+    Si las tareas vecinas no tienen clave, o sus claves coinciden, la lista se
+    reequilibra una vez antes de calcular la nueva posición.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+        task_id (int): ID de la tarea a mover.
+        after_id (Optional[int]): ID de la tarea que quedará antes; None = al inicio.
+
+    Returns:
+        TaskModel: La tarea con su nueva clave.
+
+    Raises:
+        TaskNotFoundException: Si la tarea o `after_id` no existen en la lista.
+        HTTPException 400: Si `after_id` es la misma tarea.
+    """
+    if after_id == task_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Una tarea no puede ubicarse después de sí misma",
+        )
+
+    for attempt in range(2):
+        found, lower, upper = _neighbour_ranks(db, list_id, task_id, after_id)
+        if not found:
+            raise TaskNotFoundException(after_id)
+        try:
+            if after_id is not None and lower is None:
+                raise OrderKeyError("neighbour without rank")
+            new_rank = key_between(lower, upper)
+            if len(new_rank) <= RANK_MAX_LENGTH:
+                break
+            raise OrderKeyError("rank too long")
+        except OrderKeyError:
+            if attempt:
+                raise
+            logger.info("Rebalancing list %s before moving task %s", list_id, task_id)
+            rebalance_list(db, list_id)
+
+    task = db.scalars(
+        update(TaskModel)
+        .where(TaskModel.id == task_id, TaskModel.list_id == list_id)
+        .values(rank=new_rank)
+        .returning(TaskModel)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    if task is None:
+        db.rollback()
+        raise TaskNotFoundException(task_id)
+    db.commit()
+    logger.info("Moved task %s in list %s to rank %s", task_id, list_id, new_rank)
+    return task
+
+
+@traced()
+def rebalance_list(db: Session, list_id: int) -> int:
+    """
+    Reescribe las claves de una lista con claves cortas, conservando el orden actual.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+
+    Returns:
+        int: Número de tareas actualizadas.
+    """
+    ids = db.scalars(
+        rank_order(
+            select(TaskModel.id).where(TaskModel.list_id == list_id)
+        ).with_for_update()
+    ).all()
+    ranks = keys_between(None, None, len(ids))
+    if ids:
+        db.execute(
+            update(TaskModel.__table__)
+            .where(
+                TaskModel.__table__.c.list_id == list_id,
+                TaskModel.__table__.c.id == bindparam("task_id"),
+            )
+            .values(rank=bindparam("new_rank")),
+            [
+                {"task_id": task_id, "new_rank": rank}
+                for task_id, rank in zip(ids, ranks)
+            ],
+        )
+    db.commit()
+    logger.info("Rebalanced %d task ranks in list %s", len(ids), list_id)
+    return len(ids)
+
+
+@traced()
+def lists_to_rebalance(
+    db: Session, max_length: int, after_list_id: int = 0, limit: int = 100
+) -> list[int]:
+    """
+    Busca listas con claves demasiado largas o con tareas sin clave.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        max_length (int): Longitud máxima tolerada de una clave.
+        after_list_id (int): Devuelve solo listas con ID mayor (paginación).
+        limit (int): Número máximo de listas a devolver.
+
+    Returns:
+        list[int]: IDs de las listas a reequilibrar, en orden ascendente.
+    """
+    return list(
+        db.scalars(
+            select(TaskModel.list_id)
+            .where(
+                TaskModel.list_id > after_list_id,
+                or_(TaskModel.rank.is_(None), func.length(TaskModel.rank) > max_length),
+            )
+            .distinct()
+            .order_by(TaskModel.list_id)
+            .limit(limit)
+        )
+    )
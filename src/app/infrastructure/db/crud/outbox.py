@@ -0,0 +1,191 @@
+"""
+Bandeja de salida transaccional (*transactional outbox*) para los efectos
+secundarios de los cambios: notificaciones, webhooks, auditoría...
+
+El CRUD que origina el efecto llama a `enqueue_event` antes de confirmar, de modo que
+el evento se escribe en la misma transacción que el cambio (un `INSERT` más en la
+petición) y se pierde o se confirma con él. Un despachador en segundo plano
+(`app.infrastructure.jobs.outbox`) llama a `dispatch_outbox_events`, que reclama los
+eventos pendientes en lotes y los entrega a los manejadores de su tema.
+
+La entrega es *al menos una vez*: si el proceso cae después de ejecutar un manejador
+y antes de eliminar el evento, este se vuelve a entregar cuando vence su reclamo
+(`claimed_until`).
+
+Funciones principales:
+- enqueue_event: Registra un evento en la transacción en curso.
+- dispatch_outbox_events: Reclama y entrega un lote de eventos pendientes.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Mapping, Sequence
+
+from sqlalchemy import Row, delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.infrastructure.db.models.outbox_event import OutboxEventModel
+
+logger = logging.getLogger(__name__)
+
+# Manejador de un tema: recibe una sesión y el payload. Lo que escriba se confirma junto
+# con la eliminación del evento, o se deshace si algún manejador del tema falla.
+Handler = Callable[[Session, dict], None]
+
+
+def enqueue_event(db: Session, topic: str, payload: dict) -> None:
+    """
+    Registra un evento en la transacción en curso (no confirma).
+
+    Args:
+        db (Session): Sesión de la transacción que origina el evento.
+        topic (str): Tema del evento (ver `OutboxTopic`).
+        payload (dict): Datos del evento, serializables como JSON.
+    """
+    db.execute(insert(OutboxEventModel).values(topic=topic, payload=payload))
+
+
+def _claim(
+    db: Session, topics: list[str], batch_size: int, lease: float
+) -> Sequence[Row]:
+    # Reclama el lote con un único `UPDATE` que fija `claimed_until` y lo confirma de
+    # inmediato: la entrega no retiene bloqueos de filas (ni, en SQLite, el de
+    # escritura de toda la base de datos).
+    now = datetime.now(timezone.utc)
+    claimable = (
+        select(OutboxEventModel.id)
+        .where(
+            OutboxEventModel.failed_at.is_(None),
+            OutboxEventModel.available_at <= now,
+            or_(
+                OutboxEventModel.claimed_until.is_(None),
+                OutboxEventModel.claimed_until <= now,
+            ),
+            OutboxEventModel.topic.in_(topics),
+        )
+        .order_by(OutboxEventModel.available_at, OutboxEventModel.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    # Se leen columnas, no entidades: la sesión del despachador es de larga duración y
+    # el mapa de identidad podría devolver intentos desactualizados.
+    events = db.execute(
+        update(OutboxEventModel)
+        .where(OutboxEventModel.id.in_(claimable))
+        .values(claimed_until=now + timedelta(seconds=lease))
+        .returning(
+            OutboxEventModel.id,
+            OutboxEventModel.topic,
+            OutboxEventModel.payload,
+            OutboxEventModel.attempts,
+            OutboxEventModel.available_at,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    return sorted(events, key=lambda event: (event.available_at, event.id))
+
+
+def _record_failure(
+    db: Session, event: Row, error: Exception, max_attempts: int, retry_backoff: float
+) -> None:
+    # Cuenta el intento fallido y libera el reclamo, en una transacción propia.
+    attempts = event.attempts + 1
+    now = datetime.now(timezone.utc)
+    values = {"attempts": attempts, "last_error": repr(error)[:1000]}
+    if attempts >= max_attempts:
+        values["failed_at"] = now
+        logger.error(
+            "Outbox event %s (%s) failed after %d attempts: %r",
+            event.id,
+            event.topic,
+            attempts,
+            error,
+        )
+    else:
+        delay = retry_backoff * 2 ** (attempts - 1)
+        values["available_at"] = now + timedelta(seconds=delay)
+        logger.warning(
+            "Outbox event %s (%s) failed (attempt %d), retrying in %.0f s: %r",
+            event.id,
+            event.topic,
+            attempts,
+            delay,
+            error,
+        )
+    db.execute(
+        update(OutboxEventModel)
+        .where(OutboxEventModel.id == event.id)
+        .values(**values, claimed_until=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+@traced()
+def dispatch_outbox_events(  # pylint: disable=too-many-arguments
+    db: Session,
+    handlers: Mapping[str, Sequence[Handler]],
+    batch_size: int = 100,
+    max_attempts: int = 5,
+    retry_backoff: float = 5.0,
+    *,
+    lease: float = 60.0,
+) -> int:
+    """
+    Reclama y entrega un lote de eventos pendientes.
+
+    El reclamo es una transacción corta: marca los eventos con `claimed_until`
+    (ahora + `lease`) y confirma. Se eligen con `FOR UPDATE SKIP LOCKED` en
+    PostgreSQL, así que varios despachadores pueden reclamar a la vez lotes
+    distintos; en SQLite se turnan solo durante el reclamo. Mientras dura el reclamo,
+    ningún otro despachador toma esos eventos; si el proceso cae, se vuelven a
+    reclamar al vencer. Solo se reclaman los temas que tienen manejadores en
+    `handlers`; los demás esperan a un despachador que los conozca.
+
+    La entrega se hace fuera de esa transacción, evento a evento. Los entregados se
+    eliminan en la misma transacción que confirma lo que escribieran sus manejadores;
+    si un manejador falla, eso se deshace y el evento se pospone
+    `retry_backoff * 2^(intentos - 1)` segundos o, al llegar a `max_attempts`, se
+    marca como fallido, en una transacción propia.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        handlers (Mapping[str, Sequence[Handler]]): Manejadores por tema.
+        batch_size (int): Número máximo de eventos del lote.
+        max_attempts (int): Intentos antes de dar un evento por fallido.
+        retry_backoff (float): Espera, en segundos, tras el primer fallo.
+        lease (float): Segundos que dura el reclamo; debe cubrir la entrega del lote.
+
+    Returns:
+        int: Número de eventos reclamados (entregados o no).
+    """
+    try:
+        events = _claim(db, list(handlers), batch_size, lease)
+        delivered = 0
+        for event in events:
+            try:
+                for handler in handlers[event.topic]:
+                    handler(db, event.payload)
+                db.execute(
+                    delete(OutboxEventModel)
+                    .where(OutboxEventModel.id == event.id)
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+            except Exception as e:  # pylint: disable=broad-except
+                db.rollback()
+                _record_failure(db, event, e, max_attempts, retry_backoff)
+            else:
+                delivered += 1
+    except Exception:
+        db.rollback()
+        logger.error("Error dispatching outbox events", exc_info=True)
+        raise
+
+    if events:
+        logger.info(
+            "Dispatched %d outbox events (%d delivered)", len(events), delivered
+        )
+    return len(events)
@@ -0,0 +1,126 @@
+"""
+Recordatorios de las tareas con fecha límite (`tasks.due_at`).
+
+El planificador (`app.infrastructure.jobs.reminders`) lee con
+`get_upcoming_reminders` una ventana de recordatorios próximos sobre el índice
+parcial `ix_tasks_pending_reminders` y, al vencer, los reclama por lotes con
+`claim_due_reminders`. El envío se delega en la bandeja de salida (evento
+`task.due`), registrado en la misma transacción que el reclamo.
+
+Funciones principales:
+- get_upcoming_reminders: Recordatorios pendientes que vencen antes de un instante.
+- claim_due_reminders: Marca como enviados los recordatorios vencidos de un lote.
+"""
+
+import logging
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Row, func, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.core.constants import OutboxTopic
+from app.core.tracing import traced
+from app.infrastructure.db.crud.outbox import enqueue_event
+from app.infrastructure.db.models.task import TaskModel
+
+logger = logging.getLogger(__name__)
+
+# Condición del índice parcial `ix_tasks_pending_reminders`: repetirla en las consultas
+# permite al planificador usarlo.
+PENDING_REMINDER = (
+    TaskModel.due_at.isnot(None),
+    TaskModel.reminded_at.is_(None),
+    TaskModel.is_done.is_(False),
+)
+
+
+@traced()
+def get_upcoming_reminders(db: Session, until: datetime, limit: int) -> list[Row]:
+    """
+    Obtiene los recordatorios pendientes que vencen antes de `until`, por fecha.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        until (datetime): Fin de la ventana (incluido).
+        limit (int): Número máximo de recordatorios.
+
+    Returns:
+        list[Row]: Filas `(due_at, id, list_id)` ordenadas por fecha límite.
+    """
+    return list(
+        db.execute(
+            select(TaskModel.due_at, TaskModel.id, TaskModel.list_id)
+            .where(*PENDING_REMINDER, TaskModel.due_at <= until)
+            .order_by(TaskModel.due_at, TaskModel.id)
+            .limit(limit)
+        )
+    )
+
+
+@traced()
+def claim_due_reminders(
+    db: Session, keys: Sequence[tuple[int, int]], now: datetime
+) -> int:
+    """
+    Reclama los recordatorios vencidos de un lote y encola su envío, en una transacción.
+
+    El reclamo es un único `UPDATE` condicionado a que el recordatorio siga pendiente
+    y vencido: si otro planificador ya lo reclamó, o la tarea se completó o cambió de
+    fecha desde que se leyó, la fila no se modifica y no se avisa. Las filas
+    reclamadas se entregan juntas en un solo evento `task.due`.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        keys (Sequence[tuple[int, int]]): Pares `(list_id, task_id)` candidatos.
+        now (datetime): Instante del reclamo.
+
+    Returns:
+        int: Número de recordatorios reclamados.
+    """
+    if not keys:
+        return 0
+    try:
+        claimed = db.execute(
+            update(TaskModel)
+            .where(
+                tuple_(TaskModel.list_id, TaskModel.id).in_(list(keys)),
+                *PENDING_REMINDER,
+                TaskModel.due_at <= now,
+            )
+            # `updated_at` se conserva: avisar no es una modificación de la tarea.
+            .values(reminded_at=now, updated_at=TaskModel.updated_at)
+            .returning(
+                TaskModel.id,
+                TaskModel.list_id,
+                TaskModel.title,
+                TaskModel.due_at,
+                func.coalesce(TaskModel.assigned_to, TaskModel.created_by).label(
+                    "user_id"
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        if claimed:
+            enqueue_event(
+                db,
+                OutboxTopic.TASK_DUE.value,
+                {
+                    "reminders": [
+                        {
+                            "task_id": row.id,
+                            "list_id": row.list_id,
+                            "title": row.title,
+                            "due_at": row.due_at.isoformat(),
+                            "user_id": row.user_id,
+                        }
+                        for row in claimed
+                    ]
+                },
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    logger.debug("Claimed %d of %d due reminders", len(claimed), len(keys))
+    return len(claimed)
@@ -1,28 +1,109 @@
 """
 CRUD para operaciones sobre el modelo TaskModel: creación, consulta,
-actualización, eliminación y cambio de estado de tareas.
+actualización, eliminación, cambio de estado y búsqueda de tareas.
+
+La creación, la actualización, el cambio de estado y la eliminación se registran,
+una vez confirmados, en el historial de la tarea (ver `crud/task_history.py`).
 """
 
 import logging
+import re
+from datetime import datetime
+from typing import NoReturn, Optional
 
 from fastapi import HTTPException
+from sqlalchemy import (
+    and_,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from app.core.constants import ListRole, OutboxTopic, TaskHistoryAction, TaskRelation
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.tracing import traced
+from app.domain.models.exceptions import (
+    AssigneeNotFoundException,
+    TaskListNotFoundException,
+    TaskNotFoundException,
+    TaskVersionConflictException,
+)
 from app.domain.models.task import TaskCreate, TaskUpdate
-from app.infrastructure.db.models.task import TaskModel
+from app.infrastructure.db.crud.membership import member_of
+from app.infrastructure.db.crud.ordering import (
+    RANK_ORDER,
+    next_rank,
+    ranks_by_position,
+)
+from app.infrastructure.db.crud.outbox import enqueue_event
+from app.infrastructure.db.crud.task_history import HISTORY_FIELDS, record_task_change
+from app.infrastructure.db.models.task import (
+    SEARCH_CONFIG,
+    SEARCH_FTS_TABLE,
+    TaskModel,
+    search_document,
+)
 from app.infrastructure.db.models.task_list import TaskListModel
 from app.infrastructure.db.models.user import UserModel
-from app.infrastructure.email.notifier import notify_assigned_user
 
 logger = logging.getLogger(__name__)
 
 
+def _raise_for_integrity_error(
+    db: Session,
+    error: IntegrityError,
+    list_id: Optional[int] = None,
+    assigned_to: Optional[int] = None,
+) -> NoReturn:
+    """
+    Traduce una violación de integridad en la excepción HTTP correspondiente.
+
+    Las escrituras no comprueban antes la existencia de la lista ni del usuario
+    asignado: lo hacen las claves foráneas. Solo cuando la sentencia falla se consulta,
+    en una única sentencia, cuál de las referencias no existe.
+    """
+    db.rollback()
+    list_exists = (
+        exists().where(TaskListModel.id == list_id) if list_id else literal(True)
+    )
+    user_exists = (
+        exists().where(UserModel.id == assigned_to) if assigned_to else literal(True)
+    )
+    found_list, found_user = db.execute(select(list_exists, user_exists)).one()
+    if not found_list:
+        raise TaskListNotFoundException(list_id) from error
+    if not found_user:
+        raise AssigneeNotFoundException() from error
+    logger.warning("Integrity error writing task: %s", error.orig)
+    raise HTTPException(
+        status_code=400,
+        detail="Database integrity error: possible duplicate or invalid data",
+    ) from error
+
+
+@traced()
 def create_task(
     db: Session, list_id: int, task_data: TaskCreate, created_by_id: int
 ) -> TaskModel:
     """
     Crea una nueva tarea asociada a una lista específica.
 
+    La tarea se inserta y se devuelve con un único `INSERT ... RETURNING`; la
+    existencia de la lista y del usuario asignado la garantizan las claves foráneas.
+    Si la tarea tiene usuario asignado, su notificación se registra como evento
+    `task.assigned` en la misma transacción; la envía el despachador de la bandeja de
+    salida, fuera de la petición.
+
     Args:
         db (Session): Sesión activa de base de datos.
         list_id (int): ID de la lista a la que se asignará la tarea.
@@ -32,65 +113,57 @@ def create_task(
         TaskModel: Instancia de la tarea creada.
 
     Raises:
-        HTTPException 404: Si la lista o usuario asignado no existen.
+        TaskListNotFoundException: Si la lista no existe.
+        AssigneeNotFoundException: Si el usuario asignado no existe.
         HTTPException 400: Si hay error de integridad.
         HTTPException 500: Otros errores inesperados.
     """
-    try:
-        task_list = db.query(TaskListModel).filter(TaskListModel.id == list_id).first()
-        if not task_list:
-            raise HTTPException(status_code=404, detail="Task list not found")
-
-        assigned_id = task_data.assigned_to
-        if assigned_id == 0:
-            assigned_id = None
-
-        assignee = None
-        if task_data.assigned_to:
-            assignee = (
-                db.query(UserModel)
-                .filter(UserModel.id == task_data.assigned_to)
-                .first()
-            )
-            if not assignee:
-                raise HTTPException(
-                    status_code=404, detail="Usuario asignado no existe"
-                )
-
-        task_dict = task_data.dict()
-        if task_dict["assigned_to"] == 0:
-            task_dict["assigned_to"] = None
+    task_dict = task_data.dict()
+    if task_dict["assigned_to"] == 0:
+        task_dict["assigned_to"] = None
 
+    try:
         logger.info("Creating task in list %d: %s", list_id, task_dict)
-        db_task = TaskModel(**task_dict, list_id=list_id, created_by=created_by_id)
-        db.add(db_task)
-        db.commit()
-        db.refresh(db_task)
-
-        if assignee:
-            logger.info(
-                "[NOTIFICACIÓN FICTICIA] Se notificó al usuario %s (%s) sobre la tarea '%s'.",
-                assignee.username,
-                assignee.email,
-                db_task.title,
+        db_task = db.scalars(
+            insert(TaskModel)
+            .values(
+                **task_dict,
+                list_id=list_id,
+                created_by=created_by_id,
+                rank=next_rank(db, list_id),
             )
-            notify_assigned_user(assignee.email, db_task.title)
-
-        return db_task
-
+            .returning(TaskModel)
+        ).one()
+        if db_task.assigned_to:
+            enqueue_event(
+                db,
+                OutboxTopic.TASK_ASSIGNED,
+                {
+                    "task_id": db_task.id,
+                    "title": db_task.title,
+                    "assigned_to": db_task.assigned_to,
+                },
+            )
+        db.commit()
     except IntegrityError as e:
-        logger.warning("Integrity error creating task: %s", e.orig)
-        raise HTTPException(
-            status_code=400,
-            detail="Database integrity error: possible duplicate or invalid data",
-        ) from e
-    except HTTPException:
-        raise  # Propaga HTTPExceptions ya lanzadas arriba
+        _raise_for_integrity_error(db, e, list_id, task_dict["assigned_to"])
     except Exception as e:
+        db.rollback()
         logger.error("Unexpected error creating task: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to create task") from e
 
+    record_task_change(
+        db,
+        TaskHistoryAction.CREATED,
+        db_task.id,
+        list_id,
+        db_task.version,
+        changes={field: getattr(db_task, field) for field in HISTORY_FIELDS},
+    )
+    return db_task
 
+
+@traced()
 def get_task(db: Session, list_id: int, task_id: int) -> TaskModel:
     """
     Obtiene una tarea específica por su ID y el ID de su lista.
@@ -121,55 +194,103 @@ def get_task(db: Session, list_id: int, task_id: int) -> TaskModel:
         raise HTTPException(status_code=500, detail="Failed to fetch task") from e
 
 
+def _versioned_update(
+    db: Session,
+    list_id: int,
+    task_id: int,
+    values: dict,
+    expected_version: Optional[int],
+) -> tuple[TaskModel, dict]:
+    """
+    Aplica `values` a la tarea con un `UPDATE ... RETURNING`, incrementando su
+    versión. Antes lee la fila bloqueándola (`FOR UPDATE`), lo que distingue entre
+    tarea inexistente y conflicto de `expected_version` y devuelve, junto con la
+    tarea, los valores que tenían los campos de `values`.
+    """
+    current = db.execute(
+        select(TaskModel.version, *(getattr(TaskModel, field) for field in values))
+        .where(TaskModel.id == task_id, TaskModel.list_id == list_id)
+        .with_for_update()
+    ).one_or_none()
+    if current is None:
+        db.rollback()
+        raise TaskNotFoundException(task_id)
+    if expected_version is not None and current.version != expected_version:
+        db.rollback()
+        raise TaskVersionConflictException(task_id)
+    try:
+        task = db.scalars(
+            update(TaskModel)
+            .where(TaskModel.id == task_id, TaskModel.list_id == list_id)
+            .values(**values, version=TaskModel.version + 1)
+            .returning(TaskModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).one()
+    except IntegrityError as e:
+        _raise_for_integrity_error(db, e, assigned_to=values.get("assigned_to"))
+    db.commit()
+    return task, current._asdict()
+
+
+def _changed_fields(previous: dict, task: TaskModel, fields) -> dict:
+    # Campos de `fields` cuyo valor cambió, como `[anterior, nuevo]`.
+    return {
+        field: [previous[field], getattr(task, field)]
+        for field in fields
+        if previous[field] != getattr(task, field)
+    }
+
+
+@traced()
 def update_task(
-    db: Session, list_id: int, task_id: int, task_data: TaskUpdate
+    db: Session,
+    list_id: int,
+    task_id: int,
+    task_data: TaskUpdate,
+    expected_version: Optional[int] = None,
 ) -> TaskModel:
     """
-    Actualiza parcialmente una tarea existente.
+    Actualiza parcialmente una tarea existente. El historial recoge, de los campos
+    enviados, solo los que cambiaron.
 
     Args:
         db (Session): Sesión activa de base de datos.
         list_id (int): ID de la lista que contiene la tarea.
         task_id (int): ID de la tarea a actualizar.
         task_data (TaskUpdate): Campos para actualizar en la tarea.
+        expected_version (Optional[int]): Versión que el cliente modificó (`If-Match`);
+            None para no comprobarla.
 
     Returns:
         TaskModel: Instancia de la tarea actualizada.
 
     Raises:
-        HTTPException 404: Si la tarea no existe.
+        TaskNotFoundException: Si la tarea no existe.
+        AssigneeNotFoundException: Si el usuario asignado no existe.
+        TaskVersionConflictException: Si la tarea cambió desde `expected_version`.
         HTTPException 500: Si ocurre un error al actualizar la tarea.
     """
-    try:
-        db_task = (
-            db.query(TaskModel)
-            .filter(TaskModel.id == task_id, TaskModel.list_id == list_id)
-            .first()
-        )
-        if not db_task:
-            raise HTTPException(status_code=404, detail="Task not found")
-
-        logger.info(
-            "Updating task %d in list %d with data: %s",
-            task_id,
-            list_id,
-            task_data.dict(exclude_unset=True),
-        )
+    updated_data = task_data.dict(exclude_unset=True)
+    logger.info(
+        "Updating task %d in list %d with data: %s", task_id, list_id, updated_data
+    )
 
-        updated_data = task_data.dict(exclude_unset=True)
+    if "assigned_to" in updated_data and updated_data["assigned_to"] == 0:
+        updated_data["assigned_to"] = None
 
-        if "assigned_to" in updated_data and updated_data["assigned_to"] == 0:
-            updated_data["assigned_to"] = None
+    values = dict(updated_data)
+    if "due_at" in values:
+        # Una fecha límite nueva vuelve a programar el recordatorio.
+        values["reminded_at"] = None
 
-        for key, value in updated_data.items():
-            setattr(db_task, key, value)
-
-        for key, value in updated_data.items():
-            setattr(db_task, key, value)
-        db.commit()
-        db.refresh(db_task)
-        return db_task
+    try:
+        task, previous = _versioned_update(
+            db, list_id, task_id, values, expected_version
+        )
+    except HTTPException:
+        raise
     except Exception as e:
+        db.rollback()
         logger.error(
             "Error updating task %d in list %d: %s",
             task_id,
@@ -178,39 +299,60 @@ def update_task(
         )
         raise HTTPException(status_code=500, detail="Failed to update task") from e
 
+    record_task_change(
+        db,
+        TaskHistoryAction.UPDATED,
+        task_id,
+        list_id,
+        task.version,
+        changes=_changed_fields(previous, task, updated_data),
+    )
+    return task
+
 
-def delete_task(db: Session, list_id: int, task_id: int) -> None:
+@traced()
+def delete_task(db: Session, list_id: int, task_id: int) -> bool:
     """
-    Elimina una tarea específica por su ID y lista asociada.
+    Elimina una tarea específica por su ID y lista asociada con un único `DELETE`.
 
     Args:
         db (Session): Sesión activa de base de datos.
         list_id (int): ID de la lista que contiene la tarea.
         task_id (int): ID de la tarea a eliminar.
 
+    Returns:
+        bool: True si la tarea existía y se eliminó.
+
     Raises:
-        HTTPException 404: Si la tarea no existe.
         HTTPException 500: Si ocurre un error al eliminar la tarea.
     """
     try:
-        db_task = (
-            db.query(TaskModel)
-            .filter(TaskModel.id == task_id, TaskModel.list_id == list_id)
-            .first()
-        )
-        if not db_task:
-            return False
         logger.info("Deleting task %s from list %s", task_id, list_id)
-        db.delete(db_task)
+        version = db.scalar(
+            delete(TaskModel)
+            .where(TaskModel.id == task_id, TaskModel.list_id == list_id)
+            .returning(TaskModel.version)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        return True
     except Exception as e:
+        db.rollback()
         logger.error("Error deleting task %s from list %s: %s", task_id, list_id, e)
         raise HTTPException(status_code=500, detail="Failed to delete task") from e
 
+    if version is None:
+        return False
+    record_task_change(db, TaskHistoryAction.DELETED, task_id, list_id, version + 1)
+    return True
 
+
+@traced()
 def update_task_status(
-    db: Session, list_id: int, task_id: int, is_done: bool
+    db: Session,
+    list_id: int,
+    task_id: int,
+    is_done: bool,
+    expected_version: Optional[int] = None,
 ) -> TaskModel:
     """
     Cambia el estado de completitud de una tarea.
@@ -220,34 +362,291 @@ def update_task_status(
         list_id (int): ID de la lista que contiene la tarea.
         task_id (int): ID de la tarea a modificar.
         is_done (bool): Nuevo estado de completitud.
+        expected_version (Optional[int]): Versión que el cliente modificó (`If-Match`);
+            None para no comprobarla.
 
     Returns:
         TaskModel: Instancia de la tarea actualizada.
 
     Raises:
-        HTTPException 404: Si la tarea no existe.
+        TaskNotFoundException: Si la tarea no existe.
+        TaskVersionConflictException: Si la tarea cambió desde `expected_version`.
         HTTPException 500: Si ocurre un error al actualizar el estado.
     """
+    logger.info(
+        "Updating status of task %s in list %s to %s", task_id, list_id, is_done
+    )
     try:
-        task = (
-            db.query(TaskModel)
-            .filter(TaskModel.id == task_id, TaskModel.list_id == list_id)
-            .first()
+        task, previous = _versioned_update(
+            db, list_id, task_id, {"is_done": is_done}, expected_version
         )
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-
-        logger.info(
-            "Updating status of task %s in list %s to %s", task_id, list_id, is_done
-        )
-        task.is_done = is_done
-        db.commit()
-        db.refresh(task)
-        return task
+    except HTTPException:
+        raise
     except Exception as e:
+        db.rollback()
         logger.error(
             "Error updating status for task %s in list %s: %s", task_id, list_id, e
         )
         raise HTTPException(
             status_code=500, detail="Failed to update task status"
         ) from e
+
+    record_task_change(
+        db,
+        TaskHistoryAction.UPDATED,
+        task_id,
+        list_id,
+        task.version,
+        changes=_changed_fields(previous, task, ["is_done"]),
+    )
+    return task
+
+
+def _search_terms(query: str) -> list[str]:
+    """Extrae los términos alfanuméricos de la cadena de búsqueda."""
+    return re.findall(r"\w+", query)
+
+
+def _postgres_search(list_id: int, query: str):
+    """Consulta rankeada sobre el índice GIN `ix_tasks_search_document`."""
+    document = search_document(TaskModel.title, TaskModel.description)
+    ts_query = func.websearch_to_tsquery(
+        literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query
+    )
+    return (
+        select(TaskModel)
+        .where(TaskModel.list_id == list_id, document.op("@@")(ts_query))
+        .order_by(func.ts_rank_cd(document, ts_query).desc(), TaskModel.id.desc())
+    )
+
+
+def _sqlite_search(list_id: int, terms: list[str]):
+    """Consulta rankeada (bm25) sobre la tabla virtual FTS5 `tasks_fts`."""
+    fts = table(SEARCH_FTS_TABLE, column("rowid"))
+    fts_ref = literal_column(SEARCH_FTS_TABLE)
+    match = " ".join(f'"{term}"*' for term in terms)
+    return (
+        select(TaskModel)
+        .join(fts, fts.c.rowid == TaskModel.id)
+        .where(TaskModel.list_id == list_id, fts_ref.op("MATCH")(match))
+        .order_by(func.bm25(fts_ref), TaskModel.id.desc())
+    )
+
+
+def _fallback_search(list_id: int, terms: list[str]):
+    """Búsqueda sin índice (LIKE) para motores sin soporte de texto completo."""
+    conditions = [
+        or_(
+            TaskModel.title.ilike(f"%{term}%"),
+            TaskModel.description.ilike(f"%{term}%"),
+        )
+        for term in terms
+    ]
+    return (
+        select(TaskModel)
+        .where(TaskModel.list_id == list_id, and_(*conditions))
+        .order_by(TaskModel.id.desc())
+    )
+
+
+@traced()
+def search_tasks(
+    db: Session, list_id: int, query: str, limit: int = 20, offset: int = 0
+) -> list[TaskModel]:
+    """
+    Busca tareas de una lista por texto en su título y descripción.
+
+    Usa el backend indexado del motor activo: `tsvector` + GIN en PostgreSQL y
+    FTS5 en SQLite. Los resultados se ordenan por relevancia y se paginan.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista en la que se busca.
+        query (str): Texto a buscar.
+        limit (int): Número máximo de resultados.
+        offset (int): Número de resultados a omitir.
+
+    Returns:
+        list[TaskModel]: Tareas encontradas, de mayor a menor relevancia.
+
+    Raises:
+        HTTPException 500: Si ocurre un error durante la búsqueda.
+    """
+    terms = _search_terms(query)
+    if not terms:
+        return []
+
+    try:
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = _postgres_search(list_id, query)
+        elif dialect == "sqlite":
+            stmt = _sqlite_search(list_id, terms)
+        else:
+            stmt = _fallback_search(list_id, terms)
+
+        logger.info("Searching tasks in list %s for %r (%s)", list_id, query, dialect)
+        return list(db.scalars(stmt.limit(limit).offset(offset)))
+    except Exception as e:
+        logger.error("Error searching tasks in list %s: %s", list_id, e)
+        raise HTTPException(status_code=500, detail="Failed to search tasks") from e
+
+
+@traced()
+def get_user_tasks(  # pylint: disable=too-many-arguments
+    db: Session,
+    user_id: int,
+    relation: TaskRelation,
+    *,
+    is_done: Optional[bool] = None,
+    priority: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> tuple[list[TaskModel], Optional[str]]:
+    """
+    Obtiene las tareas asignadas a (o creadas por) un usuario en todas sus listas.
+
+    Se resuelve con una única consulta sobre los índices
+    `(assigned_to | created_by, is_done, updated_at, id)` y paginación keyset
+    ordenada por `updated_at` e `id` descendentes. La pertenencia del usuario a la
+    lista de cada tarea se comprueba en la misma consulta (`EXISTS` sobre la clave
+    primaria de `list_members`).
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        user_id (int): ID del usuario.
+        relation (TaskRelation): `assigned` o `created`.
+        is_done (Optional[bool]): Filtrar tareas completadas o no.
+        priority (Optional[str]): Filtrar tareas por nivel de prioridad.
+        limit (int): Tamaño de página.
+        cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+    Returns:
+        tuple[list[TaskModel], Optional[str]]: Tareas de la página y cursor de la
+        siguiente (None si no hay más).
+
+    Raises:
+        HTTPException 400: Si el cursor no es válido.
+        HTTPException 500: Si ocurre un error inesperado durante la consulta.
+    """
+    owner_column = (
+        TaskModel.assigned_to
+        if relation == TaskRelation.ASSIGNED
+        else TaskModel.created_by
+    )
+    # Solo las tareas de listas de las que el usuario sigue siendo miembro.
+    stmt = select(TaskModel).where(
+        owner_column == user_id, member_of(user_id, TaskModel.list_id)
+    )
+    if is_done is not None:
+        stmt = stmt.where(TaskModel.is_done == is_done)
+    if priority:
+        stmt = stmt.where(TaskModel.priority == priority)
+    if cursor:
+        updated_at, task_id = decode_cursor(cursor, datetime, int)
+        stmt = stmt.where(
+            tuple_(TaskModel.updated_at, TaskModel.id)
+            < tuple_(literal(updated_at, TaskModel.updated_at.type), task_id)
+        )
+    stmt = stmt.order_by(TaskModel.updated_at.desc(), TaskModel.id.desc())
+
+    try:
+        tasks = list(db.scalars(stmt.limit(limit + 1)))
+    except Exception as e:
+        logger.error("Error fetching %s tasks for user %s: %s", relation, user_id, e)
+        raise HTTPException(status_code=500, detail="Failed to fetch tasks") from e
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1].updated_at, tasks[-1].id)
+    return tasks, next_cursor
+
+
+@traced()
+def move_tasks(
+    db: Session, list_id: int, task_ids: list[int], target_list_id: int, user_id: int
+) -> int:
+    """
+    Mueve un conjunto de tareas de una lista a otra, al final de la lista destino y
+    en el orden que tenían en la origen.
+
+    Que el usuario pueda editar la lista destino (lo que implica que existe) se
+    verifica en la misma sentencia; solo si no se movió ninguna tarea se consulta
+    para distinguir el error. Todas las tareas se actualizan con un único `UPDATE`:
+    un `ROW_NUMBER()` sobre el orden de la origen da a cada una su posición, y de
+    ella se calcula en SQL una clave de orden nueva, posterior a la última de la
+    lista destino (`ranks_by_position`). Cada tarea movida deja una entrada `moved`
+    en su historial.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista origen.
+        task_ids (list[int]): IDs de las tareas a mover.
+        target_list_id (int): ID de la lista destino.
+        user_id (int): ID del usuario que mueve las tareas.
+
+    Returns:
+        int: Número de tareas movidas (las que no pertenecen a la lista origen se omiten).
+
+    Raises:
+        TaskListNotFoundException: Si la lista destino no existe o el usuario no puede
+            editarla.
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    try:
+        logger.info(
+            "Moving %d tasks from list %s to list %s",
+            len(task_ids),
+            list_id,
+            target_list_id,
+        )
+        target_editable = member_of(
+            user_id, target_list_id, ListRole.EDITOR, ListRole.OWNER
+        )
+        moving = (
+            select(
+                TaskModel.id, func.row_number().over(order_by=RANK_ORDER).label("pos")
+            )
+            .where(
+                TaskModel.list_id == list_id,
+                TaskModel.id.in_(task_ids),
+                target_editable,
+            )
+            .cte("moving")
+        )
+        tasks = TaskModel.__table__
+        new_rank = (
+            select(
+                ranks_by_position(
+                    next_rank(db, target_list_id), moving.c.pos, len(set(task_ids))
+                )
+            )
+            .where(moving.c.id == tasks.c.id)
+            .scalar_subquery()
+        )
+        moved_tasks = db.execute(
+            update(tasks)
+            .where(tasks.c.list_id == list_id, tasks.c.id.in_(select(moving.c.id)))
+            .values(list_id=target_list_id, rank=new_rank, version=tasks.c.version + 1)
+            .returning(tasks.c.id, tasks.c.version)
+        ).all()
+        db.commit()
+        moved = len(moved_tasks)
+    except Exception as e:
+        db.rollback()
+        logger.error("Error moving tasks from list %s: %s", list_id, e)
+        raise HTTPException(status_code=500, detail="Failed to move tasks") from e
+
+    if moved == 0 and not db.scalar(select(target_editable)):
+        raise TaskListNotFoundException(target_list_id)
+    for task in moved_tasks:
+        record_task_change(
+            db,
+            TaskHistoryAction.MOVED,
+            task.id,
+            target_list_id,
+            task.version,
+            changes={"list_id": [list_id, target_list_id]},
+        )
+    return moved
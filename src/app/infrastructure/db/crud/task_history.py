@@ -0,0 +1,272 @@
+"""
+Historial de cambios de las tareas (`task_history`), de solo inserción.
+
+Las funciones CRUD de tareas llaman a `record_task_change` después de confirmar cada
+cambio. La entrada no se escribe en la petición: queda en `task_history_writer`, que
+la inserta desde un hilo propio junto con las demás pendientes, en lotes de un solo
+`INSERT`. Así, la latencia de las escrituras de tareas no cambia. Si el proceso cae,
+se pierden las entradas de como mucho `task_history_flush_interval` segundos.
+
+Si la sesión tiene una lista en `info["task_history"]` (las operaciones por lotes),
+las entradas se acumulan en ella y quien controla la transacción las entrega al
+confirmarla. Así, un lote deshecho no deja historial.
+
+Funciones principales:
+- record_task_change: Registra un cambio ya confirmado de una tarea.
+- get_task_history: Historial de una tarea, del cambio más reciente al más antiguo.
+
+Los cambios se ordenan por la versión que produjeron (y después por `id`), no por
+orden de inserción: cada proceso escribe sus entradas en su propio hilo y dos
+cambios seguidos hechos desde procesos distintos pueden insertarse al revés.
+"""
+
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import Settings
+from app.core.constants import TaskHistoryAction
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.tracing import traced
+from app.infrastructure.db.models.task_history import TaskHistoryModel
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.jobs.worker import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+# Campos de la tarea que se registran al crearla.
+HISTORY_FIELDS = tuple("title description priority is_done assigned_to due_at".split())
+
+
+class TaskHistoryWriter(BackgroundJob):
+    """
+    Cola en memoria de entradas del historial, insertadas por lotes desde un hilo.
+
+    Sin el hilo arrancado (scripts, tests), cada entrada se inserta al recibirla.
+
+    Attributes:
+        thread_name (str): Nombre del hilo.
+
+    Args:
+        flush_interval (float): Segundos entre escrituras del hilo (0 = no se arranca).
+        batch_size (int): Entradas pendientes que adelantan la escritura.
+        max_pending (int): Entradas que se retienen si la base de datos no responde;
+            por encima se descartan las más antiguas.
+    """
+
+    thread_name = "task-history"
+
+    def __init__(
+        self,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_pending: int = 100_000,
+    ):
+        super().__init__()
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._pending: deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def _enabled(self) -> bool:
+        return self.flush_interval > 0
+
+    def configure(self, settings: Settings) -> None:
+        """Aplica la configuración `task_history_*`."""
+        self.flush_interval = settings.task_history_flush_interval
+        self.batch_size = settings.task_history_batch_size
+        self.max_pending = settings.task_history_max_pending
+
+    def submit(self, entries: list[dict]) -> None:
+        """Encola entradas para insertarlas en el próximo lote."""
+        if not entries:
+            return
+        with self._lock:
+            self._pending.extend(entries)
+            self._trim()
+            full = len(self._pending) >= self.batch_size
+        if self._thread is None:
+            self.flush()
+        elif full:
+            self._wake.set()
+
+    def _trim(self) -> None:
+        dropped = len(self._pending) - self.max_pending
+        if dropped > 0:
+            for _ in range(dropped):
+                self._pending.popleft()
+            logger.error("Task history queue full, dropped %d entries", dropped)
+
+    def flush(self) -> int:
+        """
+        Inserta todas las entradas pendientes con un único `INSERT` por lote.
+
+        Returns:
+            int: Número de entradas insertadas (0 si falla; se reintentan después).
+        """
+        with self._lock:
+            entries = list(self._pending)
+            self._pending.clear()
+        if not entries:
+            return 0
+        db = SessionLocal()
+        try:
+            db.execute(insert(TaskHistoryModel), entries)
+            db.commit()
+        except Exception:  # pylint: disable=broad-except
+            db.rollback()
+            logger.error(
+                "Error writing %d task history entries", len(entries), exc_info=True
+            )
+            with self._lock:
+                self._pending.extendleft(reversed(entries))
+                self._trim()
+            return 0
+        finally:
+            db.close()
+        logger.debug("Wrote %d task history entries", len(entries))
+        return len(entries)
+
+    def run(self) -> None:
+        """Escribe las entradas pendientes cada `flush_interval` o al llenarse un lote."""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def stop(self) -> None:
+        """Detiene el hilo y escribe las entradas pendientes."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            super().stop()
+        self.flush()
+
+
+task_history_writer = TaskHistoryWriter()
+
+
+def _jsonable(value):
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def record_task_change(  # pylint: disable=too-many-arguments
+    db: Session,
+    action: TaskHistoryAction,
+    task_id: int,
+    list_id: int,
+    version: Optional[int],
+    *,
+    changes: Optional[dict] = None,
+) -> None:
+    """
+    Registra un cambio ya confirmado de una tarea, hecho por el usuario de la sesión.
+
+    Args:
+        db (Session): Sesión con la que se hizo el cambio.
+        action (TaskHistoryAction): Tipo de cambio.
+        task_id (int): ID de la tarea.
+        list_id (int): ID de su lista (la de destino, al moverla).
+        version (Optional[int]): Versión resultante; al borrar, la siguiente a la
+            última, para que cada entrada tenga la suya.
+        changes (Optional[dict]): Al crear, los campos y su valor; en los demás
+            cambios, solo los campos que cambiaron, como `[anterior, nuevo]`.
+    """
+    entry = {
+        "task_id": task_id,
+        "list_id": list_id,
+        "version": version,
+        "action": action,
+        "changed_by": db.info.get("user_id"),
+        "changed_at": datetime.now(timezone.utc),
+        "changes": (
+            {field: _jsonable(value) for field, value in changes.items()}
+            if changes is not None
+            else None
+        ),
+    }
+    deferred = db.info.get("task_history")
+    if deferred is not None:
+        deferred.append(entry)
+    else:
+        task_history_writer.submit([entry])
+
+
+@traced()
+def get_task_history(
+    db: Session,
+    list_id: int,
+    task_id: int,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> tuple[list[TaskHistoryModel], Optional[str]]:
+    """
+    Obtiene el historial de una tarea, del cambio más reciente al más antiguo,
+    incluidos los hechos en otras listas antes de moverla. Incluye el de las tareas ya
+    eliminadas.
+
+    El acceso se concede por la lista de la ruta, así que esta debe ser la última de
+    la tarea (en la que está o de la que se eliminó); si no, el historial está vacío.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+        task_id (int): ID de la tarea.
+        limit (int): Tamaño de página.
+        cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+    Returns:
+        tuple[list[TaskHistoryModel], Optional[str]]: Entradas de la página y cursor
+        de la siguiente (None si no hay más).
+
+    Raises:
+        HTTPException 400: Si el cursor no es válido.
+        HTTPException 500: Si ocurre un error inesperado durante la consulta.
+    """
+    latest = aliased(TaskHistoryModel)
+    latest_list_id = (
+        select(latest.list_id)
+        .where(latest.task_id == task_id)
+        .order_by(latest.version.desc(), latest.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    order = tuple_(TaskHistoryModel.version, TaskHistoryModel.id)
+    stmt = select(TaskHistoryModel).where(
+        TaskHistoryModel.task_id == task_id, latest_list_id == list_id
+    )
+    if cursor:
+        version, entry_id = decode_cursor(cursor, int, int)
+        stmt = stmt.where(order < tuple_(version, entry_id))
+    stmt = stmt.order_by(
+        TaskHistoryModel.version.desc(), TaskHistoryModel.id.desc()
+    ).limit(limit + 1)
+
+    try:
+        entries = list(db.scalars(stmt))
+    except Exception as e:
+        logger.error("Error fetching history of task %s: %s", task_id, e)
+        raise HTTPException(
+            status_code=500, detail="Failed to fetch task history"
+        ) from e
+
+    next_cursor = None
+    if len(entries) > limit:
+        entries = entries[:limit]
+        next_cursor = encode_cursor(entries[-1].version, entries[-1].id)
+    return entries, next_cursor
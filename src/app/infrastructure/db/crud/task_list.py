@@ -12,32 +12,65 @@ Funciones principales:
 - update_task_list: Actualiza una lista de tareas existente.
 - delete_task_list: Elimina una lista de tareas por ID.
 - get_tasks_with_filters: Obtiene tareas filtradas y calcula porcentaje de completitud.
+- get_completion_percentage: Calcula el porcentaje de completitud (incluye archivadas).
+- clone_task_list: Duplica una lista y todas sus tareas con sentencias INSERT ... SELECT.
+- get_user_lists: Lista paginada de las listas de un usuario con sus estadísticas.
 
 Cada función registra logs de operaciones y errores para facilitar el monitoreo y debugging.
 """
 
+# pylint: disable=not-callable
+
 import logging
 from typing import Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import (
+    Row,
+    Select,
+    delete,
+    false,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-
-from app.core.constants import TaskListError
-from app.domain.models.exceptions import TaskListCreationException
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.constants import ListRole, TaskListError, TaskSortField
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.tracing import traced
+from app.domain.models.exceptions import (
+    TaskListCreationException,
+    TaskListNotEmptyException,
+    TaskListNotFoundException,
+)
 from app.domain.models.task_list import TaskListCreate
+from app.infrastructure.db.crud.membership import add_list_owner, membership_cache
+from app.infrastructure.db.crud.ordering import rank_order
+from app.infrastructure.db.models.list_member import ListMemberModel
+from app.infrastructure.db.models.archived_task import ArchivedTaskModel
 from app.infrastructure.db.models.task import TaskModel
 from app.infrastructure.db.models.task_list import TaskListModel
 
 logger = logging.getLogger(__name__)
 
 
-def create_task_list(db: Session, list_data: TaskListCreate) -> TaskListModel:
+@traced()
+def create_task_list(
+    db: Session, list_data: TaskListCreate, owner_id: Optional[int] = None
+) -> TaskListModel:
     """
-    Crea una nueva lista de tareas en la base de datos.
+    Crea una nueva lista de tareas con un único `INSERT ... RETURNING` y registra a
+    su propietario como miembro con rol `owner` en la misma transacción.
 
     Args:
         db (Session): Sesión activa de base de datos.
         list_data (TaskListCreate): Datos para crear la lista de tareas.
+        owner_id (Optional[int]): ID del usuario propietario de la lista.
 
     Returns:
         TaskListModel: La lista de tareas creada y persistida.
@@ -47,16 +80,26 @@ def create_task_list(db: Session, list_data: TaskListCreate) -> TaskListModel:
     """
     try:
         logger.info("Creating task list: %s", list_data.dict())
-        db_list = TaskListModel(**list_data.dict())
-        db.add(db_list)
+        db_list = db.scalars(
+            insert(TaskListModel)
+            .values(**list_data.dict(), owner_id=owner_id)
+            .returning(TaskListModel)
+        ).one()
+        if owner_id is not None:
+            add_list_owner(db, db_list.id, owner_id)
         db.commit()
-        db.refresh(db_list)
+        if owner_id is not None:
+            membership_cache.put(owner_id, db_list.id, ListRole.OWNER)
+        # Una lista recién creada no tiene tareas: se evita la carga perezosa.
+        set_committed_value(db_list, "tasks", [])
         return db_list
     except Exception as e:
+        db.rollback()
         logger.error("Error creating task list: %s", e)
         raise TaskListCreationException(detail=TaskListError.CREATION_FAILED) from e
 
 
+@traced()
 def get_task_list(db: Session, list_id: int) -> TaskListModel:
     """
     Obtiene una lista de tareas por su ID.
@@ -86,11 +129,12 @@ def get_task_list(db: Session, list_id: int) -> TaskListModel:
         raise HTTPException(status_code=500, detail="Failed to get task list") from e
 
 
+@traced()
 def update_task_list(
     db: Session, list_id: int, list_data: TaskListCreate
 ) -> TaskListModel:
     """
-    Actualiza una lista de tareas existente con nuevos datos.
+    Actualiza una lista de tareas existente con un único `UPDATE ... RETURNING`.
 
     Args:
         db (Session): Sesión activa de base de datos.
@@ -101,58 +145,81 @@ def update_task_list(
         TaskListModel: La lista actualizada.
 
     Raises:
-        HTTPException 404: Si la lista no existe.
+        TaskListNotFoundException: Si la lista no existe.
         HTTPException 500: Si ocurre un error inesperado.
     """
     try:
         logger.info("Updating task list ID %s with: %s", list_id, list_data.dict())
-        db_list = db.query(TaskListModel).filter(TaskListModel.id == list_id).first()
-        if not db_list:
+        db_list = db.scalars(
+            update(TaskListModel)
+            .where(TaskListModel.id == list_id)
+            .values(**list_data.dict())
+            .returning(TaskListModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).one_or_none()
+        if db_list is None:
+            db.rollback()
             logger.warning("Task list %s not found for update", list_id)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="List not found"
-            )
-        for key, value in list_data.dict().items():
-            setattr(db_list, key, value)
+            raise TaskListNotFoundException(list_id)
         db.commit()
-        db.refresh(db_list)
         return db_list
+    except HTTPException:
+        raise
     except Exception as e:
+        db.rollback()
         logger.error("Error updating task in list %s: %s", list_id, e)
         raise HTTPException(status_code=500, detail="Failed to update task list") from e
 
 
+@traced()
 def delete_task_list(db: Session, list_id: int) -> None:
     """
-    Elimina una lista de tareas específica por su ID.
+    Elimina una lista de tareas específica por su ID con un único `DELETE`.
+
+    Las tareas archivadas y los miembros de la lista se eliminan en cascada; si
+    todavía tiene tareas activas, la clave foránea de `tasks` impide el borrado.
 
     Args:
         db (Session): Sesión activa de base de datos.
         list_id (int): ID de la lista a eliminar.
 
     Raises:
-        HTTPException 404: Si la lista no existe.
+        TaskListNotFoundException: Si la lista no existe.
+        TaskListNotEmptyException: Si la lista todavía tiene tareas.
         HTTPException 500: Si ocurre un error inesperado.
     """
     try:
         logger.info("Deleting task list ID: %s", list_id)
-        db_list = db.query(TaskListModel).filter(TaskListModel.id == list_id).first()
-        if not db_list:
+        deleted = db.execute(
+            delete(TaskListModel)
+            .where(TaskListModel.id == list_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not deleted:
+            db.rollback()
             logger.warning("Task list %s not found for deletion", list_id)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="List not found"
-            )
-        db.delete(db_list)
+            raise TaskListNotFoundException(list_id)
         db.commit()
+        membership_cache.invalidate_list(list_id)
     except HTTPException:
         raise
+    except IntegrityError as e:
+        db.rollback()
+        logger.warning("Task list %s still has tasks: %s", list_id, e.orig)
+        raise TaskListNotEmptyException(list_id) from e
     except Exception as e:
+        db.rollback()
         logger.error("Error deleting task list %s: %s", list_id, e)
         raise HTTPException(status_code=500, detail="Failed to delete task list") from e
 
 
+@traced()
 def get_tasks_with_filters(
-    db: Session, list_id: int, is_done: Optional[bool], priority: Optional[str]
+    db: Session,
+    list_id: int,
+    is_done: Optional[bool],
+    priority: Optional[str],
+    sort: Optional[TaskSortField] = None,
 ) -> tuple[list[TaskModel], float]:
     """
     Obtiene las tareas de una lista con filtros opcionales y calcula el porcentaje de completitud.
@@ -162,6 +229,8 @@ def get_tasks_with_filters(
         list_id (int): ID de la lista cuyas tareas se consultan.
         is_done (Optional[bool]): Filtrar tareas completadas o no.
         priority (Optional[str]): Filtrar tareas por nivel de prioridad.
+        sort (Optional[TaskSortField]): Criterio de orden (`rank`: orden manual;
+            `priority`: de mayor a menor prioridad).
 
     Returns:
         Tuple[List[TaskModel], float]: Lista filtrada de tareas y porcentaje de tareas completadas.
@@ -176,15 +245,252 @@ def get_tasks_with_filters(
             query = query.filter(TaskModel.is_done == is_done)
         if priority:
             query = query.filter(TaskModel.priority == priority)
+        if sort == TaskSortField.RANK:
+            query = rank_order(query)
+        elif sort == TaskSortField.PRIORITY:
+            # Servido por `ix_tasks_list_id_priority` (list_id, priority DESC, id).
+            query = query.order_by(TaskModel.priority.desc(), TaskModel.id.asc())
 
         filtered_tasks = query.all()
 
-        all_tasks = db.query(TaskModel).filter(TaskModel.list_id == list_id).all()
-        total = len(all_tasks)
-        done = len([task for task in all_tasks if task.is_done])
-        percentage = round((done / total) * 100, 2) if total > 0 else 0.0
+        percentage = get_completion_percentage(db, list_id)
 
         return filtered_tasks, percentage
     except Exception as e:
         logger.error("Error fetching tasks for list %s with filters: %s", list_id, e)
         raise HTTPException(status_code=500, detail="Failed to fetch tasks") from e
+
+
+@traced()
+def get_completion_percentage(db: Session, list_id: int) -> float:
+    """
+    Calcula el porcentaje de tareas completadas de una lista con una sola consulta
+    agregada, contando también las tareas archivadas (que siempre están completadas).
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista.
+
+    Returns:
+        float: Porcentaje de tareas completadas, redondeado a dos decimales.
+    """
+    in_list = TaskModel.list_id == list_id
+    total, done, archived = db.execute(
+        select(
+            select(func.count(TaskModel.id)).where(in_list).scalar_subquery(),
+            select(func.count(TaskModel.id))
+            .where(in_list, TaskModel.is_done.is_(True))
+            .scalar_subquery(),
+            select(func.count(ArchivedTaskModel.id))
+            .where(ArchivedTaskModel.list_id == list_id)
+            .scalar_subquery(),
+        )
+    ).one()
+    return _completion(total, done, archived)
+
+
+def _completion(total: int, done: int, archived: int) -> float:
+    total += archived
+    done += archived
+    return round((done / total) * 100, 2) if total > 0 else 0.0
+
+
+@traced()
+def clone_task_list(
+    db: Session,
+    list_id: int,
+    created_by_id: int,
+    name: Optional[str] = None,
+    reset_status: bool = True,
+) -> tuple[Row, int]:
+    """
+    Duplica una lista de tareas y todas sus tareas en la base de datos.
+
+    La copia se hace con dos sentencias `INSERT ... SELECT` (una para la lista y
+    otra para sus tareas), sin leer las tareas en la aplicación, por lo que el costo
+    no depende del número de tareas de la plantilla.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        list_id (int): ID de la lista origen.
+        created_by_id (int): ID del usuario que realiza la copia (creador de las tareas
+            y propietario de la nueva lista).
+        name (Optional[str]): Nombre de la nueva lista; por defecto el de la original.
+        reset_status (bool): Si es True, las tareas copiadas quedan pendientes.
+
+    Returns:
+        tuple[Row, int]: Fila de la lista creada (id, name, color_tag, category,
+        owner_id) y número de tareas copiadas.
+
+    Raises:
+        TaskListNotFoundException: Si la lista origen no existe.
+        HTTPException 500: Si ocurre un error inesperado.
+    """
+    try:
+        logger.info("Cloning task list %s (reset_status=%s)", list_id, reset_status)
+        new_list = db.execute(
+            insert(TaskListModel)
+            .from_select(
+                ["name", "color_tag", "category", "owner_id"],
+                select(
+                    func.coalesce(literal(name), TaskListModel.name),
+                    TaskListModel.color_tag,
+                    TaskListModel.category,
+                    literal(created_by_id),
+                ).where(TaskListModel.id == list_id),
+            )
+            .returning(
+                TaskListModel.id,
+                TaskListModel.name,
+                TaskListModel.color_tag,
+                TaskListModel.category,
+                TaskListModel.owner_id,
+            )
+        ).first()
+        if new_list is None:
+            db.rollback()
+            raise TaskListNotFoundException(list_id)
+        add_list_owner(db, new_list.id, created_by_id)
+
+        copy = {
+            "title": TaskModel.title,
+            "description": TaskModel.description,
+            "priority": TaskModel.priority,
+            "is_done": false() if reset_status else TaskModel.is_done,
+            "assigned_to": TaskModel.assigned_to,
+            "rank": TaskModel.rank,
+            "list_id": literal(new_list.id),
+            "created_by": literal(created_by_id),
+        }
+        copied = db.execute(
+            insert(TaskModel).from_select(
+                list(copy),
+                select(*copy.values())
+                .where(TaskModel.list_id == list_id)
+                .order_by(TaskModel.id),
+            )
+        ).rowcount
+        db.commit()
+        membership_cache.put(created_by_id, new_list.id, ListRole.OWNER)
+        logger.info(
+            "Cloned list %s into %s with %s tasks", list_id, new_list.id, copied
+        )
+        return new_list, copied
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("Error cloning task list %s: %s", list_id, e)
+        raise HTTPException(status_code=500, detail="Failed to clone task list") from e
+
+
+# Columnas de la lista devueltas por `get_user_lists`.
+_USER_LIST_COLUMNS = (
+    TaskListModel.id,
+    TaskListModel.name,
+    TaskListModel.color_tag,
+    TaskListModel.category,
+    TaskListModel.owner_id,
+)
+
+
+def _user_lists_query(user_id: int, limit: int, cursor: Optional[str]) -> Select:
+    # Una fila por lista de la página: columnas, rol y recuentos de tareas activas,
+    # activas completadas y archivadas. Se pide una fila de más para el cursor.
+    page = select(ListMemberModel.list_id, ListMemberModel.role).where(
+        ListMemberModel.user_id == user_id
+    )
+    if cursor:
+        (after_id,) = decode_cursor(cursor, int)
+        page = page.where(ListMemberModel.list_id > after_id)
+    page = page.order_by(ListMemberModel.list_id).limit(limit + 1).cte("page")
+
+    page_ids = select(page.c.list_id)
+    tasks = (
+        select(
+            TaskModel.list_id.label("list_id"),
+            func.count(TaskModel.id).label("total"),
+            func.count(TaskModel.id).filter(TaskModel.is_done.is_(True)).label("done"),
+        )
+        .where(TaskModel.list_id.in_(page_ids))
+        .group_by(TaskModel.list_id)
+        .subquery()
+    )
+    archived = (
+        select(
+            ArchivedTaskModel.list_id.label("list_id"),
+            func.count(ArchivedTaskModel.id).label("total"),
+        )
+        .where(ArchivedTaskModel.list_id.in_(page_ids))
+        .group_by(ArchivedTaskModel.list_id)
+        .subquery()
+    )
+    return (
+        select(
+            *_USER_LIST_COLUMNS,
+            page.c.role,
+            func.coalesce(tasks.c.total, 0),
+            func.coalesce(tasks.c.done, 0),
+            func.coalesce(archived.c.total, 0),
+        )
+        .select_from(page)
+        .join(TaskListModel, TaskListModel.id == page.c.list_id)
+        .outerjoin(tasks, tasks.c.list_id == page.c.list_id)
+        .outerjoin(archived, archived.c.list_id == page.c.list_id)
+        .order_by(page.c.list_id)
+    )
+
+
+@traced()
+def get_user_lists(
+    db: Session, user_id: int, limit: int = 50, cursor: Optional[str] = None
+) -> tuple[list[dict], Optional[str]]:
+    """
+    Obtiene las listas de las que un usuario es miembro, con su rol, el número de
+    tareas y el porcentaje de completitud de cada una.
+
+    Se resuelve con una única consulta: la página de pertenencias (CTE con keyset por
+    `list_id` sobre la clave primaria `(user_id, list_id)` de `list_members`) unida a
+    sus listas y a los recuentos de tareas activas y archivadas, agrupados por lista
+    y limitados a las listas de la página.
+
+    Args:
+        db (Session): Sesión activa de base de datos.
+        user_id (int): ID del usuario.
+        limit (int): Tamaño de página.
+        cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+    Returns:
+        tuple[list[dict], Optional[str]]: Listas de la página (datos de la lista,
+        `role`, `task_count`, `done_count` y `completion_percentage`) y cursor de la
+        siguiente (None si no hay más).
+
+    Raises:
+        HTTPException 400: Si el cursor no es válido.
+        HTTPException 500: Si ocurre un error inesperado durante la consulta.
+    """
+    stmt = _user_lists_query(user_id, limit, cursor)
+
+    try:
+        rows = db.execute(stmt).all()
+    except Exception as e:
+        logger.error("Error fetching lists of user %s: %s", user_id, e)
+        raise HTTPException(status_code=500, detail="Failed to fetch task lists") from e
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
+    lists = []
+    for row in rows:
+        *columns, role, total, done, archived_total = row
+        lists.append(
+            {
+                **dict(zip((column.key for column in _USER_LIST_COLUMNS), columns)),
+                "role": role,
+                "task_count": total + archived_total,
+                "done_count": done + archived_total,
+                "completion_percentage": _completion(total, done, archived_total),
+            }
+        )
+    return lists, next_cursor
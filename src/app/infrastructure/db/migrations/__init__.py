@@ -0,0 +1,17 @@
+"""
+Migraciones versionadas del esquema de TidyTasks.
+
+`create_all` solo crea tablas nuevas; los índices y columnas que se añaden a tablas
+existentes se aplican con estas migraciones, construidas a partir de los modelos de
+`app/infrastructure/db/models/`. En PostgreSQL los índices se crean con
+`CREATE INDEX CONCURRENTLY` y las columnas nuevas se rellenan por lotes. Uso:
+
+    cd src/
+    python -m app.infrastructure.db.migrations status
+    python -m app.infrastructure.db.migrations upgrade --dry-run
+    python -m app.infrastructure.db.migrations upgrade
+"""
+
+from app.infrastructure.db.migrations.runner import dry_run, format_plan, upgrade
+
+__all__ = ["dry_run", "format_plan", "upgrade"]
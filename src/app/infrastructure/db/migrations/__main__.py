@@ -0,0 +1,59 @@
+"""
+Línea de comandos de las migraciones. Ver `app.infrastructure.db.migrations`.
+"""
+
+import argparse
+import logging
+
+from app.core.config import get_settings
+from app.infrastructure.db.migrations.runner import (
+    applied_versions,
+    dry_run,
+    format_plan,
+    load_migrations,
+    upgrade,
+)
+from app.infrastructure.db.session import build_engine
+
+
+def main():
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Migraciones del esquema.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="Lista las migraciones y si están aplicadas.")
+    upgrade_parser = commands.add_parser(
+        "upgrade", help="Aplica las migraciones pendientes."
+    )
+    upgrade_parser.add_argument(
+        "--to", type=int, default=None, help="Última versión a aplicar."
+    )
+    upgrade_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Muestra el SQL y los bloqueos sin ejecutar.",
+    )
+    upgrade_parser.add_argument(
+        "--lock-timeout", default="5s", help="Espera máxima por bloqueos (PostgreSQL)."
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+
+    engine = build_engine(get_settings())
+    try:
+        if args.command == "status":
+            applied = applied_versions(engine)
+            for migration in load_migrations():
+                mark = "x" if migration.version in applied else " "
+                print(f"[{mark}] v{migration.version:04d} {migration.name}")
+        elif args.dry_run:
+            print(format_plan(engine, dry_run(engine, args.to)))
+        else:
+            upgrade(engine, args.to, args.lock_timeout)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,821 @@
+"""
+Operaciones de migración.
+
+Cada operación se traduce, según el dialecto y el estado actual de la base de datos,
+en una lista de pasos (`Step`) con el SQL a ejecutar y el bloqueo que toma. El mismo
+plan se usa para aplicar la migración y para el modo `--dry-run`.
+
+Las operaciones son idempotentes: las que ya están aplicadas (tabla, índice o columna
+existentes) no generan pasos, de modo que una migración interrumpida puede volver a
+ejecutarse y una base creada con `create_all` puede migrarse sin conflictos.
+"""
+
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Collection, Dict, List, Optional, Sequence
+
+from sqlalchemy import Column, Index, Table, create_mock_engine, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.schema import CreateIndex as CreateIndexDDL
+from sqlalchemy.types import TypeDecorator
+
+# `schema` importa todos los modelos, de modo que `Base.metadata` está completo.
+from app.infrastructure.db.schema import Base
+
+LOCK_NEW_TABLE = "ACCESS EXCLUSIVE solo sobre la tabla nueva (sin impacto)"
+LOCKS = {
+    "postgresql": {
+        "create_index": (
+            "SHARE UPDATE EXCLUSIVE (CONCURRENTLY): no bloquea lecturas ni "
+            "escrituras; bloquea otros DDL y VACUUM sobre la tabla"
+        ),
+        "create_index_empty": "SHARE: bloquea escrituras (tabla recién creada)",
+        "drop_index": "SHARE UPDATE EXCLUSIVE (CONCURRENTLY): no bloquea lecturas ni escrituras",
+        "add_column": (
+            "ACCESS EXCLUSIVE breve (solo catálogo): espera a las transacciones "
+            "abiertas sobre la tabla, limitado por lock_timeout"
+        ),
+        "backfill": "ROW EXCLUSIVE + bloqueo de las filas de cada lote; no bloquea lecturas",
+        "add_check": "ACCESS EXCLUSIVE breve (NOT VALID: no recorre la tabla)",
+        "validate_check": (
+            "SHARE UPDATE EXCLUSIVE durante un recorrido completo: no bloquea "
+            "lecturas ni escrituras"
+        ),
+        "set_not_null": "ACCESS EXCLUSIVE breve (usa el CHECK validado, sin recorrido)",
+        "drop_check": "ACCESS EXCLUSIVE breve (solo catálogo)",
+        "convert_column": (
+            "ACCESS EXCLUSIVE durante la reescritura completa de la tabla y de sus "
+            "índices: bloquea lecturas y escrituras"
+        ),
+        "sync_trigger": (
+            "SHARE ROW EXCLUSIVE breve (CREATE TRIGGER); después, cada escritura en la "
+            "tabla se replica en la tabla particionada hasta el intercambio"
+        ),
+        "copy_rows": (
+            "ROW SHARE sobre la tabla original (FOR SHARE sobre las filas del lote: "
+            "las escrituras sobre ellas esperan al final del lote) y ROW EXCLUSIVE "
+            "sobre la particionada; no bloquea lecturas"
+        ),
+        "create_index_parent": (
+            "SHARE breve sobre la tabla particionada (ON ONLY: no recorre filas; el "
+            "índice queda inválido hasta adjuntar el de cada partición)"
+        ),
+        "attach_index": "SHARE UPDATE EXCLUSIVE breve sobre la partición (solo catálogo)",
+        "swap_tables": (
+            "ACCESS EXCLUSIVE breve (solo catálogo: renombrados): espera a las "
+            "transacciones abiertas sobre la tabla, limitado por lock_timeout"
+        ),
+    },
+    "sqlite": {
+        "create_index": "bloqueo de escritura de toda la base durante la construcción",
+        "create_index_empty": "bloqueo de escritura de toda la base (tabla recién creada)",
+        "drop_index": "bloqueo de escritura de toda la base (breve)",
+        "add_column": "bloqueo de escritura de toda la base (breve, solo esquema)",
+        "backfill": "bloqueo de escritura de toda la base por cada lote",
+        "convert_column": "bloqueo de escritura de toda la base por cada lote",
+    },
+}
+
+
+def lock_for(dialect: str, action: str) -> str:
+    """Describe el bloqueo que toma `action` en el dialecto indicado."""
+    return LOCKS.get(dialect, {}).get(action, "depende del motor (sin información)")
+
+
+@dataclass
+class Step:
+    """
+    Paso concreto de una migración.
+
+    Atributos:
+        sql (str): Sentencia a ejecutar.
+        lock (str): Bloqueo que toma la sentencia.
+        table (Optional[str]): Tabla afectada, para estimar el impacto.
+        autocommit (bool): Ejecutar fuera de una transacción (p. ej. `CONCURRENTLY`).
+        batched (bool): Repetir en transacciones cortas hasta que no afecte filas.
+    """
+
+    sql: str
+    lock: str
+    table: Optional[str] = None
+    autocommit: bool = False
+    batched: bool = False
+
+
+def _table(name: str) -> Table:
+    return Base.metadata.tables[name]
+
+
+def _capture_ddl(conn: Connection, create: Callable) -> List[str]:
+    """
+    Devuelve el DDL que SQLAlchemy emitiría para `create(bind)` en el dialecto de
+    `conn`, respetando `ddl_if`, `execute_if` y los eventos `after_create`.
+    """
+    statements: List[str] = []
+
+    def executor(sql, *_args, **_kwargs):
+        statements.append(str(sql.compile(dialect=conn.dialect)).strip())
+
+    create(create_mock_engine(conn.engine.url, executor))
+    return statements
+
+
+@contextmanager
+def _concurrently(index: Index):
+    """Marca temporalmente un índice del modelo para construirse con CONCURRENTLY."""
+    options = index.dialect_options["postgresql"]
+    previous = options["concurrently"]
+    options["concurrently"] = True
+    try:
+        yield
+    finally:
+        options["concurrently"] = previous
+
+
+class Operation:  # pylint: disable=too-few-public-methods
+    """
+    Operación base. Las subclases implementan `_plan`.
+
+    Args:
+        dialects (Optional[Sequence[str]]): Dialectos en los que aplica; todos si es None.
+    """
+
+    def __init__(self, dialects: Optional[Sequence[str]] = None):
+        self.dialects = dialects
+
+    def plan(self, conn: Connection) -> List[Step]:
+        """
+        Calcula los pasos pendientes de la operación sobre la base de `conn`.
+
+        Args:
+            conn (Connection): Conexión usada para inspeccionar el esquema.
+
+        Returns:
+            List[Step]: Pasos a ejecutar (vacía si la operación ya está aplicada).
+        """
+        if self.dialects and conn.dialect.name not in self.dialects:
+            return []
+        return self._plan(conn)
+
+    def _plan(self, conn: Connection) -> List[Step]:
+        raise NotImplementedError
+
+
+class CreateTable(Operation):
+    """
+    Crea una tabla del modelo, con sus índices y DDL asociado, si no existe.
+
+    Args:
+        table (str): Nombre de la tabla en `Base.metadata`.
+    """
+
+    def __init__(self, table: str, dialects: Optional[Sequence[str]] = None):
+        super().__init__(dialects)
+        self.table = table
+
+    def __repr__(self) -> str:
+        return f"CreateTable({self.table!r})"
+
+    def _plan(self, conn: Connection) -> List[Step]:
+        if inspect(conn).has_table(self.table):
+            return []
+        dialect = conn.dialect.name
+        statements = _capture_ddl(
+            conn, lambda bind: _table(self.table).create(bind, checkfirst=False)
+        )
+        return [
+            Step(
+                sql,
+                (
+                    LOCK_NEW_TABLE
+                    if sql.upper().startswith("CREATE TABLE")
+                    else lock_for(dialect, "create_index_empty")
+                ),
+                table=self.table,
+            )
+            for sql in statements
+        ]
+
+
+class CreateIndex(Operation):
+    """
+    Crea un índice definido en el modelo sin bloquear escrituras.
+
+    En PostgreSQL usa `CREATE INDEX CONCURRENTLY` fuera de transacción; si una
+    ejecución anterior falló y dejó el índice inválido, lo elimina y lo reconstruye.
+    Sobre una tabla con particiones (donde `CONCURRENTLY` no se admite) crea el índice
+    solo en la tabla padre (`ON ONLY`), lo construye de forma concurrente en cada
+    partición y lo adjunta; todos los pasos se pueden repetir.
+    Si la tabla aún no existe no hace nada: `CreateTable` ya crea sus índices.
+
+    Args:
+        table (str): Tabla del modelo.
+        name (str): Nombre del índice en `__table_args__`.
+    """
+
+    def __init__(self, table: str, name: str, dialects: Optional[Sequence[str]] = None):
+        super().__init__(dialects)
+        self.table = table
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"CreateIndex({self.table!r}, {self.name!r})"
+
+    def _index(self) -> Index:
+        for index in _table(self.table).indexes:
+            if index.name == self.name:
+                return index
+        raise LookupError(f"Index {self.name} is not defined on {self.table}")
+
+    def _plan(self, conn: Connection) -> List[Step]:
+        index = self._index()
+        inspector = inspect(conn)
+        if not inspector.has_table(self.table):
+            return []
+        dialect = conn.dialect.name
+        partitioned = dialect == "postgresql" and _pg_is_partitioned(conn, self.table)
+        steps = []
+        if inspector.has_index(self.table, self.name):
+            if dialect != "postgresql" or _pg_index_is_valid(conn, self.name):
+                return []
+        if partitioned:
+            return self.partitioned_steps(
+                conn.dialect, _pg_partitions(conn, self.table)
+            )
+        if inspector.has_index(self.table, self.name):
+            steps.append(
+                Step(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {self.name}",
+                    lock_for(dialect, "drop_index"),
+                    table=self.table,
+                    autocommit=True,
+                )
+            )
+
+        if dialect == "postgresql":
+            with _concurrently(index):
+                statements = _capture_ddl(conn, index.create)
+        else:
+            statements = _capture_ddl(conn, index.create)
+        steps.extend(
+            Step(
+                sql,
+                lock_for(dialect, "create_index"),
+                table=self.table,
+                autocommit=dialect == "postgresql",
+            )
+            for sql in statements
+        )
+        return steps
+
+    def partitioned_steps(self, dialect, partitions: Sequence[str]) -> List[Step]:
+        """
+        Pasos para crear el índice en una tabla de PostgreSQL con particiones.
+
+        Args:
+            dialect: Dialecto con el que se compila el DDL del índice.
+            partitions (Sequence[str]): Particiones de la tabla.
+
+        Returns:
+            List[Step]: Índice en la tabla padre y, por partición, su construcción
+                concurrente y su adjunción.
+        """
+        ddl = str(
+            CreateIndexDDL(self._index(), if_not_exists=True).compile(dialect=dialect)
+        )
+        prefix = re.compile(
+            rf"^CREATE (UNIQUE )?INDEX IF NOT EXISTS {self.name} ON {self.table} "
+        )
+        steps = [
+            Step(
+                prefix.sub(
+                    rf"CREATE \1INDEX IF NOT EXISTS {self.name} ON ONLY {self.table} ",
+                    ddl,
+                ),
+                lock_for("postgresql", "create_index_parent"),
+                table=self.table,
+            )
+        ]
+        for partition in partitions:
+            child = f"{partition}_{self.name}"
+            steps.append(
+                Step(
+                    prefix.sub(
+                        rf"CREATE \1INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} ",
+                        ddl,
+                    ),
+                    lock_for("postgresql", "create_index"),
+                    table=partition,
+                    autocommit=True,
+                )
+            )
+            steps.append(
+                Step(
+                    f"ALTER INDEX {self.name} ATTACH PARTITION {child}",
+                    lock_for("postgresql", "attach_index"),
+                    table=self.table,
+                )
+            )
+        return steps
+
+
+def _pg_index_is_valid(conn: Connection, name: str) -> bool:
+    return bool(
+        conn.execute(
+            text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+            ),
+            {"name": name},
+        ).scalar()
+    )
+
+
+class AddColumn(Operation):
+    """
+    Añade una columna del modelo a una tabla existente.
+
+    La columna se añade como nullable (operación solo de catálogo). Si se indica
+    `backfill`, se rellena en lotes de `batch_size` filas, cada uno en su propia
+    transacción. Si el modelo la declara NOT NULL, en PostgreSQL la restricción se
+    aplica con un CHECK `NOT VALID` validado aparte, evitando bloquear la tabla durante
+    el recorrido completo; si además tiene un `server_default` y no requiere relleno,
+    se añade directamente como NOT NULL (también solo de catálogo).
+
+    Args:
+        table (str): Tabla del modelo.
+        column (str): Nombre de la columna en el modelo.
+        backfill (Optional[str]): Expresión SQL con la que rellenar las filas existentes.
+        batch_size (int): Filas por lote del relleno.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        table: str,
+        column: str,
+        *,
+        backfill: Optional[str] = None,
+        batch_size: int = 1000,
+        dialects: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(dialects)
+        self.table = table
+        self.column = column
+        self.backfill = backfill
+        self.batch_size = batch_size
+
+    def __repr__(self) -> str:
+        return f"AddColumn({self.table!r}, {self.column!r})"
+
+    def _plan(self, conn: Connection) -> List[Step]:
+        inspector = inspect(conn)
+        if not inspector.has_table(self.table):
+            return []
+        dialect = conn.dialect.name
+        model_column = _table(self.table).c[self.column]
+        existing = {column["name"] for column in inspector.get_columns(self.table)}
+        steps = []
+
+        # En PostgreSQL una columna NOT NULL con valor por defecto constante se añade
+        # solo en el catálogo (las filas existentes toman el valor por defecto).
+        not_null_now = (
+            dialect == "postgresql"
+            and not model_column.nullable
+            and model_column.server_default is not None
+            and not self.backfill
+        )
+        if self.column not in existing:
+            new_column = Column(
+                model_column.name,
+                model_column.type,
+                nullable=not not_null_now,
+                server_default=model_column.server_default,
+            )
+            spec = CreateColumn(new_column).compile(dialect=conn.dialect)
+            steps.append(
+                Step(
+                    f"ALTER TABLE {self.table} ADD COLUMN {spec}",
+                    lock_for(dialect, "add_column"),
+                    table=self.table,
+                )
+            )
+
+        if self.backfill:
+            steps.append(
+                Step(
+                    f"UPDATE {self.table} SET {self.column} = {self.backfill} "
+                    f"WHERE id IN (SELECT id FROM {self.table} "
+                    f"WHERE {self.column} IS NULL AND ({self.backfill}) IS NOT NULL "
+                    f"LIMIT {self.batch_size})",
+                    lock_for(dialect, "backfill"),
+                    table=self.table,
+                    batched=True,
+                )
+            )
+
+        if not model_column.nullable and dialect == "postgresql" and not not_null_now:
+            steps.extend(self._set_not_null_steps(conn, existing))
+        return steps
+
+    def _set_not_null_steps(self, conn: Connection, existing: set) -> List[Step]:
+        if self.column in existing and not next(
+            column["nullable"]
+            for column in inspect(conn).get_columns(self.table)
+            if column["name"] == self.column
+        ):
+            return []
+        check = f"ck_{self.table}_{self.column}_not_null"
+        return [
+            Step(
+                f"ALTER TABLE {self.table} DROP CONSTRAINT IF EXISTS {check}, "
+                f"ADD CONSTRAINT {check} CHECK ({self.column} IS NOT NULL) NOT VALID",
+                lock_for("postgresql", "add_check"),
+                table=self.table,
+            ),
+            Step(
+                f"ALTER TABLE {self.table} VALIDATE CONSTRAINT {check}",
+                lock_for("postgresql", "validate_check"),
+                table=self.table,
+            ),
+            Step(
+                f"ALTER TABLE {self.table} ALTER COLUMN {self.column} SET NOT NULL",
+                lock_for("postgresql", "set_not_null"),
+                table=self.table,
+            ),
+            Step(
+                f"ALTER TABLE {self.table} DROP CONSTRAINT {check}",
+                lock_for("postgresql", "drop_check"),
+                table=self.table,
+            ),
+        ]
+
+
+class ConvertColumn(Operation):
+    """
+    Convierte los valores de una columna existente al tipo que declara el modelo.
+
+    En PostgreSQL usa `ALTER COLUMN ... TYPE ... USING`, que reescribe la tabla (el
+    dry-run lo indica). SQLite no permite cambiar el tipo de una columna: los valores
+    se convierten en su lugar, por lotes, y el tipo declarado se conserva.
+
+    Args:
+        table (str): Tabla del modelo.
+        column (str): Columna a convertir.
+        using (str): Expresión SQL que calcula el valor nuevo a partir del actual.
+        pending (str): Condición SQL que identifica las filas aún sin convertir (SQLite).
+        batch_size (int): Filas por lote en SQLite.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        table: str,
+        column: str,
+        *,
+        using: str,
+        pending: str,
+        batch_size: int = 1000,
+        dialects: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(dialects)
+        self.table = table
+        self.column = column
+        self.using = using
+        self.pending = pending
+        self.batch_size = batch_size
+
+    def __repr__(self) -> str:
+        return f"ConvertColumn({self.table!r}, {self.column!r})"
+
+    def _plan(self, conn: Connection) -> List[Step]:
+        inspector = inspect(conn)
+        if not inspector.has_table(self.table):
+            return []
+        dialect = conn.dialect.name
+        model_type = _table(self.table).c[self.column].type
+        if dialect == "postgresql":
+            current = next(
+                column["type"]
+                for column in inspector.get_columns(self.table)
+                if column["name"] == self.column
+            )
+            target = (
+                model_type.load_dialect_impl(conn.dialect)
+                if isinstance(model_type, TypeDecorator)
+                else model_type
+            )
+            if isinstance(current, type(target)):
+                return []
+            return [
+                Step(
+                    f"ALTER TABLE {self.table} ALTER COLUMN {self.column} "
+                    f"TYPE {target.compile(dialect=conn.dialect)} USING {self.using}",
+                    lock_for(dialect, "convert_column"),
+                    table=self.table,
+                )
+            ]
+        return [
+            Step(
+                f"UPDATE {self.table} SET {self.column} = {self.using} "
+                f"WHERE id IN (SELECT id FROM {self.table} WHERE {self.pending} "
+                f"LIMIT {self.batch_size})",
+                lock_for(dialect, "convert_column"),
+                table=self.table,
+                batched=True,
+            )
+        ]
+
+
+class RunSQL(Operation):
+    """
+    Ejecuta sentencias SQL arbitrarias. Deben ser idempotentes.
+
+    Args:
+        statements (Sequence[str]): Sentencias a ejecutar, en orden.
+        lock (str): Descripción del bloqueo que toman.
+        table (Optional[str]): Tabla afectada.
+        autocommit (bool): Ejecutarlas fuera de transacción.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        statements: Sequence[str],
+        *,
+        lock: str,
+        table: Optional[str] = None,
+        autocommit: bool = False,
+        dialects: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(dialects)
+        self.statements = statements
+        self.lock = lock
+        self.table = table
+        self.autocommit = autocommit
+
+    def __repr__(self) -> str:
+        return f"RunSQL({len(self.statements)} statements)"
+
+    def _plan(self, conn: Connection) -> List[Step]:
+        if self.table and not inspect(conn).has_table(self.table):
+            return []
+        return [
+            Step(sql, self.lock, table=self.table, autocommit=self.autocommit)
+            for sql in self.statements
+        ]
+
+
+def _pg_is_partitioned(conn: Connection, table: str) -> bool:
+    return (
+        conn.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:t)"),
+            {"t": table},
+        ).scalar()
+        == "p"
+    )
+
+
+def _pg_partitions(conn: Connection, table: str) -> List[str]:
+    return list(
+        conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:t) ORDER BY c.relname"
+            ),
+            {"t": table},
+        ).scalars()
+    )
+
+
+@dataclass
+class TableLayout:
+    """
+    Estructura actual de una tabla de PostgreSQL, leída del catálogo.
+
+    Atributos:
+        columns (List[str]): Columnas, en orden.
+        indexes (Dict[str, str]): DDL de cada índice (salvo los de restricciones), por
+            nombre.
+        foreign_keys (Dict[str, str]): Definición de cada clave foránea, por nombre.
+    """
+
+    columns: List[str]
+    indexes: Dict[str, str]
+    foreign_keys: Dict[str, str]
+
+
+def _pg_table_layout(conn: Connection, table: str) -> TableLayout:
+    columns = [column["name"] for column in inspect(conn).get_columns(table)]
+    indexes = conn.execute(
+        text(
+            "SELECT c.relname, pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = to_regclass(:t) AND NOT EXISTS "
+            "(SELECT 1 FROM pg_constraint WHERE conindid = i.indexrelid) "
+            "ORDER BY c.relname"
+        ),
+        {"t": table},
+    ).all()
+    foreign_keys = conn.execute(
+        text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(:t) AND contype = 'f' ORDER BY conname"
+        ),
+        {"t": table},
+    ).all()
+    return TableLayout(columns, dict(indexes), dict(foreign_keys))
+
+
+class PartitionTable(Operation):
+    """
+    Convierte una tabla de PostgreSQL en una tabla con particiones por hash.
+
+    La conversión se hace sin bloquear la tabla durante la copia:
+
+    1. Se crea `<tabla>_partitioned` (mismas columnas, valores por defecto y claves
+       foráneas, clave primaria `(id, <columna>)`) con `partitions` particiones
+       `<tabla>_pNN` y los mismos índices.
+    2. Un trigger replica en ella cada INSERT, UPDATE y DELETE de la tabla original.
+    3. Las filas existentes se copian por lotes de `batch_size` en orden de `id`
+       (`ON CONFLICT DO NOTHING`: las que el trigger ya copió se conservan). El lote
+       bloquea sus filas con `FOR SHARE`: una fila borrada después de empezar el lote
+       no se copia, y un borrado posterior espera a que termine el lote, de modo que
+       el DELETE del trigger ve la fila copiada. El progreso se guarda en
+       `<tabla>_partition_progress`, de modo que una ejecución interrumpida continúa
+       donde se quedó.
+    4. En una transacción breve se quita el trigger y se intercambian los nombres de
+       tablas e índices; la secuencia de `id` pasa a pertenecer a la tabla nueva.
+
+    Las columnas, índices y claves foráneas se leen de la tabla actual, no del
+    modelo: las columnas e índices que el modelo añade después los crean sus propias
+    migraciones sobre la tabla ya particionada.
+
+    La tabla original queda como `<tabla>_unpartitioned` para poder comprobar la
+    copia; se elimina a mano. La clave primaria debe incluir la columna de partición,
+    así que la unicidad de `id` por sí solo la garantiza su secuencia. Si la tabla ya
+    tiene particiones no hace nada; en otros motores tampoco.
+
+    Args:
+        table (str): Tabla a particionar.
+        column (str): Columna de partición.
+        partitions (int): Número de particiones (módulo del hash).
+        batch_size (int): Filas por lote de la copia.
+    """
+
+    def __init__(
+        self, table: str, column: str, partitions: int, batch_size: int = 5000
+    ):
+        super().__init__(("postgresql",))
+        self.table = table
+        self.column = column
+        self.partitions = partitions
+        self.batch_size = batch_size
+
+    def __repr__(self) -> str:
+        return f"PartitionTable({self.table!r}, {self.column!r}, {self.partitions})"
+
+    @property
+    def shadow(self) -> str:
+        """Nombre de la tabla particionada hasta el intercambio."""
+        return f"{self.table}_partitioned"
+
+    def _plan(self, conn: Connection) -> List[Step]:
+        if not inspect(conn).has_table(self.table) or _pg_is_partitioned(
+            conn, self.table
+        ):
+            return []
+        return self.steps(_pg_table_layout(conn, self.table))
+
+    def steps(self, layout: TableLayout) -> List[Step]:
+        """
+        Pasos de la conversión de una tabla con la estructura indicada.
+
+        Args:
+            layout (TableLayout): Columnas, índices y claves foráneas de la tabla.
+
+        Returns:
+            List[Step]: Pasos en orden de ejecución.
+        """
+        return [
+            Step(
+                ";\n".join(self._create_sql(layout)), LOCK_NEW_TABLE, table=self.table
+            ),
+            Step(
+                ";\n".join(self._trigger_sql(layout.columns)),
+                lock_for("postgresql", "sync_trigger"),
+                table=self.table,
+            ),
+            Step(
+                self._copy_sql(layout.columns),
+                lock_for("postgresql", "copy_rows"),
+                table=self.table,
+                batched=True,
+            ),
+            Step(
+                ";\n".join(self._swap_sql(layout.indexes)),
+                lock_for("postgresql", "swap_tables"),
+                table=self.table,
+            ),
+        ]
+
+    def _create_sql(self, layout: TableLayout) -> List[str]:
+        definition = [
+            f"LIKE {self.table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS",
+            f"CONSTRAINT {self.shadow}_pkey PRIMARY KEY (id, {self.column})",
+        ]
+        definition.extend(
+            f"CONSTRAINT {name} {constraint}"
+            for name, constraint in layout.foreign_keys.items()
+        )
+        create = [
+            f"CREATE TABLE IF NOT EXISTS {self.shadow} ({', '.join(definition)}) "
+            f"PARTITION BY HASH ({self.column})"
+        ]
+        create.extend(
+            f"CREATE TABLE IF NOT EXISTS {self.table}_p{remainder:02d} PARTITION OF "
+            f"{self.shadow} FOR VALUES WITH (MODULUS {self.partitions}, "
+            f"REMAINDER {remainder})"
+            for remainder in range(self.partitions)
+        )
+        # `pg_get_indexdef` califica la tabla con su esquema (`ON public.tasks`).
+        prefix = re.compile(
+            rf"^CREATE (UNIQUE )?INDEX (\w+) ON (?:ONLY )?(?:\w+\.)?{self.table} "
+        )
+        create.extend(
+            prefix.sub(
+                rf"CREATE \1INDEX IF NOT EXISTS \2_partitioned ON {self.shadow} ", ddl
+            )
+            for ddl in layout.indexes.values()
+        )
+        return create
+
+    def _trigger_sql(self, columns: Sequence[str]) -> List[str]:
+        sync = f"{self.table}_partition_sync"
+        progress = f"{self.table}_partition_progress"
+        key = f"id, {self.column}"
+        changed = ", ".join(
+            f"{name} = EXCLUDED.{name}"
+            for name in columns
+            if name not in ("id", self.column)
+        )
+        values = ", ".join(f"NEW.{name}" for name in columns)
+        return [
+            f"CREATE OR REPLACE FUNCTION {sync}() RETURNS trigger LANGUAGE plpgsql AS $$ "
+            f"BEGIN "
+            f"IF TG_OP <> 'INSERT' THEN DELETE FROM {self.shadow} "
+            f"WHERE id = OLD.id AND {self.column} = OLD.{self.column}; END IF; "
+            f"IF TG_OP <> 'DELETE' THEN INSERT INTO {self.shadow} ({', '.join(columns)}) "
+            f"VALUES ({values}) ON CONFLICT ({key}) DO UPDATE SET {changed}; END IF; "
+            f"RETURN NULL; END $$",
+            f"DROP TRIGGER IF EXISTS {sync} ON {self.table}",
+            f"CREATE TRIGGER {sync} AFTER INSERT OR UPDATE OR DELETE ON {self.table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {sync}()",
+            f"CREATE TABLE IF NOT EXISTS {progress} (last_id bigint NOT NULL)",
+            f"INSERT INTO {progress} SELECT 0 "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {progress})",
+        ]
+
+    def _copy_sql(self, columns: Sequence[str]) -> str:
+        # Cada lote afecta a la única fila de progreso: el paso termina cuando un lote
+        # no encuentra filas nuevas.
+        progress = f"{self.table}_partition_progress"
+        names = ", ".join(columns)
+        return (
+            f"WITH batch AS (SELECT {names} FROM {self.table} "
+            f"WHERE id > (SELECT last_id FROM {progress}) ORDER BY id "
+            f"LIMIT {self.batch_size} FOR SHARE), "
+            f"copied AS (INSERT INTO {self.shadow} ({names}) SELECT {names} FROM batch "
+            f"ON CONFLICT (id, {self.column}) DO NOTHING) "
+            f"UPDATE {progress} SET last_id = (SELECT max(id) FROM batch) "
+            f"WHERE EXISTS (SELECT 1 FROM batch)"
+        )
+
+    def _swap_sql(self, indexes: Collection[str]) -> List[str]:
+        table, shadow = self.table, self.shadow
+        swap = [
+            f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE",
+            f"DROP TRIGGER {table}_partition_sync ON {table}",
+            f"ALTER TABLE {table} RENAME TO {table}_unpartitioned",
+            f"ALTER INDEX IF EXISTS {table}_pkey RENAME TO {table}_unpartitioned_pkey",
+        ]
+        swap.extend(
+            f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_unpartitioned"
+            for name in indexes
+        )
+        swap.extend(
+            [
+                f"ALTER TABLE {shadow} RENAME TO {table}",
+                f"ALTER INDEX {shadow}_pkey RENAME TO {table}_pkey",
+            ]
+        )
+        swap.extend(
+            f"ALTER INDEX {name}_partitioned RENAME TO {name}" for name in indexes
+        )
+        swap.extend(
+            [
+                f"ALTER SEQUENCE IF EXISTS {table}_id_seq OWNED BY {table}.id",
+                f"DROP FUNCTION {table}_partition_sync()",
+                f"DROP TABLE {table}_partition_progress",
+            ]
+        )
+        return swap
@@ -0,0 +1,258 @@
+"""
+Ejecución de las migraciones versionadas.
+
+Las migraciones son módulos `vNNNN_<nombre>.py` del paquete `versions` con una lista
+`OPERATIONS`. Las versiones aplicadas se registran en la tabla `schema_migrations`.
+Cada migración se planifica justo antes de aplicarse, sobre el esquema real.
+"""
+
+# pylint: disable=not-callable
+
+import importlib
+import logging
+import pkgutil
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+from app.infrastructure.db.base import Timestamp
+from app.infrastructure.db.migrations import versions
+from app.infrastructure.db.migrations.operations import Operation, Step
+
+logger = logging.getLogger(__name__)
+
+VERSION_MODULE = re.compile(r"^v(\d{4})_(\w+)$")
+
+migrations_table = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", Timestamp, server_default=func.now(), nullable=False),
+)
+
+
+@dataclass
+class Migration:
+    """
+    Migración versionada.
+
+    Atributos:
+        version (int): Número de versión (orden de aplicación).
+        name (str): Nombre descriptivo tomado del módulo.
+        description (str): Docstring del módulo.
+        operations (Sequence[Operation]): Operaciones a aplicar, en orden.
+    """
+
+    version: int
+    name: str
+    description: str
+    operations: Sequence[Operation]
+
+
+def load_migrations() -> List[Migration]:
+    """Carga las migraciones del paquete `versions`, ordenadas por versión."""
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        match = VERSION_MODULE.match(module_info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        migrations.append(
+            Migration(
+                version=int(match.group(1)),
+                name=match.group(2),
+                description=(module.__doc__ or "").strip(),
+                operations=module.OPERATIONS,
+            )
+        )
+    return sorted(migrations, key=lambda migration: migration.version)
+
+
+def applied_versions(engine: Engine) -> set:
+    """Devuelve las versiones ya registradas en `schema_migrations`."""
+    with engine.begin() as conn:
+        migrations_table.create(conn, checkfirst=True)
+        return set(conn.execute(select(migrations_table.c.version)).scalars())
+
+
+def pending_migrations(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """
+    Devuelve las migraciones pendientes hasta `target` (incluida).
+
+    Args:
+        engine (Engine): Motor de la base de datos.
+        target (Optional[int]): Última versión a considerar; todas si es None.
+
+    Returns:
+        List[Migration]: Migraciones sin aplicar, en orden.
+    """
+    applied = applied_versions(engine)
+    return [
+        migration
+        for migration in load_migrations()
+        if migration.version not in applied
+        and (target is None or migration.version <= target)
+    ]
+
+
+def plan_migration(engine: Engine, migration: Migration) -> List[Step]:
+    """Calcula los pasos de una migración sobre el esquema actual."""
+    with engine.connect() as conn:
+        return [
+            step for operation in migration.operations for step in operation.plan(conn)
+        ]
+
+
+def _estimated_rows(conn: Connection, table: str) -> Optional[int]:
+    if conn.dialect.name == "postgresql":
+        return conn.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"),
+            {"t": table},
+        ).scalar()
+    if conn.dialect.name == "sqlite":
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :t"),
+            {"t": table},
+        ).scalar()
+        return (
+            conn.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+            if exists
+            else None
+        )
+    return None
+
+
+def dry_run(
+    engine: Engine, target: Optional[int] = None
+) -> List[Tuple[Migration, List[Step]]]:
+    """
+    Planifica las migraciones pendientes sin ejecutar nada.
+
+    Cada migración se planifica contra el esquema actual, por lo que los pasos de una
+    migración que depende de otra pendiente pueden variar al aplicarse.
+
+    Args:
+        engine (Engine): Motor de la base de datos.
+        target (Optional[int]): Última versión a considerar.
+
+    Returns:
+        List[Tuple[Migration, List[Step]]]: Pasos previstos por migración.
+    """
+    return [
+        (migration, plan_migration(engine, migration))
+        for migration in pending_migrations(engine, target)
+    ]
+
+
+def format_plan(engine: Engine, plan: List[Tuple[Migration, List[Step]]]) -> str:
+    """Genera el informe legible del modo `--dry-run`, con el impacto de bloqueos."""
+    if not plan:
+        return "No hay migraciones pendientes."
+    lines = []
+    with engine.connect() as conn:
+        rows = {}
+        for migration, steps in plan:
+            lines.append(f"v{migration.version:04d} {migration.name}")
+            if not steps:
+                lines.append("  (sin cambios: el esquema ya está al día)")
+            for step in steps:
+                if step.table and step.table not in rows:
+                    rows[step.table] = _estimated_rows(conn, step.table)
+                mode = "transacción"
+                if step.batched:
+                    mode = "lotes"
+                elif step.autocommit:
+                    mode = "autocommit"
+                lines.append(f"  - {step.sql}")
+                lines.append(f"    bloqueo: {step.lock}")
+                if step.table:
+                    estimate = rows[step.table]
+                    size = "n/d" if estimate is None else f"~{estimate} filas"
+                    lines.append(f"    tabla: {step.table} ({size}); ejecución: {mode}")
+    return "\n".join(lines)
+
+
+def _set_lock_timeout(conn: Connection, lock_timeout: Optional[str]) -> None:
+    if lock_timeout and conn.dialect.name == "postgresql":
+        conn.execute(
+            text("SELECT set_config('lock_timeout', :t, false)"), {"t": lock_timeout}
+        )
+
+
+def apply_step(engine: Engine, step: Step, lock_timeout: Optional[str] = None) -> int:
+    """
+    Ejecuta un paso de migración.
+
+    Args:
+        engine (Engine): Motor de la base de datos.
+        step (Step): Paso a ejecutar.
+        lock_timeout (Optional[str]): Espera máxima por bloqueos en PostgreSQL (p. ej. "5s").
+
+    Returns:
+        int: Filas afectadas (suma de todos los lotes en los pasos por lotes).
+    """
+    if step.autocommit:
+        with engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            _set_lock_timeout(conn, lock_timeout)
+            conn.execute(text(step.sql))
+        return 0
+
+    total = 0
+    while True:
+        with engine.begin() as conn:
+            _set_lock_timeout(conn, lock_timeout)
+            affected = conn.execute(text(step.sql)).rowcount
+        if not step.batched:
+            return affected
+        if affected <= 0:
+            return total
+        total += affected
+        logger.info("Backfilled %d rows on %s", total, step.table)
+
+
+def upgrade(
+    engine: Engine, target: Optional[int] = None, lock_timeout: Optional[str] = "5s"
+) -> List[Migration]:
+    """
+    Aplica las migraciones pendientes hasta `target`.
+
+    Las operaciones son idempotentes, así que si un paso falla (por ejemplo, por
+    `lock_timeout`) basta con volver a ejecutar `upgrade`.
+
+    Args:
+        engine (Engine): Motor de la base de datos.
+        target (Optional[int]): Última versión a aplicar; todas si es None.
+        lock_timeout (Optional[str]): Espera máxima por bloqueos en PostgreSQL.
+
+    Returns:
+        List[Migration]: Migraciones aplicadas.
+    """
+    applied = []
+    for migration in pending_migrations(engine, target):
+        logger.info("Applying migration v%04d %s", migration.version, migration.name)
+        for step in plan_migration(engine, migration):
+            logger.info("%s", step.sql)
+            apply_step(engine, step, lock_timeout)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(migrations_table).values(
+                    version=migration.version, name=migration.name
+                )
+            )
+        applied.append(migration)
+    return applied
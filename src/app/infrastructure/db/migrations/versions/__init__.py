@@ -0,0 +1,3 @@
+"""
+Versiones de las migraciones. Cada módulo `vNNNN_<nombre>.py` define `OPERATIONS`.
+"""
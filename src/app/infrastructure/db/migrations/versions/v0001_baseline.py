@@ -0,0 +1,11 @@
+"""
+Esquema inicial: usuarios, listas y tareas.
+"""
+
+from app.infrastructure.db.migrations.operations import CreateTable
+
+OPERATIONS = [
+    CreateTable("users"),
+    CreateTable("task_lists"),
+    CreateTable("tasks"),
+]
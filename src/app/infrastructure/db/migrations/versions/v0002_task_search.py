@@ -0,0 +1,20 @@
+"""
+Búsqueda de texto completo sobre las tareas: índice GIN en PostgreSQL y tabla FTS5
+sincronizada por triggers en SQLite (reconstruida a partir de las tareas existentes).
+"""
+
+from app.infrastructure.db.migrations.operations import CreateIndex, RunSQL
+from app.infrastructure.db.models.task import SEARCH_FTS_TABLE, SQLITE_FTS_DDL
+
+OPERATIONS = [
+    CreateIndex("tasks", "ix_tasks_search_document"),
+    RunSQL(
+        [
+            *SQLITE_FTS_DDL,
+            f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}) VALUES ('rebuild')",
+        ],
+        lock="bloqueo de escritura de toda la base durante la reconstrucción",
+        table="tasks",
+        dialects=("sqlite",),
+    ),
+]
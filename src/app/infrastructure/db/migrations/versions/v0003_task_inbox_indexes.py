@@ -0,0 +1,10 @@
+"""
+Índices de la bandeja "mis tareas" (asignadas y creadas por el usuario).
+"""
+
+from app.infrastructure.db.migrations.operations import CreateIndex
+
+OPERATIONS = [
+    CreateIndex("tasks", "ix_tasks_assigned_to_is_done_updated_at"),
+    CreateIndex("tasks", "ix_tasks_created_by_is_done_updated_at"),
+]
@@ -0,0 +1,11 @@
+"""
+Archivado de tareas completadas: tabla `archived_tasks` e índice parcial de tareas
+completadas por fecha de actualización.
+"""
+
+from app.infrastructure.db.migrations.operations import CreateIndex, CreateTable
+
+OPERATIONS = [
+    CreateTable("archived_tasks"),
+    CreateIndex("tasks", "ix_tasks_completed_updated_at"),
+]
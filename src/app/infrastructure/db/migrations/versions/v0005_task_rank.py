@@ -0,0 +1,13 @@
+"""
+Orden manual de las tareas: columna `rank` e índice por lista y rank.
+
+Las tareas existentes quedan sin clave (se listan al final); el job
+`app.infrastructure.jobs.rank_rebalance` les asigna claves lista por lista.
+"""
+
+from app.infrastructure.db.migrations.operations import AddColumn, CreateIndex
+
+OPERATIONS = [
+    AddColumn("tasks", "rank"),
+    CreateIndex("tasks", "ix_tasks_list_id_rank"),
+]
@@ -0,0 +1,46 @@
+"""
+Prioridad de las tareas y color de las listas almacenados como SMALLINT
+(códigos de `PRIORITY_CODES` y `COLOR_TAG_CODES`), e índice para ordenar por prioridad.
+
+En PostgreSQL la conversión reescribe `tasks`, `archived_tasks` y `task_lists`
+(bloqueo ACCESS EXCLUSIVE mientras dura); conviene aplicarla en una ventana de
+mantenimiento. Valores de color fuera del enumerado quedan como NULL.
+"""
+
+from app.core.constants import COLOR_TAG_CODES, PRIORITY_CODES
+from app.infrastructure.db.migrations.operations import ConvertColumn, CreateIndex
+
+
+def _to_code(column: str, codes: dict) -> str:
+    whens = " ".join(
+        f"WHEN '{member.value}' THEN {code}" for member, code in codes.items()
+    )
+    return f"(CASE {column} {whens} END)"
+
+
+def _still_text(column: str) -> str:
+    # En SQLite los códigos convertidos se guardan como texto numérico ('1', '2', ...).
+    return f"typeof({column}) = 'text' AND {column} NOT GLOB '[0-9]*'"
+
+
+OPERATIONS = [
+    ConvertColumn(
+        "tasks",
+        "priority",
+        using=_to_code("priority", PRIORITY_CODES),
+        pending=_still_text("priority"),
+    ),
+    ConvertColumn(
+        "archived_tasks",
+        "priority",
+        using=_to_code("priority", PRIORITY_CODES),
+        pending=_still_text("priority"),
+    ),
+    ConvertColumn(
+        "task_lists",
+        "color_tag",
+        using=_to_code("color_tag", COLOR_TAG_CODES),
+        pending=_still_text("color_tag"),
+    ),
+    CreateIndex("tasks", "ix_tasks_list_id_priority"),
+]
@@ -0,0 +1,13 @@
+"""
+Concurrencia optimista: columna `version` en `tasks` y `archived_tasks`.
+
+Las filas existentes toman la versión 1 mediante el valor por defecto del servidor
+(sin reescribir la tabla en PostgreSQL 11 o superior).
+"""
+
+from app.infrastructure.db.migrations.operations import AddColumn
+
+OPERATIONS = [
+    AddColumn("tasks", "version"),
+    AddColumn("archived_tasks", "version"),
+]
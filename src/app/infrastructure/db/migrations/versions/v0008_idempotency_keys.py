@@ -0,0 +1,10 @@
+"""
+Claves de idempotencia: tabla `idempotency_keys` con índice por fecha de creación.
+"""
+
+from app.infrastructure.db.migrations.operations import CreateIndex, CreateTable
+
+OPERATIONS = [
+    CreateTable("idempotency_keys"),
+    CreateIndex("idempotency_keys", "ix_idempotency_keys_created_at"),
+]
@@ -0,0 +1,15 @@
+"""
+Particiones de `tasks` por hash de `list_id` (solo PostgreSQL).
+
+Casi todas las consultas de tareas filtran por lista; con 16 particiones, cada una
+lee solo la partición de su lista y sus índices, y el mantenimiento (VACUUM,
+reindexado) se reparte por partición. Las columnas, índices y claves foráneas se
+leen de la tabla actual, no del modelo, de modo que la migración no depende de las
+columnas que añaden las versiones posteriores.
+"""
+
+from app.infrastructure.db.migrations.operations import PartitionTable
+
+OPERATIONS = [
+    PartitionTable("tasks", "list_id", partitions=16),
+]
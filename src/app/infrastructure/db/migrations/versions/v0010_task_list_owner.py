@@ -0,0 +1,26 @@
+"""
+Propietario de las listas: columna `owner_id` en `task_lists` e índice
+`(owner_id, id)` para el listado paginado de "mis listas".
+
+Las listas existentes toman como propietario al creador de su tarea más antigua,
+activa o archivada. Las que no tienen ninguna quedan sin propietario hasta que un
+administrador las reclame (`POST /admin/lists/{list_id}/claim`). En bases existentes
+la columna se añade sin clave foránea (solo las bases nuevas la crean con
+`create_schema`).
+"""
+
+from app.infrastructure.db.migrations.operations import AddColumn, CreateIndex
+
+OPERATIONS = [
+    AddColumn(
+        "task_lists",
+        "owner_id",
+        backfill=(
+            "(SELECT t.created_by FROM ("
+            "SELECT id, list_id, created_by FROM tasks UNION ALL "
+            "SELECT id, list_id, created_by FROM archived_tasks"
+            ") t WHERE t.list_id = task_lists.id ORDER BY t.id LIMIT 1)"
+        ),
+    ),
+    CreateIndex("task_lists", "ix_task_lists_owner_id_id"),
+]
@@ -0,0 +1,41 @@
+"""
+Miembros de las listas: tabla `list_members` (rol por usuario y lista) con índice por
+lista. En las listas existentes, el propietario queda como miembro `owner`, y los
+demás usuarios que crearon tareas o las tenían asignadas (activas o archivadas), como
+`editor`, de modo que nadie pierde el acceso que tenía.
+
+Las listas sin tareas no tienen miembros. Un administrador las encuentra en
+`GET /admin/lists/unowned` y las reclama con `POST /admin/lists/{list_id}/claim`.
+"""
+
+from app.core.constants import LIST_ROLE_CODES, ListRole
+from app.infrastructure.db.migrations.operations import CreateIndex, CreateTable, RunSQL
+
+OPERATIONS = [
+    CreateTable("list_members"),
+    CreateIndex("list_members", "ix_list_members_list_id"),
+    RunSQL(
+        [
+            "INSERT INTO list_members (user_id, list_id, role) "
+            f"SELECT owner_id, id, {LIST_ROLE_CODES[ListRole.OWNER]} "
+            "FROM task_lists WHERE owner_id IS NOT NULL AND NOT EXISTS ("
+            "SELECT 1 FROM list_members m "
+            "WHERE m.user_id = task_lists.owner_id AND m.list_id = task_lists.id)",
+            "INSERT INTO list_members (user_id, list_id, role) "
+            f"SELECT w.user_id, w.list_id, {LIST_ROLE_CODES[ListRole.EDITOR]} FROM ("
+            "SELECT created_by AS user_id, list_id FROM tasks UNION "
+            "SELECT assigned_to, list_id FROM tasks WHERE assigned_to IS NOT NULL UNION "
+            "SELECT created_by, list_id FROM archived_tasks UNION "
+            "SELECT assigned_to, list_id FROM archived_tasks "
+            "WHERE assigned_to IS NOT NULL"
+            ") w WHERE EXISTS (SELECT 1 FROM task_lists l WHERE l.id = w.list_id) "
+            "AND NOT EXISTS (SELECT 1 FROM list_members m "
+            "WHERE m.user_id = w.user_id AND m.list_id = w.list_id)",
+        ],
+        lock=(
+            "ROW EXCLUSIVE sobre list_members (tabla nueva); lectura de task_lists, "
+            "tasks y archived_tasks"
+        ),
+        table="task_lists",
+    ),
+]
@@ -0,0 +1,11 @@
+"""
+Bandeja de salida transaccional: tabla `outbox_events` con índice parcial de los
+eventos pendientes.
+"""
+
+from app.infrastructure.db.migrations.operations import CreateIndex, CreateTable
+
+OPERATIONS = [
+    CreateTable("outbox_events"),
+    CreateIndex("outbox_events", "ix_outbox_events_pending"),
+]
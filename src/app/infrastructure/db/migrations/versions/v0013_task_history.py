@@ -0,0 +1,10 @@
+"""
+Historial de cambios de las tareas: tabla `task_history` con índice por tarea.
+"""
+
+from app.infrastructure.db.migrations.operations import CreateIndex, CreateTable
+
+OPERATIONS = [
+    CreateTable("task_history"),
+    CreateIndex("task_history", "ix_task_history_task_id_id"),
+]
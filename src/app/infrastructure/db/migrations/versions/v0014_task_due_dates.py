@@ -0,0 +1,13 @@
+"""
+Fechas límite de las tareas y su recordatorio: columnas `due_at` y `reminded_at`, e
+índice parcial de los recordatorios pendientes.
+"""
+
+from app.infrastructure.db.migrations.operations import AddColumn, CreateIndex
+
+OPERATIONS = [
+    AddColumn("tasks", "due_at"),
+    AddColumn("tasks", "reminded_at"),
+    AddColumn("archived_tasks", "due_at"),
+    CreateIndex("tasks", "ix_tasks_pending_reminders"),
+]
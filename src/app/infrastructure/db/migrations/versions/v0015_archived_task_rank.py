@@ -0,0 +1,10 @@
+"""
+Posición manual de las tareas archivadas: columna `rank` en `archived_tasks`, para
+restaurarlas en el lugar que ocupaban.
+"""
+
+from app.infrastructure.db.migrations.operations import AddColumn
+
+OPERATIONS = [
+    AddColumn("archived_tasks", "rank"),
+]
@@ -0,0 +1,10 @@
+"""
+Reclamo de los eventos de la bandeja de salida: columna `claimed_until`, para
+entregarlos fuera de la transacción que los reclama.
+"""
+
+from app.infrastructure.db.migrations.operations import AddColumn
+
+OPERATIONS = [
+    AddColumn("outbox_events", "claimed_until"),
+]
@@ -0,0 +1,10 @@
+"""
+Cabeceras de las respuestas idempotentes: columna `headers` en `idempotency_keys`,
+para repetir `ETag` y `Location` en los reintentos.
+"""
+
+from app.infrastructure.db.migrations.operations import AddColumn
+
+OPERATIONS = [
+    AddColumn("idempotency_keys", "headers"),
+]
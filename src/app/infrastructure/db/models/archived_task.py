@@ -0,0 +1,39 @@
+"""
+Definición del modelo ArchivedTaskModel que almacena las tareas completadas
+archivadas fuera de la tabla `tasks`.
+"""
+
+# pylint: disable=not-callable, too-few-public-methods
+
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, func
+
+from app.infrastructure.db.base import Base, Timestamp
+from app.infrastructure.db.models.task import PriorityType, RankType
+
+
+class ArchivedTaskModel(Base):
+    """
+    Modelo que representa una tarea archivada.
+    Conserva el ID y los datos de la tarea original para poder restaurarla.
+    """
+
+    __tablename__ = "archived_tasks"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String(200), nullable=False)
+    description = Column(String(1000), nullable=True)
+    priority = Column(PriorityType, nullable=False)
+    is_done = Column(Boolean, default=True, nullable=False)
+    assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True)
+    list_id = Column(
+        Integer, ForeignKey("task_lists.id", ondelete="CASCADE"), nullable=False
+    )
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+    created_at = Column(Timestamp, nullable=False)
+    updated_at = Column(Timestamp, nullable=False)
+    due_at = Column(Timestamp, nullable=True)
+    rank = Column(RankType, nullable=True)
+    archived_at = Column(Timestamp, server_default=func.now(), nullable=False)
+
+    __table_args__ = (Index("ix_archived_tasks_list_id_id", list_id, id),)
@@ -0,0 +1,46 @@
+"""
+Definición del modelo IdempotencyKeyModel que guarda las respuestas de las peticiones
+enviadas con la cabecera `Idempotency-Key`.
+"""
+
+# pylint: disable=not-callable, too-few-public-methods
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    Index,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    func,
+)
+
+from app.infrastructure.db.base import Base, Timestamp
+
+
+class IdempotencyKeyModel(Base):
+    """
+    Modelo que representa una clave de idempotencia de un usuario.
+
+    Mientras la petición original está en curso, `status_code` es NULL; al terminar
+    guarda el código, el cuerpo y las cabeceras relevantes (`ETag`, `Location`...) de
+    la respuesta para repetirla en los reintentos. `request_hash` (SHA-256 del
+    método, la ruta con los parámetros de consulta y el cuerpo) detecta claves
+    reutilizadas con otra petición.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(LargeBinary(32), nullable=False)
+    status_code = Column(SmallInteger, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    headers = Column(JSON, nullable=True)
+    created_at = Column(Timestamp, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Limpieza periódica por antigüedad (TTL).
+        Index("ix_idempotency_keys_created_at", "created_at"),
+    )
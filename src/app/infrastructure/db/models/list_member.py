@@ -0,0 +1,33 @@
+"""
+Definición del modelo ListMemberModel: rol de un usuario en una lista de tareas.
+"""
+
+# pylint: disable=not-callable, too-few-public-methods
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, func
+
+from app.core.constants import LIST_ROLE_CODES, ListRole
+from app.infrastructure.db.base import Base, CodedEnum, Timestamp
+
+ListRoleType = CodedEnum(ListRole, LIST_ROLE_CODES)
+
+
+class ListMemberModel(Base):
+    """
+    Pertenencia de un usuario a una lista de tareas, con su rol (`viewer`, `editor`
+    u `owner`).
+
+    La clave primaria `(user_id, list_id)` resuelve la comprobación de acceso y el
+    listado de las listas de un usuario; `ix_list_members_list_id`, los miembros de
+    una lista. Las pertenencias se eliminan en cascada con la lista.
+    """
+
+    __tablename__ = "list_members"
+    __table_args__ = (Index("ix_list_members_list_id", "list_id"),)
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    list_id = Column(
+        Integer, ForeignKey("task_lists.id", ondelete="CASCADE"), primary_key=True
+    )
+    role = Column(ListRoleType, nullable=False)
+    created_at = Column(Timestamp, server_default=func.now(), nullable=False)
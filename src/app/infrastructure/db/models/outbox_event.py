@@ -0,0 +1,45 @@
+"""
+Definición del modelo OutboxEventModel: eventos pendientes de entregar a sus
+manejadores (notificaciones, webhooks, auditoría...).
+"""
+
+# pylint: disable=not-callable, too-few-public-methods
+
+from sqlalchemy import JSON, Column, Index, Integer, SmallInteger, String, Text, func
+
+from app.infrastructure.db.base import Base, Timestamp
+
+
+class OutboxEventModel(Base):
+    """
+    Evento escrito en la misma transacción que el cambio que lo origina (patrón
+    *transactional outbox*): si la transacción se deshace, el evento tampoco existe.
+
+    El despachador lo reclama hasta `claimed_until`, lo entrega y lo elimina; si un
+    manejador falla, incrementa `attempts`, guarda el error, libera el reclamo y lo
+    pospone hasta `available_at`. Al agotar los intentos se marca `failed_at` y deja
+    de reintentarse.
+    """
+
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True)
+    topic = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(SmallInteger, nullable=False, server_default="0")
+    available_at = Column(Timestamp, server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    failed_at = Column(Timestamp, nullable=True)
+    claimed_until = Column(Timestamp, nullable=True)
+    created_at = Column(Timestamp, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Eventos pendientes en orden de entrega; los fallidos quedan fuera del índice.
+        Index(
+            "ix_outbox_events_pending",
+            available_at,
+            id,
+            postgresql_where=failed_at.is_(None),
+            sqlite_where=failed_at.is_(None),
+        ),
+    )
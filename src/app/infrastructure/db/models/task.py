@@ -1,14 +1,58 @@
 """
 Definición del modelo TaskModel para representar tareas individuales dentro de una
 lista de tareas en la base de datos.
+
+Incluye además la infraestructura de búsqueda de texto completo sobre `title` y
+`description`: un índice GIN sobre `tsvector` en PostgreSQL y una tabla virtual FTS5
+sincronizada mediante triggers en SQLite.
 """
 
 # pylint: disable=not-callable, too-few-public-methods
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    and_,
+    event,
+    func,
+    literal_column,
+)
 from sqlalchemy.orm import relationship
 
-from app.infrastructure.db.base import Base
+from app.core.constants import PRIORITY_CODES, PriorityLevel
+from app.infrastructure.db.base import Base, CodedEnum, Timestamp
+
+SEARCH_CONFIG = "simple"
+
+PriorityType = CodedEnum(PriorityLevel, PRIORITY_CODES)
+
+# Las claves de orden se comparan byte a byte: en PostgreSQL se fuerza la
+# colación "C" para que el orden del índice coincida con el de las claves.
+RANK_MAX_LENGTH = 255
+RankType = String(RANK_MAX_LENGTH).with_variant(
+    String(RANK_MAX_LENGTH, collation="C"), "postgresql"
+)
+SEARCH_FTS_TABLE = "tasks_fts"
+
+
+def search_document(title, description):
+    """
+    Construye la expresión `tsvector` indexada para la búsqueda en PostgreSQL.
+
+    Las constantes se renderizan como literales (no como parámetros) para que la
+    expresión de la consulta coincida exactamente con la del índice GIN.
+    """
+    return func.to_tsvector(
+        literal_column(f"'{SEARCH_CONFIG}'::regconfig"),
+        func.coalesce(title, literal_column("''"))
+        .op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(description, literal_column("''"))),
+    )
 
 
 class TaskModel(Base):
@@ -22,23 +66,108 @@ class TaskModel(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(String(1000), nullable=True)
-    priority = Column(String(50), nullable=False)
+    priority = Column(PriorityType, nullable=False)
     is_done = Column(Boolean, default=False)
     assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True)
     list_id = Column(Integer, ForeignKey("task_lists.id"), nullable=False)
+    rank = Column(RankType, nullable=True)
+    # Versión para concurrencia optimista (ETag / If-Match). Se incrementa en cada
+    # modificación del contenido de la tarea; los cambios de orden (`rank`) no cuentan.
+    version = Column(Integer, default=1, server_default="1", nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
+    created_at = Column(Timestamp, server_default=func.now(), nullable=False)
     updated_at = Column(
-        DateTime(timezone=True),
+        Timestamp,
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
     )
+    # Fecha límite y momento en que se envió su recordatorio (NULL mientras esté
+    # pendiente; vuelve a NULL si cambia la fecha límite).
+    due_at = Column(Timestamp, nullable=True)
+    reminded_at = Column(Timestamp, nullable=True)
 
     task_list = relationship("TaskListModel", back_populates="tasks")
     creator = relationship(
         "UserModel", foreign_keys=[created_by], backref="created_tasks"
     )
     assignee = relationship("UserModel", foreign_keys=[assigned_to])
+
+    __table_args__ = (
+        Index("ix_tasks_list_id_rank", list_id, rank, id),
+        Index("ix_tasks_list_id_priority", list_id, priority.desc(), id),
+        Index(
+            "ix_tasks_assigned_to_is_done_updated_at",
+            assigned_to,
+            is_done,
+            updated_at,
+            id,
+        ),
+        Index(
+            "ix_tasks_created_by_is_done_updated_at",
+            created_by,
+            is_done,
+            updated_at,
+            id,
+        ),
+        Index(
+            "ix_tasks_completed_updated_at",
+            updated_at,
+            postgresql_where=is_done.is_(True),
+            sqlite_where=is_done.is_(True),
+        ),
+        # Solo los recordatorios pendientes: el planificador lee una ventana por fecha
+        # sin recorrer las tareas completadas, avisadas o sin fecha límite.
+        Index(
+            "ix_tasks_pending_reminders",
+            due_at,
+            id,
+            list_id,
+            postgresql_where=and_(
+                due_at.isnot(None), reminded_at.is_(None), is_done.is_(False)
+            ),
+            sqlite_where=and_(
+                due_at.isnot(None), reminded_at.is_(None), is_done.is_(False)
+            ),
+        ),
+        Index(
+            "ix_tasks_search_document",
+            search_document(title, description),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        # Sin AUTOINCREMENT, SQLite reutiliza el mayor ID tras archivarlo y la tarea ya
+        # no podría restaurarse con su ID (en PostgreSQL la secuencia no retrocede).
+        {"sqlite_autoincrement": True},
+    )
+
+
+SQLITE_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} USING fts5("
+    "title, description, content='tasks', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description "
+    f"ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+)
+
+for _statement in SQLITE_FTS_DDL:
+    event.listen(
+        TaskModel.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    TaskModel.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
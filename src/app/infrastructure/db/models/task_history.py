@@ -0,0 +1,40 @@
+"""
+Definición del modelo TaskHistoryModel: historial de cambios de las tareas.
+"""
+
+# pylint: disable=not-callable, too-few-public-methods
+
+from sqlalchemy import JSON, Column, Index, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.core.constants import TASK_HISTORY_ACTION_CODES, TaskHistoryAction
+from app.infrastructure.db.base import Base, CodedEnum, Timestamp
+
+TaskHistoryActionType = CodedEnum(TaskHistoryAction, TASK_HISTORY_ACTION_CODES)
+
+
+class TaskHistoryModel(Base):
+    """
+    Cambio de una tarea: quién, cuándo, qué versión produjo y qué campos cambió.
+
+    Solo se añaden filas. `changes` (JSONB en PostgreSQL) guarda los campos que
+    cambiaron como `[anterior, nuevo]`; en la entrada de creación, cada campo con su
+    valor inicial. No hay claves foráneas: el historial sobrevive a la tarea y a su
+    lista.
+    """
+
+    __tablename__ = "task_history"
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    list_id = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=True)
+    action = Column(TaskHistoryActionType, nullable=False)
+    changed_by = Column(Integer, nullable=True)
+    changed_at = Column(Timestamp, nullable=False)
+    changes = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
+
+    __table_args__ = (
+        # Historial de una tarea, del cambio más reciente al más antiguo.
+        Index("ix_task_history_task_id_id", "task_id", "id"),
+    )
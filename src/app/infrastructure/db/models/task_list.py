@@ -4,23 +4,32 @@ Definición del modelo TaskListModel que representa una lista de tareas.
 
 # pylint: disable=too-few-public-methods
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
-from app.infrastructure.db.base import Base
+from app.core.constants import COLOR_TAG_CODES, ColorTagEnum
+from app.infrastructure.db.base import Base, CodedEnum
 
 
 class TaskListModel(Base):
     """
     Modelo que representa una lista de tareas.
     Puede tener múltiples tareas asociadas mediante la relación con TaskModel.
+
+    `owner_id` es el usuario que creó la lista; las listas anteriores a la columna
+    toman como propietario al creador de su primera tarea (o quedan sin él).
     """
 
     __tablename__ = "task_lists"
+    __table_args__ = (
+        # "Mis listas": filtro por propietario y paginación keyset por id.
+        Index("ix_task_lists_owner_id_id", "owner_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
-    color_tag = Column(String(255), nullable=True)
+    color_tag = Column(CodedEnum(ColorTagEnum, COLOR_TAG_CODES), nullable=True)
     category = Column(String(255), nullable=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
     tasks = relationship("TaskModel", back_populates="task_list")
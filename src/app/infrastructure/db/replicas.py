@@ -0,0 +1,174 @@
+"""
+Réplicas de lectura y encaminamiento de las consultas de solo lectura.
+
+Las rutas de solo lectura obtienen su sesión con `get_read_db_session`; en ellas las
+`SELECT` (sin `FOR UPDATE`) se envían a una réplica y todo lo demás al primario. Las
+escrituras, en cualquier sesión, fijan al usuario al primario durante
+`read_your_writes_seconds`: sus lecturas siguientes no van a una réplica que todavía
+no tenga sus cambios.
+
+El retraso de cada réplica se consulta cada `replica_lag_check_interval` segundos en
+un hilo aparte (la petición que encuentra el estado caducado no espera al resultado);
+una réplica con más de `replica_max_lag_seconds` de retraso, o que no responde, sale
+de la rotación hasta la siguiente comprobación. Hasta la primera comprobación no se
+usa ninguna réplica. Si no queda ninguna disponible, las lecturas van al primario.
+
+Las fijaciones son por proceso: con varios workers, cada uno solo conoce las
+escrituras que ha atendido. El retraso máximo admitido acota lo que puede ver de más
+antiguo un usuario cuya lectura llega a otro proceso.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_POSTGRES_LAG = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+def replication_lag(engine: Engine) -> float:
+    """
+    Segundos de retraso de una réplica respecto al primario.
+
+    En PostgreSQL se mide con la última transacción reproducida (0 si ya ha
+    reproducido todo lo recibido); en otros motores no hay replicación que medir y se
+    devuelve 0.
+
+    Args:
+        engine (Engine): Motor de la réplica.
+
+    Returns:
+        float: Retraso en segundos.
+    """
+    if engine.dialect.name != "postgresql":
+        return 0.0
+    with engine.connect() as conn:
+        return float(conn.execute(_POSTGRES_LAG).scalar_one())
+
+
+class ReplicaSet:  # pylint: disable=too-many-instance-attributes
+    """
+    Réplicas de lectura con control de retraso y fijación al primario tras escribir.
+
+    Args:
+        engines (list[Engine]): Motores de las réplicas.
+        max_lag (float): Retraso máximo (segundos) de una réplica en rotación.
+        check_interval (float): Segundos entre comprobaciones del retraso.
+        pin_seconds (float): Tiempo que un usuario lee del primario tras escribir.
+        lag_probe (Callable[[Engine], float]): Función que mide el retraso.
+        max_pinned (int): Usuarios fijados que se recuerdan (se olvidan los más
+            antiguos).
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        engines: list[Engine],
+        *,
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+        pin_seconds: float = 5.0,
+        lag_probe: Callable[[Engine], float] = replication_lag,
+        max_pinned: int = 10_000,
+    ):
+        self.engines = engines
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.pin_seconds = pin_seconds
+        self.lag_probe = lag_probe
+        self.max_pinned = max_pinned
+        self.lags: dict[Engine, Optional[float]] = {engine: None for engine in engines}
+        self._healthy: list[Engine] = []
+        self._cycle = itertools.cycle(())
+        self._checked = float("-inf")
+        self._checking = False
+        self._pinned: OrderedDict[int, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._checker = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="replica-lag"
+        )
+
+    def engine_for_read(self, user_id: Optional[int] = None) -> Optional[Engine]:
+        """
+        Elige la réplica de una lectura.
+
+        Args:
+            user_id (Optional[int]): Usuario de la petición, si se conoce.
+
+        Returns:
+            Optional[Engine]: Réplica disponible (por turnos), o None si la lectura
+                debe ir al primario.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked >= self.check_interval and not self._checking:
+                self._checking = True
+                self._checker.submit(self.refresh)
+            if user_id is not None and self._pinned.get(user_id, 0.0) > now:
+                return None
+            if not self._healthy:
+                return None
+            return next(self._cycle)
+
+    def pin(self, user_id: Optional[int]) -> None:
+        """Envía al primario las lecturas de `user_id` durante `pin_seconds`."""
+        if user_id is None or not self.pin_seconds:
+            return
+        with self._lock:
+            self._pinned[user_id] = time.monotonic() + self.pin_seconds
+            self._pinned.move_to_end(user_id)
+            while len(self._pinned) > self.max_pinned:
+                self._pinned.popitem(last=False)
+
+    def refresh(self) -> list[Engine]:
+        """
+        Mide el retraso de todas las réplicas y actualiza la rotación.
+
+        Returns:
+            list[Engine]: Réplicas en rotación tras la comprobación.
+        """
+        lags: dict[Engine, Optional[float]] = {}
+        for engine in self.engines:
+            try:
+                lags[engine] = self.lag_probe(engine)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Replica %s is unreachable", engine.url, exc_info=True)
+                lags[engine] = None
+        healthy = [
+            engine
+            for engine, lag in lags.items()
+            if lag is not None and lag <= self.max_lag
+        ]
+        for engine, lag in lags.items():
+            if lag is not None and lag > self.max_lag:
+                logger.warning(
+                    "Replica %s is %.1f s behind, skipping it", engine.url, lag
+                )
+        with self._lock:
+            self.lags = lags
+            self._healthy = healthy
+            self._cycle = itertools.cycle(healthy)
+            self._checked = time.monotonic()
+            self._checking = False
+        return healthy
+
+    def dispose(self) -> None:
+        """Cierra las conexiones de las réplicas."""
+        self._checker.shutdown(wait=True)
+        for engine in self.engines:
+            engine.dispose()
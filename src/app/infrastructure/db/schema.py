@@ -0,0 +1,38 @@
+"""
+Gestión del esquema de la base de datos.
+
+Importa todos los modelos ORM para que `Base.metadata` esté completo y expone
+`create_schema`, usado solo cuando la creación de tablas al arrancar está
+habilitada (`CREATE_SCHEMA=true`).
+"""
+
+import logging
+
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.db.base import Base
+
+# pylint: disable=unused-import
+from app.infrastructure.db.models import (  # noqa
+    archived_task,
+    idempotency_key,
+    list_member,
+    outbox_event,
+    task,
+    task_history,
+    task_list,
+    user,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_schema(engine: Engine) -> None:
+    """
+    Crea las tablas e índices que aún no existen (no modifica tablas existentes).
+
+    Args:
+        engine (Engine): Motor sobre el que se crea el esquema.
+    """
+    logger.info("Creating missing database tables")
+    Base.metadata.create_all(bind=engine)
@@ -2,29 +2,244 @@
 Módulo de configuración de la base de datos para TidyTasks.
 
 Este archivo define el motor de conexión a la base de datos y la dependencia `get_db`
-utilizada por FastAPI para manejar sesiones con SQLAlchemy.
+utilizada por FastAPI para manejar sesiones con SQLAlchemy. Si se configuran réplicas
+de lectura (`replica_urls`), las sesiones marcadas como de solo lectura envían sus
+`SELECT` a ellas (ver `app.infrastructure.db.replicas`).
+
+El motor no se crea al importar el módulo: se crea en el arranque de la aplicación
+(`init_engine`) o, en su defecto, la primera vez que una sesión lo necesita.
 """
 
-import os
+import re
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import Select, create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import Settings, get_settings
+from app.infrastructure.db.replicas import ReplicaSet
+from app.infrastructure.db.slow_queries import slow_query_log
+
+_engine: Optional[Engine] = None
+_replicas: Optional[ReplicaSet] = None
+_engine_lock = threading.Lock()
+
+
+class TimedQueuePool(QueuePool):
+    """
+    `QueuePool` que mide cuánto esperan las peticiones para obtener una conexión.
+
+    Combina las esperas en curso con una media móvil exponencial de las ya
+    terminadas, que decae con el tiempo sin nuevas muestras; así el control de
+    admisión reacciona en cuanto el pool se satura y deja de rechazar carga en
+    cuanto vuelve a estar libre.
+    """
+
+    WAIT_SMOOTHING = 0.2
+    WAIT_HALF_LIFE = 1.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self._wait_average = 0.0
+        self._last_sample = time.monotonic()
+        self._waiting: dict[int, float] = {}
+
+    def _do_get(self):
+        start = time.monotonic()
+        waiter = threading.get_ident()
+        with self._wait_lock:
+            self._waiting[waiter] = start
+        try:
+            return super()._do_get()
+        finally:
+            now = time.monotonic()
+            with self._wait_lock:
+                del self._waiting[waiter]
+                self._wait_average += self.WAIT_SMOOTHING * (
+                    now - start - self._wait_average
+                )
+                self._last_sample = now
+
+    def wait_time(self) -> float:
+        """Espera reciente (segundos) para obtener una conexión."""
+        now = time.monotonic()
+        with self._wait_lock:
+            oldest = min(self._waiting.values(), default=now)
+            average = self._wait_average
+            idle = now - self._last_sample
+        return max(now - oldest, average * 0.5 ** (idle / self.WAIT_HALF_LIFE))
+
+
+def _configure_sqlite_connection(dbapi_connection, _connection_record) -> None:
+    # SQLite no aplica las claves foráneas salvo que se active por conexión; el CRUD
+    # depende de ellas para detectar listas y usuarios inexistentes.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+    # pysqlite abre las transacciones por su cuenta con `BEGIN` diferido, lo que rompe
+    # los SAVEPOINT; se desactiva y la transacción se abre en `_begin_sqlite_write`.
+    dbapi_connection.isolation_level = None
+
+
+# Sentencias que escriben (o abren un SAVEPOINT) y deben ir dentro de la transacción.
+# Las lecturas (`SELECT`, `WITH ... SELECT`, `EXPLAIN`, `PRAGMA`...) no coinciden.
+_SQLITE_WRITE = re.compile(
+    r"\s*(INSERT|UPDATE|DELETE|REPLACE|SAVEPOINT|CREATE|DROP|ALTER)\b", re.IGNORECASE
+)
+_SQLITE_CTE_WRITE = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+
+def is_sqlite_write(statement: str) -> bool:
+    """Indica si una sentencia de SQLite escribe (o abre un SAVEPOINT)."""
+    if _SQLITE_WRITE.match(statement):
+        return True
+    return statement.lstrip()[:4].upper() == "WITH" and bool(
+        _SQLITE_CTE_WRITE.search(statement)
+    )
+
+
+def _locks_rows(context) -> bool:
+    statement = getattr(getattr(context, "compiled", None), "statement", None)
+    # pylint: disable-next=protected-access
+    return getattr(statement, "_for_update_arg", None) is not None
+
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
+def _begin_sqlite_write(conn, cursor, statement, _parameters, context, _many) -> None:
+    # Como hacía pysqlite, las lecturas van en modo autocommit y la transacción se abre
+    # justo antes de la primera escritura (o SAVEPOINT). Se abre con `BEGIN IMMEDIATE`:
+    # una transacción que lee y luego pide el bloqueo de escritura choca con otra que ya
+    # lo tiene y SQLite falla al instante ("database is locked") en vez de esperar.
+    # SQLite no admite `FOR UPDATE` (el compilador lo omite): esas lecturas también
+    # abren la transacción, y el bloqueo de escritura de la base hace de bloqueo de
+    # filas (p. ej., dos despachadores de la bandeja de salida no reclaman el mismo
+    # lote: el segundo espera a que el primero confirme).
+    if (
+        not cursor.connection.in_transaction
+        and (is_sqlite_write(statement) or _locks_rows(context))
+        and conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT"
+    ):
+        cursor.execute("BEGIN IMMEDIATE")
 
-load_dotenv()
 
-DB = os.getenv("DB")
-USERDB = os.getenv("USERDB")
-PASSWORDDB = os.getenv("PASSWORDDB")
-NAME_SERVICEDB = os.getenv("NAME_SERVICEDB")
-PORT = os.getenv("PORT")
-NAMEDB = os.getenv("NAMEDB")
+def build_engine(settings: Settings, url: Optional[str] = None) -> Engine:
+    """
+    Crea un motor de SQLAlchemy a partir de la configuración.
+
+    Args:
+        settings (Settings): Configuración de la aplicación.
+        url (Optional[str]): URL de conexión; por defecto la del primario.
+
+    Returns:
+        Engine: Motor sin conexiones abiertas (el pool se llena bajo demanda).
+    """
+    url = url or settings.sqlalchemy_url
+    pool_args = {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+    if url.startswith("sqlite"):
+        # Las bases en memoria necesitan el pool por defecto (una conexión por hilo).
+        if make_url(url).database in (None, "", ":memory:"):
+            pool_args = {}
+        engine = create_engine(
+            url, connect_args={"check_same_thread": False}, **pool_args
+        )
+        event.listen(engine, "connect", _configure_sqlite_connection)
+        event.listen(engine, "before_cursor_execute", _begin_sqlite_write)
+    else:
+        engine = create_engine(url, pool_pre_ping=True, **pool_args)
+    if settings.slow_query_threshold_ms:
+        slow_query_log.configure(settings)
+        slow_query_log.attach(engine)
+    return engine
+
+
+def init_engine(settings: Optional[Settings] = None) -> Engine:
+    """
+    Crea (una sola vez) el motor compartido de la aplicación y sus réplicas.
+
+    Args:
+        settings (Optional[Settings]): Configuración; por defecto `get_settings()`.
+
+    Returns:
+        Engine: Motor compartido (primario).
+    """
+    global _engine, _replicas  # pylint: disable=global-statement
+    with _engine_lock:
+        if _engine is None:
+            settings = settings or get_settings()
+            _engine = build_engine(settings)
+            if settings.replica_urls:
+                _replicas = ReplicaSet(
+                    [build_engine(settings, url) for url in settings.replica_urls],
+                    max_lag=settings.replica_max_lag_seconds,
+                    check_interval=settings.replica_lag_check_interval,
+                    pin_seconds=settings.read_your_writes_seconds,
+                )
+        return _engine
+
+
+def get_engine() -> Engine:
+    """Devuelve el motor compartido, creándolo si aún no existe."""
+    return _engine or init_engine()
+
+
+def dispose_engine() -> None:
+    """Cierra las conexiones del motor compartido y lo descarta."""
+    global _engine, _replicas  # pylint: disable=global-statement
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+        if _replicas is not None:
+            _replicas.dispose()
+            _replicas = None
+
+
+def _is_read(clause) -> bool:
+    # pylint: disable=protected-access
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+class LazySession(Session):  # pylint: disable=too-few-public-methods
+    """
+    Sesión que resuelve el motor compartido la primera vez que lo necesita.
+
+    Con réplicas configuradas (o un `ReplicaSet` en `info["replicas"]`), las `SELECT`
+    de una sesión con `info["read_only"]` van a una réplica, salvo que el usuario de
+    `info["user_id"]` haya escrito hace poco; cualquier otra sentencia va al primario
+    y fija a ese usuario al primario.
+    """
 
-DATABASE_URL = f"{DB}://{USERDB}:{PASSWORDDB}@{NAME_SERVICEDB}:{PORT}/{NAMEDB}"
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """Devuelve el motor (primario o réplica) que ejecutará `clause`."""
+        replicas = self.info.get("replicas", _replicas)
+        if replicas is not None:
+            if not _is_read(clause):
+                # `get_bind()` sin argumentos solo consulta el motor (p. ej. su dialecto).
+                if clause is not None or mapper is not None:
+                    replicas.pin(self.info.get("user_id"))
+            elif self.info.get("read_only"):
+                replica = replicas.engine_for_read(self.info.get("user_id"))
+                if replica is not None:
+                    return replica
+        if self.bind is None:
+            return get_engine()
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
 
-engine = create_engine(DATABASE_URL)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Las escrituras devuelven las filas con `RETURNING`; no se expiran al hacer commit
+# para no releerlas al serializar la respuesta.
+SessionLocal = sessionmaker(
+    class_=LazySession, autocommit=False, autoflush=False, expire_on_commit=False
+)
 
 
 def get_db():
@@ -0,0 +1,252 @@
+"""
+Registro de consultas lentas agregadas por huella (fingerprint).
+
+Los eventos `before_cursor_execute` y `after_cursor_execute` del motor miden cada
+sentencia; las que superan `slow_query_threshold_ms` se normalizan (literales y
+parámetros sustituidos por `?`, listas `IN (...)` colapsadas) y se acumulan por huella:
+número de ejecuciones lentas, tiempo total, medio y máximo.
+
+En PostgreSQL, con `slow_query_explain`, la primera vez que aparece una huella se
+obtiene su plan en segundo plano, con una conexión propia y fuera de la transacción
+de la petición: `EXPLAIN (ANALYZE, BUFFERS)` para las lecturas y `EXPLAIN` sin
+`ANALYZE` para las escrituras y los `SELECT ... FOR UPDATE/SHARE`, que así no se
+ejecutan dos veces.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_POSTCOMPILE = re.compile(r"\(?\s*__\[POSTCOMPILE_\w+\]\s*\)?")
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_TUPLES = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+_LOCKING = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+)?(?:UPDATE|SHARE|KEY\s+SHARE)\b", re.IGNORECASE
+)
+
+SAMPLE_LENGTH = 2000
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normaliza una sentencia para agrupar las que solo difieren en sus valores.
+
+    Args:
+        statement (str): Sentencia tal como se envía al driver.
+
+    Returns:
+        str: Sentencia normalizada (p. ej. `... WHERE tasks.list_id = ? AND id IN (...)`).
+    """
+    text = _STRING.sub("?", statement)
+    text = _POSTCOMPILE.sub("(...)", text)
+    text = _PARAMETER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _VALUE_LIST.sub("(...)", text)
+    text = _REPEATED_TUPLES.sub("(...)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass
+class QueryStats:  # pylint: disable=too-many-instance-attributes
+    """
+    Estadísticas acumuladas de una huella.
+
+    Atributos:
+        id (str): Identificador corto y estable de la huella.
+        fingerprint (str): Sentencia normalizada.
+        sample (str): Primera sentencia lenta observada (truncada).
+        count (int): Ejecuciones por encima del umbral.
+        total_ms (float): Tiempo total de esas ejecuciones.
+        max_ms (float): Ejecución más lenta.
+        last_seen (datetime): Última ejecución lenta.
+        explain (Optional[str]): Plan de ejecución, si se capturó.
+    """
+
+    id: str
+    fingerprint: str
+    sample: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_seen: Optional[datetime] = None
+    explain: Optional[str] = None
+
+    @property
+    def mean_ms(self) -> float:
+        """Tiempo medio por ejecución lenta."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class SlowQueryLog:
+    """
+    Agregado en memoria de las sentencias lentas de un proceso.
+
+    Args:
+        threshold_ms (float): Umbral en milisegundos (0 desactiva el registro).
+        max_fingerprints (int): Huellas que se conservan; al superarlo se descarta la de
+            menor tiempo total.
+        explain (bool): Capturar el plan de las huellas nuevas (solo PostgreSQL).
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 0.0,
+        max_fingerprints: int = 500,
+        explain: bool = False,
+    ):
+        self.threshold_ms = threshold_ms
+        self.max_fingerprints = max_fingerprints
+        self.explain = explain
+        self._stats: dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+        self._explainer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="explain"
+        )
+
+    def configure(self, settings: Settings) -> None:
+        """Aplica la configuración `slow_query_*`."""
+        self.threshold_ms = settings.slow_query_threshold_ms
+        self.max_fingerprints = settings.slow_query_max_fingerprints
+        self.explain = settings.slow_query_explain
+
+    def attach(self, engine: Engine) -> None:
+        """Registra los eventos de medición en `engine` (una sola vez)."""
+        if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    def record(
+        self,
+        statement: str,
+        duration_ms: float,
+        engine: Optional[Engine] = None,
+        parameters=None,
+    ) -> Optional[QueryStats]:
+        """
+        Acumula una sentencia si supera el umbral.
+
+        Args:
+            statement (str): Sentencia ejecutada.
+            duration_ms (float): Duración en milisegundos.
+            engine (Optional[Engine]): Motor que la ejecutó (para el `EXPLAIN`).
+            parameters: Parámetros de la sentencia (para el `EXPLAIN`).
+
+        Returns:
+            Optional[QueryStats]: Estadísticas de su huella, o None si no es lenta.
+        """
+        if not self.threshold_ms or duration_ms < self.threshold_ms:
+            return None
+        normalized = fingerprint(statement)
+        key = hashlib.sha1(normalized.encode()).hexdigest()[:12]
+        with self._lock:
+            stats = self._stats.get(key)
+            new = stats is None
+            if new:
+                if len(self._stats) >= self.max_fingerprints:
+                    del self._stats[
+                        min(self._stats.values(), key=lambda s: s.total_ms).id
+                    ]
+                stats = self._stats[key] = QueryStats(
+                    key, normalized, statement[:SAMPLE_LENGTH]
+                )
+            stats.count += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.last_seen = datetime.now(timezone.utc)
+        logger.warning(
+            "Slow query %s (%.1f ms): %s", key, duration_ms, normalized[:500]
+        )
+        if (
+            new
+            and self.explain
+            and engine is not None
+            and engine.dialect.name == "postgresql"
+        ):
+            self._submit_explain(engine, stats, statement, parameters)
+        return stats
+
+    def top(self, limit: int = 20, sort: str = "total_ms") -> list[QueryStats]:
+        """
+        Devuelve las huellas con mayor `sort` (`total_ms`, `count`, `max_ms`, `mean_ms`).
+
+        Args:
+            limit (int): Número máximo de huellas.
+            sort (str): Criterio de orden, de mayor a menor.
+
+        Returns:
+            list[QueryStats]: Huellas ordenadas.
+        """
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda s: getattr(s, sort), reverse=True)[:limit]
+
+    def reset(self) -> None:
+        """Descarta todas las estadísticas acumuladas."""
+        with self._lock:
+            self._stats.clear()
+
+    def _submit_explain(self, engine: Engine, stats: QueryStats, statement, parameters):
+        if not isinstance(parameters, (dict, tuple)):
+            return  # `executemany`: no hay un único conjunto de parámetros
+        self._explainer.submit(_explain, engine, stats, statement, parameters)
+
+
+def explain_options(statement: str) -> str:
+    """
+    Opciones de `EXPLAIN` para una sentencia.
+
+    `ANALYZE` ejecuta la sentencia: solo se usa con las lecturas que no bloquean filas
+    (un `SELECT ... FOR UPDATE` tomaría los bloqueos, o se los saltaría con
+    `SKIP LOCKED`, como si fuera otro trabajador).
+
+    Args:
+        statement (str): Sentencia SQL.
+
+    Returns:
+        str: `(ANALYZE, BUFFERS)` o una cadena vacía.
+    """
+    is_read = statement.lstrip()[:6].upper() == "SELECT"
+    return "(ANALYZE, BUFFERS)" if is_read and not _LOCKING.search(statement) else ""
+
+
+def _explain(engine: Engine, stats: QueryStats, statement: str, parameters) -> None:
+    options = explain_options(statement)
+    try:
+        with engine.connect() as conn:
+            # Las filas del plan no deben volver a medirse como consultas lentas.
+            conn = conn.execution_options(slow_query_log=False)
+            rows = conn.exec_driver_sql(f"EXPLAIN {options} {statement}", parameters)
+            stats.explain = "\n".join(row[0] for row in rows)
+            conn.rollback()
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Could not EXPLAIN slow query %s", stats.id)
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _many):
+    context.slow_query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, _cursor, statement, parameters, context, _many):
+    elapsed_ms = (time.perf_counter() - context.slow_query_started) * 1000
+    if conn.get_execution_options().get("slow_query_log", True):
+        slow_query_log.record(statement, elapsed_ms, conn.engine, parameters)
+
+
+slow_query_log = SlowQueryLog()
@@ -1,11 +1,17 @@
 """
 Módulo para enviar notificaciones por correo electrónico.
 
-Contiene funciones simuladas para el envío de invitaciones u otras notificaciones.
+Contiene funciones simuladas para el envío de invitaciones u otras notificaciones, y
+los manejadores de la bandeja de salida (`outbox_events`) que las disparan.
 """
 
 import logging
 
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.user import UserModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,3 +24,59 @@ def notify_assigned_user(assignee_email: str, task_title: str) -> None:
         assignee_email,
         task_title,
     )
+
+
+def notify_task_assignment(db: Session, payload: dict) -> None:
+    """
+    Manejador del evento `task.assigned`: notifica al usuario asignado a una tarea.
+
+    Args:
+        db (Session): Sesión del despachador.
+        payload (dict): `task_id`, `title` y `assigned_to` de la tarea.
+    """
+    email = db.scalar(
+        select(UserModel.email).where(UserModel.id == payload["assigned_to"])
+    )
+    if email is None:
+        logger.warning(
+            "Assignee %s of task %s no longer exists, skipping notification",
+            payload["assigned_to"],
+            payload["task_id"],
+        )
+        return
+    notify_assigned_user(email, payload["title"])
+
+
+def notify_due_tasks(db: Session, payload: dict) -> None:
+    """
+    Manejador del evento `task.due`: envía los recordatorios de un lote de tareas
+    vencidas al usuario asignado (o, si no hay, a quien la creó).
+
+    Args:
+        db (Session): Sesión del despachador.
+        payload (dict): `reminders`, con `task_id`, `title`, `due_at` y `user_id` de
+            cada tarea.
+    """
+    reminders = payload["reminders"]
+    emails = dict(
+        db.execute(
+            select(UserModel.id, UserModel.email).where(
+                UserModel.id.in_({reminder["user_id"] for reminder in reminders})
+            )
+        ).all()
+    )
+    for reminder in reminders:
+        email = emails.get(reminder["user_id"])
+        if email is None:
+            logger.warning(
+                "User %s of task %s no longer exists, skipping reminder",
+                reminder["user_id"],
+                reminder["task_id"],
+            )
+            continue
+        logger.info(
+            "[NOTIFICACIÓN FICTICIA] Se recordó al usuario %s que la tarea '%s' vence el %s.",
+            email,
+            reminder["title"],
+            reminder["due_at"],
+        )
@@ -0,0 +1,71 @@
+"""
+Tarea periódica de archivado de tareas completadas.
+
+Mueve a `archived_tasks` las tareas completadas sin cambios desde hace más de
+`ARCHIVE_AFTER_DAYS` días, en lotes de `ARCHIVE_BATCH_SIZE`. Pensada para
+ejecutarse desde cron u otro planificador:
+
+    cd src/
+    python -m app.infrastructure.jobs.archive --days 30 --batch-size 500
+"""
+
+import argparse
+import logging
+from datetime import timedelta
+from typing import Optional
+
+from app.core.config import get_settings
+from app.infrastructure.db.crud.archive import archive_completed_tasks
+from app.infrastructure.db.crud.task_history import task_history_writer
+from app.infrastructure.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def run(days: Optional[int] = None, batch_size: Optional[int] = None) -> int:
+    """
+    Ejecuta una pasada completa del archivador.
+
+    Args:
+        days (Optional[int]): Antigüedad mínima, en días, de las tareas completadas a
+            archivar (por defecto, `ARCHIVE_AFTER_DAYS`).
+        batch_size (Optional[int]): Número máximo de tareas por transacción (por
+            defecto, `ARCHIVE_BATCH_SIZE`).
+
+    Returns:
+        int: Número de tareas archivadas.
+    """
+    settings = get_settings()
+    days = settings.archive_after_days if days is None else days
+    batch_size = settings.archive_batch_size if batch_size is None else batch_size
+    db = SessionLocal()
+    try:
+        archived = archive_completed_tasks(
+            db, older_than=timedelta(days=days), batch_size=batch_size
+        )
+        logger.info("Archived %d tasks completed more than %d days ago", archived, days)
+        return archived
+    finally:
+        db.close()
+
+
+def main() -> None:
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Archiva tareas completadas.")
+    parser.add_argument("--days", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    # Las entradas `archived` del historial se escriben por lotes, no una a una.
+    task_history_writer.configure(get_settings())
+    task_history_writer.start()
+    try:
+        run(days=args.days, batch_size=args.batch_size)
+    finally:
+        task_history_writer.stop()
+
+
+if __name__ == "__main__":
+    main()
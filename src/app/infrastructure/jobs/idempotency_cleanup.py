@@ -0,0 +1,60 @@
+"""
+Tarea periódica de limpieza de claves de idempotencia.
+
+Elimina las claves de `idempotency_keys` con más de `IDEMPOTENCY_TTL_HOURS` horas,
+en lotes. Pensada para ejecutarse desde cron u otro planificador:
+
+    cd src/
+    python -m app.infrastructure.jobs.idempotency_cleanup --hours 24
+"""
+
+import argparse
+import logging
+from datetime import timedelta
+from typing import Optional
+
+from app.core.config import get_settings
+from app.infrastructure.db.crud.idempotency import purge_expired_idempotency_keys
+from app.infrastructure.db.session import SessionLocal
+
+PURGE_BATCH_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+def run(hours: Optional[int] = None, batch_size: int = PURGE_BATCH_SIZE) -> int:
+    """
+    Ejecuta una pasada completa de la limpieza.
+
+    Args:
+        hours (Optional[int]): TTL de las claves, en horas (por defecto,
+            `IDEMPOTENCY_TTL_HOURS`).
+        batch_size (int): Número máximo de claves por transacción.
+
+    Returns:
+        int: Número de claves eliminadas.
+    """
+    if hours is None:
+        hours = get_settings().idempotency_ttl_hours
+    db = SessionLocal()
+    try:
+        purged = purge_expired_idempotency_keys(
+            db, older_than=timedelta(hours=hours), batch_size=batch_size
+        )
+        logger.info("Purged %d idempotency keys older than %d hours", purged, hours)
+        return purged
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Elimina claves de idempotencia vencidas."
+    )
+    parser.add_argument("--hours", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    run(hours=args.hours, batch_size=args.batch_size)
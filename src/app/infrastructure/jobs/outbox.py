@@ -0,0 +1,151 @@
+"""
+Despachador de la bandeja de salida (`outbox_events`).
+
+Entrega en segundo plano los eventos que el CRUD registra en la misma transacción
+que sus cambios (ver `app.infrastructure.db.crud.outbox`). La aplicación arranca
+un despachador en un hilo propio cada `OUTBOX_DISPATCH_INTERVAL` segundos; con el
+intervalo a 0 no lo arranca y los eventos se entregan con un proceso aparte:
+
+    cd src/
+    python -m app.infrastructure.jobs.outbox            # en bucle
+    python -m app.infrastructure.jobs.outbox --once     # vacía la bandeja y termina
+
+Varios despachadores (uno por proceso de la aplicación) pueden ejecutarse a la vez:
+cada lote se reclama en una transacción corta que lo marca hasta `claimed_until`
+(`FOR UPDATE SKIP LOCKED` en PostgreSQL; en SQLite los reclamos se turnan) y se
+entrega después, sin bloqueos, así que ningún evento se entrega dos veces mientras
+dura el reclamo. Los manejadores se registran por tema con
+`register_handler`.
+"""
+
+import argparse
+import logging
+import time
+
+from app.core.config import Settings, get_settings
+from app.core.constants import OutboxTopic
+from app.infrastructure.db.crud.outbox import Handler, dispatch_outbox_events
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.email.notifier import notify_due_tasks, notify_task_assignment
+from app.infrastructure.jobs.worker import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+HANDLERS: dict[str, list[Handler]] = {
+    OutboxTopic.TASK_ASSIGNED.value: [notify_task_assignment],
+    OutboxTopic.TASK_DUE.value: [notify_due_tasks],
+}
+
+
+def register_handler(topic: str, handler: Handler) -> None:
+    """
+    Añade un manejador a los eventos de un tema.
+
+    Args:
+        topic (str): Tema del evento.
+        handler (Handler): Función `(db, payload)`; si lanza una excepción, el evento
+            se reintenta (y se vuelven a ejecutar todos los manejadores del tema).
+    """
+    HANDLERS.setdefault(topic, []).append(handler)
+
+
+class OutboxDispatcher(BackgroundJob):
+    """
+    Entrega los eventos pendientes en lotes, en un hilo propio o bajo demanda.
+
+    Args:
+        handlers (dict[str, list[Handler]]): Manejadores por tema.
+        interval (float): Segundos entre pasadas del hilo (0 = no se arranca).
+        batch_size (int): Eventos reclamados por lote.
+        max_attempts (int): Intentos antes de dar un evento por fallido.
+        retry_backoff (float): Espera, en segundos, tras el primer fallo.
+        lease (float): Segundos que dura el reclamo de un lote.
+    """
+
+    thread_name = "outbox"
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        handlers: dict[str, list[Handler]],
+        *,
+        interval: float = 1.0,
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        retry_backoff: float = 5.0,
+        lease: float = 60.0,
+    ):
+        super().__init__()
+        self.handlers = handlers
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lease = lease
+
+    def configure(self, settings: Settings) -> None:
+        """Aplica la configuración `outbox_*`."""
+        self.interval = settings.outbox_dispatch_interval
+        self.batch_size = settings.outbox_batch_size
+        self.max_attempts = settings.outbox_max_attempts
+        self.retry_backoff = settings.outbox_retry_backoff_seconds
+        self.lease = settings.outbox_claim_lease_seconds
+
+    def run_once(self) -> int:
+        """
+        Entrega lotes hasta vaciar los eventos disponibles.
+
+        Returns:
+            int: Número de eventos reclamados.
+        """
+        total = 0
+        db = SessionLocal()
+        try:
+            while True:
+                claimed = dispatch_outbox_events(
+                    db,
+                    self.handlers,
+                    batch_size=self.batch_size,
+                    max_attempts=self.max_attempts,
+                    retry_backoff=self.retry_backoff,
+                    lease=self.lease,
+                )
+                total += claimed
+                if claimed < self.batch_size or self._stop.is_set():
+                    return total
+        finally:
+            db.close()
+
+    def _enabled(self) -> bool:
+        return self.interval > 0
+
+    def run(self) -> None:
+        """Ejecuta pasadas hasta que se llame a `stop`."""
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:  # pylint: disable=broad-except
+                logger.error("Outbox dispatcher pass failed", exc_info=True)
+            self._stop.wait(self.interval)
+
+
+outbox_dispatcher = OutboxDispatcher(HANDLERS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Entrega los eventos de la bandeja de salida."
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="vacía la bandeja y termina"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    outbox_dispatcher.configure(get_settings())
+    if args.once:
+        outbox_dispatcher.run_once()
+    else:
+        while True:
+            outbox_dispatcher.run_once()
+            time.sleep(outbox_dispatcher.interval or 1.0)
@@ -0,0 +1,57 @@
+"""
+Tarea periódica de reequilibrio de las claves de orden de las tareas.
+
+Reescribe las claves de las listas cuyas claves superan `RANK_REBALANCE_LENGTH`
+caracteres (o que tienen tareas sin clave). Pensada para ejecutarse desde cron:
+
+    cd src/
+    python -m app.infrastructure.jobs.rank_rebalance --max-length 32
+"""
+
+import argparse
+import logging
+
+from app.core.config import get_settings
+from app.infrastructure.db.crud.ordering import lists_to_rebalance, rebalance_list
+from app.infrastructure.db.session import SessionLocal
+
+RANK_REBALANCE_LENGTH = get_settings().rank_rebalance_length
+
+logger = logging.getLogger(__name__)
+
+
+def run(max_length: int = RANK_REBALANCE_LENGTH) -> int:
+    """
+    Reequilibra todas las listas que lo necesitan.
+
+    Args:
+        max_length (int): Longitud máxima tolerada de una clave.
+
+    Returns:
+        int: Número de listas reequilibradas.
+    """
+    db = SessionLocal()
+    rebalanced = 0
+    last_list_id = 0
+    try:
+        while list_ids := lists_to_rebalance(
+            db, max_length, after_list_id=last_list_id
+        ):
+            for list_id in list_ids:
+                rebalance_list(db, list_id)
+            rebalanced += len(list_ids)
+            last_list_id = list_ids[-1]
+        logger.info("Rebalanced %d lists", rebalanced)
+        return rebalanced
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reequilibra claves de orden.")
+    parser.add_argument("--max-length", type=int, default=RANK_REBALANCE_LENGTH)
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    run(max_length=args.max_length)
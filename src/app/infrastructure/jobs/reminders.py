@@ -0,0 +1,192 @@
+"""
+Planificador de recordatorios de las tareas con fecha límite.
+
+En lugar de recorrer las tareas en cada pasada, el planificador lee cada
+`REMINDER_REFRESH_SECONDS` segundos los recordatorios que vencen en los próximos
+`REMINDER_WINDOW_SECONDS` (una consulta por rango sobre el índice parcial
+`ix_tasks_pending_reminders`) y los guarda en un montículo ordenado por fecha. El hilo
+duerme hasta el siguiente vencimiento o la siguiente lectura; al despertar, saca del
+montículo los vencidos y los reclama en lotes de `REMINDER_BATCH_SIZE`.
+
+El reclamo (`claim_due_reminders`) es un `UPDATE` condicional, así que varios
+planificadores (uno por proceso de la aplicación) pueden ejecutarse a la vez sin
+avisar dos veces de la misma tarea. Las fechas límite nuevas o adelantadas dentro de la
+ventana se recogen en la siguiente lectura. Con `REMINDER_REFRESH_SECONDS=0` la
+aplicación no lo arranca y puede ejecutarse en un proceso aparte:
+
+    cd src/
+    python -m app.infrastructure.jobs.reminders            # en bucle
+    python -m app.infrastructure.jobs.reminders --once     # reclama los vencidos y termina
+"""
+
+import argparse
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.infrastructure.db.crud.reminders import (
+    claim_due_reminders,
+    get_upcoming_reminders,
+)
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.jobs.worker import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite devuelve las fechas sin zona horaria; se almacenan en UTC.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class ReminderScheduler(BackgroundJob):
+    """
+    Montículo en memoria de los recordatorios próximos, reclamados al vencer.
+
+    Args:
+        window (float): Segundos hacia delante que se cargan en cada lectura.
+        refresh_interval (float): Segundos entre lecturas (0 = el hilo no se arranca).
+        batch_size (int): Recordatorios por reclamo (y por evento `task.due`).
+        max_loaded (int): Recordatorios cargados como máximo por lectura; si la ventana
+            tiene más, se vuelve a leer al agotarlos.
+    """
+
+    thread_name = "reminders"
+
+    def __init__(
+        self,
+        window: float = 300.0,
+        refresh_interval: float = 60.0,
+        batch_size: int = 100,
+        max_loaded: int = 10_000,
+    ):
+        super().__init__()
+        self.window = window
+        self.refresh_interval = refresh_interval
+        self.batch_size = batch_size
+        self.max_loaded = max_loaded
+        self._heap: list[tuple[datetime, int, int]] = []
+        self._truncated = False
+        self._refresh_at: Optional[datetime] = None
+
+    def configure(self, settings: Settings) -> None:
+        """Aplica la configuración `reminder_*`."""
+        self.window = settings.reminder_window_seconds
+        self.refresh_interval = settings.reminder_refresh_seconds
+        self.batch_size = settings.reminder_batch_size
+        self.max_loaded = settings.reminder_max_loaded
+
+    def refresh(self, db: Session, now: datetime) -> None:
+        """
+        Sustituye el montículo por los recordatorios pendientes de la ventana.
+
+        Args:
+            db (Session): Sesión activa de base de datos.
+            now (datetime): Inicio de la ventana.
+        """
+        rows = get_upcoming_reminders(
+            db, now + timedelta(seconds=self.window), self.max_loaded
+        )
+        # Las filas llegan ordenadas por fecha: la lista ya es un montículo válido.
+        self._heap = [(_utc(row.due_at), row.id, row.list_id) for row in rows]
+        self._truncated = len(rows) >= self.max_loaded
+        self._refresh_at = now + timedelta(seconds=self.refresh_interval)
+        logger.debug("Loaded %d upcoming reminders", len(rows))
+
+    def pop_due(self, now: datetime) -> list[tuple[int, int]]:
+        """
+        Saca del montículo hasta `batch_size` recordatorios vencidos.
+
+        Returns:
+            list[tuple[int, int]]: Pares `(list_id, task_id)`.
+        """
+        due = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            _, task_id, list_id = heapq.heappop(self._heap)
+            due.append((list_id, task_id))
+        return due
+
+    def tick(self, db: Session, now: Optional[datetime] = None) -> int:
+        """
+        Reclama los recordatorios vencidos, leyendo la ventana si toca.
+
+        Args:
+            db (Session): Sesión activa de base de datos.
+            now (Optional[datetime]): Instante de la pasada (por defecto, el actual).
+
+        Returns:
+            int: Número de recordatorios reclamados.
+        """
+        now = now or datetime.now(timezone.utc)
+        if self._refresh_at is None or now >= self._refresh_at:
+            self.refresh(db, now)
+        claimed = 0
+        while True:
+            due = self.pop_due(now)
+            if due:
+                claimed += claim_due_reminders(db, due, now)
+            elif not self._heap and self._truncated:
+                self.refresh(db, now)
+                if not self._heap:
+                    break
+            else:
+                break
+        if claimed:
+            logger.info("Claimed %d due reminders", claimed)
+        return claimed
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> float:
+        """Segundos hasta el próximo vencimiento cargado o la próxima lectura."""
+        now = now or datetime.now(timezone.utc)
+        if self._refresh_at is None:
+            return self.refresh_interval
+        wake_at = (
+            min(self._refresh_at, self._heap[0][0]) if self._heap else self._refresh_at
+        )
+        return max((wake_at - now).total_seconds(), 0.0)
+
+    def _enabled(self) -> bool:
+        return self.refresh_interval > 0
+
+    def run(self) -> None:
+        """Ejecuta pasadas hasta que se llame a `stop`."""
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                self.tick(db)
+            except Exception:  # pylint: disable=broad-except
+                logger.error("Reminder scheduler pass failed", exc_info=True)
+                # Los recordatorios sacados y no reclamados vuelven en la próxima lectura.
+                self._refresh_at = None
+            finally:
+                db.close()
+            self._stop.wait(self.seconds_until_next())
+
+
+reminder_scheduler = ReminderScheduler()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Envía los recordatorios de tareas vencidas."
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="reclama los vencidos y termina"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    reminder_scheduler.configure(get_settings())
+    if args.once:
+        with SessionLocal() as session:
+            reminder_scheduler.tick(session)
+    else:
+        reminder_scheduler.refresh_interval = (
+            reminder_scheduler.refresh_interval or 60.0
+        )
+        reminder_scheduler.run()
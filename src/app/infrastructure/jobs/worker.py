@@ -0,0 +1,49 @@
+"""
+Base de los trabajos que la aplicación ejecuta en un hilo propio.
+
+La subclase implementa `run` (el bucle, que termina al activarse `_stop`) y
+`_enabled`; `start` y `stop` gestionan el hilo.
+"""
+
+import threading
+from typing import Optional
+
+
+class BackgroundJob:
+    """
+    Trabajo periódico con arranque y parada de su hilo.
+
+    Attributes:
+        thread_name (str): Nombre del hilo.
+    """
+
+    thread_name = "job"
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _enabled(self) -> bool:
+        return True
+
+    def run(self) -> None:
+        """Ejecuta pasadas hasta que se llame a `stop`."""
+        raise NotImplementedError
+
+    def start(self) -> None:
+        """Arranca el hilo si el trabajo está habilitado y no se había arrancado."""
+        if not self._enabled() or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, name=self.thread_name, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el hilo al terminar la pasada en curso."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
@@ -0,0 +1,10 @@
+"""
+Punto de entrada para plataformas que importan una instancia ASGI (p. ej. Vercel).
+
+Construye la aplicación al importarse; el resto de despliegues sirven la fábrica
+de `main` (`uvicorn main:create_app --factory`) y no cargan este módulo.
+"""
+
+from main import create_app
+
+app = create_app()
@@ -0,0 +1,108 @@
+"""
+Benchmark de latencia de las consultas "calientes" antes y después de archivar.
+
+Genera una base SQLite con N tareas, de las cuales una fracción está completada
+desde hace meses, mide `get_tasks_with_filters` (tareas pendientes de una lista y
+porcentaje de completitud), ejecuta el archivador y vuelve a medir. Uso:
+
+    cd src/
+    python -m benchmarks.archive_hot_queries --tasks 500000 --lists 500
+"""
+
+# pylint: disable=not-callable
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.crud.archive import archive_completed_tasks
+from app.infrastructure.db.crud.task_list import get_tasks_with_filters
+from app.infrastructure.db.models.task import TaskModel
+from benchmarks.common import seed_owner_and_lists
+
+
+def seed(engine, n_tasks: int, n_lists: int, done_ratio: float, batch: int = 20_000):
+    """Inserta `n_tasks` tareas; `done_ratio` de ellas completadas hace 90 días."""
+    rng = random.Random(42)
+    old = datetime.now(timezone.utc) - timedelta(days=90)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed_owner_and_lists(conn, n_lists)
+        for start in range(0, n_tasks, batch):
+            rows = []
+            for index in range(start, min(start + batch, n_tasks)):
+                done = rng.random() < done_ratio
+                rows.append(
+                    {
+                        "title": f"Tarea {index}",
+                        "description": "Descripción de prueba",
+                        "priority": rng.choice(("low", "medium", "high")),
+                        "is_done": done,
+                        "list_id": rng.randint(1, n_lists),
+                        "created_by": 1,
+                        "updated_at": old if done else datetime.now(timezone.utc),
+                    }
+                )
+            conn.execute(insert(TaskModel), rows)
+
+
+def measure(engine, n_lists: int, queries: int) -> dict:
+    """Mide la consulta de tareas pendientes + completitud sobre listas aleatorias."""
+    rng = random.Random(7)
+    list_ids = [rng.randint(1, n_lists) for _ in range(queries)]
+    samples = []
+    with Session(engine) as db:
+        for list_id in list_ids:
+            start = time.perf_counter()
+            get_tasks_with_filters(db, list_id, is_done=False, priority=None)
+            samples.append((time.perf_counter() - start) * 1000)
+        hot_rows = db.scalar(select(func.count(TaskModel.id)))
+    quantiles = statistics.quantiles(samples, n=100)
+    return {
+        "hot_rows": hot_rows,
+        "p50_ms": round(quantiles[49], 3),
+        "p95_ms": round(quantiles[94], 3),
+        "p99_ms": round(quantiles[98], 3),
+    }
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--lists", type=int, default=200)
+    parser.add_argument("--done-ratio", type=float, default=0.8)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'archive.db'}")
+        seed(engine, args.tasks, args.lists, args.done_ratio)
+        result = {"tasks": args.tasks, "lists": args.lists}
+        result["before"] = measure(engine, args.lists, args.queries)
+
+        start = time.perf_counter()
+        with Session(engine) as db:
+            archived = archive_completed_tasks(
+                db, older_than=timedelta(days=30), batch_size=args.batch_size
+            )
+        result["archived"] = archived
+        result["archive_s"] = round(time.perf_counter() - start, 2)
+
+        result["after"] = measure(engine, args.lists, args.queries)
+        engine.dispose()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
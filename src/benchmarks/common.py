@@ -0,0 +1,21 @@
+"""
+Datos comunes de los benchmarks que generan su propia base SQLite.
+"""
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.models.task_list import TaskListModel
+from app.infrastructure.db.models.user import UserModel
+
+
+def seed_owner_and_lists(conn: Connection, n_lists: int) -> None:
+    """Inserta el usuario 1 (`bench`) y las listas con IDs de 1 a `n_lists`."""
+    conn.execute(
+        insert(UserModel),
+        [{"id": 1, "username": "bench", "email": "b@x.io", "password_hash": "x"}],
+    )
+    conn.execute(
+        insert(TaskListModel),
+        [{"id": i, "name": f"Lista {i}"} for i in range(1, n_lists + 1)],
+    )
@@ -0,0 +1,113 @@
+"""
+Benchmark de espacio de `priority` y `color_tag` como texto frente a SMALLINT.
+
+Genera dos bases SQLite con las mismas tareas y listas: una con el esquema anterior
+(`priority` VARCHAR(50), `color_tag` VARCHAR(255)) y otra con el actual (códigos
+SMALLINT), y compara el tamaño de las tablas y del índice
+`ix_tasks_list_id_priority` usando la tabla virtual `dbstat`. Uso:
+
+    cd src/
+    python -m benchmarks.enum_storage --tasks 500000 --lists 5000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import MetaData, String, create_engine, insert, text
+
+from app.core.constants import ColorTagEnum, PriorityLevel
+from app.infrastructure.db.schema import Base
+
+MEASURED = ("tasks", "task_lists", "ix_tasks_list_id_priority")
+
+
+def legacy_metadata() -> MetaData:
+    """Copia de las tablas con las columnas de texto previas a los códigos."""
+    metadata = MetaData()
+    for name in ("users", "task_lists", "tasks"):
+        Base.metadata.tables[name].to_metadata(metadata)
+    tasks = metadata.tables["tasks"]
+    tasks.c.priority.type = String(50)
+    # `to_metadata` no conserva `ddl_if`: el índice GIN solo existe en PostgreSQL.
+    tasks.indexes = {
+        index for index in tasks.indexes if index.name != "ix_tasks_search_document"
+    }
+    metadata.tables["task_lists"].c.color_tag.type = String(255)
+    return metadata
+
+
+def seed(engine, metadata: MetaData, n_tasks: int, n_lists: int, batch: int = 20_000):
+    """Inserta el mismo conjunto de datos (semilla fija) con el esquema indicado."""
+    rng = random.Random(42)
+    tables = [metadata.tables[name] for name in ("users", "task_lists", "tasks")]
+    metadata.create_all(engine, tables=tables)
+    colors = [color.value for color in ColorTagEnum]
+    priorities = [priority.value for priority in PriorityLevel]
+    with engine.begin() as conn:
+        conn.execute(
+            insert(metadata.tables["users"]),
+            [{"id": 1, "username": "bench", "email": "b@x.io", "password_hash": "x"}],
+        )
+        conn.execute(
+            insert(metadata.tables["task_lists"]),
+            [
+                {"id": i, "name": f"Lista {i}", "color_tag": rng.choice(colors)}
+                for i in range(1, n_lists + 1)
+            ],
+        )
+        for start in range(0, n_tasks, batch):
+            conn.execute(
+                insert(metadata.tables["tasks"]),
+                [
+                    {
+                        "title": f"Tarea {index}",
+                        "priority": rng.choice(priorities),
+                        "is_done": False,
+                        "list_id": rng.randint(1, n_lists),
+                        "created_by": 1,
+                    }
+                    for index in range(start, min(start + batch, n_tasks))
+                ],
+            )
+
+
+def sizes(engine) -> dict:
+    """Bytes ocupados por cada tabla/índice medido, según `dbstat`."""
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+        ).all()
+    return {name: size for name, size in rows if name in MEASURED}
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--lists", type=int, default=2_000)
+    args = parser.parse_args()
+
+    result = {"tasks": args.tasks, "lists": args.lists}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, metadata in (
+            ("text", legacy_metadata()),
+            ("smallint", Base.metadata),
+        ):
+            engine = create_engine(f"sqlite:///{Path(tmp) / f'{label}.db'}")
+            seed(engine, metadata, args.tasks, args.lists)
+            with engine.connect() as conn:
+                conn.exec_driver_sql("VACUUM")
+            result[label] = sizes(engine)
+            engine.dispose()
+    result["saved_pct"] = {
+        name: round(100 * (1 - result["smallint"][name] / result["text"][name]), 1)
+        for name in MEASURED
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
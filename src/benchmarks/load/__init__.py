@@ -0,0 +1,7 @@
+"""
+Suite de pruebas de carga de la API HTTP.
+
+`seed` genera los datos, `scenarios` define las mezclas de endpoints, `runner`
+ejecuta la carga y `report` resume las latencias por ruta en JSON. Ver
+`python -m benchmarks.load --help` y `python -m benchmarks.load.compare --help`.
+"""
@@ -0,0 +1,141 @@
+"""
+Prueba de carga de la API HTTP con una mezcla realista de endpoints.
+
+Genera los datos en la base indicada (por defecto, una SQLite temporal), ejecuta la
+mezcla con la concurrencia pedida y escribe un informe JSON con RPS y p50/p95/p99 por
+ruta, comparable entre commits con `benchmarks.load.compare`. Uso:
+
+    cd src/
+    python -m benchmarks.load --mix default --concurrency 16 --duration 20 \\
+        --output load-default.json
+
+Contra PostgreSQL (`docker compose -f docker-compose.db.yml up -d`), pasar
+`--database-url postgresql+psycopg2://...`. Con `--base-url` se ataca un servidor ya
+arrancado (que debe usar la misma base de datos) en lugar de la aplicación en proceso.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.load.scenarios import MIXES
+from benchmarks.micro.harness import git_commit
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--database-url", help="base de datos (por defecto, SQLite temporal)"
+    )
+    parser.add_argument(
+        "--base-url", help="servidor ya arrancado (por defecto, en proceso)"
+    )
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--lists", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=100, help="tareas por lista")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="default")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10, help="segundos medidos")
+    parser.add_argument("--warmup", type=float, default=2, help="segundos descartados")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--output", type=Path, help="fichero JSON (por defecto, stdout)"
+    )
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace, data) -> dict:
+    # pylint: disable=import-outside-toplevel
+    import httpx
+
+    from app.core.config import Settings
+    from benchmarks.load.report import build_report
+    from benchmarks.load.runner import login_tokens, run_load
+    from benchmarks.load.scenarios import Mix
+    from main import create_app
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+    else:
+        # Se mide la aplicación, no la limitación por cliente: todo sale de un mismo origen.
+        app = create_app(Settings(rate_limit_user_rate=0, rate_limit_ip_rate=0))
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=30
+        )
+    async with client:
+        tokens = await login_tokens(client, data.usernames)
+        samples, elapsed = await run_load(
+            client,
+            data,
+            tokens,
+            Mix(args.mix),
+            args.concurrency,
+            duration=args.duration,
+            warmup=args.warmup,
+            seed=args.seed,
+        )
+    metadata = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "target": args.base_url or "in-process",
+        "database": args.database_url.split("://", 1)[0],
+        "mix": args.mix,
+        "concurrency": args.concurrency,
+        "warmup_s": args.warmup,
+        "users": args.users,
+        "lists": args.lists,
+        "tasks_per_list": args.tasks,
+        "python": sys.version.split()[0],
+    }
+    return build_report(samples, elapsed, metadata)
+
+
+def main() -> None:
+    """Punto de entrada de la prueba de carga."""
+    args = _parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        args.database_url = args.database_url or f"sqlite:///{Path(tmp) / 'load.db'}"
+        os.environ["DATABASE_URL"] = args.database_url
+        os.environ.setdefault("LOG_PATH", "")
+
+        # pylint: disable=import-outside-toplevel
+        import logging
+
+        from app.infrastructure.db.schema import create_schema
+        from app.infrastructure.db.session import dispose_engine, get_engine
+        from benchmarks.load.seed import SeedSize, seed_database
+
+        logging.disable(logging.WARNING)
+        engine = get_engine()
+        create_schema(engine)
+        started = time.perf_counter()
+        data = seed_database(
+            engine,
+            SeedSize(args.users, args.lists, args.tasks),
+            prefix=f"load_{uuid.uuid4().hex[:8]}",
+            seed=args.seed,
+        )
+        seed_s = time.perf_counter() - started
+
+        report = asyncio.run(_run(args, data))
+        report["metadata"]["seed_s"] = round(seed_s, 3)
+        dispose_engine()
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compara dos informes de `benchmarks.load` (p. ej. de dos commits distintos).
+
+Muestra, por ruta, RPS y p50/p95/p99 de ambos informes y la variación relativa. Con
+`--threshold` el proceso termina con código 1 si algún p95 empeora más de ese
+porcentaje, para usarlo en CI. Uso:
+
+    python -m benchmarks.load.compare base.json head.json --threshold 20
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = ("rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(base: dict, head: dict) -> list[dict]:
+    """
+    Calcula la variación de cada métrica en las rutas presentes en ambos informes.
+
+    Args:
+        base (dict): Informe de referencia.
+        head (dict): Informe a comparar.
+
+    Returns:
+        list[dict]: Por ruta (y `TOTAL`), los valores de ambos informes y el cambio.
+    """
+    rows = []
+    pairs = [("TOTAL", base["total"], head["total"])] + [
+        (route, base["routes"][route], head["routes"][route])
+        for route in sorted(base["routes"].keys() & head["routes"].keys())
+    ]
+    for route, before, after in pairs:
+        rows.append(
+            {
+                "route": route,
+                **{
+                    metric: (
+                        before[metric],
+                        after[metric],
+                        _change(before[metric], after[metric]),
+                    )
+                    for metric in METRICS
+                },
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    """Punto de entrada de la comparación."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument(
+        "--threshold", type=float, help="máximo empeoramiento de p95 (%%)"
+    )
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text(encoding="utf-8"))
+    head = json.loads(args.head.read_text(encoding="utf-8"))
+    print(
+        f"base: {base['metadata'].get('commit')}  head: {head['metadata'].get('commit')}"
+    )
+    regressions = []
+    for row in compare(base, head):
+        print(row["route"])
+        for metric in METRICS:
+            before, after, change = row[metric]
+            print(f"  {metric:<7} {before:>10} -> {after:>10}  {change}")
+        before, after, _ = row["p95_ms"]
+        if (
+            args.threshold is not None
+            and before
+            and after > before * (1 + args.threshold / 100)
+        ):
+            regressions.append(row["route"])
+
+    if regressions:
+        print(f"p95 empeora más de un {args.threshold}% en: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
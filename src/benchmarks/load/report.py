@@ -0,0 +1,71 @@
+"""
+Resumen de las muestras de una prueba de carga en un informe JSON.
+"""
+
+import math
+from collections import defaultdict
+from typing import Iterable, NamedTuple
+
+
+class Sample(NamedTuple):
+    """Resultado de una petición."""
+
+    route: str
+    status: int
+    latency_ms: float
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Percentil `q` (0-100) por el método del rango más cercano."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summary(latencies: list[float], errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+def build_report(samples: Iterable[Sample], elapsed: float, metadata: dict) -> dict:
+    """
+    Agrupa las muestras por ruta y calcula RPS y percentiles de latencia.
+
+    Se cuentan como error las respuestas 5xx y los fallos de conexión (`status` 0).
+
+    Args:
+        samples (Iterable[Sample]): Muestras de la fase medida.
+        elapsed (float): Duración de la fase medida, en segundos.
+        metadata (dict): Parámetros de la ejecución (commit, mezcla, concurrencia...).
+
+    Returns:
+        dict: Informe con `metadata`, `total` y `routes` (y códigos por ruta).
+    """
+    latencies, errors, statuses = defaultdict(list), defaultdict(int), defaultdict(dict)
+    for sample in samples:
+        latencies[sample.route].append(sample.latency_ms)
+        if sample.status == 0 or sample.status >= 500:
+            errors[sample.route] += 1
+        codes = statuses[sample.route]
+        codes[str(sample.status)] = codes.get(str(sample.status), 0) + 1
+
+    routes = {}
+    for route in sorted(latencies):
+        routes[route] = _summary(latencies[route], errors[route], elapsed)
+        routes[route]["status"] = statuses[route]
+    everything = [value for values in latencies.values() for value in values]
+    return {
+        "metadata": {**metadata, "elapsed_s": round(elapsed, 3)},
+        "total": _summary(everything, sum(errors.values()), elapsed),
+        "routes": routes,
+    }
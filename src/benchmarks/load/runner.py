@@ -0,0 +1,91 @@
+"""
+Ejecución concurrente de una mezcla de endpoints.
+
+Cada trabajador es una corrutina que envía peticiones una tras otra (sistema cerrado)
+con el token de uno de los usuarios generados. Se descartan las muestras del
+calentamiento y se mide solo la ventana de `duration` segundos posterior.
+"""
+
+import asyncio
+import random
+import time
+from typing import Optional
+
+import httpx
+
+from benchmarks.load.report import Sample
+from benchmarks.load.scenarios import Mix
+from benchmarks.load.seed import SEED_PASSWORD, SeedData
+
+
+async def login_tokens(client: httpx.AsyncClient, usernames: list[str]) -> list[str]:
+    """
+    Obtiene un token de acceso por usuario mediante `POST /auth/login`.
+
+    Args:
+        client (httpx.AsyncClient): Cliente contra la API.
+        usernames (list[str]): Usuarios generados.
+
+    Returns:
+        list[str]: Tokens, en el mismo orden.
+    """
+    tokens = []
+    for username in usernames:
+        response = await client.post(
+            "/auth/login", data={"username": username, "password": SEED_PASSWORD}
+        )
+        response.raise_for_status()
+        tokens.append(response.json()["access_token"])
+    return tokens
+
+
+async def run_load(  # pylint: disable=too-many-arguments
+    client: httpx.AsyncClient,
+    data: SeedData,
+    tokens: list[str],
+    mix: Mix,
+    concurrency: int,
+    *,
+    duration: float,
+    warmup: float = 0.0,
+    seed: Optional[int] = None,
+) -> tuple[list[Sample], float]:
+    """
+    Lanza `concurrency` trabajadores durante `warmup + duration` segundos.
+
+    Args:
+        client (httpx.AsyncClient): Cliente contra la API.
+        data (SeedData): Datos generados.
+        tokens (list[str]): Tokens de `data.usernames`; el trabajador `i` usa el `i % n`.
+        mix (Mix): Mezcla de operaciones.
+        concurrency (int): Número de trabajadores.
+        duration (float): Duración de la ventana medida, en segundos.
+        warmup (float): Segundos iniciales cuyas muestras se descartan.
+        seed (Optional[int]): Semilla para que la secuencia de operaciones sea reproducible.
+
+    Returns:
+        tuple[list[Sample], float]: Muestras de la ventana medida y su duración real.
+    """
+    samples: list[Sample] = []
+    start = time.perf_counter()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+
+    async def worker(index: int) -> None:
+        rng = random.Random(None if seed is None else seed + index)
+        user = index % len(tokens)
+        headers = {"Authorization": f"Bearer {tokens[user]}"}
+        while (sent := time.perf_counter()) < deadline:
+            route, request = mix.next(data, rng, data.user_ids[user])
+            try:
+                response = await client.request(
+                    request.method, request.url, headers=headers, **request.kwargs
+                )
+                code = response.status_code
+            except httpx.HTTPError:
+                code = 0
+            if sent >= measure_from:
+                samples.append(Sample(route, code, (time.perf_counter() - sent) * 1000))
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return samples, time.perf_counter() - measure_from
@@ -0,0 +1,189 @@
+"""
+Mezclas de endpoints para las pruebas de carga.
+
+Cada operación tiene un nombre de ruta estable (la plantilla, sin IDs), un peso y una
+función que construye la petición a partir de los datos generados y del usuario que
+la envía. Las mezclas
+reparten el tráfico entre autenticación, lecturas, listados filtrados y escrituras.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks.load.seed import SEED_PASSWORD, SeedData
+
+
+@dataclass
+class Request:
+    """Petición HTTP a enviar."""
+
+    method: str
+    url: str
+    kwargs: dict
+
+
+@dataclass
+class Operation:
+    """
+    Operación de una mezcla.
+
+    Atributos:
+        route (str): Nombre de la ruta en el informe (p. ej. `GET /lists/{list_id}`).
+        build (Callable[[SeedData, random.Random, int], Request]): Genera la petición
+            (datos, generador aleatorio e ID del usuario).
+    """
+
+    route: str
+    build: Callable[[SeedData, random.Random, int], Request]
+
+
+def _list_and_task(data: SeedData, rng: random.Random) -> tuple[int, int]:
+    list_id = rng.choice(list(data.tasks_by_list))
+    return list_id, rng.choice(data.tasks_by_list[list_id])
+
+
+def _own_list_and_task(
+    data: SeedData, rng: random.Random, user_id: int
+) -> tuple[int, int]:
+    # Tareas creadas por el usuario (escenario comparable con mediciones anteriores).
+    lists = data.lists_by_creator.get(user_id)
+    if not lists:
+        return _list_and_task(data, rng)
+    list_id = rng.choice(lists)
+    return list_id, rng.choice(data.tasks_by_list[list_id])
+
+
+def _login(data, rng, _user_id):
+    return Request(
+        "POST",
+        "/auth/login",
+        {"data": {"username": rng.choice(data.usernames), "password": SEED_PASSWORD}},
+    )
+
+
+def _get_list(data, rng, _user_id):
+    return Request("GET", f"/lists/{rng.choice(list(data.tasks_by_list))}", {})
+
+
+def _filtered_tasks(data, rng, _user_id):
+    params = {"list_id": rng.choice(list(data.tasks_by_list))}
+    if rng.random() < 0.5:
+        params["is_done"] = rng.choice(["true", "false"])
+    if rng.random() < 0.5:
+        params["priority"] = rng.choice(["low", "medium", "high"])
+    params["sort"] = rng.choice(["rank", "priority"])
+    return Request("GET", "/lists/", {"params": params})
+
+
+def _get_task(data, rng, user_id):
+    list_id, task_id = _own_list_and_task(data, rng, user_id)
+    return Request("GET", f"/lists/{list_id}/tasks/{task_id}", {})
+
+
+def _my_tasks(_data, rng, _user_id):
+    return Request(
+        "GET",
+        "/tasks/mine",
+        {"params": {"relation": rng.choice(["assigned", "created"])}},
+    )
+
+
+def _search(data, rng, _user_id):
+    list_id = rng.choice(list(data.tasks_by_list))
+    query = rng.choice(["comprar", "informe", "reunión", "pan"])
+    return Request("GET", f"/lists/{list_id}/tasks/search", {"params": {"q": query}})
+
+
+def _create_task(data, rng, _user_id):
+    list_id = rng.choice(list(data.tasks_by_list))
+    task = {
+        "title": "Tarea de carga",
+        "priority": rng.choice(["low", "medium", "high"]),
+    }
+    return Request("POST", f"/lists/{list_id}/tasks/", {"json": task})
+
+
+def _update_task(data, rng, _user_id):
+    list_id, task_id = _list_and_task(data, rng)
+    task = {"title": "Tarea editada", "priority": "medium", "is_done": False}
+    return Request("PUT", f"/lists/{list_id}/tasks/{task_id}", {"json": task})
+
+
+def _change_status(data, rng, _user_id):
+    list_id, task_id = _list_and_task(data, rng)
+    return Request(
+        "PATCH",
+        f"/lists/{list_id}/tasks/{task_id}/status",
+        {"json": {"is_done": rng.random() < 0.5}},
+    )
+
+
+OPERATIONS = {
+    "login": Operation("POST /auth/login", _login),
+    "get_list": Operation("GET /lists/{list_id}", _get_list),
+    "filtered_tasks": Operation("GET /lists/?list_id&filters", _filtered_tasks),
+    "get_task": Operation("GET /lists/{list_id}/tasks/{task_id}", _get_task),
+    "my_tasks": Operation("GET /tasks/mine", _my_tasks),
+    "search": Operation("GET /lists/{list_id}/tasks/search", _search),
+    "create_task": Operation("POST /lists/{list_id}/tasks/", _create_task),
+    "update_task": Operation("PUT /lists/{list_id}/tasks/{task_id}", _update_task),
+    "change_status": Operation(
+        "PATCH /lists/{list_id}/tasks/{task_id}/status", _change_status
+    ),
+}
+
+# Pesos relativos de cada operación por mezcla.
+MIXES = {
+    "default": {
+        "login": 1,
+        "get_list": 20,
+        "filtered_tasks": 25,
+        "get_task": 15,
+        "my_tasks": 10,
+        "search": 5,
+        "create_task": 10,
+        "update_task": 7,
+        "change_status": 7,
+    },
+    "read-heavy": {
+        "login": 1,
+        "get_list": 30,
+        "filtered_tasks": 30,
+        "get_task": 20,
+        "my_tasks": 12,
+        "search": 5,
+        "create_task": 1,
+        "change_status": 1,
+    },
+    "write-heavy": {
+        "login": 1,
+        "get_list": 10,
+        "filtered_tasks": 10,
+        "create_task": 30,
+        "update_task": 25,
+        "change_status": 24,
+    },
+}
+
+
+class Mix:  # pylint: disable=too-few-public-methods
+    """
+    Selector ponderado de operaciones de una mezcla.
+
+    Args:
+        name (str): Nombre de la mezcla en `MIXES`.
+    """
+
+    def __init__(self, name: str):
+        weights = MIXES[name]
+        self.name = name
+        self.operations = [OPERATIONS[key] for key in weights]
+        self.weights = list(weights.values())
+
+    def next(
+        self, data: SeedData, rng: random.Random, user_id: int
+    ) -> tuple[str, Request]:
+        """Elige una operación y construye su petición para el usuario `user_id`."""
+        operation = rng.choices(self.operations, weights=self.weights)[0]
+        return operation.route, operation.build(data, rng, user_id)
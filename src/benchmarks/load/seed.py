@@ -0,0 +1,152 @@
+"""
+Generación de datos para las pruebas de carga.
+
+Inserta usuarios, listas y tareas con sentencias `INSERT` masivas. Todos los usuarios
+comparten la contraseña `SEED_PASSWORD` (se calcula un único hash bcrypt).
+"""
+
+import random
+from dataclasses import dataclass, field
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from app.core.constants import ListRole, PriorityLevel
+from app.core.ordering import keys_between
+from app.infrastructure.db.crud.auth import pwd_context
+from app.infrastructure.db.models.list_member import ListMemberModel
+from app.infrastructure.db.models.task import TaskModel
+from app.infrastructure.db.models.task_list import TaskListModel
+from app.infrastructure.db.models.user import UserModel
+
+SEED_PASSWORD = "benchmark-password"
+WORDS = (
+    "comprar revisar enviar llamar preparar informe factura reunión correo pan".split()
+)
+
+
+@dataclass
+class SeedData:
+    """
+    Identificadores generados, para que los escenarios usen recursos existentes.
+
+    Atributos:
+        usernames (list[str]): Usuarios creados (contraseña `SEED_PASSWORD`).
+        user_ids (list[int]): IDs de esos usuarios, en el mismo orden.
+        tasks_by_list (dict[int, list[int]]): IDs de tareas por ID de lista.
+        lists_by_creator (dict[int, list[int]]): Listas cuyas tareas creó cada usuario.
+    """
+
+    usernames: list[str] = field(default_factory=list)
+    user_ids: list[int] = field(default_factory=list)
+    tasks_by_list: dict[int, list[int]] = field(default_factory=dict)
+    lists_by_creator: dict[int, list[int]] = field(default_factory=dict)
+
+
+@dataclass
+class SeedSize:
+    """
+    Volumen de los datos a generar.
+
+    Atributos:
+        users (int): Número de usuarios.
+        lists (int): Número de listas.
+        tasks_per_list (int): Tareas por lista.
+    """
+
+    users: int
+    lists: int
+    tasks_per_list: int
+
+
+def seed_database(  # pylint: disable=too-many-locals
+    engine: Engine, size: SeedSize, prefix: str = "bench", seed: int = 42
+) -> SeedData:
+    """
+    Inserta `size.users` usuarios y `size.lists` listas con `size.tasks_per_list`
+    tareas cada una.
+
+    Args:
+        engine (Engine): Motor con el esquema ya creado.
+        size (SeedSize): Volumen de los datos.
+        prefix (str): Prefijo de los nombres de usuario (para no chocar con datos previos).
+        seed (int): Semilla del generador aleatorio (datos reproducibles).
+
+    Returns:
+        SeedData: Identificadores generados.
+    """
+    users, lists, tasks_per_list = size.users, size.lists, size.tasks_per_list
+    rng = random.Random(seed)
+    password_hash = pwd_context.hash(SEED_PASSWORD)
+    ranks = keys_between(None, None, tasks_per_list)
+    data = SeedData()
+    with engine.begin() as conn:
+        rows = conn.execute(
+            insert(UserModel).returning(UserModel.id, UserModel.username),
+            [
+                {
+                    "username": f"{prefix}_{i}",
+                    "email": f"{prefix}_{i}@example.com",
+                    "password_hash": password_hash,
+                }
+                for i in range(users)
+            ],
+        ).all()
+        data.user_ids = [row.id for row in rows]
+        data.usernames = [row.username for row in rows]
+        list_ids = (
+            conn.execute(
+                insert(TaskListModel).returning(TaskListModel.id),
+                [
+                    {
+                        "name": f"{prefix} lista {i}",
+                        "category": prefix,
+                        "owner_id": data.user_ids[i % users],
+                    }
+                    for i in range(lists)
+                ],
+            )
+            .scalars()
+            .all()
+        )
+        # Listas compartidas: su creador es propietario y los demás, editores.
+        conn.execute(
+            insert(ListMemberModel),
+            [
+                {
+                    "user_id": user_id,
+                    "list_id": list_id,
+                    "role": (
+                        ListRole.OWNER
+                        if user_id == data.user_ids[index % users]
+                        else ListRole.EDITOR
+                    ),
+                }
+                for index, list_id in enumerate(list_ids)
+                for user_id in data.user_ids
+            ],
+        )
+        for index, list_id in enumerate(list_ids):
+            # Reparto circular: con tantas listas como usuarios, todos crearon alguna.
+            owner = data.user_ids[index % users]
+            data.lists_by_creator.setdefault(owner, []).append(list_id)
+            data.tasks_by_list[list_id] = (
+                conn.execute(
+                    insert(TaskModel).returning(TaskModel.id),
+                    [
+                        {
+                            "title": " ".join(rng.sample(WORDS, 3)),
+                            "priority": rng.choice(list(PriorityLevel)),
+                            "is_done": rng.random() < 0.3,
+                            "assigned_to": rng.choice(data.user_ids),
+                            "created_by": owner,
+                            "list_id": list_id,
+                            "rank": ranks[i],
+                        }
+                        for i in range(tasks_per_list)
+                    ],
+                )
+                .scalars()
+                .all()
+            )
+    return data
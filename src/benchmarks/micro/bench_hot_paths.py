@@ -0,0 +1,125 @@
+"""
+Micro-benchmarks de las rutas que más CPU consumen por petición.
+
+Cubren el listado filtrado (`get_tasks_with_filters`), la creación de tareas
+(`create_task`), la validación y serialización de `TaskResponse`, y la emisión y
+verificación de tokens y contraseñas. Los datos se generan con semilla fija sobre
+una SQLite temporal. Uso:
+
+    cd src/
+    python -m pytest benchmarks/micro                  # comparar con baseline.json
+    python -m pytest benchmarks/micro --bench-save     # actualizar la línea base
+"""
+
+# pylint: disable=redefined-outer-name
+
+import logging
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.api.schemas.task import TaskCreate, TaskResponse
+from app.core.auth.jwt import create_access_token, verify_token
+from app.core.config import Settings
+from app.core.constants import TaskSortField
+from app.infrastructure.db.crud.auth import pwd_context
+from app.infrastructure.db.crud.task import create_task
+from app.infrastructure.db.crud.task_list import get_tasks_with_filters
+from app.infrastructure.db.models.task import TaskModel
+from app.infrastructure.db.schema import create_schema
+from app.infrastructure.db.session import SessionLocal, build_engine
+from benchmarks.load.seed import SEED_PASSWORD, SeedSize, seed_database
+
+TASKS_PER_LIST = 500
+TASK_RESPONSES = TypeAdapter(list[TaskResponse])
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    """SQLite temporal con 2 listas de `TASKS_PER_LIST` tareas."""
+    logging.disable(logging.WARNING)
+    path = tmp_path_factory.mktemp("micro") / "micro.db"
+    engine = build_engine(Settings(database_url=f"sqlite:///{path}", log_path=""))
+    create_schema(engine)
+    yield engine
+    engine.dispose()
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="module")
+def data(engine):
+    """Datos generados con semilla fija."""
+    return seed_database(
+        engine, SeedSize(users=5, lists=2, tasks_per_list=TASKS_PER_LIST), seed=7
+    )
+
+
+@pytest.fixture(scope="module")
+def rows(engine, data):
+    """Tareas de la primera lista, cargadas como modelos ORM."""
+    list_id = next(iter(data.tasks_by_list))
+    with SessionLocal(bind=engine) as db:
+        return db.scalars(select(TaskModel).where(TaskModel.list_id == list_id)).all()
+
+
+def bench_get_tasks_with_filters(bench, engine, data):
+    """Listado de una lista de 500 tareas, pendientes y ordenadas por prioridad."""
+    list_id = next(iter(data.tasks_by_list))
+
+    def run():
+        with SessionLocal(bind=engine) as db:
+            tasks, _ = get_tasks_with_filters(
+                db, list_id, False, None, TaskSortField.PRIORITY
+            )
+        assert tasks
+
+    bench(run)
+
+
+def bench_create_task(bench, engine, data):
+    """Creación de una tarea (INSERT ... RETURNING y cálculo del rank)."""
+    list_id = list(data.tasks_by_list)[1]
+    task = TaskCreate(title="Micro-benchmark", priority="high")
+
+    def run():
+        with SessionLocal(bind=engine) as db:
+            create_task(db, list_id, task, created_by_id=data.user_ids[0])
+
+    bench(run)
+
+
+@pytest.mark.parametrize("size", [10, TASKS_PER_LIST])
+def bench_task_response_serialization(bench, rows, size):
+    """Validación de `size` modelos ORM como `TaskResponse` y volcado a JSON."""
+    subset = rows[:size]
+
+    def run():
+        TASK_RESPONSES.dump_json(TASK_RESPONSES.validate_python(subset))
+
+    bench(run)
+
+
+def bench_create_access_token(bench):
+    """Emisión de un JWT HS256."""
+    bench(lambda: create_access_token({"sub": "1"}))
+
+
+def bench_verify_token(bench):
+    """Verificación y decodificación de un JWT HS256."""
+    token = create_access_token({"sub": "1"})
+
+    def run():
+        assert verify_token(token)
+
+    bench(run)
+
+
+def bench_pwd_context_verify(bench):
+    """Comprobación de una contraseña contra su hash bcrypt."""
+    password_hash = pwd_context.hash(SEED_PASSWORD)
+
+    def run():
+        assert pwd_context.verify(SEED_PASSWORD, password_hash)
+
+    bench(run)
@@ -0,0 +1,155 @@
+"""
+Plugin de pytest de los micro-benchmarks.
+
+Expone el fixture `bench`, que mide una función con `harness.measure`, y al terminar
+imprime la tabla de resultados y los compara con la línea base (`--bench-baseline`).
+Si algún benchmark empeora más de `--bench-threshold` de forma significativa, se vuelve
+a medir (`--bench-retries`) y se conserva la mejor medición: el ruido de la máquina
+entre ejecuciones es mayor que entre rondas y, sin repetir, daría falsos positivos. Si
+la regresión se mantiene, la sesión termina con código 1. `--bench-save` sobrescribe
+la línea base con la mejor de `1 + --bench-retries` mediciones.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from benchmarks.micro.harness import (
+    BenchmarkResult,
+    compare,
+    environment,
+    git_commit,
+    load_baseline,
+    measure,
+    save_results,
+)
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+RESULTS_KEY = pytest.StashKey[list]()
+COMPARISONS_KEY = pytest.StashKey[dict]()
+BASELINE_KEY = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    """Opciones de línea de comandos de los micro-benchmarks."""
+    group = parser.getgroup("bench", "micro-benchmarks")
+    group.addoption("--bench-baseline", type=Path, default=DEFAULT_BASELINE)
+    group.addoption("--bench-save", action="store_true", help="guardar como línea base")
+    group.addoption(
+        "--bench-json", type=Path, help="guardar los resultados en otro fichero"
+    )
+    group.addoption("--bench-threshold", type=float, default=0.25)
+    group.addoption("--bench-rounds", type=int, default=15)
+    group.addoption("--bench-warmup", type=float, default=0.2)
+    group.addoption("--bench-retries", type=int, default=2)
+
+
+def pytest_configure(config):
+    """Inicializa el almacén de resultados de la sesión y carga la línea base."""
+    config.stash[RESULTS_KEY] = []
+    config.stash[COMPARISONS_KEY] = {}
+    baseline = (
+        None
+        if config.getoption("bench_save")
+        else load_baseline(config.getoption("bench_baseline"))
+    )
+    config.stash[BASELINE_KEY] = baseline
+
+
+@pytest.fixture
+def bench(request):
+    """Mide la función sin argumentos recibida y registra el resultado."""
+    config = request.config
+
+    entry = (
+        (config.stash[BASELINE_KEY] or {}).get("benchmarks", {}).get(request.node.name)
+    )
+    threshold = config.getoption("bench_threshold")
+    # La línea base se guarda con la mejor de todas las mediciones, la más reproducible.
+    saving = config.getoption("bench_save")
+
+    def run(func) -> BenchmarkResult:
+        result = None
+        for _ in range(1 + config.getoption("bench_retries")):
+            current = measure(
+                func,
+                request.node.name,
+                rounds=config.getoption("bench_rounds"),
+                warmup=config.getoption("bench_warmup"),
+            )
+            if result is None or current.median < result.median:
+                result = current
+            if saving:
+                continue
+            if entry is None or not compare(result, entry, threshold).regression:
+                break
+        config.stash[RESULTS_KEY].append(result)
+        return result
+
+    return run
+
+
+def _metadata(config) -> dict:
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rounds": config.getoption("bench_rounds"),
+        "warmup_s": config.getoption("bench_warmup"),
+        **environment(),
+    }
+
+
+def pytest_sessionfinish(session, exitstatus):  # pylint: disable=unused-argument
+    """Compara con la línea base, guarda los resultados y falla si hay regresiones."""
+    config = session.config
+    results = config.stash[RESULTS_KEY]
+    if not results:
+        return
+    entries = (config.stash[BASELINE_KEY] or {}).get("benchmarks", {})
+    config.stash[COMPARISONS_KEY] = {
+        result.name: compare(
+            result, entries[result.name], config.getoption("bench_threshold")
+        )
+        for result in results
+        if result.name in entries
+    }
+
+    if config.getoption("bench_save"):
+        save_results(config.getoption("bench_baseline"), results, _metadata(config))
+    if config.getoption("bench_json"):
+        save_results(config.getoption("bench_json"), results, _metadata(config))
+    if any(c.regression for c in config.stash[COMPARISONS_KEY].values()):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Imprime la tabla de resultados y su variación respecto a la línea base."""
+    results = config.stash[RESULTS_KEY]
+    if not results:
+        return
+    write = terminalreporter.write_line
+    comparisons = config.stash[COMPARISONS_KEY]
+    baseline = config.stash[BASELINE_KEY]
+
+    terminalreporter.section("micro-benchmarks")
+    if baseline and baseline["metadata"].get("machine") != environment()["machine"]:
+        write("aviso: la línea base se midió en otra arquitectura", yellow=True)
+    write(f"{'benchmark':<44} {'mediana':>12} {'IQR':>10} {'vs base':>9} {'p':>7}")
+    for result in results:
+        line = f"{result.name:<44} {result.median * 1e6:>10.1f}us {result.iqr * 1e6:>8.1f}us"
+        comparison = comparisons.get(result.name)
+        if comparison:
+            line += f" {comparison.ratio - 1:>+9.1%} {comparison.p_value:>7.3f}"
+            if comparison.regression:
+                line += "  REGRESIÓN"
+        write(line, red=bool(comparison and comparison.regression))
+
+    if config.getoption("bench_save"):
+        write(f"línea base guardada en {config.getoption('bench_baseline')}")
+    regressions = sum(c.regression for c in comparisons.values())
+    if regressions:
+        threshold = config.getoption("bench_threshold")
+        write(
+            f"{regressions} benchmark(s) empeoran más de un {threshold:.0%}", red=True
+        )
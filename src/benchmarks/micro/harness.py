@@ -0,0 +1,225 @@
+"""
+Medición y comparación estadística de micro-benchmarks.
+
+Cada benchmark se calienta durante `warmup` segundos (lo que también fija cuántas
+llamadas hace cada ronda, para que una ronda dure unos `round_time` segundos) y se
+mide en `rounds` rondas. Se guarda el tiempo medio por llamada de cada ronda; contra
+la línea base se compara la mediana y se exige además que la diferencia sea
+significativa (prueba U de Mann-Whitney), para no marcar como regresión el ruido.
+"""
+
+import gc
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Resultado de un benchmark.
+
+    Atributos:
+        name (str): Identificador del benchmark (nombre del test).
+        iterations (int): Llamadas por ronda.
+        samples (list[float]): Segundos por llamada de cada ronda.
+    """
+
+    name: str
+    iterations: int
+    samples: list[float]
+
+    @property
+    def median(self) -> float:
+        """Mediana de los segundos por llamada."""
+        return statistics.median(self.samples)
+
+    @property
+    def iqr(self) -> float:
+        """Rango intercuartílico de los segundos por llamada."""
+        if len(self.samples) < 2:
+            return 0.0
+        quartiles = statistics.quantiles(self.samples, n=4)
+        return quartiles[2] - quartiles[0]
+
+
+@dataclass
+class Comparison:
+    """
+    Comparación de un resultado con su línea base.
+
+    Atributos:
+        name (str): Identificador del benchmark.
+        ratio (float): Mediana actual / mediana de la línea base.
+        p_value (float): Probabilidad (unilateral) de observar un empeoramiento así por azar.
+        regression (bool): Si empeora más que el umbral y de forma significativa.
+    """
+
+    name: str
+    ratio: float
+    p_value: float
+    regression: bool
+
+
+def measure(
+    func: Callable[[], object],
+    name: str,
+    rounds: int = 15,
+    warmup: float = 0.2,
+    round_time: float = 0.05,
+) -> BenchmarkResult:
+    """
+    Mide `func` (sin argumentos) tras calentarla.
+
+    El recolector de basura se desactiva durante cada ronda para que sus pausas no se
+    atribuyan a la llamada que las sufre.
+
+    Args:
+        func (Callable[[], object]): Función a medir.
+        name (str): Identificador del benchmark.
+        rounds (int): Número de rondas medidas.
+        warmup (float): Segundos de calentamiento (como mínimo, una llamada).
+        round_time (float): Duración aproximada de cada ronda, en segundos.
+
+    Returns:
+        BenchmarkResult: Segundos por llamada de cada ronda.
+    """
+    calls = 0
+    start = time.perf_counter()
+    while calls == 0 or time.perf_counter() - start < warmup:
+        func()
+        calls += 1
+    per_call = (time.perf_counter() - start) / calls
+    iterations = max(1, int(round_time / per_call))
+
+    samples = []
+    for _ in range(rounds):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            samples.append((time.perf_counter() - start) / iterations)
+        finally:
+            gc.enable()
+    return BenchmarkResult(name, iterations, samples)
+
+
+def mann_whitney_greater(current: list[float], baseline: list[float]) -> float:
+    """
+    p-valor unilateral de la prueba U de Mann-Whitney (`current` mayor que `baseline`).
+
+    Usa la aproximación normal con corrección por empates, suficiente para las 10-30
+    rondas habituales.
+
+    Args:
+        current (list[float]): Muestras actuales.
+        baseline (list[float]): Muestras de la línea base.
+
+    Returns:
+        float: p-valor; pequeño si `current` es sistemáticamente mayor.
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    ranked = sorted(
+        [(value, 0) for value in current] + [(value, 1) for value in baseline]
+    )
+    ranks = [0.0] * len(ranked)
+    ties = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(
+    result: BenchmarkResult, baseline: dict, threshold: float, alpha: float = 0.01
+) -> Comparison:
+    """
+    Compara un resultado con la entrada de la línea base del mismo benchmark.
+
+    Args:
+        result (BenchmarkResult): Resultado actual.
+        baseline (dict): Entrada guardada (`samples` y `median`).
+        threshold (float): Empeoramiento relativo tolerado de la mediana (0.25 = 25 %).
+        alpha (float): Nivel de significación de la prueba.
+
+    Returns:
+        Comparison: Ratio de medianas, p-valor y si es una regresión.
+    """
+    ratio = result.median / baseline["median"]
+    p_value = mann_whitney_greater(result.samples, baseline["samples"])
+    return Comparison(
+        result.name, ratio, p_value, ratio > 1 + threshold and p_value < alpha
+    )
+
+
+def environment() -> dict:
+    """Datos de la máquina, para saber si dos informes son comparables."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "processor": platform.processor(),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Commit corto de `HEAD`, o None fuera de un repositorio git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_baseline(path: Path) -> Optional[dict]:
+    """Lee una línea base guardada con `save_results`, o None si no existe."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_results(path: Path, results: list[BenchmarkResult], metadata: dict) -> None:
+    """
+    Guarda los resultados en JSON (sirve como línea base de ejecuciones posteriores).
+
+    Args:
+        path (Path): Fichero de destino.
+        results (list[BenchmarkResult]): Resultados a guardar.
+        metadata (dict): Entorno y parámetros de la ejecución.
+    """
+    benchmarks = {
+        result.name: {**asdict(result), "median": result.median, "iqr": result.iqr}
+        for result in sorted(results, key=lambda result: result.name)
+    }
+    for entry in benchmarks.values():
+        del entry["name"]
+    document = {"metadata": metadata, "benchmarks": benchmarks}
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
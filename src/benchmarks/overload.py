@@ -0,0 +1,177 @@
+"""
+Escenario de sobrecarga: latencia de un cliente bien portado junto a uno ruidoso.
+
+Un usuario "ruidoso" lanza `--noisy` peticiones concurrentes sin pausa contra
+`GET /lists/{id}` (solo respeta `Retry-After` tras un 429/503, como hacen los
+clientes HTTP habituales) mientras otro usuario hace `--rate` peticiones por segundo
+al mismo endpoint. Se mide la latencia del cliente bien portado con la limitación por
+cliente y el control de admisión desactivados y activados. El pool se reduce
+(`--pool-size`) para que se sature con facilidad. Uso:
+
+    cd src/
+    python -m benchmarks.overload --seconds 10 --noisy 64
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+
+async def _scenario(app, list_id, tokens, args) -> dict:
+    # pylint: disable=import-outside-toplevel
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    deadline = time.monotonic() + args.seconds
+    url = f"/lists/{list_id}"
+    noisy_status = Counter()
+    latencies, good_status = [], Counter()
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def noisy():
+            headers = {"Authorization": f"Bearer {tokens[0]}"}
+            while time.monotonic() < deadline:
+                response = await client.get(url, headers=headers)
+                noisy_status[response.status_code] += 1
+                if "Retry-After" in response.headers:
+                    await asyncio.sleep(float(response.headers["Retry-After"]))
+
+        async def well_behaved():
+            headers = {"Authorization": f"Bearer {tokens[1]}"}
+            while time.monotonic() < deadline:
+                start = time.monotonic()
+                response = await client.get(url, headers=headers)
+                latencies.append((time.monotonic() - start) * 1000)
+                good_status[response.status_code] += 1
+                await asyncio.sleep(
+                    max(0.0, 1 / args.rate - (time.monotonic() - start))
+                )
+
+        await asyncio.gather(well_behaved(), *(noisy() for _ in range(args.noisy)))
+
+    ok = sorted(latencies)
+    return {
+        "well_behaved": {
+            "requests": len(ok),
+            "status": dict(good_status),
+            "p50_ms": round(statistics.median(ok), 1),
+            "p99_ms": round(ok[int(len(ok) * 0.99) - 1], 1),
+            "max_ms": round(ok[-1], 1),
+        },
+        "noisy": {"requests": sum(noisy_status.values()), "status": dict(noisy_status)},
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument(
+        "--noisy", type=int, default=64, help="concurrencia del ruidoso"
+    )
+    parser.add_argument("--rate", type=float, default=10, help="req/s del bien portado")
+    parser.add_argument("--pool-size", type=int, default=2)
+    return parser.parse_args()
+
+
+def _seed(engine) -> tuple[int, list[str]]:
+    """
+    Crea los dos usuarios y una lista compartida con 50 tareas; devuelve el ID de
+    la lista y un token de cada usuario.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import insert
+
+    from app.core.auth.jwt import create_access_token
+
+    from app.infrastructure.db.models.list_member import ListMemberModel
+    from app.infrastructure.db.models.task import TaskModel
+    from app.infrastructure.db.models.task_list import TaskListModel
+    from app.infrastructure.db.models.user import UserModel
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(UserModel),
+            [
+                {
+                    "id": i,
+                    "username": f"u{i}",
+                    "email": f"u{i}@x.io",
+                    "password_hash": "x",
+                }
+                for i in (1, 2)
+            ],
+        )
+        list_id = conn.execute(
+            insert(TaskListModel).values(name="Overload").returning(TaskListModel.id)
+        ).scalar_one()
+        conn.execute(
+            insert(ListMemberModel),
+            [{"user_id": i, "list_id": list_id, "role": "editor"} for i in (1, 2)],
+        )
+        conn.execute(
+            insert(TaskModel),
+            [
+                {
+                    "title": f"T{i}",
+                    "priority": "low",
+                    "list_id": list_id,
+                    "created_by": 1,
+                }
+                for i in range(50)
+            ],
+        )
+    return list_id, [create_access_token({"sub": str(i)}) for i in (1, 2)]
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    args = _parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'overload.db'}"
+        os.environ["LOG_PATH"] = ""
+        os.environ["DB_POOL_SIZE"] = str(args.pool_size)
+        os.environ["DB_MAX_OVERFLOW"] = "0"
+
+        # pylint: disable=import-outside-toplevel
+        import logging
+
+        from app.core.config import Settings
+        from app.infrastructure.db.schema import create_schema
+        from app.infrastructure.db.session import dispose_engine, get_engine
+        from main import create_app
+
+        logging.disable(logging.WARNING)
+        create_schema(get_engine())
+        list_id, tokens = _seed(get_engine())
+
+        # Las peticiones de ambos clientes llegan desde la misma IP, así que solo se
+        # limita por usuario (el límite por IP queda desactivado, como por defecto).
+        scenarios = {
+            "unprotected": Settings(
+                rate_limit_user_rate=0,
+                rate_limit_ip_rate=0,
+                admission_max_in_flight=0,
+                admission_max_pool_wait=0,
+            ),
+            "protected": Settings(rate_limit_ip_rate=0),
+        }
+        result = {
+            name: asyncio.run(_scenario(create_app(settings), list_id, tokens, args))
+            for name, settings in scenarios.items()
+        }
+        dispose_engine()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark de latencia de la búsqueda de texto completo (`search_tasks`).
+
+Genera una base SQLite con N tareas repartidas en varias listas y mide la latencia
+de búsquedas rankeadas sobre el índice FTS5. Uso:
+
+    cd src/
+    python -m benchmarks.search_latency --tasks 1000000 --lists 1000
+"""
+
+import argparse
+import itertools
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.crud.task import search_tasks
+from app.infrastructure.db.models.task import TaskModel
+from benchmarks.common import seed_owner_and_lists
+
+SYLLABLES = "ba ce di fo gu la me ni po ru sa te vi xo zu ca de fi go hu".split()
+VOCABULARY = [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES][:5000]
+# Distribución tipo Zipf: pocas palabras muy frecuentes y una cola larga.
+CUM_WEIGHTS = list(
+    itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1))
+)
+
+
+def words(rng: random.Random, k: int) -> str:
+    """Devuelve `k` palabras del vocabulario sintético."""
+    return " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=k))
+
+
+def seed(engine, n_tasks: int, n_lists: int, batch: int = 20_000) -> None:
+    """Inserta un usuario, `n_lists` listas y `n_tasks` tareas aleatorias."""
+    rng = random.Random(42)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed_owner_and_lists(conn, n_lists)
+        for start in range(0, n_tasks, batch):
+            conn.execute(
+                insert(TaskModel),
+                [
+                    {
+                        "title": words(rng, 3),
+                        "description": words(rng, 12),
+                        "priority": rng.choice(("low", "medium", "high")),
+                        "is_done": rng.random() < 0.5,
+                        "list_id": rng.randint(1, n_lists),
+                        "created_by": 1,
+                    }
+                    for _ in range(min(batch, n_tasks - start))
+                ],
+            )
+
+
+def run(engine, n_lists: int, queries: int) -> dict:
+    """Ejecuta `queries` búsquedas aleatorias y devuelve percentiles en ms."""
+    rng = random.Random(7)
+    samples = []
+    with Session(engine) as db:
+        for _ in range(queries):
+            list_id = rng.randint(1, n_lists)
+            query = words(rng, rng.randint(1, 2))
+            start = time.perf_counter()
+            search_tasks(db, list_id, query, limit=20)
+            samples.append((time.perf_counter() - start) * 1000)
+    quantiles = statistics.quantiles(samples, n=100)
+    return {
+        "queries": queries,
+        "p50_ms": round(quantiles[49], 3),
+        "p95_ms": round(quantiles[94], 3),
+        "p99_ms": round(quantiles[98], 3),
+    }
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--lists", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'search.db'}")
+        start = time.perf_counter()
+        seed(engine, args.tasks, args.lists)
+        result = {"tasks": args.tasks, "lists": args.lists}
+        result["seed_s"] = round(time.perf_counter() - start, 2)
+        result.update(run(engine, args.lists, args.queries))
+        engine.dispose()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark de arranque de la aplicación.
+
+Mide, en procesos nuevos, el tiempo de `import main` (desglosado con `-X importtime`)
+y el tiempo hasta la primera respuesta: importar, construir la aplicación
+(`create_app`), ejecutar el arranque (lifespan) y servir `GET /`. Usa una base
+SQLite temporal, por lo que no requiere PostgreSQL. Uso:
+
+    cd src/
+    python -m benchmarks.startup --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+FIRST_REQUEST = """
+import time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+import main
+imported = time.perf_counter()
+with TestClient(main.create_app()) as client:
+    client.get("/")
+    first = time.perf_counter()
+print(imported - start, first - start)
+"""
+
+
+def run_child(args: list, env: dict) -> subprocess.CompletedProcess:
+    """Ejecuta el intérprete actual en un proceso nuevo desde `src/`."""
+    return subprocess.run(
+        [sys.executable, *args],
+        env=env,
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def slowest_imports(env: dict, top: int) -> list:
+    """Módulos con mayor tiempo acumulado de importación según `-X importtime`."""
+    stderr = run_child(["-X", "importtime", "-c", "import main"], env).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        rows.append((int(cumulative), name.strip()))
+    rows.sort(reverse=True)
+    return [{"module": name, "ms": round(us / 1000, 1)} for us, name in rows[:top]]
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{Path(tmp) / 'startup.db'}",
+            "CREATE_SCHEMA": "true",
+            "LOG_PATH": "",
+        }
+        imports, firsts = [], []
+        for _ in range(args.runs):
+            stdout = run_child(["-c", FIRST_REQUEST], env).stdout
+            imported, first = (float(value) for value in stdout.split())
+            imports.append(imported * 1000)
+            firsts.append(first * 1000)
+
+        result = {
+            "runs": args.runs,
+            "import_ms": round(statistics.median(imports), 1),
+            "first_request_ms": round(statistics.median(firsts), 1),
+            "slowest_imports": slowest_imports(env, args.top),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
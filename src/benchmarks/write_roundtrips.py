@@ -0,0 +1,128 @@
+"""
+Benchmark de sentencias SQL y latencia por endpoint de escritura.
+
+Levanta la aplicación contra una base SQLite temporal, ejecuta cada endpoint de
+escritura de listas y tareas `--runs` veces y cuenta las sentencias enviadas a la
+base por petición (incluida la consulta del usuario autenticado). Uso:
+
+    cd src/
+    python -m benchmarks.write_roundtrips --runs 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+
+def main() -> None:  # pylint: disable=too-many-locals
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'writes.db'}"
+        os.environ["LOG_PATH"] = ""
+
+        # pylint: disable=import-outside-toplevel
+        from fastapi.testclient import TestClient
+        from sqlalchemy import event, insert
+
+        from app.core.auth.jwt import create_access_token
+        from app.infrastructure.db.models.user import UserModel
+        from app.infrastructure.db.schema import create_schema
+        from app.infrastructure.db.session import dispose_engine, get_engine
+        from main import create_app
+
+        engine = get_engine()
+        create_schema(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(UserModel),
+                [
+                    {
+                        "id": 1,
+                        "username": "bench",
+                        "email": "b@x.io",
+                        "password_hash": "x",
+                    }
+                ],
+            )
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': '1'})}"}
+
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *_args, **_kwargs: statements.append(1),
+        )
+        client = TestClient(create_app())
+        counts = defaultdict(list)
+        latencies = defaultdict(list)
+
+        def call(name, method, url, **kwargs):
+            statements.clear()
+            start = time.perf_counter()
+            response = client.request(method, url, headers=headers, **kwargs)
+            latencies[name].append((time.perf_counter() - start) * 1000)
+            counts[name].append(len(statements))
+            assert response.status_code < 300, (
+                name,
+                response.status_code,
+                response.text,
+            )
+            return response
+
+        for _ in range(args.runs):
+            list_id = call(
+                "POST /lists/", "POST", "/lists/", json={"name": "Bench"}
+            ).json()["id"]
+            call(
+                "PUT /lists/{id}", "PUT", f"/lists/{list_id}", json={"name": "Bench 2"}
+            )
+            tasks = f"/lists/{list_id}/tasks"
+            task_id = call(
+                "POST /tasks/",
+                "POST",
+                f"{tasks}/",
+                json={"title": "Tarea", "priority": "low"},
+            ).json()["id"]
+            call(
+                "POST /tasks/ (assigned)",
+                "POST",
+                f"{tasks}/",
+                json={"title": "Asignada", "priority": "low", "assigned_to": 1},
+            )
+            call(
+                "PUT /tasks/{id}",
+                "PUT",
+                f"{tasks}/{task_id}",
+                json={"title": "Editada", "priority": "high", "is_done": False},
+            )
+            call(
+                "PATCH /tasks/{id}/status",
+                "PATCH",
+                f"{tasks}/{task_id}/status",
+                json={"is_done": True},
+            )
+            call("DELETE /tasks/{id}", "DELETE", f"{tasks}/{task_id}")
+
+        result = {
+            name: {
+                "statements": statistics.median(counts[name]),
+                "p50_ms": round(statistics.median(latencies[name]), 3),
+                "p95_ms": round(statistics.quantiles(latencies[name], n=20)[18], 3),
+            }
+            for name in counts
+        }
+        dispose_engine()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
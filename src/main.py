@@ -1,36 +1,82 @@
 """
 Módulo principal de la aplicación TidyTasks.
-Define la configuración de logging, inicializa la base de datos
-y crea la instancia de FastAPI con las rutas incluidas.
+
+Expone `create_app`, que construye la instancia de FastAPI con las rutas incluidas.
+El módulo no crea ninguna instancia: importarlo no carga rutas, middlewares ni CRUD.
+Se sirve con la fábrica:
+
+    uvicorn main:create_app --factory
+
+El motor de base de datos, el logging a archivo y la creación opcional del esquema
+se inicializan en el arranque (lifespan).
 """
 
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
+
 from fastapi import FastAPI
-from app.api.routers.task_lists import router as api_router_task_lists
-from app.api.routers.tasks import router as api_router_tasks
-from app.api.routers.auth import router as api_router_auth
-from app.infrastructure.db.base import Base
-from app.infrastructure.db.session import engine
 
-log_path = Path("logs/app.log")
-log_path.parent.mkdir(parents=True, exist_ok=True)
+from app.core.config import Settings, get_settings
 
-if not log_path.exists():
-    log_path.touch()
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[logging.FileHandler(log_path), logging.StreamHandler()],
-)
 
-Base.metadata.create_all(bind=engine)
+def configure_logging(settings: Settings) -> None:
+    """
+    Configura el logging de la aplicación (consola y, opcionalmente, archivo).
+
+    Args:
+        settings (Settings): Configuración con `log_path` y `log_level`.
+    """
+    handlers = [logging.StreamHandler()]
+    if settings.log_path:
+        log_path = Path(settings.log_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_path))
 
-app = FastAPI()
+    logging.basicConfig(
+        level=settings.log_level,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=handlers,
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Inicializa los recursos de la aplicación al arrancar y los libera al terminar.
+    """
+    # pylint: disable=import-outside-toplevel
+    from app.infrastructure.db.crud.membership import membership_cache
+    from app.infrastructure.db.crud.task_history import task_history_writer
+    from app.infrastructure.db.session import dispose_engine, init_engine
+    from app.infrastructure.jobs.outbox import outbox_dispatcher
+    from app.infrastructure.jobs.reminders import reminder_scheduler
+
+    settings: Settings = app.state.settings
+    configure_logging(settings)
+    engine = init_engine(settings)
+    membership_cache.configure(settings)
+    if settings.create_schema:
+        from app.infrastructure.db.schema import create_schema
+
+        create_schema(engine)
+    outbox_dispatcher.configure(settings)
+    outbox_dispatcher.start()
+    task_history_writer.configure(settings)
+    task_history_writer.start()
+    reminder_scheduler.configure(settings)
+    reminder_scheduler.start()
+    logger.info("TidyTasks started")
+    yield
+    reminder_scheduler.stop()
+    task_history_writer.stop()
+    outbox_dispatcher.stop()
+    dispose_engine()
 
 
-@app.get("/")
 def home_page():
     """
     Clasica pagina de inicio de Fastapi
@@ -38,6 +84,66 @@ def home_page():
     return {"page": "home", "Version": "1.0", "Update Date": "Jul 23 2025"}
 
 
-app.include_router(api_router_auth)
-app.include_router(api_router_task_lists)
-app.include_router(api_router_tasks)
+def add_middlewares(app: FastAPI) -> None:
+    """
+    Añade los middlewares según la configuración de `app.state.settings`.
+
+    El último middleware añadido es el más externo: las trazas, si están activadas,
+    envuelven todo (su span raíz incluye los rechazos); después se rechaza la carga
+    excedente, se aplican los límites por cliente, la idempotencia y, si está
+    activado, el perfilado (que así solo mide las peticiones admitidas).
+    """
+    # pylint: disable=import-outside-toplevel
+    from app.api.middleware.admission import AdmissionControlMiddleware
+    from app.api.middleware.idempotency import IdempotencyMiddleware
+    from app.api.middleware.profiling import ProfilingMiddleware, profiling_enabled
+    from app.api.middleware.rate_limit import RateLimitMiddleware
+    from app.api.middleware.tracing import TracingMiddleware, tracing_enabled
+
+    settings = app.state.settings
+    if profiling_enabled(settings):
+        app.add_middleware(ProfilingMiddleware, settings=settings)
+    app.add_middleware(IdempotencyMiddleware, settings=settings)
+    app.add_middleware(RateLimitMiddleware, settings=settings)
+    app.add_middleware(AdmissionControlMiddleware, settings=settings)
+    if tracing_enabled(settings):
+        app.add_middleware(TracingMiddleware, settings=settings)
+
+
+def include_routers(app: FastAPI) -> None:
+    """
+    Registra la página de inicio y los routers de la API.
+    """
+    # pylint: disable=import-outside-toplevel
+    from app.api.routers import (
+        admin,
+        auth,
+        batch,
+        inbox,
+        list_members,
+        task_lists,
+        tasks,
+    )
+
+    app.get("/")(home_page)
+    for module in (auth, task_lists, tasks, list_members, inbox, batch, admin):
+        app.include_router(module.router)
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """
+    Construye la aplicación FastAPI.
+
+    No abre conexiones ni ejecuta DDL: eso ocurre en el arranque (`lifespan`).
+
+    Args:
+        settings (Optional[Settings]): Configuración; por defecto `get_settings()`.
+
+    Returns:
+        FastAPI: Aplicación con todas las rutas registradas.
+    """
+    app = FastAPI(lifespan=lifespan)
+    app.state.settings = settings or get_settings()
+    add_middlewares(app)
+    include_routers(app)
+    return app
@@ -1,18 +1,32 @@
 """
 Configuración común para los tests.
 
-Incluye la carga de variables de entorno,
-el cliente de pruebas y los headers de autenticación.
+Incluye la carga de variables de entorno, la creación del esquema,
+el cliente de pruebas, los headers de autenticación, el ID de su usuario y
+ayudantes para registrar usuarios adicionales, enviar lotes atómicos y registrar
+el SQL ejecutado.
 """
 
 import os
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, Optional
 from dotenv import load_dotenv
 from fastapi.testclient import TestClient
-from main import app
+from sqlalchemy import event
+from app.core.auth.jwt import create_access_token, user_id_from_authorization
+from app.core.config import Settings
+from app.infrastructure.db.schema import create_schema
+from app.infrastructure.db.session import get_engine
+from main import create_app
 
 load_dotenv()
 
-client = TestClient(app)
+create_schema(get_engine())
+
+# Los tests envían ráfagas de peticiones con el mismo usuario; los límites por
+# cliente se prueban por separado en `test_rate_limit.py`.
+client = TestClient(create_app(Settings(rate_limit_user_rate=0, rate_limit_ip_rate=0)))
 
 ACCESS_TOKEN = os.getenv("ACCESS_TOKEN")
 HEADERS = {
@@ -20,3 +34,65 @@ HEADERS = {
     "accept": "application/json",
     "Content-Type": "application/json",
 }
+USER_ID = user_id_from_authorization(HEADERS["Authorization"])
+
+
+def register_user(username: Optional[str] = None) -> tuple[int, dict]:
+    """
+    Registra un usuario nuevo y devuelve su ID y sus cabeceras de autenticación.
+
+    Args:
+        username (Optional[str]): Nombre del usuario; uno aleatorio si es None.
+
+    Returns:
+        tuple[int, dict]: ID del usuario y cabecera `Authorization`.
+    """
+    username = username or f"user_{uuid.uuid4().hex[:8]}"
+    user = client.post(
+        "/auth/register",
+        json={
+            "username": username,
+            "email": f"{username}@x.io",
+            "password": "secreto123",
+        },
+    ).json()
+    token = create_access_token({"sub": str(user["user_id"])})
+    return user["user_id"], {"Authorization": f"Bearer {token}"}
+
+
+def post_atomic_batch(operations: list[dict]) -> dict:
+    """
+    Envía un lote atómico a `POST /batch/`.
+
+    Args:
+        operations (list[dict]): Operaciones del lote, en orden.
+
+    Returns:
+        dict: Cuerpo de la respuesta (`committed` y `results`).
+    """
+    response = client.post(
+        "/batch/", headers=HEADERS, json={"atomic": True, "operations": operations}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@contextmanager
+def recorded_statements() -> Iterator[list[str]]:
+    """
+    Registra las sentencias SQL que ejecuta el motor compartido dentro del bloque.
+
+    Yields:
+        list[str]: Sentencias ejecutadas, en orden; se completa al salir del bloque.
+    """
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,130 @@
+"""
+Test suite para el archivo de tareas completadas
+usando FastAPI TestClient.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+
+from app.infrastructure.db.crud.archive import archive_completed_tasks
+from app.infrastructure.db.models.task import TaskModel
+from app.infrastructure.db.session import SessionLocal
+from tests.conftest import client, HEADERS
+
+
+LONG_AGO = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def archive_tasks(task_ids: list[int]) -> int:
+    """
+    Archiva solo las tareas indicadas: las marca como completadas hace años y archiva
+    las completadas antes de esa fecha, sin tocar las de otros tests.
+    """
+    with SessionLocal() as db:
+        db.execute(
+            update(TaskModel)
+            .where(TaskModel.id.in_(task_ids))
+            .values(is_done=True, updated_at=LONG_AGO)
+        )
+        db.commit()
+        older_than = datetime.now(timezone.utc) - LONG_AGO - timedelta(days=1)
+        return archive_completed_tasks(db, older_than=older_than)
+
+
+def create_task(list_id: int, title: str) -> int:
+    """Crea una tarea en la lista y devuelve su ID."""
+    response = client.post(
+        f"/lists/{list_id}/tasks/", headers=HEADERS, json={"title": title}
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_archive_and_restore_completed_task():
+    """
+    Crea una lista con una tarea pendiente y otra completada, archiva las
+    completadas y verifica que:
+    - El listado habitual solo muestre la tarea pendiente.
+    - El porcentaje de completitud siga contando la tarea archivada.
+    - La tarea archivada aparezca en `/tasks/archived` y pueda restaurarse.
+    """
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista test archivo"}
+    ).json()["id"]
+    pending_id, done_id = (
+        create_task(list_id, title) for title in ("Tarea pendiente", "Tarea completada")
+    )
+    assert archive_tasks([done_id]) == 1
+
+    listing = client.get(f"/lists/?list_id={list_id}", headers=HEADERS).json()
+    assert [task["id"] for task in listing["tasks"]] == [pending_id]
+    assert listing["completion_percentage"] == 50.0
+
+    archived = client.get(f"/lists/{list_id}/tasks/archived", headers=HEADERS)
+    assert archived.status_code == 200
+    assert [task["id"] for task in archived.json()["tasks"]] == [done_id]
+
+    restore = client.post(
+        f"/lists/{list_id}/tasks/archived/{done_id}/restore", headers=HEADERS
+    )
+    assert restore.status_code == 200
+    assert restore.json()["is_done"] is True
+
+    listing = client.get(f"/lists/?list_id={list_id}", headers=HEADERS).json()
+    assert sorted(task["id"] for task in listing["tasks"]) == [pending_id, done_id]
+    assert listing["completion_percentage"] == 50.0
+
+
+def test_restore_after_newer_task_created():
+    """
+    Archiva la tarea más reciente, crea otra y verifica que la nueva no reutilice su
+    ID, de modo que la archivada pueda restaurarse sin conflicto.
+    """
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista test IDs"}
+    ).json()["id"]
+    archived_id = create_task(list_id, "Última tarea")
+    assert archive_tasks([archived_id]) == 1
+    assert create_task(list_id, "Tarea nueva") > archived_id
+
+    restore = client.post(
+        f"/lists/{list_id}/tasks/archived/{archived_id}/restore", headers=HEADERS
+    )
+    assert restore.status_code == 200
+
+
+def test_restore_keeps_position_and_history():
+    """
+    Archiva una tarea intermedia y verifica que al restaurarla recupera su clave de
+    orden y que archivar y restaurar dejan su entrada, con versión propia, en el
+    historial.
+    """
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista test posición"}
+    ).json()["id"]
+    task_ids = [create_task(list_id, title) for title in ("Uno", "Dos", "Tres")]
+    with SessionLocal() as db:
+        rank = db.scalar(select(TaskModel.rank).where(TaskModel.id == task_ids[1]))
+    assert archive_tasks([task_ids[1]]) == 1
+
+    restore = client.post(
+        f"/lists/{list_id}/tasks/archived/{task_ids[1]}/restore", headers=HEADERS
+    )
+    assert restore.status_code == 200
+    with SessionLocal() as db:
+        ranks = db.scalars(
+            select(TaskModel.rank)
+            .where(TaskModel.id.in_(task_ids))
+            .order_by(TaskModel.id)
+        ).all()
+    assert ranks[1] == rank
+    assert ranks == sorted(ranks)
+
+    history = client.get(
+        f"/lists/{list_id}/tasks/{task_ids[1]}/history", headers=HEADERS
+    ).json()["entries"]
+    assert [(entry["action"], entry["version"]) for entry in history][:2] == [
+        ("restored", restore.json()["version"]),
+        ("archived", restore.json()["version"] - 1),
+    ]
@@ -0,0 +1,91 @@
+"""
+Test suite para el endpoint de operaciones por lotes (`POST /batch/`).
+"""
+
+from tests.conftest import client, HEADERS, post_atomic_batch
+
+
+def _create_list(name: str) -> int:
+    response = client.post("/lists/", headers=HEADERS, json={"name": name})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_batch_runs_operations_in_order():
+    """
+    Crea, actualiza y completa tareas en dos listas en un solo lote no atómico; la
+    operación que falla se informa sin afectar a las demás.
+    """
+    first, second = _create_list("Lote uno"), _create_list("Lote dos")
+    response = client.post(
+        "/batch/",
+        headers=HEADERS,
+        json={
+            "operations": [
+                {"op": "create", "list_id": first, "task": {"title": "A"}},
+                {"op": "create", "list_id": second, "task": {"title": "B"}},
+                {"op": "delete", "list_id": first, "task_id": 999999},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["committed"] is True
+    assert [result["status"] for result in body["results"]] == [201, 201, 404]
+    task = body["results"][0]["task"]
+
+    response = client.post(
+        "/batch/",
+        headers=HEADERS,
+        json={
+            "operations": [
+                {
+                    "op": "update",
+                    "list_id": first,
+                    "task_id": task["id"],
+                    "task": {
+                        "title": "A editada",
+                        "priority": "high",
+                        "is_done": False,
+                    },
+                    "version": task["version"],
+                },
+                {
+                    "op": "status",
+                    "list_id": first,
+                    "task_id": task["id"],
+                    "is_done": True,
+                },
+            ]
+        },
+    )
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [200, 200]
+    assert results[1]["task"]["title"] == "A editada"
+    assert results[1]["task"]["is_done"] is True
+
+
+def test_atomic_batch_rolls_back_everything():
+    """
+    En un lote atómico, un error deshace las operaciones anteriores.
+    """
+    list_id = _create_list("Lote atómico")
+    body = post_atomic_batch(
+        [
+            {
+                "op": "create",
+                "list_id": list_id,
+                "task": {"title": "No debe quedar"},
+            },
+            {
+                "op": "create",
+                "list_id": 999999,
+                "task": {"title": "Lista inexistente"},
+            },
+            {"op": "create", "list_id": list_id, "task": {"title": "Tampoco"}},
+        ]
+    )
+    assert body["committed"] is False
+    assert [result["status"] for result in body["results"]] == [424, 404, 424]
+    tasks = client.get(f"/lists/{list_id}", headers=HEADERS).json()["tasks"]
+    assert tasks == []
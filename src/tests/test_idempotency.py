@@ -0,0 +1,58 @@
+"""
+Test suite para la cabecera `Idempotency-Key` en los endpoints POST.
+"""
+
+import uuid
+
+from tests.conftest import client, HEADERS
+
+
+def test_retry_with_idempotency_key_replays_response():
+    """
+    Reintenta la creación de una lista y de una tarea con la misma clave y verifica
+    que se devuelve la respuesta original sin crear duplicados. Reutilizar la clave
+    con otro cuerpo responde 422.
+    """
+    headers = {**HEADERS, "Idempotency-Key": str(uuid.uuid4())}
+    payload = {"name": "Lista idempotente"}
+    first = client.post("/lists/", headers=headers, json=payload)
+    retry = client.post("/lists/", headers=headers, json=payload)
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+
+    other = client.post("/lists/", headers=headers, json={"name": "Otra lista"})
+    assert other.status_code == 422
+
+    list_id = first.json()["id"]
+    task_headers = {**HEADERS, "Idempotency-Key": str(uuid.uuid4())}
+    task = {"title": "Tarea idempotente", "priority": "low"}
+    for _ in range(3):
+        response = client.post(
+            f"/lists/{list_id}/tasks/", headers=task_headers, json=task
+        )
+        assert response.status_code == 201
+
+    tasks = client.get(f"/lists/{list_id}", headers=HEADERS).json()
+    assert len(tasks["tasks"]) == 1
+
+
+def test_replay_checks_query_and_keeps_headers():
+    """
+    Reutilizar la clave con otros parámetros de consulta responde 422, y el reintento
+    de una creación de tarea repite su `ETag`.
+    """
+    headers = {**HEADERS, "Idempotency-Key": str(uuid.uuid4())}
+    payload = {"name": "Lista con consulta"}
+    first = client.post("/lists/?origen=web", headers=headers, json=payload)
+    assert first.status_code == 201
+    other = client.post("/lists/?origen=movil", headers=headers, json=payload)
+    assert other.status_code == 422
+
+    task_headers = {**HEADERS, "Idempotency-Key": str(uuid.uuid4())}
+    url = f"/lists/{first.json()['id']}/tasks/"
+    created = client.post(url, headers=task_headers, json={"title": "Con ETag"})
+    retry = client.post(url, headers=task_headers, json={"title": "Con ETag"})
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.headers["ETag"] == created.headers["ETag"]
+    assert retry.headers["content-type"] == created.headers["content-type"]
@@ -0,0 +1,74 @@
+"""
+Test suite para la bandeja "mis tareas" (`/tasks/mine`)
+usando FastAPI TestClient.
+"""
+
+from app.core.pagination import encode_cursor
+from tests.conftest import client, HEADERS
+
+
+def test_list_my_created_tasks_paginated():
+    """
+    Crea una lista con tres tareas y recorre todas las páginas de
+    `/tasks/mine?relation=created` con tamaño de página 2.
+
+    Verifica que las páginas no repitan tareas y que las tareas
+    nuevas aparezcan en el recorrido.
+    """
+    list_response = client.post(
+        "/lists/",
+        headers=HEADERS,
+        json={"name": "Lista test inbox", "color_tag": "purple", "category": "test"},
+    )
+    assert list_response.status_code == 201
+    list_id = list_response.json()["id"]
+
+    created_ids = set()
+    for index in range(3):
+        response = client.post(
+            f"/lists/{list_id}/tasks/",
+            headers=HEADERS,
+            json={"title": f"Tarea inbox {index}", "priority": "high"},
+        )
+        assert response.status_code == 201
+        created_ids.add(response.json()["id"])
+
+    seen_ids = []
+    cursor = None
+    while True:
+        params = {"relation": "created", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/tasks/mine", headers=HEADERS, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["tasks"]) <= 2
+        seen_ids.extend(task["id"] for task in data["tasks"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen_ids) == len(set(seen_ids))
+    assert created_ids <= set(seen_ids)
+
+
+def test_list_my_tasks_invalid_cursor():
+    """
+    Verifica que un cursor inválido sea rechazado con 400.
+    """
+    response = client.get(
+        "/tasks/mine", headers=HEADERS, params={"cursor": "no-es-un-cursor"}
+    )
+    assert response.status_code == 400
+
+
+def test_list_my_tasks_cursor_with_wrong_types():
+    """
+    Verifica que un cursor bien codificado pero con valores de otro tipo sea
+    rechazado con 400 en lugar de llegar a la consulta.
+    """
+    for values in ((1, 2), ("2024-01-01", 2), ({"dt": "2024-01-01"}, True)):
+        response = client.get(
+            "/tasks/mine", headers=HEADERS, params={"cursor": encode_cursor(*values)}
+        )
+        assert response.status_code == 400
@@ -0,0 +1,160 @@
+"""
+Tests de los miembros de las listas y de la autorización por rol.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.core.constants import ListRole
+from app.infrastructure.db.crud.membership import MISSING, MembershipCache
+from app.infrastructure.db.models.task_list import TaskListModel
+from app.infrastructure.db.session import SessionLocal
+from main import create_app
+from tests.conftest import HEADERS, client, recorded_statements, register_user
+
+
+def test_roles_gate_list_and_task_routes():
+    """
+    Un no miembro no ve la lista (404); un `viewer` puede leer pero no escribir (403);
+    al subirlo a `editor` o quitarlo, el cambio se aplica en la petición siguiente.
+    """
+    user_id, headers = register_user()
+    list_id = client.post(
+        "/lists/", json={"name": "Compartida"}, headers=HEADERS
+    ).json()["id"]
+    task = client.post(
+        f"/lists/{list_id}/tasks/", json={"title": "Tarea compartida"}, headers=HEADERS
+    ).json()
+    task_url = f"/lists/{list_id}/tasks/{task['id']}"
+
+    assert client.get(f"/lists/{list_id}", headers=headers).status_code == 404
+    assert client.get(task_url, headers=headers).status_code == 404
+
+    member_url = f"/lists/{list_id}/members/{user_id}"
+    member = client.put(member_url, json={"role": "viewer"}, headers=HEADERS)
+    assert member.status_code == 200 and member.json()["role"] == "viewer"
+    assert client.get(task_url, headers=headers).status_code == 200
+    denied = client.patch(f"{task_url}/status", json={"is_done": True}, headers=headers)
+    assert denied.status_code == 403
+    assert (
+        client.put(member_url, json={"role": "owner"}, headers=headers).status_code
+        == 403
+    )
+
+    client.put(member_url, json={"role": "editor"}, headers=HEADERS)
+    allowed = client.patch(
+        f"{task_url}/status", json={"is_done": True}, headers=headers
+    )
+    assert allowed.status_code == 200
+    mine = client.get("/lists/mine", params={"limit": 200}, headers=headers).json()[
+        "lists"
+    ]
+    assert [(item["id"], item["role"]) for item in mine] == [(list_id, "editor")]
+
+    client.post(
+        f"/lists/{list_id}/tasks/", json={"title": "Del editor"}, headers=headers
+    )
+    inbox = client.get("/tasks/mine", params={"relation": "created"}, headers=headers)
+    assert len(inbox.json()["tasks"]) == 1
+
+    assert client.delete(member_url, headers=HEADERS).status_code == 204
+    assert client.get(task_url, headers=headers).status_code == 404
+    inbox = client.get("/tasks/mine", params={"relation": "created"}, headers=headers)
+    assert not inbox.json()["tasks"]
+
+
+def test_list_keeps_an_owner():
+    """
+    El único propietario no puede quitarse ni degradarse (409).
+    """
+    list_id = client.post(
+        "/lists/", json={"name": "Con dueño"}, headers=HEADERS
+    ).json()["id"]
+    members = client.get(f"/lists/{list_id}/members/", headers=HEADERS).json()
+    ((owner_id, role),) = [(member["user_id"], member["role"]) for member in members]
+    assert role == "owner"
+
+    url = f"/lists/{list_id}/members/{owner_id}"
+    assert client.put(url, json={"role": "viewer"}, headers=HEADERS).status_code == 409
+    assert client.delete(url, headers=HEADERS).status_code == 409
+    missing = f"/lists/{list_id}/members/999999"
+    assert (
+        client.put(missing, json={"role": "viewer"}, headers=HEADERS).status_code == 404
+    )
+
+
+def test_cached_role_skips_membership_query():
+    """
+    Con el rol en caché, autorizar una petición no consulta `list_members`.
+    """
+    list_id = client.post("/lists/", json={"name": "En caché"}, headers=HEADERS).json()[
+        "id"
+    ]
+    with recorded_statements() as statements:
+        assert client.get(f"/lists/{list_id}", headers=HEADERS).status_code == 200
+    assert statements and not any("list_members" in sql for sql in statements)
+
+
+def test_membership_cache_bounds_and_expiry(monkeypatch):
+    """
+    La caché descarta la entrada menos usada al llenarse y las que expiran.
+    """
+    now = [0.0]
+    monkeypatch.setattr(
+        "app.infrastructure.db.crud.membership.time.monotonic", lambda: now[0]
+    )
+    cache = MembershipCache(max_size=2, ttl=10)
+    cache.put(1, 1, ListRole.OWNER)
+    cache.put(1, 2, None)
+    assert cache.get(1, 1) is ListRole.OWNER
+    cache.put(1, 3, ListRole.VIEWER)
+    assert cache.get(1, 2) is MISSING
+    assert cache.get(1, 1) is ListRole.OWNER
+
+    now[0] = 11.0
+    assert cache.get(1, 1) is MISSING
+
+
+def test_admin_claims_unowned_list():
+    """
+    Una lista sin propietario aparece en `GET /admin/lists/unowned`; un administrador
+    la reclama y pasa a ser su propietario, y un segundo reclamo responde 409.
+    """
+    username = f"admin_{uuid.uuid4().hex[:8]}"
+    admin_id, admin_headers = register_user(username)
+    admin_client = TestClient(
+        create_app(
+            Settings(
+                rate_limit_user_rate=0, rate_limit_ip_rate=0, admin_usernames=[username]
+            )
+        )
+    )
+    with SessionLocal() as db:
+        orphan = TaskListModel(name="Sin propietario")
+        db.add(orphan)
+        db.commit()
+        list_id = orphan.id
+
+    def unowned_ids():
+        response = admin_client.get(
+            "/admin/lists/unowned", params={"limit": 200}, headers=admin_headers
+        )
+        assert response.status_code == 200
+        return {item["id"] for item in response.json()["lists"]}
+
+    assert list_id in unowned_ids()
+    assert (
+        admin_client.post(f"/admin/lists/{list_id}/claim", headers=HEADERS).status_code
+        == 403
+    )
+
+    claimed = admin_client.post(f"/admin/lists/{list_id}/claim", headers=admin_headers)
+    assert claimed.status_code == 200
+    assert claimed.json()["user_id"] == admin_id and claimed.json()["role"] == "owner"
+    assert client.get(f"/lists/{list_id}", headers=admin_headers).status_code == 200
+    assert list_id not in unowned_ids()
+
+    again = admin_client.post(f"/admin/lists/{list_id}/claim", headers=admin_headers)
+    assert again.status_code == 409
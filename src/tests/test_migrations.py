@@ -0,0 +1,231 @@
+"""
+Tests de las migraciones versionadas del esquema.
+
+Se ejecutan sobre bases SQLite temporales, independientes de la base de la aplicación.
+"""
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.db.migrations import dry_run, upgrade
+from app.infrastructure.db.migrations.operations import (
+    AddColumn,
+    CreateIndex,
+    PartitionTable,
+    TableLayout,
+)
+from app.infrastructure.db.migrations.runner import apply_step, load_migrations
+
+LEGACY_SCHEMA = (
+    "CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR(150) NOT NULL, "
+    "email VARCHAR(255) NOT NULL UNIQUE, password_hash VARCHAR(255) NOT NULL)",
+    "CREATE TABLE task_lists (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+    "color_tag VARCHAR(255), category VARCHAR(255))",
+    "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200) NOT NULL, "
+    "description VARCHAR(1000), priority VARCHAR(50) NOT NULL, is_done BOOLEAN, "
+    "assigned_to INTEGER, list_id INTEGER NOT NULL, created_by INTEGER NOT NULL, "
+    "created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, "
+    "updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL)",
+    "INSERT INTO users VALUES (1, 'ana', 'ana@example.com', 'x')",
+    "INSERT INTO task_lists VALUES (1, 'Casa', NULL, NULL)",
+    "INSERT INTO tasks (title, priority, is_done, list_id, created_by) VALUES "
+    "('Comprar leche', 'low', 0, 1, 1), ('Pagar luz', 'high', 1, 1, 1), "
+    "('Regar plantas', 'medium', 0, 1, 1)",
+)
+
+
+def legacy_engine(tmp_path):
+    """Crea una base con el esquema anterior a las migraciones."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+    return engine
+
+
+def test_upgrade_fresh_database(tmp_path):
+    """
+    Prueba que `upgrade` crea el esquema completo en una base vacía, registra todas
+    las versiones y que una segunda ejecución no tiene nada pendiente.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    applied = upgrade(engine)
+
+    assert [m.version for m in applied] == [m.version for m in load_migrations()]
+    tables = inspect(engine).get_table_names()
+    assert {
+        "users",
+        "task_lists",
+        "tasks",
+        "archived_tasks",
+        "schema_migrations",
+    } <= set(tables)
+    assert not dry_run(engine)
+    assert not upgrade(engine)
+
+
+def test_upgrade_legacy_database(tmp_path):
+    """
+    Prueba que una base creada antes de las migraciones recibe la columna `rank`, los
+    índices nuevos, el índice de búsqueda y las prioridades codificadas, y que el
+    dry-run lo anticipa sin aplicarlo.
+    """
+    engine = legacy_engine(tmp_path)
+
+    planned = [step.sql for _, steps in dry_run(engine) for step in steps]
+    assert any(sql.startswith("ALTER TABLE tasks ADD COLUMN rank") for sql in planned)
+    assert "rank" not in {c["name"] for c in inspect(engine).get_columns("tasks")}
+
+    upgrade(engine)
+
+    inspector = inspect(engine)
+    assert "rank" in {c["name"] for c in inspector.get_columns("tasks")}
+    assert inspector.has_index("tasks", "ix_tasks_list_id_rank")
+    with engine.connect() as conn:
+        found = conn.execute(
+            text("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'leche'")
+        ).all()
+    assert len(found) == 1
+    with engine.connect() as conn:
+        priorities = conn.execute(
+            text("SELECT priority FROM tasks ORDER BY id")
+        ).scalars()
+        assert [int(code) for code in priorities] == [1, 3, 2]
+
+
+def test_upgrade_backfills_list_members(tmp_path):
+    """
+    Prueba que, al introducir los miembros, el creador de la tarea más antigua queda
+    como propietario y los demás creadores y asignados como editores, y que las
+    listas sin tareas quedan sin propietario (para que las reclame un administrador).
+    """
+    engine = legacy_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO users VALUES (2, 'bea', 'bea@example.com', 'x'), "
+                "(3, 'carla', 'carla@example.com', 'x')"
+            )
+        )
+        conn.execute(text("INSERT INTO task_lists VALUES (2, 'Vacía', NULL, NULL)"))
+        conn.execute(
+            text(
+                "INSERT INTO tasks (title, priority, is_done, list_id, created_by, "
+                "assigned_to) VALUES ('Barrer', 'low', 0, 1, 2, 3)"
+            )
+        )
+
+    upgrade(engine)
+
+    with engine.connect() as conn:
+        owners = dict(conn.execute(text("SELECT id, owner_id FROM task_lists")).all())
+        members = conn.execute(
+            text("SELECT list_id, user_id, role FROM list_members ORDER BY user_id")
+        ).all()
+    assert owners == {1: 1, 2: None}
+    assert [tuple(member) for member in members] == [(1, 1, 3), (1, 2, 2), (1, 3, 2)]
+
+
+def test_add_column_backfills_in_batches(tmp_path):
+    """
+    Prueba que `AddColumn` añade la columna y la rellena en lotes hasta cubrir
+    todas las filas existentes.
+    """
+    engine = legacy_engine(tmp_path)
+    operation = AddColumn("tasks", "rank", backfill="'a' || id", batch_size=2)
+
+    with engine.connect() as conn:
+        steps = operation.plan(conn)
+    assert [step.batched for step in steps] == [False, True]
+
+    apply_step(engine, steps[0])
+    assert apply_step(engine, steps[1]) == 3
+    with engine.connect() as conn:
+        ranks = conn.execute(text("SELECT rank FROM tasks ORDER BY id")).scalars().all()
+    assert ranks == ["a1", "a2", "a3"]
+
+
+# Tabla `tasks` de una base en la versión 8, tal como la describe el catálogo.
+V0008_TASKS = TableLayout(
+    columns=(
+        "id title description priority is_done assigned_to list_id created_by "
+        "created_at updated_at rank version"
+    ).split(),
+    indexes={
+        "ix_tasks_list_id_rank": (
+            "CREATE INDEX ix_tasks_list_id_rank ON public.tasks USING btree "
+            "(list_id, rank, id)"
+        ),
+        "ix_tasks_completed_updated_at": (
+            "CREATE INDEX ix_tasks_completed_updated_at ON public.tasks USING btree "
+            "(updated_at) WHERE (is_done IS TRUE)"
+        ),
+    },
+    foreign_keys={
+        "tasks_list_id_fkey": "FOREIGN KEY (list_id) REFERENCES task_lists(id)",
+    },
+)
+
+
+def test_partition_table_plan(tmp_path):
+    """
+    Prueba que `PartitionTable` no hace nada fuera de PostgreSQL y que, en
+    PostgreSQL, copia las filas por lotes y conserva los nombres de la tabla y de
+    sus índices tras el intercambio.
+    """
+    operation = PartitionTable("tasks", "list_id", partitions=4)
+    with legacy_engine(tmp_path).connect() as conn:
+        assert not operation.plan(conn)
+
+    create, sync, copy, swap = operation.steps(V0008_TASKS)
+    assert "PARTITION BY HASH (list_id)" in create.sql
+    assert create.sql.count("PARTITION OF tasks_partitioned") == 4
+    assert "PRIMARY KEY (id, list_id)" in create.sql
+    assert (
+        "CONSTRAINT tasks_list_id_fkey FOREIGN KEY (list_id) REFERENCES task_lists(id)"
+        in create.sql
+    )
+    assert (
+        "CREATE INDEX IF NOT EXISTS ix_tasks_list_id_rank_partitioned ON "
+        "tasks_partitioned USING btree (list_id, rank, id)" in create.sql
+    )
+    assert "CREATE TRIGGER tasks_partition_sync" in sync.sql
+    assert copy.batched and not swap.batched
+    # Un lote no puede volver a copiar una fila borrada mientras se ejecutaba.
+    assert "FOR SHARE" in copy.sql
+    assert "ALTER TABLE tasks_partitioned RENAME TO tasks" in swap.sql
+    assert (
+        "ALTER INDEX ix_tasks_list_id_rank_partitioned RENAME TO ix_tasks_list_id_rank"
+        in (swap.sql)
+    )
+
+
+def test_partitioning_leaves_later_columns_to_their_migrations():
+    """
+    Prueba que `PartitionTable` solo copia las columnas e índices que ya tiene la
+    tabla, no los que el modelo añadió después, y que `CreateIndex` crea después los
+    índices nuevos en cada partición y los adjunta al de la tabla particionada.
+    """
+    create, sync, _, swap = PartitionTable("tasks", "list_id", partitions=4).steps(
+        V0008_TASKS
+    )
+    assert "due_at" not in sync.sql
+    assert "ix_tasks_pending_reminders" not in create.sql + swap.sql
+    assert "ix_tasks_list_id_rank_partitioned" in create.sql
+
+    steps = CreateIndex("tasks", "ix_tasks_pending_reminders").partitioned_steps(
+        postgresql.dialect(), ["tasks_p00", "tasks_p01"]
+    )
+    assert [step.autocommit for step in steps] == [False, True, False, True, False]
+    assert steps[0].sql.startswith(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_pending_reminders ON ONLY tasks "
+    )
+    assert steps[1].sql.startswith(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS tasks_p00_ix_tasks_pending_reminders "
+        "ON tasks_p00 "
+    )
+    assert "WHERE" in steps[1].sql
+    assert steps[2].sql == (
+        "ALTER INDEX ix_tasks_pending_reminders "
+        "ATTACH PARTITION tasks_p00_ix_tasks_pending_reminders"
+    )
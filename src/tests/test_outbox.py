@@ -0,0 +1,187 @@
+"""
+Tests de la bandeja de salida transaccional (`outbox_events`) y su despachador.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select, update
+
+from app.infrastructure.db.crud.outbox import dispatch_outbox_events
+from app.infrastructure.db.models.outbox_event import OutboxEventModel
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.jobs.outbox import HANDLERS
+from tests.conftest import HEADERS, USER_ID, client, post_atomic_batch
+
+
+def pending_events(task_id: int) -> list[OutboxEventModel]:
+    """Eventos `task.assigned` pendientes de una tarea."""
+    with SessionLocal() as db:
+        events = db.scalars(
+            select(OutboxEventModel).where(OutboxEventModel.topic == "task.assigned")
+        ).all()
+        return [event for event in events if event.payload["task_id"] == task_id]
+
+
+def test_assignment_notified_through_outbox(monkeypatch):
+    """
+    Crear una tarea asignada no notifica en la petición: registra un evento que el
+    despachador entrega después y elimina.
+    """
+    sent = []
+    monkeypatch.setattr(
+        "app.infrastructure.email.notifier.notify_assigned_user",
+        lambda email, title: sent.append(title),
+    )
+    list_id = client.post(
+        "/lists/", json={"name": "Con aviso"}, headers=HEADERS
+    ).json()["id"]
+    task = client.post(
+        f"/lists/{list_id}/tasks/",
+        json={"title": "Tarea asignada", "assigned_to": USER_ID},
+        headers=HEADERS,
+    ).json()
+
+    (event,) = pending_events(task["id"])
+    assert event.payload == {
+        "task_id": task["id"],
+        "title": "Tarea asignada",
+        "assigned_to": USER_ID,
+    }
+    assert not sent
+
+    with SessionLocal() as db:
+        while dispatch_outbox_events(db, HANDLERS, batch_size=50):
+            pass
+    assert "Tarea asignada" in sent
+    assert not pending_events(task["id"])
+
+
+def test_rolled_back_batch_leaves_no_event():
+    """
+    Un lote atómico que se deshace tampoco deja eventos de sus tareas.
+    """
+    list_id = client.post(
+        "/lists/", json={"name": "Sin aviso"}, headers=HEADERS
+    ).json()["id"]
+    task = {"title": "Asignada y deshecha", "assigned_to": USER_ID}
+    body = post_atomic_batch(
+        [
+            {"op": "create", "list_id": list_id, "task": task},
+            {"op": "delete", "list_id": list_id, "task_id": 999999},
+        ]
+    )
+    assert body["committed"] is False
+    with SessionLocal() as db:
+        events = db.scalars(select(OutboxEventModel.payload)).all()
+    assert all(payload.get("title") != task["title"] for payload in events)
+
+
+def test_failing_handler_retries_then_marks_failed():
+    """
+    Un manejador que falla deja el evento pendiente con el intento contado y, al
+    agotar los intentos, lo marca como fallido; los temas sin manejador no se tocan.
+    """
+    calls = []
+
+    def failing(_db, payload):
+        calls.append(payload["n"])
+        raise RuntimeError("webhook caído")
+
+    with SessionLocal() as db:
+        event_id = db.scalar(
+            insert(OutboxEventModel)
+            .values(topic="test.failing", payload={"n": 1})
+            .returning(OutboxEventModel.id)
+        )
+        db.commit()
+
+        handlers = {"test.failing": [failing]}
+        for _ in range(3):
+            dispatch_outbox_events(db, handlers, max_attempts=2, retry_backoff=0)
+        event = db.get(OutboxEventModel, event_id)
+        assert calls == [1, 1]
+        assert event.attempts == 2 and event.failed_at is not None
+        assert "webhook caído" in event.last_error
+
+        assert dispatch_outbox_events(db, {"test.other": [failing]}) == 0
+
+
+def test_concurrent_dispatchers_deliver_once():
+    """
+    Dos despachadores a la vez (uno por proceso de la aplicación) no entregan dos
+    veces el mismo evento: el segundo no reclama los que el primero tiene reclamados.
+    """
+    delivered = []
+
+    def slow(_db, payload):
+        time.sleep(0.1)
+        delivered.append(payload["n"])
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(OutboxEventModel),
+            [{"topic": "test.concurrent", "payload": {"n": n}} for n in range(3)],
+        )
+        db.commit()
+
+    def dispatch():
+        with SessionLocal() as db:
+            dispatch_outbox_events(db, {"test.concurrent": [slow]})
+
+    threads = [threading.Thread(target=dispatch) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(delivered) == [0, 1, 2]
+
+
+def test_delivery_runs_outside_the_claim():
+    """
+    Los manejadores se ejecutan con el reclamo ya confirmado: otras sesiones pueden
+    escribir mientras tanto, y un evento reclamado no se vuelve a reclamar hasta que
+    vence su reclamo.
+    """
+
+    def writes_elsewhere(_db, payload):
+        with SessionLocal() as other:
+            other.execute(
+                insert(OutboxEventModel).values(topic="test.written", payload=payload)
+            )
+            other.commit()
+
+    with SessionLocal() as db:
+        claimed, delivered = (
+            db.execute(
+                insert(OutboxEventModel).returning(OutboxEventModel.id),
+                [{"topic": "test.lease", "payload": {"n": n}} for n in range(2)],
+            )
+            .scalars()
+            .all()
+        )
+        db.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id == claimed)
+            .values(claimed_until=datetime.now(timezone.utc) + timedelta(minutes=1))
+        )
+        db.commit()
+
+        handlers = {"test.lease": [writes_elsewhere]}
+        assert dispatch_outbox_events(db, handlers) == 1
+        assert db.get(OutboxEventModel, delivered) is None
+        written = db.scalars(
+            select(OutboxEventModel.payload).where(
+                OutboxEventModel.topic == "test.written"
+            )
+        ).all()
+        assert written == [{"n": 1}]
+
+        db.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id == claimed)
+            .values(claimed_until=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        db.commit()
+        assert dispatch_outbox_events(db, handlers) == 1
@@ -0,0 +1,76 @@
+"""
+Tests para el perfilado bajo demanda de peticiones.
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.middleware.profiling import ProfilingMiddleware
+from app.core.config import Settings
+from main import create_app
+from tests.conftest import HEADERS
+
+NO_LIMITS = {"rate_limit_user_rate": 0, "rate_limit_ip_rate": 0}
+
+
+def test_profiling_disabled_by_default():
+    """
+    Sin tasa ni token, el middleware de perfilado no se instala.
+    """
+    app = create_app(Settings(**NO_LIMITS))
+    assert all(m.cls is not ProfilingMiddleware for m in app.user_middleware)
+
+
+def test_profile_with_privileged_header(tmp_path):
+    """
+    Una petición con la cabecera `X-Profile` correcta se perfila: el fichero
+    speedscope incluye las muestras de pila y las sentencias SQL ejecutadas.
+    """
+    settings = Settings(
+        **NO_LIMITS, profiling_token="secreto", profiling_dir=str(tmp_path)
+    )
+    client = TestClient(create_app(settings))
+    list_id = client.post(
+        "/lists/", json={"name": "Perfilada"}, headers=HEADERS
+    ).json()["id"]
+
+    assert (
+        "X-Profile-Id" not in client.get(f"/lists/{list_id}", headers=HEADERS).headers
+    )
+    wrong = client.get(f"/lists/{list_id}", headers={**HEADERS, "X-Profile": "otro"})
+    assert "X-Profile-Id" not in wrong.headers
+    non_ascii = client.get(
+        f"/lists/{list_id}", headers={**HEADERS, "X-Profile": "é".encode()}
+    )
+    assert non_ascii.status_code == 200
+    assert "X-Profile-Id" not in non_ascii.headers
+
+    response = client.get(
+        f"/lists/{list_id}", headers={**HEADERS, "X-Profile": "secreto"}
+    )
+    assert response.status_code == 200
+    document = json.loads((tmp_path / response.headers["X-Profile-Id"]).read_text())
+    sampled, sql = document["profiles"]
+    assert sampled["type"] == "sampled"
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    names = [document["shared"]["frames"][e["frame"]]["name"] for e in sql["events"]]
+    assert any(name.startswith("SQL: SELECT") for name in names)
+
+
+def test_profiles_ring_buffer(tmp_path):
+    """
+    Con muestreo total y un máximo de 2 ficheros, solo se conservan los 2 últimos
+    perfiles, en formato de pilas colapsadas.
+    """
+    settings = Settings(
+        **NO_LIMITS,
+        profiling_sample_rate=1.0,
+        profiling_dir=str(tmp_path),
+        profiling_max_files=2,
+        profiling_format="collapsed",
+    )
+    client = TestClient(create_app(settings))
+    ids = [client.get("/").headers["X-Profile-Id"] for _ in range(3)]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ids[1:]
+    assert all(name.endswith(".collapsed") for name in ids)
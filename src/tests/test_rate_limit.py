@@ -0,0 +1,74 @@
+"""
+Tests para la limitación de peticiones y el control de admisión.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.api.middleware.admission import AdmissionControlMiddleware
+from app.api.middleware.rate_limit import RateLimitMiddleware, TokenBucketLimiter
+from app.core.config import Settings
+from main import create_app
+from tests.conftest import HEADERS, USER_ID
+
+
+def test_token_bucket_refill_and_eviction():
+    """
+    Verifica que la cubeta admite una ráfaga, después exige esperar según la tasa
+    y que las cubetas inactivas se eliminan.
+    """
+    limiter = TokenBucketLimiter(rate=2, burst=3)
+    assert [limiter.acquire("a", now=0.0) for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("a", now=0.0) == 0.5
+    assert limiter.acquire("a", now=0.5) == 0
+    limiter.acquire("b", now=1.0)
+    assert limiter.evict(now=2.0) == 1
+    assert len(limiter) == 1
+
+
+def test_rate_limit_responds_429_with_retry_after():
+    """
+    Con un límite por IP de una ráfaga de 2 peticiones, la tercera recibe 429.
+    """
+    client = TestClient(
+        create_app(Settings(rate_limit_ip_rate=0.5, rate_limit_ip_burst=2))
+    )
+    assert client.get("/").status_code == 200
+    assert client.get("/").status_code == 200
+    response = client.get("/")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+
+
+def test_ip_rejection_refunds_user_token():
+    """
+    Si la IP rechaza una petición autenticada, el usuario no pierde su token.
+    """
+    client = TestClient(
+        create_app(
+            Settings(
+                rate_limit_user_rate=0.001,
+                rate_limit_user_burst=2,
+                rate_limit_ip_rate=0.001,
+                rate_limit_ip_burst=1,
+            )
+        )
+    )
+    assert client.get("/", headers=HEADERS).status_code == 200
+    assert client.get("/", headers=HEADERS).status_code == 429
+    middleware = client.app.middleware_stack
+    while not isinstance(middleware, RateLimitMiddleware):
+        middleware = middleware.app
+    assert middleware.user_limiter.acquire(USER_ID) == 0
+
+
+def test_admission_control_sheds_when_saturated():
+    """
+    Verifica que el control de admisión rechaza con 503 al alcanzar el máximo de
+    peticiones en curso.
+    """
+    middleware = AdmissionControlMiddleware(
+        None, Settings(admission_max_in_flight=2, admission_max_pool_wait=0)
+    )
+    assert not middleware.overloaded()
+    middleware.in_flight = 2
+    assert middleware.overloaded()
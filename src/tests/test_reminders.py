@@ -0,0 +1,95 @@
+"""
+Tests de las fechas límite de las tareas y del planificador de recordatorios.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.infrastructure.db.models.outbox_event import OutboxEventModel
+from app.infrastructure.db.models.task import TaskModel
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.jobs.reminders import ReminderScheduler
+from tests.conftest import HEADERS, client
+
+
+def create_task(list_id: int, title: str, due_at: datetime) -> int:
+    """Crea una tarea con fecha límite y devuelve su ID."""
+    response = client.post(
+        f"/lists/{list_id}/tasks/",
+        json={"title": title, "due_at": due_at.isoformat()},
+        headers=HEADERS,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def reminded_tasks() -> set[int]:
+    """IDs de las tareas incluidas en los eventos `task.due` pendientes."""
+    with SessionLocal() as db:
+        payloads = db.scalars(
+            select(OutboxEventModel.payload).where(OutboxEventModel.topic == "task.due")
+        ).all()
+    return {
+        reminder["task_id"] for payload in payloads for reminder in payload["reminders"]
+    }
+
+
+def test_due_reminders_claimed_once():
+    """
+    Las tareas vencidas se reclaman una sola vez, aunque haya varios planificadores,
+    y se notifican en un único evento; las completadas o lejanas no se reclaman.
+    """
+    now = datetime.now(timezone.utc)
+    list_id = client.post("/lists/", json={"name": "Vencidas"}, headers=HEADERS).json()[
+        "id"
+    ]
+    overdue = {
+        create_task(list_id, f"Vencida {n}", now - timedelta(hours=n)) for n in (1, 2)
+    }
+    done = create_task(list_id, "Ya hecha", now - timedelta(hours=1))
+    client.patch(
+        f"/lists/{list_id}/tasks/{done}/status", json={"is_done": True}, headers=HEADERS
+    )
+    later = create_task(list_id, "Para el mes que viene", now + timedelta(days=30))
+
+    with SessionLocal() as db:
+        assert ReminderScheduler().tick(db, now) >= 2
+    with SessionLocal() as db:
+        assert ReminderScheduler().tick(db, now) == 0
+
+    reminded = reminded_tasks()
+    assert overdue <= reminded
+    assert done not in reminded and later not in reminded
+
+
+def test_loaded_reminder_fires_and_rearms_on_new_due_date():
+    """
+    Un recordatorio cargado en la ventana se reclama al vencer sin volver a leerla, y
+    cambiar la fecha límite de la tarea lo vuelve a programar.
+    """
+    now = datetime.now(timezone.utc)
+    list_id = client.post("/lists/", json={"name": "Próximas"}, headers=HEADERS).json()[
+        "id"
+    ]
+    task_id = create_task(list_id, "En dos minutos", now + timedelta(minutes=2))
+
+    scheduler = ReminderScheduler(window=300, refresh_interval=600)
+    with SessionLocal() as db:
+        assert scheduler.tick(db, now) == 0
+        assert scheduler.tick(db, now + timedelta(minutes=3)) >= 1
+    assert task_id in reminded_tasks()
+
+    new_due = now + timedelta(days=1)
+    response = client.put(
+        f"/lists/{list_id}/tasks/{task_id}",
+        json={"due_at": new_due.isoformat(), "priority": "medium", "is_done": False},
+        headers=HEADERS,
+    )
+    assert response.status_code == 200
+    with SessionLocal() as db:
+        task = db.get(TaskModel, task_id)
+        assert task.reminded_at is None
+        assert task.due_at.replace(tzinfo=timezone.utc) == new_due.replace(
+            microsecond=0
+        )
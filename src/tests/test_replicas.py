@@ -0,0 +1,144 @@
+"""
+Tests para el encaminamiento de lecturas a réplicas, con dos bases SQLite locales.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.core.auth.jwt import verify_token
+from app.core.config import Settings
+from app.infrastructure.db import session
+from app.infrastructure.db.models.task_list import TaskListModel
+from app.infrastructure.db.models.user import UserModel
+from app.infrastructure.db.replicas import ReplicaSet
+from app.infrastructure.db.schema import create_schema
+from app.infrastructure.db.session import SessionLocal, build_engine
+from tests.conftest import HEADERS, client
+
+
+def sqlite_engine(path):
+    """Motor SQLite con el esquema creado."""
+    engine = build_engine(Settings(database_url=f"sqlite:///{path}", log_path=""))
+    create_schema(engine)
+    return engine
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """Primario y réplica con una lista de igual ID y distinto nombre en cada uno."""
+    primary, replica = sqlite_engine(tmp_path / "p.db"), sqlite_engine(
+        tmp_path / "r.db"
+    )
+    for engine, name in ((primary, "primaria"), (replica, "replica")):
+        with engine.begin() as conn:
+            conn.execute(insert(TaskListModel).values(id=1, name=name))
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def read_name(primary, replicas, user_id=None, read_only=True) -> str:
+    """Nombre de la lista 1 leído con una sesión enrutada por `replicas`."""
+    info = {"replicas": replicas, "read_only": read_only, "user_id": user_id}
+    with SessionLocal(bind=primary, info=info) as db:
+        return db.scalar(select(TaskListModel.name).where(TaskListModel.id == 1))
+
+
+def test_reads_routed_to_healthy_replica(databases):
+    """
+    Las lecturas de solo lectura van a la réplica una vez comprobado su retraso; las
+    de sesiones normales y las `FOR UPDATE`, al primario.
+    """
+    primary, replica = databases
+    replicas = ReplicaSet([replica], lag_probe=lambda _engine: 0.0)
+    assert read_name(primary, replicas) == "primaria"  # aún sin comprobar
+
+    assert replicas.refresh() == [replica]
+    assert read_name(primary, replicas) == "replica"
+    assert read_name(primary, replicas, read_only=False) == "primaria"
+    with SessionLocal(
+        bind=primary, info={"replicas": replicas, "read_only": True}
+    ) as db:
+        locked = (
+            select(TaskListModel.name).where(TaskListModel.id == 1).with_for_update()
+        )
+        assert db.scalar(locked) == "primaria"
+
+
+def test_lagging_or_unreachable_replica_leaves_rotation(databases):
+    """
+    Una réplica con más retraso del admitido, o que falla al medirlo, deja de
+    recibir lecturas hasta la siguiente comprobación.
+    """
+    primary, replica = databases
+    lag = {"seconds": 30.0}
+
+    def probe(_engine):
+        if lag["seconds"] is None:
+            raise OSError("replica caída")
+        return lag["seconds"]
+
+    replicas = ReplicaSet([replica], max_lag=5.0, lag_probe=probe)
+    assert not replicas.refresh()
+    assert read_name(primary, replicas) == "primaria"
+
+    lag["seconds"] = 1.0
+    replicas.refresh()
+    assert read_name(primary, replicas) == "replica"
+
+    lag["seconds"] = None
+    replicas.refresh()
+    assert replicas.lags[replica] is None
+    assert read_name(primary, replicas) == "primaria"
+
+
+def test_read_your_writes_pins_writer_to_primary(databases):
+    """
+    Tras escribir, las lecturas del mismo usuario van al primario durante
+    `pin_seconds`; las de otros usuarios siguen yendo a la réplica.
+    """
+    primary, replica = databases
+    replicas = ReplicaSet([replica], pin_seconds=60, lag_probe=lambda _engine: 0.0)
+    replicas.refresh()
+
+    with SessionLocal(bind=primary, info={"replicas": replicas, "user_id": 7}) as db:
+        db.add(TaskListModel(name="nueva"))
+        db.commit()
+
+    assert read_name(primary, replicas, user_id=7) == "primaria"
+    assert read_name(primary, replicas, user_id=8) == "replica"
+
+
+@pytest.mark.parametrize("pin_seconds, expected_tasks", [(0, 0), (60, 1)])
+def test_get_routes_read_from_replica(
+    tmp_path, monkeypatch, pin_seconds, expected_tasks
+):
+    """
+    Las rutas GET leen de la réplica: una tarea recién creada en el primario aún no
+    aparece en ella, salvo que el usuario quede fijado al primario por su propia
+    escritura.
+    """
+    replica = sqlite_engine(tmp_path / "r.db")
+    user_id = int(verify_token(HEADERS["Authorization"].split()[1])["sub"])
+    with SessionLocal(bind=session.get_engine()) as db:
+        user = db.get(UserModel, user_id)
+        row = {c.name: getattr(user, c.name) for c in UserModel.__table__.columns}
+    with replica.begin() as conn:
+        conn.execute(insert(UserModel).values(**row))
+    replicas = ReplicaSet(
+        [replica], pin_seconds=pin_seconds, lag_probe=lambda _engine: 0.0
+    )
+    replicas.refresh()
+    monkeypatch.setattr(session, "_replicas", replicas)
+
+    created = client.post("/lists/", json={"name": "Recién creada"}, headers=HEADERS)
+    list_id = created.json()["id"]
+    client.post(
+        f"/lists/{list_id}/tasks/", json={"title": "Tarea nueva"}, headers=HEADERS
+    )
+    response = client.get("/lists/", params={"list_id": list_id}, headers=HEADERS)
+    assert response.status_code == 200
+    assert len(response.json()["tasks"]) == expected_tasks
+    replica.dispose()
@@ -0,0 +1,64 @@
+"""
+Tests de la apertura perezosa de transacciones de escritura en SQLite.
+"""
+
+from sqlalchemy import column, select, table, text
+
+from app.core.config import Settings
+from app.infrastructure.db.session import build_engine, is_sqlite_write
+
+
+def test_sqlite_write_detection():
+    """Solo las escrituras, el DDL y los SAVEPOINT abren `BEGIN IMMEDIATE`."""
+    for statement in (
+        "INSERT INTO tasks (title) VALUES (?)",
+        "  update tasks SET title = ?",
+        "DELETE FROM tasks",
+        "SAVEPOINT sa_savepoint_1",
+        "WITH moved AS (SELECT id FROM tasks) UPDATE tasks SET list_id = ?",
+    ):
+        assert is_sqlite_write(statement), statement
+    for statement in (
+        "SELECT * FROM tasks FOR UPDATE",
+        "WITH x AS (SELECT 1) SELECT * FROM x",
+        "EXPLAIN QUERY PLAN SELECT * FROM tasks",
+        "PRAGMA table_info(tasks)",
+        "SELECT updated_at FROM tasks",
+    ):
+        assert not is_sqlite_write(statement), statement
+
+
+def test_sqlite_reads_stay_in_autocommit(tmp_path):
+    """Las lecturas no abren transacción; la primera escritura sí."""
+    engine = build_engine(
+        Settings(database_url=f"sqlite:///{tmp_path / 's.db'}", log_path="")
+    )
+    with engine.connect() as conn:
+        dbapi_connection = conn.connection.dbapi_connection
+        conn.execute(text("WITH x AS (SELECT 1 AS n) SELECT n FROM x"))
+        conn.execute(text("EXPLAIN SELECT 1"))
+        assert not dbapi_connection.in_transaction
+        conn.execute(text("CREATE TABLE t (n INTEGER)"))
+        assert dbapi_connection.in_transaction
+        conn.commit()
+    engine.dispose()
+
+
+def test_sqlite_for_update_opens_write_transaction(tmp_path):
+    """
+    SQLite omite `FOR UPDATE`: la lectura abre la transacción de escritura para que
+    otra conexión no lea las mismas filas hasta que esta confirme.
+    """
+    engine = build_engine(
+        Settings(database_url=f"sqlite:///{tmp_path / 's.db'}", log_path="")
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (n INTEGER)"))
+    with engine.connect() as conn:
+        dbapi_connection = conn.connection.dbapi_connection
+        conn.execute(select(column("n")).select_from(table("t")))
+        assert not dbapi_connection.in_transaction
+        conn.execute(select(column("n")).select_from(table("t")).with_for_update())
+        assert dbapi_connection.in_transaction
+        conn.rollback()
+    engine.dispose()
@@ -0,0 +1,87 @@
+"""
+Tests para el registro de consultas lentas y su endpoint de administración.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.infrastructure.db.slow_queries import (
+    explain_options,
+    fingerprint,
+    slow_query_log,
+)
+from main import create_app
+from tests.conftest import HEADERS, client, register_user
+
+
+def test_fingerprint_normalizes_literals_and_lists():
+    """
+    Sentencias que solo difieren en sus valores comparten huella.
+    """
+    a = fingerprint(
+        "SELECT * FROM tasks WHERE list_id = 5 AND title = 'x' AND id IN (?, ?)"
+    )
+    b = fingerprint(
+        "SELECT *\nFROM tasks WHERE list_id = %(list_id_1)s AND title = 'it''s' "
+        "AND id IN (__[POSTCOMPILE_id_1])"
+    )
+    assert (
+        a == b == "SELECT * FROM tasks WHERE list_id = ? AND title = ? AND id IN (...)"
+    )
+    assert fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)") == (
+        "INSERT INTO t (a, b) VALUES (...)"
+    )
+
+
+def test_explain_analyze_only_for_plain_reads():
+    """
+    `EXPLAIN ANALYZE` ejecuta la sentencia: no se usa con escrituras ni con lecturas
+    que bloquean filas.
+    """
+    assert explain_options("SELECT * FROM tasks WHERE id = ?") == "(ANALYZE, BUFFERS)"
+    for statement in (
+        "UPDATE tasks SET title = ? WHERE id = ?",
+        "SELECT id FROM outbox_events ORDER BY id LIMIT ? FOR UPDATE SKIP LOCKED",
+        "SELECT id FROM tasks WHERE list_id = ? FOR NO KEY UPDATE",
+        "SELECT id FROM list_members WHERE list_id = ?\nFOR SHARE",
+    ):
+        assert explain_options(statement) == "", statement
+
+
+def test_slow_query_report_for_admins(monkeypatch):
+    """
+    Con un umbral mínimo, las consultas de una petición aparecen agregadas en
+    `GET /admin/slow-queries`, que solo pueden consultar los administradores.
+    """
+    username = f"admin_{uuid.uuid4().hex[:8]}"
+    _, admin_headers = register_user(username)
+    settings = Settings(
+        rate_limit_user_rate=0, rate_limit_ip_rate=0, admin_usernames=[username]
+    )
+    admin_client = TestClient(create_app(settings))
+    list_id = client.post("/lists/", json={"name": "Lenta"}, headers=HEADERS).json()[
+        "id"
+    ]
+
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 1e-6)
+    slow_query_log.reset()
+    for _ in range(3):
+        assert client.get(f"/lists/{list_id}", headers=HEADERS).status_code == 200
+
+    assert admin_client.get("/admin/slow-queries", headers=HEADERS).status_code == 403
+    response = admin_client.get(
+        "/admin/slow-queries", params={"sort": "count"}, headers=admin_headers
+    )
+    assert response.status_code == 200
+    queries = response.json()["queries"]
+    by_list = [q for q in queries if "FROM task_lists" in q["fingerprint"]]
+    assert by_list and by_list[0]["count"] >= 3
+    assert "task_lists.id = ?" in by_list[0]["fingerprint"]
+
+    assert (
+        admin_client.delete("/admin/slow-queries", headers=admin_headers).status_code
+        == 204
+    )
+    assert slow_query_log.top() == []
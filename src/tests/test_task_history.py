@@ -0,0 +1,175 @@
+"""
+Tests del historial de cambios de las tareas (`GET .../tasks/{task_id}/history`).
+"""
+
+# pylint: disable=not-callable
+
+from sqlalchemy import func, select
+
+from app.core.constants import TaskHistoryAction
+from app.infrastructure.db.crud.task_history import (
+    TaskHistoryWriter,
+    record_task_change,
+)
+from app.infrastructure.db.models.task_history import TaskHistoryModel
+from app.infrastructure.db.session import SessionLocal
+from tests.conftest import HEADERS, USER_ID, client, post_atomic_batch
+
+
+def test_task_history_records_changes():
+    """
+    Crear, actualizar, completar y eliminar una tarea deja una entrada por cambio,
+    con su autor, su versión propia y solo los campos que cambiaron; el historial se
+    pagina y sigue disponible tras eliminar la tarea.
+    """
+    list_id = client.post(
+        "/lists/", json={"name": "Historial"}, headers=HEADERS
+    ).json()["id"]
+    task = client.post(
+        f"/lists/{list_id}/tasks/", json={"title": "Versión uno"}, headers=HEADERS
+    ).json()
+    url = f"/lists/{list_id}/tasks/{task['id']}"
+    update = {"title": "Versión dos", "priority": "high", "is_done": False}
+    assert client.put(url, json=update, headers=HEADERS).status_code == 200
+    client.patch(f"{url}/status", json={"is_done": True}, headers=HEADERS)
+    assert client.delete(url, headers=HEADERS).status_code == 204
+
+    first = client.get(f"{url}/history", params={"limit": 3}, headers=HEADERS).json()
+    rest = client.get(
+        f"{url}/history", params={"cursor": first["next_cursor"]}, headers=HEADERS
+    ).json()
+    entries = first["entries"] + rest["entries"]
+    assert rest["next_cursor"] is None
+    assert [(entry["action"], entry["version"]) for entry in entries] == [
+        ("deleted", 4),
+        ("updated", 3),
+        ("updated", 2),
+        ("created", 1),
+    ]
+    assert entries[0]["changes"] is None
+    assert entries[1]["changes"] == {"is_done": [False, True]}
+    assert entries[2]["changes"] == {
+        "title": ["Versión uno", "Versión dos"],
+        "priority": ["medium", "high"],
+    }
+    assert entries[3]["changes"]["title"] == "Versión uno"
+    assert {entry["changed_by"] for entry in entries} == {USER_ID}
+
+    other = client.post("/lists/", json={"name": "Otra"}, headers=HEADERS).json()["id"]
+    foreign = client.get(f"/lists/{other}/tasks/{task['id']}/history", headers=HEADERS)
+    assert foreign.json()["entries"] == []
+
+
+def test_moved_task_keeps_its_history():
+    """
+    Mover una tarea deja una entrada `moved`; su historial completo, incluidos los
+    cambios hechos en la lista de origen, se consulta desde la de destino.
+    """
+    source, target = (
+        client.post("/lists/", json={"name": name}, headers=HEADERS).json()["id"]
+        for name in ("Origen", "Destino")
+    )
+    task = client.post(
+        f"/lists/{source}/tasks/", json={"title": "Viajera"}, headers=HEADERS
+    ).json()
+    response = client.post(
+        f"/lists/{source}/tasks/move",
+        json={"task_ids": [task["id"]], "target_list_id": target},
+        headers=HEADERS,
+    )
+    assert response.status_code == 200
+
+    history = client.get(
+        f"/lists/{target}/tasks/{task['id']}/history", headers=HEADERS
+    ).json()["entries"]
+    assert [(e["action"], e["list_id"], e["version"]) for e in history] == [
+        ("moved", target, 2),
+        ("created", source, 1),
+    ]
+    assert history[0]["changes"] == {"list_id": [source, target]}
+    stale = client.get(f"/lists/{source}/tasks/{task['id']}/history", headers=HEADERS)
+    assert stale.json()["entries"] == []
+
+
+def test_history_ordered_by_version():
+    """
+    El historial se ordena y pagina por versión, aunque las entradas se hayan
+    insertado en otro orden (cada proceso las escribe desde su propio hilo).
+    """
+    list_id = client.post(
+        "/lists/", json={"name": "Desordenada"}, headers=HEADERS
+    ).json()["id"]
+    task_id = 20_000_000
+    with SessionLocal() as db:
+        for version in (1, 3, 2):
+            record_task_change(db, TaskHistoryAction.UPDATED, task_id, list_id, version)
+
+    url = f"/lists/{list_id}/tasks/{task_id}/history"
+    first = client.get(url, params={"limit": 2}, headers=HEADERS).json()
+    rest = client.get(
+        url, params={"cursor": first["next_cursor"]}, headers=HEADERS
+    ).json()
+    versions = [entry["version"] for entry in first["entries"] + rest["entries"]]
+    assert versions == [3, 2, 1]
+
+
+def test_rolled_back_batch_leaves_no_history():
+    """
+    Las operaciones de un lote atómico deshecho no aparecen en el historial.
+    """
+    list_id = client.post(
+        "/lists/", json={"name": "Lote deshecho"}, headers=HEADERS
+    ).json()["id"]
+    task = client.post(
+        f"/lists/{list_id}/tasks/", json={"title": "Intacta"}, headers=HEADERS
+    ).json()
+    body = post_atomic_batch(
+        [
+            {
+                "op": "status",
+                "list_id": list_id,
+                "task_id": task["id"],
+                "is_done": True,
+            },
+            {"op": "delete", "list_id": list_id, "task_id": 999999},
+        ]
+    )
+    assert body["committed"] is False
+    history = client.get(
+        f"/lists/{list_id}/tasks/{task['id']}/history", headers=HEADERS
+    )
+    assert [entry["action"] for entry in history.json()["entries"]] == ["created"]
+
+
+def test_writer_batches_entries_off_the_request():
+    """
+    Con el hilo del escritor arrancado, las entradas no se escriben al registrarlas
+    sino en un lote posterior (al vencer el intervalo o al detenerlo).
+    """
+    writer = TaskHistoryWriter(flush_interval=60)
+    task_id = 10_000_000
+
+    def stored() -> int:
+        with SessionLocal() as db:
+            return db.scalar(
+                select(func.count()).where(TaskHistoryModel.task_id == task_id)
+            )
+
+    writer.start()
+    try:
+        with SessionLocal() as db:
+            db.info["task_history"] = deferred = []
+            for version in range(1, 4):
+                record_task_change(
+                    db,
+                    TaskHistoryAction.UPDATED,
+                    task_id,
+                    1,
+                    version,
+                    changes={"is_done": True},
+                )
+        writer.submit(deferred)
+        assert stored() == 0
+    finally:
+        writer.stop()
+    assert stored() == 3
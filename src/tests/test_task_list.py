@@ -3,6 +3,7 @@ Test suite para los endpoints relacionados con listas de tareas
 usando FastAPI TestClient.
 """
 
+from app.core.pagination import encode_cursor
 from tests.conftest import client, HEADERS
 
 
@@ -108,3 +109,96 @@ def test_delete_task_list():
     list_id = create_response.json()["id"]
     delete_response = client.delete(f"/lists/{list_id}", headers=HEADERS)
     assert delete_response.status_code in (200, 204)
+
+
+def test_clone_task_list():
+    """
+    Crea una lista con dos tareas (una completada), la duplica y verifica
+    que la copia tenga las dos tareas pendientes.
+    """
+    create_response = client.post(
+        "/lists/",
+        headers=HEADERS,
+        json={"name": "Plantilla", "color_tag": "orange", "category": "test"},
+    )
+    assert create_response.status_code in (200, 201)
+    list_id = create_response.json()["id"]
+
+    for title in ("Paso uno", "Paso dos"):
+        task_response = client.post(
+            f"/lists/{list_id}/tasks/",
+            headers=HEADERS,
+            json={"title": title, "priority": "medium"},
+        )
+        assert task_response.status_code == 201
+    client.patch(
+        f"/lists/{list_id}/tasks/{task_response.json()['id']}/status",
+        headers=HEADERS,
+        json={"is_done": True},
+    )
+
+    clone_response = client.post(
+        f"/lists/{list_id}/clone", headers=HEADERS, json={"name": "Copia plantilla"}
+    )
+    assert clone_response.status_code == 201
+    clone = clone_response.json()
+    assert clone["id"] != list_id
+    assert clone["name"] == "Copia plantilla"
+    assert clone["color_tag"] == "orange"
+    assert clone["copied_tasks"] == 2
+
+    tasks_response = client.get(f"/lists/?list_id={clone['id']}", headers=HEADERS)
+    assert tasks_response.status_code == 200
+    data = tasks_response.json()
+    assert sorted(task["title"] for task in data["tasks"]) == ["Paso dos", "Paso uno"]
+    assert data["completion_percentage"] == 0.0
+
+
+def test_clone_missing_task_list():
+    """
+    Verifica que duplicar una lista inexistente retorne 404.
+    """
+    response = client.post("/lists/999999/clone", headers=HEADERS)
+    assert response.status_code == 404
+
+
+def test_list_my_lists_with_stats():
+    """
+    Verifica que `GET /lists/mine` pagina las listas propias por cursor y devuelve
+    el número de tareas y el porcentaje de completitud de cada una.
+    """
+    created = client.post("/lists/", headers=HEADERS, json={"name": "Mis estadísticas"})
+    list_id = created.json()["id"]
+    assert created.json()["owner_id"] is not None
+    for title in ("Hecha", "Pendiente"):
+        client.post(f"/lists/{list_id}/tasks/", headers=HEADERS, json={"title": title})
+    first_task = client.get(f"/lists/?list_id={list_id}", headers=HEADERS).json()[
+        "tasks"
+    ][0]
+    client.patch(
+        f"/lists/{list_id}/tasks/{first_task['id']}/status",
+        headers=HEADERS,
+        json={"is_done": True},
+    )
+
+    lists, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/lists/mine", headers=HEADERS, params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["lists"]) <= 2
+        lists.extend(page["lists"])
+        if not (cursor := page["next_cursor"]):
+            break
+
+    ids = [item["id"] for item in lists]
+    assert ids == sorted(set(ids))
+    mine = next(item for item in lists if item["id"] == list_id)
+    assert mine["name"] == "Mis estadísticas"
+    assert (mine["task_count"], mine["done_count"]) == (2, 1)
+    assert mine["completion_percentage"] == 50.0
+
+    for cursor in ("%%%", encode_cursor([1, 2]), encode_cursor("1")):
+        invalid = client.get("/lists/mine", headers=HEADERS, params={"cursor": cursor})
+        assert invalid.status_code == 400
@@ -3,7 +3,13 @@ Test suite para los endpoints relacionados con tareas
 usando FastAPI TestClient.
 """
 
-from tests.conftest import client, HEADERS
+from sqlalchemy import literal, select, update
+
+from app.core.ordering import key_between
+from app.infrastructure.db.crud.ordering import ranks_by_position
+from app.infrastructure.db.models.task import TaskModel
+from app.infrastructure.db.session import SessionLocal
+from tests.conftest import client, HEADERS, recorded_statements
 
 
 def test_create_and_delete_task():
@@ -185,3 +191,336 @@ def test_create_task_and_patch_status():
 
     assert delete_task_response.status_code in (200, 204)
     assert delete_list_response.status_code in (200, 204)
+
+
+def test_search_tasks():
+    """
+    Crea una lista con dos tareas y verifica que la búsqueda por texto
+    devuelva solo la tarea cuyo título o descripción coincide.
+    """
+    list_response = client.post(
+        "/lists/",
+        headers=HEADERS,
+        json={"name": "Lista test busqueda", "color_tag": "green", "category": "test"},
+    )
+    assert list_response.status_code == 201
+    list_id = list_response.json()["id"]
+
+    for title, description in (
+        ("Comprar pan", "Ir a la panadería"),
+        ("Enviar reporte", "Reporte semanal de ventas"),
+    ):
+        response = client.post(
+            f"/lists/{list_id}/tasks/",
+            headers=HEADERS,
+            json={"title": title, "description": description, "priority": "low"},
+        )
+        assert response.status_code == 201
+
+    search_response = client.get(
+        f"/lists/{list_id}/tasks/search?q=ventas&limit=10", headers=HEADERS
+    )
+    assert search_response.status_code == 200
+    data = search_response.json()
+    assert [task["title"] for task in data["tasks"]] == ["Enviar reporte"]
+    assert data["limit"] == 10
+    assert data["offset"] == 0
+
+
+def test_move_tasks_to_another_list():
+    """
+    Crea dos listas y dos tareas en la primera, mueve ambas a la segunda
+    y verifica que la lista destino las contenga.
+    """
+    source_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista origen"}
+    ).json()["id"]
+    target_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista destino"}
+    ).json()["id"]
+
+    task_ids = [
+        client.post(
+            f"/lists/{source_id}/tasks/",
+            headers=HEADERS,
+            json={"title": f"Tarea a mover {index}", "priority": "low"},
+        ).json()["id"]
+        for index in range(2)
+    ]
+
+    move_response = client.post(
+        f"/lists/{source_id}/tasks/move",
+        headers=HEADERS,
+        json={"task_ids": task_ids, "target_list_id": target_id},
+    )
+    assert move_response.status_code == 200
+    assert move_response.json()["moved"] == 2
+
+    get_response = client.get(
+        f"/lists/{target_id}/tasks/{task_ids[0]}", headers=HEADERS
+    )
+    assert get_response.status_code == 200
+    assert get_response.json()["list_id"] == target_id
+
+    missing_target = client.post(
+        f"/lists/{target_id}/tasks/move",
+        headers=HEADERS,
+        json={"task_ids": task_ids, "target_list_id": 999999},
+    )
+    assert missing_target.status_code == 404
+
+
+def test_moved_tasks_land_at_the_end_in_order():
+    """
+    Mueve dos tareas a una lista con tareas y verifica que queden al final de la
+    lista destino, en el orden manual que tenían en la origen, con un único `UPDATE`.
+    """
+    source_id, target_id = (
+        client.post("/lists/", headers=HEADERS, json={"name": name}).json()["id"]
+        for name in ("Origen ordenada", "Destino ordenada")
+    )
+
+    def create(list_id, title):
+        return client.post(
+            f"/lists/{list_id}/tasks/",
+            headers=HEADERS,
+            json={"title": title, "priority": "low"},
+        ).json()["id"]
+
+    existing = [create(target_id, f"Ya estaba {index}") for index in range(2)]
+    first, second = (create(source_id, title) for title in ("Primera", "Segunda"))
+    client.patch(
+        f"/lists/{source_id}/tasks/{second}/position",
+        headers=HEADERS,
+        json={"after_id": None},
+    )
+
+    with recorded_statements() as statements:
+        response = client.post(
+            f"/lists/{source_id}/tasks/move",
+            headers=HEADERS,
+            json={"task_ids": [first, second], "target_list_id": target_id},
+        )
+    assert response.json()["moved"] == 2
+    assert sum("UPDATE tasks" in sql for sql in statements) == 1
+
+    response = client.get(f"/lists/?list_id={target_id}&sort=rank", headers=HEADERS)
+    tasks = response.json()["tasks"]
+    assert [task["id"] for task in tasks] == [*existing, second, first]
+    assert len({task["rank"] for task in tasks}) == len(tasks)
+
+
+def test_ranks_by_position_are_valid_and_ordered():
+    """
+    Verifica que las claves calculadas en SQL para cada posición sean válidas,
+    posteriores a la base y crecientes, también al cambiar de dígito en base 62.
+    """
+    with SessionLocal() as db:
+        keys = [
+            db.scalar(select(ranks_by_position("a1", literal(position), 200)))
+            for position in range(1, 201)
+        ]
+    assert keys == sorted(keys) and len(set(keys)) == len(keys)
+    assert all("a1" < key < key_between(key, None) for key in keys)
+
+
+def test_change_task_position():
+    """
+    Crea una lista con tres tareas, cambia su orden manual y verifica
+    que `sort=rank` devuelva las tareas en el nuevo orden.
+    """
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista test orden"}
+    ).json()["id"]
+    first, second, third = (
+        client.post(
+            f"/lists/{list_id}/tasks/",
+            headers=HEADERS,
+            json={"title": title, "priority": "medium"},
+        ).json()["id"]
+        for title in ("Primera", "Segunda", "Tercera")
+    )
+
+    def ordered_ids():
+        response = client.get(f"/lists/?list_id={list_id}&sort=rank", headers=HEADERS)
+        assert response.status_code == 200
+        return [task["id"] for task in response.json()["tasks"]]
+
+    assert ordered_ids() == [first, second, third]
+
+    response = client.patch(
+        f"/lists/{list_id}/tasks/{third}/position",
+        headers=HEADERS,
+        json={"after_id": None},
+    )
+    assert response.status_code == 200
+    assert ordered_ids() == [third, first, second]
+
+    response = client.patch(
+        f"/lists/{list_id}/tasks/{first}/position",
+        headers=HEADERS,
+        json={"after_id": second},
+    )
+    assert response.status_code == 200
+    assert ordered_ids() == [third, second, first]
+
+
+def test_change_task_position_with_duplicate_ranks():
+    """
+    Con dos tareas que comparten clave de orden (p. ej. creadas a la vez), mover
+    otra tarea justo después de la primera la deja en su sitio, reequilibrando la
+    lista.
+    """
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista test claves repetidas"}
+    ).json()["id"]
+    first, second, third = (
+        client.post(
+            f"/lists/{list_id}/tasks/",
+            headers=HEADERS,
+            json={"title": title, "priority": "medium"},
+        ).json()["id"]
+        for title in ("Primera", "Segunda", "Tercera")
+    )
+    with SessionLocal() as db:
+        rank = db.scalar(select(TaskModel.rank).where(TaskModel.id == first))
+        db.execute(update(TaskModel).where(TaskModel.id == second).values(rank=rank))
+        db.commit()
+
+    response = client.patch(
+        f"/lists/{list_id}/tasks/{third}/position",
+        headers=HEADERS,
+        json={"after_id": first},
+    )
+    assert response.status_code == 200
+    response = client.get(f"/lists/?list_id={list_id}&sort=rank", headers=HEADERS)
+    assert [task["id"] for task in response.json()["tasks"]] == [first, third, second]
+
+
+def test_list_tasks_sorted_by_priority():
+    """
+    Crea tareas con distintas prioridades y verifica que `sort=priority` las devuelva
+    de mayor a menor prioridad, conservando los valores de prioridad en la respuesta.
+    """
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista test prioridad"}
+    ).json()["id"]
+    for title, priority in (("Baja", "low"), ("Alta", "high"), ("Media", "medium")):
+        response = client.post(
+            f"/lists/{list_id}/tasks/",
+            headers=HEADERS,
+            json={"title": title, "priority": priority},
+        )
+        assert response.status_code == 201
+        assert response.json()["priority"] == priority
+
+    response = client.get(f"/lists/?list_id={list_id}&sort=priority", headers=HEADERS)
+    assert response.status_code == 200
+    tasks = response.json()["tasks"]
+    assert [task["priority"] for task in tasks] == ["high", "medium", "low"]
+    assert [task["title"] for task in tasks] == ["Alta", "Media", "Baja"]
+
+    response = client.get(f"/lists/?list_id={list_id}&priority=high", headers=HEADERS)
+    assert [task["title"] for task in response.json()["tasks"]] == ["Alta"]
+
+
+def test_update_task_with_if_match():
+    """
+    Verifica la concurrencia optimista: cada escritura incrementa la versión (`ETag`),
+    una escritura con una versión desactualizada responde 409 sin modificar la tarea
+    y una cabecera `If-Match` mal formada responde 400.
+    """
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista test versiones"}
+    ).json()["id"]
+    task_id = client.post(
+        f"/lists/{list_id}/tasks/",
+        headers=HEADERS,
+        json={"title": "Versionada", "priority": "low"},
+    ).json()["id"]
+
+    response = client.get(f"/lists/{list_id}/tasks/{task_id}", headers=HEADERS)
+    etag = response.headers["ETag"]
+    assert etag == f'"{response.json()["version"]}"'
+
+    response = client.put(
+        f"/lists/{list_id}/tasks/{task_id}",
+        headers={**HEADERS, "If-Match": etag},
+        json={"title": "Primera edición", "priority": "high", "is_done": False},
+    )
+    assert response.status_code == 200
+    new_etag = response.headers["ETag"]
+    assert new_etag != etag
+
+    response = client.put(
+        f"/lists/{list_id}/tasks/{task_id}",
+        headers={**HEADERS, "If-Match": etag},
+        json={"title": "Edición perdida", "priority": "low", "is_done": False},
+    )
+    assert response.status_code == 409
+
+    response = client.patch(
+        f"/lists/{list_id}/tasks/{task_id}/status",
+        headers={**HEADERS, "If-Match": etag},
+        json={"is_done": True},
+    )
+    assert response.status_code == 409
+
+    response = client.patch(
+        f"/lists/{list_id}/tasks/{task_id}/status",
+        headers={**HEADERS, "If-Match": "no-es-una-version"},
+        json={"is_done": True},
+    )
+    assert response.status_code == 400
+
+    response = client.patch(
+        f"/lists/{list_id}/tasks/{task_id}/status",
+        headers={**HEADERS, "If-Match": new_etag},
+        json={"is_done": True},
+    )
+    assert response.status_code == 200
+
+    task = client.get(f"/lists/{list_id}/tasks/{task_id}", headers=HEADERS).json()
+    assert task["title"] == "Primera edición"
+    assert task["is_done"] is True
+
+
+def test_write_with_missing_references():
+    """
+    Verifica que las referencias inexistentes detectadas por las claves foráneas
+    se responden con 404, y que una lista con tareas no se puede eliminar.
+    """
+    payload = {"title": "Tarea huérfana", "priority": "low"}
+    response = client.post("/lists/999999/tasks/", headers=HEADERS, json=payload)
+    assert response.status_code == 404
+
+    list_id = client.post(
+        "/lists/", headers=HEADERS, json={"name": "Lista con referencias"}
+    ).json()["id"]
+    response = client.post(
+        f"/lists/{list_id}/tasks/",
+        headers=HEADERS,
+        json={**payload, "assigned_to": 999999},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Usuario asignado no existe"
+
+    task_id = client.post(
+        f"/lists/{list_id}/tasks/", headers=HEADERS, json=payload
+    ).json()["id"]
+    response = client.put(
+        f"/lists/{list_id}/tasks/{task_id}",
+        headers=HEADERS,
+        json={**payload, "is_done": False, "assigned_to": 999999},
+    )
+    assert response.status_code == 404
+
+    assert client.delete(f"/lists/{list_id}", headers=HEADERS).status_code == 409
+    client.delete(f"/lists/{list_id}/tasks/{task_id}", headers=HEADERS)
+    assert client.delete(f"/lists/{list_id}", headers=HEADERS).status_code == 204
+    assert (
+        client.put(
+            f"/lists/{list_id}", headers=HEADERS, json={"name": "Ya no existe"}
+        ).status_code
+        == 404
+    )
@@ -0,0 +1,109 @@
+"""
+Tests para las trazas distribuidas de las peticiones.
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.middleware.tracing import TracingMiddleware
+from app.core.config import Settings
+from main import create_app
+from tests.conftest import HEADERS
+
+NO_LIMITS = {"rate_limit_user_rate": 0, "rate_limit_ip_rate": 0}
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+def traced_client(**settings) -> tuple[TestClient, list]:
+    """Cliente con trazas en memoria y la lista donde se exportan."""
+    app = create_app(Settings(**NO_LIMITS, tracing_exporter="memory", **settings))
+    client = TestClient(app)
+    client.get("/")  # construye la pila de middlewares
+    middleware = app.middleware_stack
+    while not isinstance(middleware, TracingMiddleware):
+        middleware = middleware.app
+    return client, middleware.tracer.exporter.traces
+
+
+def test_tracing_disabled_by_default():
+    """
+    Sin exportador configurado, el middleware de trazas no se instala.
+    """
+    app = create_app(Settings(**NO_LIMITS))
+    assert all(m.cls is not TracingMiddleware for m in app.user_middleware)
+
+
+def test_request_trace_spans():
+    """
+    Una petición muestreada produce un span raíz con la plantilla de la ruta y, bajo
+    él, los de las dependencias, la función CRUD y sus sentencias SQL.
+    """
+    client, traces = traced_client(tracing_sample_rate=1.0)
+    list_id = client.post("/lists/", json={"name": "Trazada"}, headers=HEADERS).json()[
+        "id"
+    ]
+    traces.clear()
+
+    response = client.get(f"/lists/{list_id}", headers=HEADERS)
+    assert response.status_code == 200
+    (trace,) = traces
+    assert response.headers["X-Trace-Id"] == trace.trace_id
+
+    spans = {span.name: span for span in trace.spans}
+    root = trace.root
+    assert root.name == "GET /lists/{list_id}"
+    assert root.attributes["http.status_code"] == 200
+    assert spans["get_current_user"].parent_id == root.span_id
+    assert spans["get_read_db_session"].parent_id == root.span_id
+    crud = spans["task_list.get_task_list"]
+    assert crud.op == "crud" and crud.parent_id == root.span_id
+    sql = [span for span in trace.spans if span.op == "db.sql"]
+    assert any(span.parent_id == crud.span_id for span in sql)
+    assert all(span.end_ns >= span.start_ns for span in trace.spans)
+
+
+def test_traceparent_propagation():
+    """
+    La cabecera `traceparent` continúa la traza de origen y su decisión de muestreo
+    prevalece sobre `tracing_sample_rate`.
+    """
+    client, traces = traced_client(tracing_sample_rate=0.0)
+    client.get("/lists/", headers=HEADERS)
+    assert not traces
+
+    sampled = {**HEADERS, "traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+    response = client.get("/lists/", headers=sampled)
+    assert response.headers["X-Trace-Id"] == TRACE_ID
+    (trace,) = traces
+    assert trace.trace_id == TRACE_ID
+    assert trace.root.parent_id == PARENT_ID
+
+    not_sampled = {**HEADERS, "traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"}
+    assert "X-Trace-Id" not in client.get("/lists/", headers=not_sampled).headers
+    assert len(traces) == 1
+
+
+def test_otlp_file_exporter(tmp_path):
+    """
+    El exportador `otlp-file` escribe una línea OTLP/JSON por traza.
+    """
+    path = tmp_path / "traces.jsonl"
+    settings = Settings(
+        **NO_LIMITS,
+        tracing_exporter="otlp-file",
+        tracing_sample_rate=1.0,
+        tracing_file=str(path),
+    )
+    client = TestClient(create_app(settings))
+    client.get("/lists/", headers=HEADERS)
+
+    (line,) = path.read_text().splitlines()
+    resource_spans = json.loads(line)["resourceSpans"][0]
+    service = resource_spans["resource"]["attributes"][0]
+    assert service == {"key": "service.name", "value": {"stringValue": "tidytasks"}}
+    spans = resource_spans["scopeSpans"][0]["spans"]
+    root = next(span for span in spans if not span["parentSpanId"])
+    assert root["name"] == "GET /lists/" and root["kind"] == 2
+    assert {span["traceId"] for span in spans} == {root["traceId"]}